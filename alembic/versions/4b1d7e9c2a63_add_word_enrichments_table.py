@@ -0,0 +1,52 @@
+"""add word enrichments table
+
+Revision ID: 4b1d7e9c2a63
+Revises: 8c3e4a1f2b7d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b1d7e9c2a63"
+down_revision: Union[str, Sequence[str], None] = "8c3e4a1f2b7d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "word_enrichments",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("word_key", sa.Text(), nullable=False),
+        sa.Column("target_language", sa.String(length=64), nullable=False),
+        sa.Column("prompt_version", sa.String(length=64), nullable=False),
+        sa.Column("translation", sa.Text(), nullable=True),
+        sa.Column("example_phrase", sa.Text(), nullable=True),
+        sa.Column("extra_info", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            onupdate=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "word_key",
+            "target_language",
+            "prompt_version",
+            name="uq_word_enrichments_key_language_version",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("word_enrichments")
@@ -0,0 +1,38 @@
+"""scope chat summaries to chat sessions
+
+Revision ID: 5c3e8b1f7a24
+Revises: 9e4f2a7c1d38
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c3e8b1f7a24"
+down_revision: Union[str, Sequence[str], None] = "9e4f2a7c1d38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nothing wrote chat summaries before they were scoped to a chat, so any rows are unusable.
+    op.execute("DELETE FROM chat_summaries")
+    op.add_column("chat_summaries", sa.Column("chat_id", sa.String(), nullable=False))
+    op.add_column(
+        "chat_summaries",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_unique_constraint("uq_chat_summaries_user_chat", "chat_summaries", ["user_id", "chat_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_chat_summaries_user_chat", "chat_summaries", type_="unique")
+    op.drop_column("chat_summaries", "updated_at")
+    op.drop_column("chat_summaries", "chat_id")
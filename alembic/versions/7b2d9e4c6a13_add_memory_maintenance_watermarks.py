@@ -0,0 +1,53 @@
+"""add memory maintenance watermarks
+
+Revision ID: 7b2d9e4c6a13
+Revises: 5c3e8b1f7a24
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2d9e4c6a13"
+down_revision: Union[str, Sequence[str], None] = "5c3e8b1f7a24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "memory_maintenance_watermarks",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("domain", sa.String(length=50), nullable=False),
+        sa.Column("item_hashes_json", sa.Text(), nullable=False, server_default="{}"),
+        sa.Column("clusters_json", sa.Text(), nullable=False, server_default="[]"),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            onupdate=sa.func.now(),
+        ),
+        sa.UniqueConstraint("user_id", "domain", name="uq_memory_maintenance_watermarks_user_domain"),
+    )
+    op.create_index(
+        op.f("ix_memory_maintenance_watermarks_id"),
+        "memory_maintenance_watermarks",
+        ["id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_memory_maintenance_watermarks_id"), table_name="memory_maintenance_watermarks")
+    op.drop_table("memory_maintenance_watermarks")
@@ -0,0 +1,48 @@
+"""add memory maintenance runs
+
+Revision ID: 9d4a6f2b8e15
+Revises: 7b2d9e4c6a13
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4a6f2b8e15"
+down_revision: Union[str, Sequence[str], None] = "7b2d9e4c6a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "memory_maintenance_runs",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("trigger_source", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("item_growth", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("known_cost_usd", sa.Numeric(12, 6), nullable=True),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_memory_maintenance_runs_user_started",
+        "memory_maintenance_runs",
+        ["user_id", "started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_memory_maintenance_runs_user_started", table_name="memory_maintenance_runs")
+    op.drop_table("memory_maintenance_runs")
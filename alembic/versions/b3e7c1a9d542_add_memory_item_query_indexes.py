@@ -0,0 +1,64 @@
+"""add memory item query indexes
+
+Revision ID: b3e7c1a9d542
+Revises: 9d4a6f2b8e15
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e7c1a9d542"
+down_revision: Union[str, Sequence[str], None] = "9d4a6f2b8e15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Superseded by the same prefix extended with the modal sort order.
+    op.drop_index("ix_memory_items_user_id_category_status", table_name="memory_items")
+    op.create_index(
+        "ix_memory_items_user_category_status_updated",
+        "memory_items",
+        ["user_id", "category", "status", sa.text("updated_at DESC"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_memory_items_user_category_updated",
+        "memory_items",
+        ["user_id", "category", sa.text("updated_at DESC"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_memory_items_user_category_priority",
+        "memory_items",
+        ["user_id", "category", sa.text("priority ASC NULLS LAST"), sa.text("updated_at DESC"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_memory_items_learning_focus",
+        "memory_items",
+        ["user_id", sa.text("coalesce(priority, 9)"), sa.text("updated_at DESC"), "id"],
+        unique=False,
+        postgresql_where=sa.text("category = 'area_to_improve' AND status IN ('struggling', 'improving')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_memory_items_learning_focus", table_name="memory_items")
+    op.drop_index("ix_memory_items_user_category_priority", table_name="memory_items")
+    op.drop_index("ix_memory_items_user_category_updated", table_name="memory_items")
+    op.drop_index("ix_memory_items_user_category_status_updated", table_name="memory_items")
+    op.create_index(
+        "ix_memory_items_user_id_category_status",
+        "memory_items",
+        ["user_id", "category", "status"],
+        unique=False,
+    )
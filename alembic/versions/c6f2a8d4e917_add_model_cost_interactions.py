@@ -0,0 +1,59 @@
+"""add model cost interactions
+
+Revision ID: c6f2a8d4e917
+Revises: b3e7c1a9d542
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f2a8d4e917"
+down_revision: Union[str, Sequence[str], None] = "b3e7c1a9d542"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "model_cost_interactions",
+        sa.Column("id", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("operation_id", sa.String(length=36), nullable=False),
+        sa.Column("operation_type", sa.String(length=100), nullable=False),
+        sa.Column("component", sa.String(length=100), nullable=False),
+        sa.Column("phase", sa.String(length=20), nullable=False),
+        sa.Column("provider", sa.String(length=100), nullable=False),
+        sa.Column("model", sa.String(length=200), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("usage_json", sa.Text(), nullable=False),
+        sa.Column("known_cost_usd", sa.Numeric(18, 10), nullable=False),
+        sa.Column("cost_quality", sa.String(length=20), nullable=False),
+        sa.Column("cost_source", sa.String(length=50), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_model_cost_interactions_recorded_at",
+        "model_cost_interactions",
+        ["recorded_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_model_cost_interactions_user_recorded",
+        "model_cost_interactions",
+        ["user_id", "recorded_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_model_cost_interactions_user_recorded", table_name="model_cost_interactions")
+    op.drop_index("ix_model_cost_interactions_recorded_at", table_name="model_cost_interactions")
+    op.drop_table("model_cost_interactions")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Standalone memory-maintenance worker application for Runestone.
+
+Runs one fleet-wide memory maintenance sweep a day at an off-peak hour, so
+users whose memory grew between chat resets are maintained outside the web
+process. See `runestone.agents.memory_maintenance_scheduler` for how users are
+chosen and how concurrency and cost are bounded.
+"""
+
+import asyncio
+import logging
+import signal
+import sys
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+from runestone.agents.memory_maintenance_scheduler import MemoryMaintenanceSweep
+from runestone.config import settings
+from runestone.core.logging_config import setup_logging
+from runestone.db.database import setup_database
+from runestone.model_costs.persistence import start_interaction_persistence, stop_interaction_persistence
+
+
+async def run_sweep_job(sweep: MemoryMaintenanceSweep) -> None:
+    """Run one sweep; a failing sweep is logged and retried at the next scheduled time."""
+    try:
+        await sweep.run()
+    except Exception:
+        logging.getLogger(__name__).exception("Error in run_sweep_job")
+
+
+def create_scheduler(sweep: MemoryMaintenanceSweep) -> AsyncIOScheduler:
+    """Create and configure the APScheduler instance."""
+    scheduler = AsyncIOScheduler()
+
+    scheduler.add_job(
+        run_sweep_job,
+        args=[sweep],
+        trigger=CronTrigger(hour=settings.memory_maintenance_schedule_hour_utc, timezone="UTC"),
+        id="memory_maintenance_sweep",
+        name="Scheduled Memory Maintenance",
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+    )
+
+    return scheduler
+
+
+async def main() -> None:
+    """Main entry point for the memory-maintenance worker application."""
+    log_level = "DEBUG" if settings.verbose else "INFO"
+    setup_logging(level=log_level)
+    logger = logging.getLogger(__name__)
+
+    logger.info("Starting Runestone Memory Maintenance Worker")
+
+    try:
+        logger.info("Setting up database...")
+        await setup_database()
+
+        scheduler = create_scheduler(MemoryMaintenanceSweep.from_settings(settings))
+
+        # Signal event for graceful shutdown
+        shutdown_event = asyncio.Event()
+
+        def shutdown_handler(signum, frame):
+            logger.info(f"Received signal {signum}, shutting down...")
+            shutdown_event.set()
+
+        signal.signal(signal.SIGINT, shutdown_handler)
+        signal.signal(signal.SIGTERM, shutdown_handler)
+
+        logger.info("Scheduler configured with jobs:")
+        for job in scheduler.get_jobs():
+            logger.info(f"  - {job.name}: {job.trigger}")
+
+        start_interaction_persistence(settings)
+        scheduler.start()
+        await shutdown_event.wait()
+
+        logger.info("Shutting down scheduler...")
+        scheduler.shutdown(wait=True)
+        await stop_interaction_persistence()
+        logger.info("Memory maintenance worker shutdown complete")
+
+    except Exception as e:
+        logger.error(f"Failed to start worker: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
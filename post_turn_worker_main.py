@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Standalone post-turn worker application for Runestone.
+
+Runs queued post-turn specialist work (post coordinator, word_keeper, memory
+keepers) claimed from the Postgres `post_turn_jobs` table. Start several
+processes to scale horizontally; the web backend enqueues jobs when
+POST_TURN_QUEUE_ENABLED is set.
+"""
+
+import asyncio
+import logging
+import signal
+import sys
+
+from runestone.agents.manager import AgentsManager
+from runestone.agents.post_turn_worker import PostTurnWorker
+from runestone.config import settings
+from runestone.core.logging_config import setup_logging
+from runestone.db.database import setup_database
+from runestone.model_costs.persistence import start_interaction_persistence, stop_interaction_persistence
+
+
+def create_worker() -> PostTurnWorker:
+    """Create the worker and the agents manager it drives."""
+    return PostTurnWorker(
+        AgentsManager(settings),
+        concurrency=settings.post_turn_worker_concurrency,
+        poll_interval_seconds=settings.post_turn_worker_poll_seconds,
+        lease_seconds=settings.post_turn_job_lease_seconds,
+        max_attempts=settings.post_turn_job_max_attempts,
+    )
+
+
+async def main() -> None:
+    """Main entry point for the post-turn worker application."""
+    log_level = "DEBUG" if settings.verbose else "INFO"
+    setup_logging(level=log_level)
+    logger = logging.getLogger(__name__)
+
+    logger.info("Starting Runestone Post-turn Worker")
+
+    try:
+        if not settings.post_turn_queue_enabled:
+            logger.warning("POST_TURN_QUEUE_ENABLED is false; the backend will not enqueue post-turn jobs")
+
+        logger.info("Setting up database...")
+        await setup_database()
+
+        worker = create_worker()
+
+        # Signal event for graceful shutdown
+        shutdown_event = asyncio.Event()
+
+        def shutdown_handler(signum, frame):
+            logger.info(f"Received signal {signum}, shutting down...")
+            shutdown_event.set()
+
+        signal.signal(signal.SIGINT, shutdown_handler)
+        signal.signal(signal.SIGTERM, shutdown_handler)
+
+        start_interaction_persistence(settings)
+        try:
+            await worker.run(shutdown_event)
+        finally:
+            await stop_interaction_persistence()
+        logger.info("Post-turn worker shutdown complete")
+
+    except Exception as e:
+        logger.error(f"Failed to start worker: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
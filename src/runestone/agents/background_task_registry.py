@@ -4,6 +4,11 @@ In-memory registry for background asyncio tasks.
 
 import asyncio
 import logging
+import weakref
+
+from runestone.core.metrics import CollectedMetric, metrics_registry
+
+_named_registries: "weakref.WeakSet[BackgroundTaskRegistry]" = weakref.WeakSet()
 
 
 class BackgroundTaskRegistry:
@@ -15,16 +20,24 @@ class BackgroundTaskRegistry:
         *,
         log_prefix: str = "[agents:post-task]",
         key_name: str = "key",
+        metrics_name: str | None = None,
     ):
         self._logger = logger
         self._log_prefix = log_prefix
         self._key_name = key_name
         self._tasks: dict[str, asyncio.Task] = {}
+        self.metrics_name = metrics_name
+        if metrics_name is not None:
+            _named_registries.add(self)
 
     @property
     def tasks(self) -> dict[str, asyncio.Task]:
         return self._tasks
 
+    @property
+    def live_count(self) -> int:
+        return sum(1 for task in self._tasks.values() if not task.done())
+
     def register(self, key: str, task: asyncio.Task) -> None:
         old = self._tasks.pop(key, None)
         if old and not old.done():
@@ -43,3 +56,18 @@ class BackgroundTaskRegistry:
             self._logger.info("%s Cancelled stale task: %s=%s", self._log_prefix, self._key_name, key)
             return True
         return False
+
+
+@metrics_registry.register_collector
+def _collect_background_tasks() -> list[CollectedMetric]:
+    counts: dict[str, int] = {}
+    for registry in list(_named_registries):
+        counts[registry.metrics_name] = counts.get(registry.metrics_name, 0) + registry.live_count
+    return [
+        CollectedMetric(
+            "runestone_background_tasks",
+            "gauge",
+            "Live background tasks by registry.",
+            [({"registry": name}, count) for name, count in sorted(counts.items())],
+        )
+    ]
@@ -0,0 +1,81 @@
+"""
+Chat summarizer that folds older messages into a rolling per-chat summary.
+
+It runs in the background after a turn, never on the foreground path. The
+teacher then receives the summary plus a short raw tail instead of a long raw
+history window.
+"""
+
+import json
+import logging
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from runestone.agents.circuit_breaker import guarded_structured_output
+from runestone.agents.llm import build_chat_model
+from runestone.agents.schemas import ChatMessage, ChatSummaryUpdate
+from runestone.config import Settings
+from runestone.core.observability import timed_operation
+
+logger = logging.getLogger(__name__)
+
+MAX_SUMMARY_CHARS = 2000
+
+CHAT_SUMMARIZER_SYSTEM_PROMPT = """
+You maintain a rolling summary of a conversation between a Swedish teacher and a student.
+You do not interact with the student.
+
+Input JSON:
+- `previous_summary`: the summary so far (may be empty).
+- `messages`: the next messages of the conversation, oldest first.
+
+Return an updated summary of the whole conversation that the teacher can rely on
+instead of the raw messages. Keep:
+- topics discussed and exercises in progress, including where they stopped;
+- corrections given and mistakes the student repeated;
+- words or phrases the teacher introduced;
+- requests or preferences the student stated about how the lesson should go.
+
+Drop greetings, small talk, and details that no longer matter. Write in English,
+quoting Swedish words and phrases verbatim. Use at most 150 words. Never invent
+facts that are not in the previous summary or the messages.
+"""
+
+
+class ChatSummarizerAgent:
+    """LLM agent that extends a chat's rolling summary with newer messages."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.model = build_chat_model(settings, "chat_summarizer")
+
+        logger.info(
+            "[agents:chat-summary] Initialized ChatSummarizerAgent with provider=%s, model=%s",
+            settings.chat_summarizer_provider,
+            settings.chat_summarizer_model,
+        )
+
+    @timed_operation(logger, "[agents:chat-summary] Summary generated")
+    async def summarize(self, previous_summary: str, messages: list[ChatMessage]) -> str | None:
+        """Return the updated summary, or None when the model call fails."""
+        payload = {
+            "previous_summary": previous_summary,
+            "messages": [{"role": message.role, "content": message.content} for message in messages],
+        }
+        model = guarded_structured_output(self.model, ChatSummaryUpdate)
+        try:
+            result = await model.ainvoke(
+                [
+                    SystemMessage(content=CHAT_SUMMARIZER_SYSTEM_PROMPT),
+                    HumanMessage(content=json.dumps(payload, ensure_ascii=False)),
+                ]
+            )
+        except OutputParserException as exc:
+            logger.warning("[agents:chat-summary] Schema validation failed: %s", exc)
+            return None
+        except Exception as exc:
+            logger.warning("[agents:chat-summary] Summarization failed: %s", exc, exc_info=True)
+            return None
+        summary = result.summary.strip()
+        return summary[:MAX_SUMMARY_CHARS] if summary else None
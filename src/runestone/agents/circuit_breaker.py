@@ -0,0 +1,396 @@
+"""
+Per provider/model circuit breakers with instant failover to a fallback model.
+
+Chat models built by `build_chat_model` share one breaker per (provider, model)
+across agents. Call outcomes are kept in a rolling time window; once the share
+of failed or slow calls crosses the threshold the circuit opens and requests go
+straight to the agent's fallback model (or fail fast with `CircuitOpenError`
+when none is configured) instead of spending the provider timeout and SDK
+retries again. After `open_seconds` the circuit half-opens and lets a limited
+number of probe requests through; a healthy probe closes it again.
+
+Breaker state and recent transitions are exposed through
+`circuit_breaker_registry.snapshot()` and `circuit_breaker_registry.transitions()`,
+and their state and rejections through the metrics registry.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from runestone.config import Settings
+from runestone.core.llm_registry import structured_output
+from runestone.core.metrics import CollectedMetric, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CircuitKey = tuple[str, str]
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a circuit is open and no fallback model is configured."""
+
+    def __init__(self, key: CircuitKey):
+        super().__init__(f"Circuit open for {key[0]}/{key[1]}")
+        self.key = key
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """When to open a circuit and how to probe for recovery."""
+
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float | None = 20.0
+    min_calls: int = 10
+    window_seconds: float = 60.0
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+
+
+def circuit_breaker_policy_from_settings(settings: Settings) -> CircuitBreakerPolicy:
+    return CircuitBreakerPolicy(
+        failure_rate_threshold=settings.llm_circuit_failure_rate,
+        slow_call_seconds=settings.llm_circuit_slow_call_seconds,
+        min_calls=settings.llm_circuit_min_calls,
+        window_seconds=settings.llm_circuit_window_seconds,
+        open_seconds=settings.llm_circuit_open_seconds,
+        half_open_max_calls=settings.llm_circuit_half_open_probes,
+    )
+
+
+@dataclass(frozen=True)
+class CircuitTransition:
+    """One state change of a breaker, kept for metrics and debugging."""
+
+    key: CircuitKey
+    from_state: CircuitState
+    to_state: CircuitState
+    reason: str
+    at: float
+
+
+@dataclass(frozen=True)
+class CircuitBinding:
+    """Breaker identity and fallback attached to one chat model instance."""
+
+    key: CircuitKey
+    policy: CircuitBreakerPolicy
+    fallback: BaseChatModel | None = None
+
+
+class CircuitBreaker:
+    """Rolling-window breaker for one provider/model pair."""
+
+    def __init__(
+        self,
+        key: CircuitKey,
+        policy: CircuitBreakerPolicy,
+        *,
+        on_transition: Callable[[CircuitTransition], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.key = key
+        self.policy = policy
+        self.state: CircuitState = "closed"
+        self.rejected = 0
+        self.transition_counts: dict[str, int] = {}
+        self._on_transition = on_transition
+        self._clock = clock
+        self._outcomes: deque[tuple[float, bool, float]] = deque()
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go to this model now; half-open calls count as probes."""
+        with self._lock:
+            if self.state == "open":
+                if self._clock() - self._opened_at < self.policy.open_seconds:
+                    self.rejected += 1
+                    return False
+                self._transition("half_open", "open interval elapsed")
+            if self.state == "half_open":
+                if self._probes_in_flight >= self.policy.half_open_max_calls:
+                    self.rejected += 1
+                    return False
+                self._probes_in_flight += 1
+            return True
+
+    def record(self, seconds: float, *, ok: bool) -> None:
+        """Record the outcome of an allowed call. Slow successes count as failures."""
+        healthy = ok and (self.policy.slow_call_seconds is None or seconds <= self.policy.slow_call_seconds)
+        with self._lock:
+            now = self._clock()
+            if self.state == "half_open":
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if healthy:
+                    self._outcomes.clear()
+                    self._transition("closed", "probe succeeded")
+                else:
+                    self._open(now, "probe failed" if not ok else "probe slow")
+                return
+            self._outcomes.append((now, healthy, seconds))
+            self._prune(now)
+            if self.state == "closed" and len(self._outcomes) >= self.policy.min_calls:
+                failure_rate = self._failure_rate()
+                if failure_rate >= self.policy.failure_rate_threshold:
+                    self._open(now, f"failure rate {failure_rate:.2f} over {len(self._outcomes)} calls")
+
+    def release(self) -> None:
+        """Give back a probe slot for a call that was cancelled before it finished."""
+        with self._lock:
+            if self.state == "half_open":
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._prune(self._clock())
+            latencies = sorted(seconds for _at, _healthy, seconds in self._outcomes)
+            return {
+                "state": self.state,
+                "calls": len(self._outcomes),
+                "failure_rate": self._failure_rate(),
+                "p50_seconds": _percentile(latencies, 0.5),
+                "p90_seconds": _percentile(latencies, 0.9),
+                "rejected": self.rejected,
+                "transitions": dict(self.transition_counts),
+            }
+
+    def _open(self, now: float, reason: str) -> None:
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._transition("open", reason)
+
+    def _transition(self, to_state: CircuitState, reason: str) -> None:
+        transition = CircuitTransition(self.key, self.state, to_state, reason, time.time())
+        self.state = to_state
+        label = f"{transition.from_state}->{to_state}"
+        self.transition_counts[label] = self.transition_counts.get(label, 0) + 1
+        if self._on_transition is not None:
+            self._on_transition(transition)
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.policy.window_seconds:
+            self._outcomes.popleft()
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _at, healthy, _seconds in self._outcomes if not healthy) / len(self._outcomes)
+
+
+def _percentile(ordered: list[float], quantile: float) -> float | None:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))]
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers keyed by provider/model, plus the model bindings that use them."""
+
+    def __init__(self, max_transitions: int = 100, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._breakers: dict[CircuitKey, CircuitBreaker] = {}
+        self._bindings: dict[int, tuple[Any, CircuitBinding]] = {}
+        self._transitions: deque[CircuitTransition] = deque(maxlen=max_transitions)
+        self._lock = threading.Lock()
+
+    def breaker(self, key: CircuitKey, policy: CircuitBreakerPolicy) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key, policy, on_transition=self._record_transition, clock=self._clock)
+                self._breakers[key] = breaker
+            return breaker
+
+    def bind(self, model: Any, binding: CircuitBinding) -> None:
+        """Attach a breaker identity and fallback to a chat model instance."""
+        with self._lock:
+            # The model is kept in the entry so its id cannot be reused while bound.
+            self._bindings[id(model)] = (model, binding)
+
+    def binding(self, model: Any) -> CircuitBinding | None:
+        with self._lock:
+            entry = self._bindings.get(id(model))
+        if entry is None or entry[0] is not model:
+            return None
+        return entry[1]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-breaker state keyed as `provider/model`."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {f"{provider}/{model}": breaker.snapshot() for (provider, model), breaker in breakers}
+
+    def collect_metrics(self) -> list[CollectedMetric]:
+        """Report each breaker's state (1 for the current one) and rejected calls."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        states = CollectedMetric("runestone_llm_circuit_state", "gauge", "Circuit breaker state per provider/model.")
+        rejected = CollectedMetric(
+            "runestone_llm_circuit_rejected_total", "counter", "Calls an open circuit sent to the fallback or failed."
+        )
+        for (provider, model), breaker in breakers:
+            snapshot = breaker.snapshot()
+            labels = {"provider": provider, "model": model}
+            for state in ("closed", "open", "half_open"):
+                states.samples.append(({**labels, "state": state}, 1 if snapshot["state"] == state else 0))
+            rejected.samples.append((labels, snapshot["rejected"]))
+        return [states, rejected]
+
+    def transitions(self) -> list[CircuitTransition]:
+        """Return the most recent transitions, oldest first."""
+        with self._lock:
+            return list(self._transitions)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+            self._bindings.clear()
+            self._transitions.clear()
+
+    def _record_transition(self, transition: CircuitTransition) -> None:
+        # Called with the breaker lock held; the registry lock is only taken briefly here.
+        with self._lock:
+            self._transitions.append(transition)
+        log = logger.warning if transition.to_state == "open" else logger.info
+        log(
+            "[agents:circuit] Circuit %s provider=%s model=%s from=%s reason=%s",
+            transition.to_state,
+            transition.key[0],
+            transition.key[1],
+            transition.from_state,
+            transition.reason,
+        )
+
+
+circuit_breaker_registry = CircuitBreakerRegistry()
+metrics_registry.register_collector(circuit_breaker_registry.collect_metrics)
+
+
+async def guarded_call(
+    binding: CircuitBinding,
+    primary: Callable[[], Awaitable[T]],
+    *,
+    fallback: Callable[[], Awaitable[T]] | None = None,
+    registry: CircuitBreakerRegistry = circuit_breaker_registry,
+) -> T:
+    """
+    Run `primary` through the breaker for `binding.key`, failing over to `fallback`.
+
+    An open circuit goes to `fallback` without calling `primary`, or raises
+    `CircuitOpenError` when there is no fallback. A failed primary call is
+    recorded and then retried once on `fallback`. Output parsing errors mean the
+    provider answered, so they count as healthy and are re-raised unchanged.
+    """
+    breaker = registry.breaker(binding.key, binding.policy)
+    if not breaker.allow_request():
+        if fallback is None:
+            raise CircuitOpenError(binding.key)
+        logger.info(
+            "[agents:circuit] Circuit open, routing to fallback provider=%s model=%s",
+            binding.key[0],
+            binding.key[1],
+        )
+        return await fallback()
+
+    started = time.monotonic()
+    try:
+        result = await primary()
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except OutputParserException:
+        breaker.record(time.monotonic() - started, ok=True)
+        raise
+    except Exception as exc:
+        breaker.record(time.monotonic() - started, ok=False)
+        if fallback is None:
+            raise
+        logger.warning(
+            "[agents:circuit] Model call failed, failing over provider=%s model=%s error=%s",
+            binding.key[0],
+            binding.key[1],
+            type(exc).__name__,
+        )
+        return await fallback()
+    breaker.record(time.monotonic() - started, ok=True)
+    return result
+
+
+class CircuitBreakerRunnable(Runnable):
+    """Async runnable that sends `primary` through the model's breaker with failover to `fallback`."""
+
+    def __init__(
+        self,
+        binding: CircuitBinding,
+        primary: Runnable,
+        fallback: Runnable | None,
+        registry: CircuitBreakerRegistry = circuit_breaker_registry,
+    ):
+        self.binding = binding
+        self.primary = primary
+        self.fallback = fallback
+        self.registry = registry
+
+    def invoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        # Agents only call models asynchronously; sync callers get the primary model unguarded.
+        return self.primary.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        fallback = self.fallback
+        return await guarded_call(
+            self.binding,
+            lambda: self.primary.ainvoke(input, config, **kwargs),
+            fallback=(lambda: fallback.ainvoke(input, config, **kwargs)) if fallback is not None else None,
+            registry=self.registry,
+        )
+
+
+def guarded_structured_output(
+    model: Any,
+    schema: Any,
+    registry: CircuitBreakerRegistry = circuit_breaker_registry,
+) -> Runnable:
+    """Return the cached structured-output runnable for `model`, guarded by its breaker when bound."""
+    runnable = structured_output(model, schema)
+    binding = registry.binding(model)
+    if binding is None:
+        return runnable
+    fallback = guarded_structured_output(binding.fallback, schema, registry) if binding.fallback is not None else None
+    return CircuitBreakerRunnable(binding, runnable, fallback, registry)
+
+
+class CircuitBreakerMiddleware(AgentMiddleware):
+    """Agent middleware that routes model calls through breakers bound to the requested model."""
+
+    def __init__(self, registry: CircuitBreakerRegistry = circuit_breaker_registry):
+        super().__init__()
+        self.registry = registry
+
+    def wrap_model_call(self, request, handler):
+        return handler(request)
+
+    async def awrap_model_call(self, request, handler):
+        binding = self.registry.binding(request.model)
+        if binding is None:
+            return await handler(request)
+        fallback = None
+        if binding.fallback is not None:
+            fallback_request = request.override(model=binding.fallback)
+            fallback = lambda: self.awrap_model_call(fallback_request, handler)  # noqa: E731
+        return await guarded_call(binding, lambda: handler(request), fallback=fallback, registry=self.registry)
@@ -9,6 +9,8 @@ from typing import Literal
 from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from runestone.agents.circuit_breaker import guarded_structured_output
+from runestone.agents.hedging import hedge_policy_from_settings, hedged_call, model_label, record_cancelled_attempt
 from runestone.agents.llm import build_chat_model
 from runestone.agents.schemas import ChatMessage, CoordinatorPlan
 from runestone.config import Settings
@@ -139,6 +141,7 @@ class CoordinatorAgent:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.model = build_chat_model(settings, "coordinator")
+        self.hedge_policy = hedge_policy_from_settings(settings) if settings.coordinator_hedging_enabled else None
 
         logger.info(
             "[agents:coordinator] Initialized CoordinatorAgent with provider=%s, model=%s",
@@ -164,7 +167,7 @@ class CoordinatorAgent:
         teacher_response: str | None = None,
     ) -> CoordinatorPlan:
         """Return a routing plan for the given turn."""
-        model = self.model.with_structured_output(CoordinatorPlan)
+        model = guarded_structured_output(self.model, CoordinatorPlan)
         payload = {
             "current_stage": current_stage,
             "message": message,
@@ -173,13 +176,21 @@ class CoordinatorAgent:
             "available_specialists": available_specialists,
         }
 
+        messages = [
+            SystemMessage(content=self._system_prompt(current_stage)),
+            HumanMessage(content=json.dumps(payload, ensure_ascii=False)),
+        ]
+
         try:
-            result = await model.ainvoke(
-                [
-                    SystemMessage(content=self._system_prompt(current_stage)),
-                    HumanMessage(content=json.dumps(payload, ensure_ascii=False)),
-                ]
-            )
+            if self.hedge_policy is not None:
+                result = await hedged_call(
+                    ("coordinator", model_label(self.model)),
+                    lambda: model.ainvoke(messages),
+                    policy=self.hedge_policy,
+                    on_cancelled=lambda _is_hedge: record_cancelled_attempt(self.model),
+                )
+            else:
+                result = await model.ainvoke(messages)
             return self._normalize_plan(result, current_stage)
         except OutputParserException as e:
             logger.error("[agents:coordinator] Schema validation failed: %s", str(e))
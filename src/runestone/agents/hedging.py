@@ -0,0 +1,258 @@
+"""
+Hedged LLM requests driven by rolling in-process latency histograms.
+
+A hedged call starts the primary request and, if it has not finished by the
+rolling p90 latency observed for that agent and model, starts a second request
+(optionally against a different model) and returns whichever finishes first.
+The loser is cancelled and recorded as a cancelled interaction with unknown
+usage, so both attempts appear in cost tracking.
+
+Histograms stay in process memory; `latency_registry.snapshot()` exposes them.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from runestone.config import Settings
+from runestone.model_costs.langchain_callback import LangChainCostCallback
+from runestone.model_costs.tracking import record_model_interaction
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LatencyKey = tuple[str, str]
+
+
+def model_label(model: Any) -> str:
+    """Return a stable label for a chat model instance."""
+    return str(getattr(model, "model_name", None) or getattr(model, "model", None) or type(model).__name__)
+
+
+def record_cancelled_attempt(model: Any) -> None:
+    """Record a cancelled request against the cost identity attached to `model`."""
+    for callback in getattr(model, "callbacks", None) or []:
+        if isinstance(callback, LangChainCostCallback):
+            record_model_interaction(
+                component=callback.component,
+                provider=callback.provider,
+                model=callback.model,
+                status="cancelled",
+                usage={},
+                provider_cost_usd=None,
+            )
+            return
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to fire a hedge request."""
+
+    percentile: float = 0.9
+    min_samples: int = 20
+    min_delay_seconds: float = 0.5
+
+
+def hedge_policy_from_settings(settings: Settings) -> HedgePolicy:
+    return HedgePolicy(
+        percentile=settings.llm_hedge_percentile,
+        min_samples=settings.llm_hedge_min_samples,
+        min_delay_seconds=settings.llm_hedge_min_delay_seconds,
+    )
+
+
+class LatencyHistogram:
+    """Rolling window of request latencies for one agent/model pair."""
+
+    def __init__(self, window_size: int):
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, quantile: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        return {
+            "count": self.count,
+            "p50_seconds": self.percentile(0.5),
+            "p90_seconds": self.percentile(0.9),
+            "p99_seconds": self.percentile(0.99),
+            "hedges_fired": self.hedges_fired,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class LatencyRegistry:
+    """Thread-safe per-(agent, model) latency histograms."""
+
+    def __init__(self, window_size: int = 200):
+        self.window_size = window_size
+        self._histograms: dict[LatencyKey, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, key: LatencyKey) -> LatencyHistogram:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram(self.window_size)
+            self._histograms[key] = histogram
+        return histogram
+
+    def record(self, key: LatencyKey, seconds: float) -> None:
+        with self._lock:
+            self._histogram(key).record(seconds)
+
+    def hedge_delay(self, key: LatencyKey, policy: HedgePolicy) -> float | None:
+        """Return the delay after which to hedge, or None while there are too few samples."""
+        with self._lock:
+            histogram = self._histogram(key)
+            if histogram.count < policy.min_samples:
+                return None
+            delay = histogram.percentile(policy.percentile)
+        return max(policy.min_delay_seconds, delay or 0.0)
+
+    def record_hedge(self, key: LatencyKey, *, hedge_won: bool) -> None:
+        with self._lock:
+            histogram = self._histogram(key)
+            histogram.hedges_fired += 1
+            if hedge_won:
+                histogram.hedge_wins += 1
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        """Return per-key statistics keyed as `agent/model`."""
+        with self._lock:
+            return {f"{agent}/{model}": histogram.snapshot() for (agent, model), histogram in self._histograms.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+latency_registry = LatencyRegistry()
+
+
+async def hedged_call(
+    primary_key: LatencyKey,
+    primary: Callable[[], Awaitable[T]],
+    *,
+    hedge: Callable[[], Awaitable[T]] | None = None,
+    hedge_key: LatencyKey | None = None,
+    policy: HedgePolicy = HedgePolicy(),
+    registry: LatencyRegistry = latency_registry,
+    on_cancelled: Callable[[bool], None] | None = None,
+) -> T:
+    """
+    Run `primary`, hedging with `hedge` (default: `primary` again) once the rolling percentile passes.
+
+    The first successful result wins and the other request is cancelled;
+    `on_cancelled(is_hedge)` is called for it. When both fail, the primary's
+    exception is raised.
+    """
+    hedge = hedge or primary
+    hedge_key = hedge_key or primary_key
+    delay = registry.hedge_delay(primary_key, policy)
+    started = time.monotonic()
+    primary_task = asyncio.create_task(primary())
+    if delay is None:
+        result = await primary_task
+        registry.record(primary_key, time.monotonic() - started)
+        return result
+
+    try:
+        done, _pending = await asyncio.wait({primary_task}, timeout=delay)
+    except asyncio.CancelledError:
+        primary_task.cancel()
+        if on_cancelled is not None:
+            on_cancelled(False)
+        raise
+    if done:
+        result = primary_task.result()
+        registry.record(primary_key, time.monotonic() - started)
+        return result
+
+    hedge_started = time.monotonic()
+    hedge_task = asyncio.create_task(hedge())
+    logger.info(
+        "[agents:hedging] Hedge fired agent=%s primary_model=%s hedge_model=%s delay_s=%.2f",
+        primary_key[0],
+        primary_key[1],
+        hedge_key[1],
+        delay,
+    )
+    tasks = {primary_task: (primary_key, started), hedge_task: (hedge_key, hedge_started)}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                key, task_started = tasks[task]
+                registry.record(key, time.monotonic() - task_started)
+                registry.record_hedge(primary_key, hedge_won=task is hedge_task)
+                return task.result()
+        registry.record_hedge(primary_key, hedge_won=False)
+        return primary_task.result()
+    finally:
+        for task, (key, task_started) in tasks.items():
+            if not task.done():
+                task.cancel()
+                # The loser's elapsed time is a lower bound; recording it keeps slow tails visible.
+                registry.record(key, time.monotonic() - task_started)
+                if on_cancelled is not None:
+                    on_cancelled(task is hedge_task)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class HedgedModelMiddleware(AgentMiddleware):
+    """Agent middleware that hedges each model call of a LangGraph agent."""
+
+    def __init__(
+        self,
+        agent_name: str,
+        *,
+        hedge_model: BaseChatModel | None = None,
+        policy: HedgePolicy = HedgePolicy(),
+        registry: LatencyRegistry = latency_registry,
+    ):
+        super().__init__()
+        self.agent_name = agent_name
+        self.hedge_model = hedge_model
+        self.policy = policy
+        self.registry = registry
+
+    def wrap_model_call(self, request, handler):
+        return handler(request)
+
+    async def awrap_model_call(self, request, handler):
+        hedge_request = request.override(model=self.hedge_model) if self.hedge_model is not None else request
+        return await hedged_call(
+            (self.agent_name, model_label(request.model)),
+            lambda: handler(request),
+            hedge=lambda: handler(hedge_request),
+            hedge_key=(self.agent_name, model_label(hedge_request.model)),
+            policy=self.policy,
+            registry=self.registry,
+            on_cancelled=lambda is_hedge: record_cancelled_attempt(hedge_request.model if is_hedge else request.model),
+        )
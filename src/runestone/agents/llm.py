@@ -7,7 +7,13 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
-from runestone.config import AgentName, ReasoningLevel, Settings
+from runestone.agents.circuit_breaker import (
+    CircuitBinding,
+    circuit_breaker_policy_from_settings,
+    circuit_breaker_registry,
+)
+from runestone.config import AgentLLMSettings, AgentName, ReasoningLevel, Settings
+from runestone.core.llm_registry import llm_registry
 from runestone.model_costs.langchain_callback import LangChainCostCallback
 
 logger = logging.getLogger(__name__)
@@ -16,6 +22,11 @@ logger = logging.getLogger(__name__)
 def build_chat_model(settings: Settings, agent_name: AgentName) -> BaseChatModel:
     """Build a LangChain chat model from validated per-agent configuration.
 
+    Models are memoized process-wide by their effective configuration, so
+    rebuilding an agent reuses the existing model and its pooled HTTP client.
+    With circuit breakers enabled, the model is bound to its provider/model
+    breaker and to the fallback model an open circuit routes to.
+
     Args:
         settings: Application settings.
         agent_name: Agent identifier used to look up per-agent LLM settings
@@ -25,22 +36,97 @@ def build_chat_model(settings: Settings, agent_name: AgentName) -> BaseChatModel
         Configured LangChain chat model.
     """
     agent_settings = settings.get_agent_llm_settings(agent_name)
+    api_key, api_base = _provider_credentials(settings, agent_settings.provider)
 
-    if agent_settings.provider == "openrouter":
+    # The cost callback is bound to the agent name, so models are never shared across agents.
+    model = _cached_chat_model(settings, "agent", agent_name, agent_settings, api_key, api_base)
+    if settings.llm_circuit_breaker_enabled and circuit_breaker_registry.binding(model) is None:
+        _bind_circuit(settings, model, agent_settings, fallback=_build_fallback_chat_model(settings, agent_name))
+    return model
+
+
+def _build_fallback_chat_model(settings: Settings, agent_name: AgentName) -> BaseChatModel | None:
+    """Return the model an open circuit fails over to: the teacher backup, or the shared fallback."""
+    if agent_name == "teacher" and settings.teacher_backup_model is not None:
+        return build_chat_model(settings, "teacher_backup")
+    fallback_settings = settings.get_agent_fallback_llm_settings(agent_name)
+    if fallback_settings is None:
+        return None
+    api_key, api_base = _provider_credentials(settings, fallback_settings.provider)
+    fallback = _cached_chat_model(settings, "agent_fallback", agent_name, fallback_settings, api_key, api_base)
+    if circuit_breaker_registry.binding(fallback) is None:
+        _bind_circuit(settings, fallback, fallback_settings, fallback=None)
+    return fallback
+
+
+def _bind_circuit(
+    settings: Settings,
+    model: BaseChatModel,
+    agent_settings: AgentLLMSettings,
+    *,
+    fallback: BaseChatModel | None,
+) -> None:
+    circuit_breaker_registry.bind(
+        model,
+        CircuitBinding(
+            key=(agent_settings.provider, agent_settings.model),
+            policy=circuit_breaker_policy_from_settings(settings),
+            fallback=fallback,
+        ),
+    )
+
+
+def _provider_credentials(settings: Settings, provider: str) -> tuple[str, str | None]:
+    if provider == "openrouter":
         api_key = settings.openrouter_api_key
         api_base = "https://openrouter.ai/api/v1"
-    elif agent_settings.provider == "gemini":
+    elif provider == "gemini":
         api_key = settings.gemini_api_key
         api_base = None
-    elif agent_settings.provider == "openai":
+    elif provider == "openai":
         api_key = settings.openai_api_key
         api_base = None
     else:
-        raise ValueError(f"Unsupported chat provider: {agent_settings.provider}")
+        raise ValueError(f"Unsupported chat provider: {provider}")
 
     if not api_key:
-        raise ValueError(f"API key for {agent_settings.provider} is not configured")
+        raise ValueError(f"API key for {provider} is not configured")
+    return api_key, api_base
+
+
+def _cached_chat_model(
+    settings: Settings,
+    role: str,
+    agent_name: AgentName,
+    agent_settings: AgentLLMSettings,
+    api_key: str,
+    api_base: str | None,
+) -> BaseChatModel:
+    cache_key = (
+        role,
+        agent_name,
+        agent_settings.provider,
+        agent_settings.model,
+        agent_settings.temperature,
+        agent_settings.reasoning_level,
+        agent_settings.timeout_seconds,
+        agent_settings.max_retries,
+        tuple(settings.resolve_openrouter_disallowed_providers()),
+        api_key,
+    )
+    return llm_registry.chat_model(
+        cache_key,
+        lambda: _create_chat_model(settings, agent_name, agent_settings, api_key, api_base),
+    )
+
 
+def _create_chat_model(
+    settings: Settings,
+    agent_name: AgentName,
+    agent_settings: AgentLLMSettings,
+    api_key: str,
+    api_base: str | None,
+) -> BaseChatModel:
     extra_kwargs = {}
     cost_callback = LangChainCostCallback(
         provider=agent_settings.provider,
@@ -85,10 +171,13 @@ def build_chat_model(settings: Settings, agent_name: AgentName) -> BaseChatModel
             **gemini_kwargs,
         )
 
+    http_client, http_async_client = llm_registry.http_clients(agent_settings.provider)
     return ChatOpenAI(
         model=agent_settings.model,
         api_key=SecretStr(api_key),
         base_url=api_base,
+        http_client=http_client,
+        http_async_client=http_async_client,
         temperature=agent_settings.temperature,
         timeout=agent_settings.timeout_seconds,
         max_retries=agent_settings.max_retries,
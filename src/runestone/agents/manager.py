@@ -5,7 +5,9 @@ Service layer for chat agent orchestration.
 import asyncio
 import json
 import logging
+import threading
 import time
+from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
@@ -13,16 +15,25 @@ from langchain_core.messages import ToolMessage
 from sqlalchemy.exc import SQLAlchemyError
 
 from runestone.agents.background_task_registry import BackgroundTaskRegistry
+from runestone.agents.chat_summarizer import ChatSummarizerAgent
 from runestone.agents.coordinator import CoordinatorAgent
+from runestone.agents.pre_router import PreTurnRouter
 from runestone.agents.schemas import (
     ChatMessage,
+    ClaimedPostTurnJob,
     CoordinatorPlan,
     LearningMemorySignal,
+    PostTurnJobPayload,
     RoutingItem,
     TeacherEmotion,
     TeacherSideEffect,
 )
-from runestone.agents.service_providers import provide_agent_side_effect_service
+from runestone.agents.service_providers import (
+    provide_agent_side_effect_service,
+    provide_chat_summary_service,
+    provide_memory_maintenance_lock,
+    provide_post_turn_job_service,
+)
 from runestone.agents.specialists.base import SpecialistContext, SpecialistResult
 from runestone.agents.specialists.learning_memory_keeper import LearningMemoryKeeperSpecialist
 from runestone.agents.specialists.memory_maintainer.specialist import CombinedMemoryMaintainerSpecialist
@@ -35,19 +46,38 @@ from runestone.agents.tools.utils import serialize_active_learning_focus
 from runestone.config import Settings
 from runestone.constants import MAX_TEACHER_GRAMMAR_SOURCE_LINKS
 from runestone.core.exceptions import RunestoneError
+from runestone.core.metrics import SPECIALIST_SECONDS, TURN_PHASE_SECONDS
 from runestone.core.observability import elapsed_ms_since
 from runestone.db.models import User
 from runestone.model_costs.tracking import CostTrackingHandle, suspend_model_cost_tracking, track_model_costs
 from runestone.rag.index import GrammarIndex
 from runestone.schemas.vocabulary_save import WordSaveCandidate
 from runestone.services.agent_side_effect_service import AgentSideEffectService
-from runestone.services.chat_session_learning_focus_service import ChatSessionLearningFocusService
+from runestone.services.chat_session_learning_focus_service import (
+    ChatSessionLearningFocusService,
+    LearningFocusSnapshot,
+)
 from runestone.services.grammar_service import GrammarService
+from runestone.services.learning_focus_cache import learning_focus_cache
 from runestone.services.memory_item_service import MemoryItemService
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class TeacherSpeculationStats:
+    """Running counters for speculative teacher generation."""
+
+    attempts: int = 0
+    hits: int = 0
+    saved_ms_total: int = 0
+    wasted_teacher_ms_total: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.attempts if self.attempts else 0.0
+
+
 class AgentsManager:
     """
     Service for managing chat agent interactions using specialist agents.
@@ -78,6 +108,17 @@ class AgentsManager:
         self.settings = settings
         self._init_allowed_ports()
         self.coordinator = CoordinatorAgent(settings=settings)
+        self.pre_router = (
+            PreTurnRouter(
+                mode=settings.coordinator_pre_router_mode,
+                confidence_threshold=settings.coordinator_pre_router_confidence,
+            )
+            if settings.coordinator_pre_router_mode in ("shadow", "active")
+            else None
+        )
+        self.teacher_speculative_enabled = settings.teacher_speculative_enabled
+        self.speculation_stats = TeacherSpeculationStats()
+        self._speculation_lock = threading.Lock()
         self.teacher = TeacherAgent(
             settings=settings,
             grammar_index=grammar_index,
@@ -90,13 +131,22 @@ class AgentsManager:
         self.registry.register(WordKeeperSpecialist(settings))
         self.memory_maintainer = CombinedMemoryMaintainerSpecialist(settings)
 
-        self._post_task_registry = BackgroundTaskRegistry(logger=logger, key_name="chat_id")
+        self.post_turn_queue_enabled = settings.post_turn_queue_enabled
+        self._post_task_registry = BackgroundTaskRegistry(logger=logger, key_name="chat_id", metrics_name="post_turn")
         self._post_task_cost_tracking: dict[str, CostTrackingHandle] = {}
         self._post_task_terminal_overrides: dict[asyncio.Task, str] = {}
         self._memory_maintenance_registry = BackgroundTaskRegistry(
             logger=logger,
             log_prefix="memory-maintenance",
             key_name="user_id",
+            metrics_name="memory_maintenance",
+        )
+        self.chat_summarizer = ChatSummarizerAgent(settings) if settings.chat_summary_enabled else None
+        self._chat_summary_registry = BackgroundTaskRegistry(
+            logger=logger,
+            log_prefix="chat-summary",
+            key_name="chat_id",
+            metrics_name="chat_summary",
         )
 
         logger.info(
@@ -154,10 +204,15 @@ class AgentsManager:
         side_effect_service: AgentSideEffectService,
         chat_session_learning_focus_service: ChatSessionLearningFocusService,
         current_recall_words: list[str] | None = None,
+        learning_focus: LearningFocusSnapshot | None = None,
+        recent_side_effects: list[TeacherSideEffect] | None = None,
     ) -> tuple[CoordinatorPlan, list[dict], str, str, list[TeacherSideEffect], list[str]]:
         """
         Run pre-stage: coordinator planning, pre specialists, side effect loading.
 
+        `learning_focus` and `recent_side_effects` come from a preloaded turn context
+        and replace the corresponding reads.
+
         Returns:
             (
                 plan,
@@ -168,9 +223,48 @@ class AgentsManager:
                 current_recall_words,
             )
         """
-        active_learning_focus_memory = ""
-        personal_info_summary = ""
         current_recall_words = current_recall_words or []
+        active_learning_focus_memory, personal_info_summary = await self.load_teacher_context(
+            chat_id=chat_id,
+            history=history,
+            user=user,
+            memory_item_service=memory_item_service,
+            chat_session_learning_focus_service=chat_session_learning_focus_service,
+            learning_focus=learning_focus,
+        )
+        plan = await self.plan_pre_turn(message=message, history=history, user=user)
+        pre_results = await self._run_pre_specialists(plan, message=message, history=history, user=user)
+        if recent_side_effects is None:
+            recent_side_effects = await side_effect_service.load_recent_for_teacher(
+                user_id=user.id,
+                chat_id=chat_id,
+            )
+
+        return (
+            plan,
+            pre_results,
+            active_learning_focus_memory,
+            personal_info_summary,
+            recent_side_effects,
+            current_recall_words,
+        )
+
+    async def load_teacher_context(
+        self,
+        chat_id: str,
+        history: list[ChatMessage],
+        user: User,
+        memory_item_service: MemoryItemService,
+        chat_session_learning_focus_service: ChatSessionLearningFocusService,
+        learning_focus: LearningFocusSnapshot | None = None,
+    ) -> tuple[str, str]:
+        """
+        Load the per-user teacher context that does not depend on coordinator routing.
+
+        Returns:
+            (active_learning_focus_memory, personal_info_summary)
+        """
+        active_learning_focus_memory = ""
         if not history:
             try:
                 deleted_count = await memory_item_service.cleanup_old_mastered_areas(
@@ -186,11 +280,20 @@ class AgentsManager:
             except (SQLAlchemyError, ValueError, RuntimeError) as e:
                 logger.warning("old mastered memory cleanup failed user_id=%s error=%s", user.id, e)
 
+        cache_enabled = self.settings.learning_focus_cache_enabled
+        if cache_enabled:
+            cached_focus = learning_focus_cache.get(user.id, chat_id)
+            if cached_focus is not None:
+                return cached_focus, self._personal_info_summary(user)
+            cache_version = learning_focus_cache.version(user.id)
+
         try:
+            focus_kwargs = {"snapshot": learning_focus} if learning_focus is not None else {}
             starter_items, was_reseeded = await chat_session_learning_focus_service.get_chat_session_learning_focus(
                 user_id=user.id,
                 chat_id=chat_id,
                 area_limit=self.STARTER_MEMORY_AREA_LIMIT,
+                **focus_kwargs,
             )
             if was_reseeded:
                 active_learning_focus_memory = "\n".join(
@@ -207,11 +310,22 @@ class AgentsManager:
                     if active_learning_focus_memory
                     else serialized_items
                 )
+            # A reseed note belongs to one turn only; the next turn loads and caches the plain bundle.
+            if cache_enabled and not was_reseeded:
+                learning_focus_cache.put(user.id, chat_id, active_learning_focus_memory, version=cache_version)
         except (SQLAlchemyError, ValueError, RuntimeError) as e:
             logger.warning("active learning focus memory load failed user_id=%s error=%s", user.id, e)
 
+        return active_learning_focus_memory, self._personal_info_summary(user)
+
+    @staticmethod
+    def _personal_info_summary(user: User) -> str:
         raw_personal_info_summary = getattr(user, "personal_info_summary", None)
-        personal_info_summary = raw_personal_info_summary if isinstance(raw_personal_info_summary, str) else ""
+        return raw_personal_info_summary if isinstance(raw_personal_info_summary, str) else ""
+
+    @TURN_PHASE_SECONDS.time(phase="coordinator")
+    async def plan_pre_turn(self, message: str, history: list[ChatMessage], user: User) -> CoordinatorPlan:
+        """Return the pre-response routing plan, from the local pre-router or the coordinator."""
         coordinator_history = history[-self.COORDINATOR_MAX_HISTORY_MESSAGES :] if history else []
         if history and len(history) > self.COORDINATOR_MAX_HISTORY_MESSAGES:
             logger.warning(
@@ -220,18 +334,30 @@ class AgentsManager:
                 len(coordinator_history),
             )
         plan: CoordinatorPlan | None = None
-        try:
-            plan = await self.coordinator.plan_pre_turn(
-                message=message,
-                history=coordinator_history,
-                available_specialists=[
-                    name
-                    for name in self.registry.list_names()
-                    if name not in {"teacher", "learning_memory_keeper", "personal_memory_keeper"}
-                ],
+        pre_route = self.pre_router.decide(message, history) if self.pre_router is not None else None
+        if self.pre_router is not None and self.pre_router.active and pre_route and pre_route.skip_coordinator:
+            plan = self.pre_router.skip_plan(pre_route)
+            logger.info(
+                "pre-router skipped coordinator user_id=%s reason=%s confidence=%.2f",
+                user.id,
+                pre_route.reason,
+                pre_route.confidence,
             )
-        except (RunestoneError, ValueError, RuntimeError) as e:
-            logger.error("coordinator failed, falling back to teacher only: %s", e)
+        else:
+            try:
+                plan = await self.coordinator.plan_pre_turn(
+                    message=message,
+                    history=coordinator_history,
+                    available_specialists=[
+                        name
+                        for name in self.registry.list_names()
+                        if name not in {"teacher", "learning_memory_keeper", "personal_memory_keeper"}
+                    ],
+                )
+            except (RunestoneError, ValueError, RuntimeError) as e:
+                logger.error("coordinator failed, falling back to teacher only: %s", e)
+            if self.pre_router is not None and pre_route is not None and plan is not None:
+                self.pre_router.record_shadow(pre_route, plan, user_id=user.id)
 
         if plan is None:
             plan = CoordinatorPlan(
@@ -244,27 +370,9 @@ class AgentsManager:
             user.id,
             ",".join([item.name for item in plan.pre_response]) if plan.pre_response else "none",
         )
+        return plan
 
-        pre_results = await self._run_specialists(
-            plan.pre_response,
-            message=message,
-            history=history,
-            user=user,
-        )
-        recent_side_effects = await side_effect_service.load_recent_for_teacher(
-            user_id=user.id,
-            chat_id=chat_id,
-        )
-
-        return (
-            plan,
-            pre_results,
-            active_learning_focus_memory,
-            personal_info_summary,
-            recent_side_effects,
-            current_recall_words,
-        )
-
+    @TURN_PHASE_SECONDS.time(phase="teacher")
     async def generate_teacher_response(
         self,
         message: str,
@@ -275,6 +383,7 @@ class AgentsManager:
         personal_info_summary: str = "",
         recent_side_effects: list[TeacherSideEffect] | None = None,
         current_recall_words: list[str] | None = None,
+        chat_summary: str = "",
     ) -> tuple[
         str,
         Optional[list[dict[str, str]]],
@@ -295,6 +404,7 @@ class AgentsManager:
                 personal_info_summary=personal_info_summary,
                 recent_side_effects=recent_side_effects,
                 current_recall_words=current_recall_words or [],
+                chat_summary=chat_summary,
             )
         except (RunestoneError, ValueError, RuntimeError) as e:
             logger.error("teacher response generation failed: %s", e)
@@ -325,14 +435,18 @@ class AgentsManager:
         chat_session_learning_focus_service: ChatSessionLearningFocusService,
         cost_tracking: CostTrackingHandle,
         current_recall_words: list[str] | None = None,
+        chat_summary: str = "",
+        learning_focus: LearningFocusSnapshot | None = None,
+        recent_side_effects: list[TeacherSideEffect] | None = None,
     ) -> tuple[str, Optional[list[dict[str, str]]], TeacherEmotion]:
         """
         Run the agent-owned portion of a prepared chat turn.
 
         The caller is responsible for message/session persistence before this call:
         - user message already saved when applicable
-        - history already loaded
+        - history already loaded (only messages newer than ``chat_summary`` when one is given)
         - user already resolved
+        - optionally, ``learning_focus`` and ``recent_side_effects`` preloaded with the history
 
         The caller also remains responsible for chat delivery concerns after this call:
         - persisting the assistant message
@@ -348,27 +462,43 @@ class AgentsManager:
                 side_effect_service=side_effect_service,
             )
 
-        prepared = await self.prepare_pre_turn(
-            message=message,
-            chat_id=chat_id,
-            history=history,
-            user=user,
-            memory_item_service=memory_item_service,
-            chat_session_learning_focus_service=chat_session_learning_focus_service,
-            side_effect_service=side_effect_service,
-            current_recall_words=current_recall_words,
-        )
-        (
-            _plan,
-            pre_results,
-            active_learning_focus_memory,
-            personal_info_summary,
-            recent_side_effects,
-            current_recall_words,
-        ) = prepared
+        if self.teacher_speculative_enabled:
+            teacher_output, pre_results = await self._run_pre_turn_speculatively(
+                message=message,
+                chat_id=chat_id,
+                history=history,
+                user=user,
+                memory_item_service=memory_item_service,
+                side_effect_service=side_effect_service,
+                chat_session_learning_focus_service=chat_session_learning_focus_service,
+                current_recall_words=current_recall_words or [],
+                chat_summary=chat_summary,
+                learning_focus=learning_focus,
+                recent_side_effects=recent_side_effects,
+            )
+        else:
+            prepared = await self.prepare_pre_turn(
+                message=message,
+                chat_id=chat_id,
+                history=history,
+                user=user,
+                memory_item_service=memory_item_service,
+                chat_session_learning_focus_service=chat_session_learning_focus_service,
+                side_effect_service=side_effect_service,
+                current_recall_words=current_recall_words,
+                learning_focus=learning_focus,
+                recent_side_effects=recent_side_effects,
+            )
+            (
+                _plan,
+                pre_results,
+                active_learning_focus_memory,
+                personal_info_summary,
+                recent_side_effects,
+                current_recall_words,
+            ) = prepared
 
-        assistant_text, sources, teacher_emotion, vocabulary_candidates, learning_memory_signals = (
-            await self.generate_teacher_response(
+            teacher_output = await self.generate_teacher_response(
                 message=message,
                 history=history,
                 user=user,
@@ -377,8 +507,9 @@ class AgentsManager:
                 personal_info_summary=personal_info_summary,
                 recent_side_effects=recent_side_effects,
                 current_recall_words=current_recall_words,
+                chat_summary=chat_summary,
             )
-        )
+        assistant_text, sources, teacher_emotion, vocabulary_candidates, learning_memory_signals = teacher_output
 
         coordinator_row_id = await side_effect_service.create_post_coordinator_row(
             user_id=user.id,
@@ -400,6 +531,122 @@ class AgentsManager:
 
         return assistant_text, sources, teacher_emotion
 
+    async def _run_pre_turn_speculatively(
+        self,
+        message: str,
+        chat_id: str,
+        history: list[ChatMessage],
+        user: User,
+        memory_item_service: MemoryItemService,
+        side_effect_service: AgentSideEffectService,
+        chat_session_learning_focus_service: ChatSessionLearningFocusService,
+        current_recall_words: list[str],
+        chat_summary: str = "",
+        learning_focus: LearningFocusSnapshot | None = None,
+        recent_side_effects: list[TeacherSideEffect] | None = None,
+    ):
+        """
+        Start the teacher without pre results while the coordinator plans the turn.
+
+        Most turns need no pre-response specialist, so the speculative teacher output
+        is kept whenever the plan comes back empty. Otherwise the speculative run is
+        cancelled and the teacher is re-run with the specialist results.
+
+        Returns:
+            (teacher_output, pre_results)
+        """
+        active_learning_focus_memory, personal_info_summary = await self.load_teacher_context(
+            chat_id=chat_id,
+            history=history,
+            user=user,
+            memory_item_service=memory_item_service,
+            chat_session_learning_focus_service=chat_session_learning_focus_service,
+            learning_focus=learning_focus,
+        )
+        if recent_side_effects is None:
+            recent_side_effects = await side_effect_service.load_recent_for_teacher(
+                user_id=user.id,
+                chat_id=chat_id,
+            )
+
+        async def _generate(pre_results: list[dict]):
+            return await self.generate_teacher_response(
+                message=message,
+                history=history,
+                user=user,
+                pre_results=pre_results,
+                active_learning_focus_memory=active_learning_focus_memory,
+                personal_info_summary=personal_info_summary,
+                recent_side_effects=recent_side_effects,
+                current_recall_words=current_recall_words,
+                chat_summary=chat_summary,
+            )
+
+        started = time.monotonic()
+        speculative_task = asyncio.create_task(_generate([]))
+        try:
+            plan = await self.plan_pre_turn(message=message, history=history, user=user)
+            coordinator_ms = elapsed_ms_since(started)
+            if not plan.pre_response:
+                teacher_output = await speculative_task
+                teacher_ms = elapsed_ms_since(started)
+                self._record_speculation(
+                    user_id=user.id,
+                    hit=True,
+                    coordinator_ms=coordinator_ms,
+                    teacher_ms=teacher_ms,
+                    saved_ms=min(coordinator_ms, teacher_ms),
+                )
+                return teacher_output, []
+
+            speculative_task.cancel()
+            await asyncio.gather(speculative_task, return_exceptions=True)
+            self._record_speculation(
+                user_id=user.id,
+                hit=False,
+                coordinator_ms=coordinator_ms,
+                teacher_ms=coordinator_ms,
+                saved_ms=0,
+            )
+        finally:
+            if not speculative_task.done():
+                speculative_task.cancel()
+
+        pre_results = await self._run_pre_specialists(plan, message=message, history=history, user=user)
+        return await _generate(pre_results), pre_results
+
+    def _record_speculation(
+        self,
+        *,
+        user_id: int,
+        hit: bool,
+        coordinator_ms: int,
+        teacher_ms: int,
+        saved_ms: int,
+    ) -> None:
+        with self._speculation_lock:
+            stats = self.speculation_stats
+            stats.attempts += 1
+            if hit:
+                stats.hits += 1
+                stats.saved_ms_total += saved_ms
+            else:
+                stats.wasted_teacher_ms_total += teacher_ms
+            hit_rate = stats.hit_rate
+            saved_ms_total = stats.saved_ms_total
+        logger.info(
+            "teacher speculation user_id=%s outcome=%s coordinator_ms=%s teacher_ms=%s saved_ms=%s "
+            "hit_rate=%.3f saved_ms_total=%s",
+            user_id,
+            "hit" if hit else "miss",
+            coordinator_ms,
+            teacher_ms,
+            saved_ms,
+            hit_rate,
+            saved_ms_total,
+        )
+
+    @TURN_PHASE_SECONDS.time(phase="post_turn")
     async def run_post_turn(
         self,
         message: str,
@@ -649,6 +896,7 @@ class AgentsManager:
         chat_id: str,
         cost_tracking: CostTrackingHandle,
         grace_seconds: float = 1.0,
+        user_id: int | None = None,
     ) -> None:
         """Cancel a started post-turn task and bound foreground-failure latency."""
         await self._cancel_post_task_with_grace(
@@ -657,6 +905,8 @@ class AgentsManager:
             grace_seconds=grace_seconds,
             expected_cost_tracking=cost_tracking,
         )
+        if self.post_turn_queue_enabled and user_id is not None:
+            await self._cancel_queued_post_turn_jobs(user_id=user_id, chat_id=chat_id, status="cancelled")
 
     async def start_background_memory_maintenance(self, user: User) -> bool:
         """
@@ -676,7 +926,7 @@ class AgentsManager:
 
         async def _run() -> None:
             try:
-                async with track_model_costs("memory_maintenance"):
+                async with track_model_costs("memory_maintenance", user_id=user.id):
                     result = await asyncio.wait_for(
                         self.run_memory_maintenance(user),
                         timeout=self.settings.memory_maintenance_timeout_seconds,
@@ -725,14 +975,87 @@ class AgentsManager:
         return True
 
     async def run_memory_maintenance(self, user: User) -> SpecialistResult:
-        """Run the memory maintainer directly for chat-reset startup hygiene."""
-        return await self.memory_maintainer.run_for_user(user)
+        """
+        Run the memory maintainer directly for chat-reset startup hygiene.
+
+        The run holds the user's maintenance lock so it never overlaps a scheduled
+        sweep; when the sweep already holds it, nothing runs.
+        """
+        async with provide_memory_maintenance_lock(user.id) as locked:
+            if not locked:
+                logger.info("memory maintenance skipped; scheduled run in progress user_id=%s", user.id)
+                return SpecialistResult(
+                    status="no_action",
+                    actions=[],
+                    info_for_teacher="",
+                    artifacts={"skipped_reason": "already_running"},
+                )
+            return await self.memory_maintainer.run_for_user(user)
 
     def is_memory_maintenance_running(self, user_id: int) -> bool:
         """Check if a memory maintenance task is currently active for the user."""
         task = self._memory_maintenance_registry.tasks.get(str(user_id))
         return task is not None and not task.done()
 
+    def start_background_chat_summary(self, user_id: int, chat_id: str) -> bool:
+        """
+        Schedule a rolling-summary refresh for the chat after a turn.
+
+        Only one refresh per chat may be active at a time; later turns are
+        picked up by the next refresh since the summary only ever advances.
+        """
+        if self.chat_summarizer is None:
+            return False
+        existing_task = self._chat_summary_registry.tasks.get(chat_id)
+        if existing_task and not existing_task.done():
+            return False
+
+        async def _run() -> None:
+            try:
+                async with track_model_costs("chat_summary", user_id=user_id):
+                    await self.refresh_chat_summary(user_id=user_id, chat_id=chat_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.error("chat summary refresh failed user_id=%s chat_id=%s", user_id, chat_id, exc_info=True)
+            finally:
+                self._chat_summary_registry.unregister(chat_id)
+
+        with suspend_model_cost_tracking():
+            task = asyncio.create_task(_run())
+        self._chat_summary_registry.register(chat_id, task)
+        return True
+
+    async def refresh_chat_summary(self, user_id: int, chat_id: str) -> bool:
+        """Fold pending messages older than the live window into the chat summary."""
+        if self.chat_summarizer is None:
+            return False
+        async with provide_chat_summary_service() as summary_service:
+            batch = await summary_service.load_refresh_batch(
+                user_id,
+                chat_id,
+                live_window=self.settings.chat_summary_live_window_messages,
+                min_messages=self.settings.chat_summary_batch_messages,
+            )
+        if batch is None:
+            return False
+
+        summary = await self.chat_summarizer.summarize(batch.summary, batch.messages)
+        if summary is None:
+            return False
+
+        async with provide_chat_summary_service() as summary_service:
+            saved = await summary_service.save_summary(user_id, chat_id, summary, batch.messages[-1].id)
+        logger.info(
+            "chat summary refreshed user_id=%s chat_id=%s folded=%s last_message_id=%s saved=%s",
+            user_id,
+            chat_id,
+            len(batch.messages),
+            batch.messages[-1].id,
+            saved,
+        )
+        return saved
+
     async def start_background_post_turn(
         self,
         message: str,
@@ -748,10 +1071,34 @@ class AgentsManager:
     ) -> None:
         """
         Run post-turn work in the pre-registered cost child and track its task.
+
+        With the post-turn queue enabled the work is handed to a worker process
+        instead; the in-process task remains the fallback when enqueueing fails.
         """
 
         await self._cancel_post_task_with_grace(chat_id, terminal_status="stale_replaced")
 
+        if self.post_turn_queue_enabled:
+            job_id = await self._enqueue_post_turn_job(
+                user_id=user.id,
+                chat_id=chat_id,
+                coordinator_row_id=coordinator_row_id,
+                payload=PostTurnJobPayload(
+                    message=message,
+                    history=history,
+                    teacher_response=teacher_response,
+                    vocabulary_candidates=vocabulary_candidates or [],
+                    learning_memory_signals=learning_memory_signals or [],
+                    pre_results=pre_results,
+                ),
+            )
+            if job_id is not None:
+                # The worker records the paid work under its own cost scope.
+                cost_tracking.finish("deferred_to_worker")
+                logger.info("post task queued chat_id=%s job_id=%s", chat_id, job_id)
+                return
+            logger.warning("post task queue unavailable; running in-process chat_id=%s", chat_id)
+
         async def _run():
             terminal_status = "completed"
             try:
@@ -843,6 +1190,8 @@ class AgentsManager:
         )
 
         await self._cancel_post_task_with_grace(chat_id, terminal_status="stale_replaced")
+        if self.post_turn_queue_enabled:
+            await self._cancel_queued_post_turn_jobs(user_id=user_id, chat_id=chat_id, status="stale_replaced")
 
         try:
             await side_effect_service.mark_coordinator_failed_if_current(
@@ -857,10 +1206,100 @@ class AgentsManager:
                 exc_info=True,
             )
 
+    async def run_post_turn_job(self, job: ClaimedPostTurnJob, user: User) -> str:
+        """
+        Run one queued post-turn job inside a post-turn worker process.
+
+        Returns the terminal job status. Cancellation (a newer turn superseded the
+        job) marks the coordinator row failed if it is still current and re-raises.
+        """
+        payload = job.payload
+        async with provide_agent_side_effect_service() as side_effect_service:
+            try:
+                return await asyncio.wait_for(
+                    self.run_post_turn(
+                        message=payload.message,
+                        chat_id=job.chat_id,
+                        history=payload.history,
+                        user=user,
+                        teacher_response=payload.teacher_response,
+                        vocabulary_candidates=payload.vocabulary_candidates,
+                        learning_memory_signals=payload.learning_memory_signals,
+                        pre_results=payload.pre_results,
+                        side_effect_service=side_effect_service,
+                        coordinator_row_id=job.coordinator_row_id,
+                    ),
+                    timeout=self.POST_TASK_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    "post job timed out timeout_s=%s chat_id=%s job_id=%s",
+                    self.POST_TASK_TIMEOUT_SECONDS,
+                    job.chat_id,
+                    job.id,
+                )
+                await side_effect_service.mark_coordinator_failed_if_current(
+                    row_id=job.coordinator_row_id,
+                    user_id=user.id,
+                    chat_id=job.chat_id,
+                )
+                return "timed_out"
+            except asyncio.CancelledError:
+                logger.info("post job cancelled chat_id=%s job_id=%s", job.chat_id, job.id)
+                await side_effect_service.mark_coordinator_failed_if_current(
+                    row_id=job.coordinator_row_id,
+                    user_id=user.id,
+                    chat_id=job.chat_id,
+                )
+                raise
+            except Exception:
+                logger.error("post job failed chat_id=%s job_id=%s", job.chat_id, job.id, exc_info=True)
+                return "failed"
+
+    async def _enqueue_post_turn_job(
+        self,
+        *,
+        user_id: int,
+        chat_id: str,
+        coordinator_row_id: int,
+        payload: PostTurnJobPayload,
+    ) -> int | None:
+        try:
+            async with provide_post_turn_job_service() as job_service:
+                return await job_service.enqueue(
+                    user_id=user_id,
+                    chat_id=chat_id,
+                    coordinator_row_id=coordinator_row_id,
+                    payload=payload,
+                )
+        except (SQLAlchemyError, OSError):
+            logger.warning("post job enqueue failed chat_id=%s", chat_id, exc_info=True)
+            return None
+
+    async def _cancel_queued_post_turn_jobs(self, *, user_id: int, chat_id: str, status: str) -> None:
+        try:
+            async with provide_post_turn_job_service() as job_service:
+                await job_service.cancel_for_chat(user_id=user_id, chat_id=chat_id, status=status)
+        except (SQLAlchemyError, OSError):
+            logger.warning("post job cancellation failed chat_id=%s", chat_id, exc_info=True)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _run_pre_specialists(
+        self,
+        plan: CoordinatorPlan,
+        *,
+        message: str,
+        history: list[ChatMessage],
+        user: User,
+    ) -> list[dict]:
+        if not plan.pre_response:
+            return []
+        with TURN_PHASE_SECONDS.time(phase="pre_specialists"):
+            return await self._run_specialists(plan.pre_response, message=message, history=history, user=user)
+
     async def _run_specialists(
         self,
         routing_items: list[RoutingItem],
@@ -908,6 +1347,7 @@ class AgentsManager:
             try:
                 result = await specialist.run(context)
                 latency_ms = elapsed_ms_since(started)
+                SPECIALIST_SECONDS.observe(latency_ms / 1000, specialist=item.name, status=result.status)
                 logger.info(
                     "specialist=%s status=%s latency_ms=%s",
                     item.name,
@@ -928,6 +1368,7 @@ class AgentsManager:
                 }
             except Exception:
                 latency_ms = elapsed_ms_since(started)
+                SPECIALIST_SECONDS.observe(latency_ms / 1000, specialist=item.name, status="error")
                 logger.warning("specialist failed name=%s", item.name, exc_info=True)
                 return {
                     "name": item.name,
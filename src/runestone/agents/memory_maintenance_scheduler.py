@@ -0,0 +1,209 @@
+"""
+Fleet-wide memory maintenance sweeps run by the memory-maintenance worker.
+
+A sweep picks active users whose maintained memory (area_to_improve and
+personal_info items) grew the most since their last completed run, maintains
+them a few at a time, and records one `memory_maintenance_runs` row per user.
+Each run holds the user's maintenance advisory lock, shared with chat-reset
+maintenance; users whose lock is already held are skipped and not recorded.
+Runs stop being started once the known model cost of the sweep reaches its
+budget; runs already in flight finish, so a sweep may overshoot the budget by
+at most `concurrency - 1` runs.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from runestone.agents.service_providers import (
+    provide_memory_maintenance_lock,
+    provide_memory_maintenance_run_service,
+    provide_user_service,
+)
+from runestone.agents.specialists.memory_maintainer.specialist import CombinedMemoryMaintainerSpecialist
+from runestone.config import Settings
+from runestone.model_costs.tracking import current_known_cost_usd, track_model_costs
+from runestone.services.memory_maintenance_run_service import MaintenanceCandidate, MaintenanceOutcome
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SweepReport:
+    """What one sweep did: the users it maintained, the ones it skipped, and the known spend."""
+
+    candidate_count: int = 0
+    outcomes: list[MaintenanceOutcome] = field(default_factory=list)
+    skipped_for_budget: list[int] = field(default_factory=list)
+    skipped_in_progress: list[int] = field(default_factory=list)
+    known_cost_usd: Decimal = Decimal("0")
+
+
+class MemoryMaintenanceSweep:
+    """Maintain the users that need it most, with bounded concurrency and a per-sweep cost budget."""
+
+    def __init__(
+        self,
+        maintainer: CombinedMemoryMaintainerSpecialist,
+        *,
+        min_growth: int = 5,
+        max_users: int = 200,
+        concurrency: int = 2,
+        budget_usd: Decimal | None = None,
+        timeout_seconds: float = 240.0,
+    ):
+        """
+        Initialize the sweep.
+
+        Args:
+            maintainer: Combined maintainer run for each selected user
+            min_growth: Items created or updated since the last completed run needed to select a user
+            max_users: Maximum number of users maintained per sweep
+            concurrency: Maximum number of users maintained at once
+            budget_usd: Known model cost after which no further runs start; None disables the budget
+            timeout_seconds: Time limit for one user's run
+        """
+        self.maintainer = maintainer
+        self.min_growth = min_growth
+        self.max_users = max_users
+        self.concurrency = concurrency
+        self.budget_usd = budget_usd
+        self.timeout_seconds = timeout_seconds
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "MemoryMaintenanceSweep":
+        """Build a sweep configured by the `memory_maintenance_schedule_*` settings."""
+        budget = settings.memory_maintenance_schedule_budget_usd
+        return cls(
+            CombinedMemoryMaintainerSpecialist(settings),
+            min_growth=settings.memory_maintenance_schedule_min_growth,
+            max_users=settings.memory_maintenance_schedule_max_users,
+            concurrency=settings.memory_maintenance_schedule_concurrency,
+            budget_usd=Decimal(str(budget)) if budget > 0 else None,
+            timeout_seconds=settings.memory_maintenance_timeout_seconds,
+        )
+
+    async def run(self) -> SweepReport:
+        """Maintain due users in order of item growth and record each outcome."""
+        async with provide_memory_maintenance_run_service() as run_service:
+            candidates = await run_service.list_candidates(min_growth=self.min_growth, limit=self.max_users)
+        report = SweepReport(candidate_count=len(candidates))
+        logger.info(
+            "[agents:memorymaintainer] scheduled sweep started candidates=%s concurrency=%s budget_usd=%s",
+            len(candidates),
+            self.concurrency,
+            self.budget_usd,
+        )
+        # asyncio.Semaphore wakes waiters in FIFO order, so runs start in growth order.
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _maintain_within_budget(candidate: MaintenanceCandidate) -> None:
+            async with semaphore:
+                if self.budget_usd is not None and report.known_cost_usd >= self.budget_usd:
+                    report.skipped_for_budget.append(candidate.user_id)
+                    return
+                outcome = await self.maintain(candidate)
+                if outcome is None:
+                    report.skipped_in_progress.append(candidate.user_id)
+                    return
+                report.outcomes.append(outcome)
+                report.known_cost_usd += outcome.known_cost_usd or Decimal("0")
+                await self._record(outcome)
+
+        await asyncio.gather(*(_maintain_within_budget(candidate) for candidate in candidates))
+        logger.info(
+            "[agents:memorymaintainer] scheduled sweep finished maintained=%s skipped_for_budget=%s "
+            "skipped_in_progress=%s known_cost_usd=%s",
+            len(report.outcomes),
+            len(report.skipped_for_budget),
+            len(report.skipped_in_progress),
+            report.known_cost_usd,
+        )
+        return report
+
+    async def maintain(self, candidate: MaintenanceCandidate) -> MaintenanceOutcome | None:
+        """
+        Run both maintenance domains for one user and describe how it went.
+
+        Returns None without running when another maintenance run holds the user's lock.
+        """
+        async with provide_memory_maintenance_lock(candidate.user_id) as locked:
+            if not locked:
+                logger.info(
+                    "[agents:memorymaintainer] scheduled maintenance skipped; already running user_id=%s",
+                    candidate.user_id,
+                )
+                return None
+            return await self._maintain_locked(candidate)
+
+    async def _maintain_locked(self, candidate: MaintenanceCandidate) -> MaintenanceOutcome:
+        started_at = datetime.now(timezone.utc)
+        async with provide_user_service() as user_service:
+            user = await user_service.get_user_by_id(candidate.user_id)
+        if user is None:
+            return self._outcome(candidate, "user_not_found", started_at)
+
+        known_cost_usd: Decimal | None = None
+        try:
+            async with track_model_costs("memory_maintenance", user_id=candidate.user_id):
+                try:
+                    result = await asyncio.wait_for(
+                        self.maintainer.run_for_user(user, trigger_source="scheduled"),
+                        timeout=self.timeout_seconds,
+                    )
+                finally:
+                    known_cost_usd = current_known_cost_usd()
+        except asyncio.TimeoutError:
+            logger.error(
+                "[agents:memorymaintainer] scheduled maintenance timed out timeout_s=%s user_id=%s",
+                self.timeout_seconds,
+                candidate.user_id,
+            )
+            return self._outcome(candidate, "timed_out", started_at, known_cost_usd=known_cost_usd)
+        except Exception as exc:
+            logger.error(
+                "[agents:memorymaintainer] scheduled maintenance failed user_id=%s",
+                candidate.user_id,
+                exc_info=True,
+            )
+            return self._outcome(candidate, "failed", started_at, known_cost_usd=known_cost_usd, summary=str(exc))
+
+        summary = result.artifacts.get("summary") if isinstance(result.artifacts, dict) else None
+        return self._outcome(candidate, result.status, started_at, known_cost_usd=known_cost_usd, summary=summary)
+
+    async def _record(self, outcome: MaintenanceOutcome) -> None:
+        try:
+            async with provide_memory_maintenance_run_service() as run_service:
+                await run_service.record(outcome)
+        except Exception as exc:
+            logger.warning(
+                "[agents:memorymaintainer] Failed to record scheduled run user_id=%s: %s", outcome.user_id, exc
+            )
+
+    @staticmethod
+    def _outcome(
+        candidate: MaintenanceCandidate,
+        status: str,
+        started_at: datetime,
+        *,
+        known_cost_usd: Decimal | None = None,
+        summary: str | None = None,
+    ) -> MaintenanceOutcome:
+        logger.info(
+            "[agents:memorymaintainer] scheduled maintenance finished user_id=%s status=%s growth=%s known_cost_usd=%s",
+            candidate.user_id,
+            status,
+            candidate.item_growth,
+            known_cost_usd,
+        )
+        return MaintenanceOutcome(
+            user_id=candidate.user_id,
+            status=status,
+            item_growth=candidate.item_growth,
+            started_at=started_at,
+            finished_at=datetime.now(timezone.utc),
+            known_cost_usd=known_cost_usd,
+            summary=summary,
+        )
@@ -0,0 +1,161 @@
+"""
+Worker loop that executes queued post-turn jobs outside the web process.
+
+Any number of worker processes may poll the same `post_turn_jobs` table:
+claims use `FOR UPDATE SKIP LOCKED`, so each job runs on exactly one worker.
+Per-chat "latest row wins" semantics are preserved twice over: a newer turn
+flags older jobs as `stale_replaced` (running workers observe it on their next
+heartbeat and cancel), and post-turn persistence still only succeeds for the
+latest coordinator row in `agent_side_effects`.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+
+from runestone.agents.manager import AgentsManager
+from runestone.agents.schemas import ClaimedPostTurnJob
+from runestone.agents.service_providers import provide_post_turn_job_service, provide_user_service
+from runestone.model_costs.tracking import track_model_costs
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """Return an id unique to this process across hosts."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class PostTurnWorker:
+    """Claim and run queued post-turn jobs with bounded concurrency."""
+
+    def __init__(
+        self,
+        manager: AgentsManager,
+        *,
+        worker_id: str | None = None,
+        concurrency: int = 4,
+        poll_interval_seconds: float = 1.0,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 2,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            manager: Agents manager used to run the post-turn stage
+            worker_id: Lock owner recorded on claimed jobs
+            concurrency: Maximum number of jobs run at once by this process
+            poll_interval_seconds: Delay between claims when the queue is idle
+            lease_seconds: Time after which a job without heartbeats is reclaimable
+            max_attempts: Claims allowed per job before an expired lease fails it
+        """
+        self.manager = manager
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def heartbeat_interval_seconds(self) -> float:
+        return self.lease_seconds / 3
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """Poll until shutdown, then wait for in-flight jobs to finish."""
+        logger.info(
+            "[agents:post-task] Post-turn worker started worker_id=%s concurrency=%s",
+            self.worker_id,
+            self.concurrency,
+        )
+        while not shutdown_event.is_set():
+            claimed = 0
+            try:
+                await self.release_expired()
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("[agents:post-task] Post-turn worker poll failed worker_id=%s", self.worker_id)
+            if claimed:
+                continue
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+        if self._tasks:
+            logger.info("[agents:post-task] Waiting for %s in-flight post-turn jobs", len(self._tasks))
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("[agents:post-task] Post-turn worker stopped worker_id=%s", self.worker_id)
+
+    async def run_once(self) -> int:
+        """Claim as many jobs as there are free slots and start them. Returns the number claimed."""
+        free_slots = self.concurrency - len(self._tasks)
+        if free_slots <= 0:
+            if self._tasks:
+                await asyncio.wait(set(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+            return 0
+        async with provide_post_turn_job_service() as job_service:
+            jobs = await job_service.claim(worker_id=self.worker_id, limit=free_slots)
+        for job in jobs:
+            task = asyncio.create_task(self.execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return len(jobs)
+
+    async def release_expired(self) -> int:
+        """Requeue jobs abandoned by crashed workers."""
+        async with provide_post_turn_job_service() as job_service:
+            return await job_service.release_expired(
+                lease_seconds=self.lease_seconds,
+                max_attempts=self.max_attempts,
+            )
+
+    async def execute(self, job: ClaimedPostTurnJob) -> str:
+        """Run one claimed job, cancelling it if a newer turn supersedes it, and record its status."""
+        async with provide_user_service() as user_service:
+            user = await user_service.get_user_by_id(job.user_id)
+        if user is None:
+            return await self._finish(job, "failed", error="user not found")
+
+        async with track_model_costs("post_turn", user_id=job.user_id):
+            run_task = asyncio.create_task(self.manager.run_post_turn_job(job, user))
+            status = await self._supervise(job, run_task)
+        return await self._finish(job, status)
+
+    async def _supervise(self, job: ClaimedPostTurnJob, run_task: asyncio.Task) -> str:
+        while True:
+            done, _pending = await asyncio.wait({run_task}, timeout=self.heartbeat_interval_seconds)
+            if done:
+                try:
+                    return run_task.result()
+                except asyncio.CancelledError:
+                    return "cancelled"
+                except Exception:
+                    logger.exception("[agents:post-task] Post-turn job crashed job_id=%s", job.id)
+                    return "failed"
+            async with provide_post_turn_job_service() as job_service:
+                current_status = await job_service.heartbeat(job.id, self.worker_id)
+            if current_status != "running":
+                logger.info(
+                    "[agents:post-task] Post-turn job superseded job_id=%s chat_id=%s status=%s",
+                    job.id,
+                    job.chat_id,
+                    current_status,
+                )
+                run_task.cancel()
+                await asyncio.gather(run_task, return_exceptions=True)
+                return current_status or "cancelled"
+
+    async def _finish(self, job: ClaimedPostTurnJob, status: str, error: str | None = None) -> str:
+        async with provide_post_turn_job_service() as job_service:
+            recorded = await job_service.finish(job.id, self.worker_id, status, error=error)
+        logger.info(
+            "[agents:post-task] Post-turn job finished job_id=%s chat_id=%s status=%s attempts=%s recorded=%s",
+            job.id,
+            job.chat_id,
+            status,
+            job.attempts,
+            recorded,
+        )
+        return status
@@ -0,0 +1,234 @@
+"""
+Local rule-based pre-router that lets trivial turns skip the pre-response coordinator.
+
+Only `word_keeper` (explicit save requests) and `news_agent` (live news/weather
+requests) can run before the teacher, and both require a literal trigger in the
+current message. Greetings, thanks, and short exercise answers never carry one,
+so the router returns a confident "no pre specialists" for them and defers every
+other turn to the LLM coordinator. Questions defer as well, since they can ask
+about current events without naming news or weather.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Literal
+
+from runestone.agents.schemas import ChatMessage, CoordinatorPlan
+
+logger = logging.getLogger(__name__)
+
+PreRouterMode = Literal["off", "shadow", "active"]
+
+# Words that may signal a pre-response specialist; any hit defers to the coordinator.
+# Kept deliberately broad: a false "defer" only costs the normal coordinator call.
+_TRIGGER_RE = re.compile(
+    r"\b("
+    # save / remember intent (word_keeper)
+    r"save|saving|remember|add|store|keep|note|list|vocab\w*|word\s?list|"
+    r"spara\w*|kom\s+ihåg|komma\s+ihåg|lägg\w*\s+till|lägga|anteckna\w*|glos\w*|ordlist\w*|"
+    r"guarda\w*|speicher\w*|merk\w*|enregistr\w*|sauvegard\w*|zapisz\w*|"
+    # live data intent (news_agent)
+    r"news|headlines?|weather|forecast|latest|today|tonight|currently|happening|"
+    r"nyhet\w*|väder\w*|prognos\w*|senaste|idag|ikväll|just\s+nu|aktuell\w*|händer|"
+    r"noticias?|nachrichten|wetter|actualités|nouvelles|météo|wiadomości|pogoda"
+    r")\b",
+    re.IGNORECASE,
+)
+_TEACHER_OFFER_RE = re.compile(r"\b(news|nyhet\w*|weather|väder\w*|save|spara\w*)\b", re.IGNORECASE)
+_URL_RE = re.compile(r"https?://|www\.", re.IGNORECASE)
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_LATIN_LETTER_RE = re.compile(r"[A-Za-zÀ-ÖØ-öø-ɏ]")
+_LETTER_RE = re.compile(r"[^\W\d_]", re.UNICODE)
+# Questions can ask about current events without a trigger word ("What is going on in Ukraine?").
+_QUESTION_RE = re.compile(
+    r"\?|^\s*(what|who|where|when|why|how|which|vad|vem|vems|var|vart|när|varför|hur|vilken|vilket|vilka)\b",
+    re.IGNORECASE,
+)
+
+_SMALL_TALK = frozenset(
+    {
+        "hej",
+        "hejsan",
+        "hallå",
+        "tjena",
+        "tja",
+        "hi",
+        "hello",
+        "hey",
+        "tack",
+        "tackar",
+        "thanks",
+        "thank",
+        "you",
+        "så",
+        "mycket",
+        "ok",
+        "okej",
+        "okay",
+        "ja",
+        "japp",
+        "nej",
+        "yes",
+        "no",
+        "bra",
+        "jättebra",
+        "toppen",
+        "great",
+        "good",
+        "hejdå",
+        "bye",
+        "vi",
+        "ses",
+        "god",
+        "morgon",
+        "natt",
+        "kväll",
+        "förstår",
+        "jag",
+        "fattar",
+        "precis",
+        "exakt",
+        "klart",
+        "nästa",
+        "next",
+        "fortsätt",
+        "continue",
+    }
+)
+
+# Confidence that a message without any trigger needs no pre specialist, by word count.
+_SMALL_TALK_CONFIDENCE = 0.99
+_LENGTH_CONFIDENCE = ((3, 0.95), (8, 0.9), (20, 0.8))
+_LONG_MESSAGE_CONFIDENCE = 0.6
+# Scripts the trigger list cannot read get a confidence well below any sensible threshold.
+_NON_LATIN_CONFIDENCE = 0.3
+# Below the default threshold: only small talk questions ("ok?") are confidently skippable.
+_QUESTION_CONFIDENCE = 0.7
+
+
+@dataclass(frozen=True)
+class PreRouteDecision:
+    """Outcome of the local pre-router for one turn."""
+
+    skip_coordinator: bool
+    confidence: float
+    reason: str
+
+
+@dataclass
+class PreRouterStats:
+    """Running counters used to judge the router before enabling it."""
+
+    decisions: int = 0
+    skips: int = 0
+    shadow_compared: int = 0
+    shadow_false_skips: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        return self.skips / self.decisions if self.decisions else 0.0
+
+    @property
+    def shadow_skip_precision(self) -> float:
+        if not self.shadow_compared:
+            return 0.0
+        return (self.shadow_compared - self.shadow_false_skips) / self.shadow_compared
+
+
+class PreTurnRouter:
+    """Confidence-gated local classifier for "no pre-response specialists needed"."""
+
+    def __init__(self, mode: PreRouterMode = "shadow", confidence_threshold: float = 0.9):
+        """
+        Initialize the router.
+
+        Args:
+            mode: "shadow" compares decisions with the coordinator without acting on them;
+                "active" skips the coordinator when the router is confident
+            confidence_threshold: Minimum confidence required to skip the coordinator
+        """
+        self.mode = mode
+        self.confidence_threshold = confidence_threshold
+        self.stats = PreRouterStats()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.mode == "active"
+
+    def decide(self, message: str, history: list[ChatMessage]) -> PreRouteDecision:
+        """Classify the current turn from the message and the immediately previous teacher reply."""
+        confidence, reason = self._score(message, history)
+        decision = PreRouteDecision(
+            skip_coordinator=confidence >= self.confidence_threshold,
+            confidence=confidence,
+            reason=reason,
+        )
+        with self._lock:
+            self.stats.decisions += 1
+            if decision.skip_coordinator:
+                self.stats.skips += 1
+        return decision
+
+    def skip_plan(self, decision: PreRouteDecision) -> CoordinatorPlan:
+        """Return the empty pre-response plan used when the coordinator is skipped."""
+        return CoordinatorPlan(
+            pre_response=[],
+            post_response=[],
+            audit={"pre_router": decision.reason, "pre_router_confidence": decision.confidence},
+        )
+
+    def record_shadow(self, decision: PreRouteDecision, plan: CoordinatorPlan, *, user_id: int) -> None:
+        """Compare a decision with the coordinator plan for the same turn and log the outcome."""
+        coordinator_specialists = [item.name for item in plan.pre_response]
+        false_skip = decision.skip_coordinator and bool(coordinator_specialists)
+        with self._lock:
+            if decision.skip_coordinator:
+                self.stats.shadow_compared += 1
+                if false_skip:
+                    self.stats.shadow_false_skips += 1
+            precision = self.stats.shadow_skip_precision
+            skip_rate = self.stats.skip_rate
+        logger.log(
+            logging.WARNING if false_skip else logging.INFO,
+            "pre-router shadow user_id=%s decision=%s confidence=%.2f reason=%s coordinator_specialists=%s "
+            "false_skip=%s skip_rate=%.3f skip_precision=%.3f",
+            user_id,
+            "skip" if decision.skip_coordinator else "defer",
+            decision.confidence,
+            decision.reason,
+            ",".join(coordinator_specialists) or "none",
+            false_skip,
+            skip_rate,
+            precision,
+        )
+
+    @staticmethod
+    def _score(message: str, history: list[ChatMessage]) -> tuple[float, str]:
+        text = message.strip()
+        if not text:
+            return 0.0, "empty_message"
+        if _URL_RE.search(text):
+            return 0.0, "url"
+        if _TRIGGER_RE.search(text):
+            return 0.0, "trigger_word"
+        # Short follow-ups such as "Ja, teknik" can answer a teacher question about news topics.
+        previous_teacher = next((msg.content for msg in reversed(history) if msg.role == "assistant"), "")
+        if _TEACHER_OFFER_RE.search(previous_teacher):
+            return 0.0, "teacher_offered_specialist"
+
+        letters = _LETTER_RE.findall(text)
+        if letters and sum(bool(_LATIN_LETTER_RE.match(ch)) for ch in letters) < len(letters):
+            return _NON_LATIN_CONFIDENCE, "non_latin_script"
+
+        words = [word.lower() for word in _WORD_RE.findall(text)]
+        if words and all(word in _SMALL_TALK for word in words):
+            return _SMALL_TALK_CONFIDENCE, "small_talk"
+        if _QUESTION_RE.search(text):
+            return _QUESTION_CONFIDENCE, "question"
+        for max_words, confidence in _LENGTH_CONFIDENCE:
+            if len(words) <= max_words:
+                return confidence, f"no_trigger_max_{max_words}_words"
+        return _LONG_MESSAGE_CONFIDENCE, "no_trigger_long_message"
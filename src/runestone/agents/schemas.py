@@ -290,3 +290,42 @@ class CoordinatorRow(BaseModel):
     id: int = Field(..., description="Persisted coordinator row id")
     status: str = Field(..., description="Coordinator status")
     created_at: datetime | None = Field(None, description="Persisted row timestamp")
+
+
+class PostTurnJobPayload(BaseModel):
+    """Serialized inputs of one post-turn run handed to a post-turn worker."""
+
+    message: str = Field(..., description="Current user message")
+    history: list[ChatMessage] = Field(default_factory=list, description="Chat history before the turn")
+    teacher_response: str = Field(..., description="Visible teacher reply for the turn")
+    vocabulary_candidates: list[WordSaveCandidate] = Field(
+        default_factory=list, description="Teacher-emitted vocabulary candidates"
+    )
+    learning_memory_signals: list[LearningMemorySignal] = Field(
+        default_factory=list, description="Teacher-emitted learning memory signals"
+    )
+    pre_results: list[dict[str, Any]] = Field(default_factory=list, description="Pre-response specialist results")
+
+
+class ClaimedPostTurnJob(BaseModel):
+    """A post-turn job claimed by a worker and ready for execution."""
+
+    id: int = Field(..., description="Persisted job id")
+    user_id: int = Field(..., description="Owning user id")
+    chat_id: str = Field(..., description="Chat session id")
+    coordinator_row_id: int = Field(..., description="Coordinator tracking row in agent_side_effects")
+    attempts: int = Field(..., description="Claims so far, including this one")
+    payload: PostTurnJobPayload = Field(..., description="Post-turn inputs")
+
+
+class ChatSummaryUpdate(BaseModel):
+    """Rolling chat summary produced by the chat summarizer."""
+
+    summary: str = Field(..., description="Updated summary of the whole conversation so far")
+
+
+class ChatSummaryRefreshBatch(BaseModel):
+    """Messages to fold into a chat's rolling summary, with the summary they extend."""
+
+    summary: str = Field("", description="Current summary text; empty before the first refresh")
+    messages: list[ChatMessage] = Field(..., description="Unsummarized messages older than the live window")
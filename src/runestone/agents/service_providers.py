@@ -5,14 +5,24 @@ from typing import AsyncIterator
 
 from runestone.config import settings
 from runestone.db.agent_side_effect_repository import AgentSideEffectRepository
+from runestone.db.chat_repository import ChatRepository
 from runestone.db.chat_session_learning_focus_repository import ChatSessionLearningFocusRepository
 from runestone.db.database import provide_db_session
 from runestone.db.memory_item_repository import MemoryItemRepository
+from runestone.db.memory_maintenance_run_repository import MemoryMaintenanceRunRepository
+from runestone.db.memory_maintenance_watermark_repository import MemoryMaintenanceWatermarkRepository
+from runestone.db.model_cost_repository import ModelCostInteractionRepository
+from runestone.db.post_turn_job_repository import PostTurnJobRepository
 from runestone.db.user_repository import UserRepository
 from runestone.db.vocabulary_repository import VocabularyRepository
 from runestone.services.agent_side_effect_service import AgentSideEffectService
 from runestone.services.chat_session_learning_focus_service import ChatSessionLearningFocusService
+from runestone.services.chat_summary_service import ChatSummaryService
 from runestone.services.memory_item_service import MemoryItemService
+from runestone.services.memory_maintenance_run_service import MemoryMaintenanceRunService
+from runestone.services.memory_maintenance_watermark_service import MemoryMaintenanceWatermarkService
+from runestone.services.model_cost_service import ModelCostService
+from runestone.services.post_turn_job_service import PostTurnJobService
 from runestone.services.user_service import UserService
 from runestone.services.vocabulary_service import VocabularyService
 
@@ -45,6 +55,45 @@ async def provide_memory_item_service() -> AsyncIterator[MemoryItemService]:
         yield service
 
 
+@asynccontextmanager
+async def provide_model_cost_service() -> AsyncIterator[ModelCostService]:
+    """Context manager for the model-cost writer's batch inserts and the cost rollup command."""
+    async with provide_db_session() as session:
+        repo = ModelCostInteractionRepository(session)
+        service = ModelCostService(repo)
+        yield service
+
+
+@asynccontextmanager
+async def provide_memory_maintenance_watermark_service() -> AsyncIterator[MemoryMaintenanceWatermarkService]:
+    """Context manager for memory-maintenance watermarks read and written by background maintainers."""
+    async with provide_db_session() as session:
+        repo = MemoryMaintenanceWatermarkRepository(session)
+        service = MemoryMaintenanceWatermarkService(repo)
+        yield service
+
+
+@asynccontextmanager
+async def provide_memory_maintenance_run_service() -> AsyncIterator[MemoryMaintenanceRunService]:
+    """Context manager for the scheduled maintenance worker's candidate queries and run records."""
+    async with provide_db_session() as session:
+        repo = MemoryMaintenanceRunRepository(session)
+        service = MemoryMaintenanceRunService(repo)
+        yield service
+
+
+@asynccontextmanager
+async def provide_memory_maintenance_lock(user_id: int) -> AsyncIterator[bool]:
+    """
+    Hold the user's memory-maintenance lock for the duration of the block.
+
+    Yields False when another run (scheduled sweep or chat reset) already holds it.
+    The lock is released when the block exits and its session closes.
+    """
+    async with provide_memory_maintenance_run_service() as run_service:
+        yield await run_service.try_lock_user(user_id)
+
+
 @asynccontextmanager
 async def provide_chat_session_learning_focus_service() -> AsyncIterator[ChatSessionLearningFocusService]:
     """Context manager for chat-session learning-focus service in agent runtime paths."""
@@ -94,6 +143,34 @@ async def provide_agent_side_effect_service() -> AsyncIterator[AgentSideEffectSe
         yield service
 
 
+@asynccontextmanager
+async def provide_post_turn_job_service() -> AsyncIterator[PostTurnJobService]:
+    """
+    Context manager for the durable post-turn job queue.
+
+    Used by the web process to enqueue jobs and by post-turn workers to claim,
+    heartbeat, and finish them, each on a dedicated database session.
+    """
+    async with provide_db_session() as session:
+        repo = PostTurnJobRepository(session)
+        service = PostTurnJobService(repo)
+        yield service
+
+
+@asynccontextmanager
+async def provide_chat_summary_service() -> AsyncIterator[ChatSummaryService]:
+    """
+    Context manager for rolling chat summaries in background refresh tasks.
+
+    Refreshes run after the turn has been answered, so they use their own
+    session rather than the request session that persisted the messages.
+    """
+    async with provide_db_session() as session:
+        repo = ChatRepository(session)
+        service = ChatSummaryService(repo)
+        yield service
+
+
 @asynccontextmanager
 async def provide_user_service() -> AsyncIterator[UserService]:
     """
@@ -9,6 +9,7 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, field_validator, model_validator
 
+from runestone.agents.circuit_breaker import guarded_structured_output
 from runestone.agents.llm import build_chat_model
 from runestone.agents.schemas import LearningMemorySignal
 from runestone.agents.service_providers import provide_memory_item_service
@@ -309,7 +310,7 @@ class LearningMemoryKeeperSpecialist(BaseSpecialist):
         return targets
 
     async def _extract(self, payload: dict[str, object]) -> LearningMemoryKeeperExtraction | SpecialistResult:
-        model = self.model.with_structured_output(LearningMemoryKeeperExtraction)
+        model = guarded_structured_output(self.model, LearningMemoryKeeperExtraction)
         try:
             return await model.ainvoke(
                 [
@@ -12,9 +12,20 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from runestone.agents.circuit_breaker import guarded_structured_output
 from runestone.agents.llm import build_chat_model
 from runestone.agents.service_providers import provide_memory_item_service
 from runestone.agents.specialists.base import BaseSpecialist, SpecialistAction, SpecialistContext, SpecialistResult
+from runestone.agents.specialists.memory_maintainer.clustering import EmbeddingBucketer
+from runestone.agents.specialists.memory_maintainer.incremental import (
+    INCREMENTAL_BUCKET_NOTE,
+    ChangeSet,
+    build_watermark,
+    change_set_artifact,
+    load_change_set,
+    save_watermark,
+)
+from runestone.agents.specialists.memory_maintainer.shared import elapsed_ms, gather_bounded
 from runestone.api.memory_item_schemas import AreaToImproveStatus, MemoryCategory
 from runestone.config import Settings
 from runestone.constants import MEMORY_DEFAULT_AREA_TO_IMPROVE_PRIORITY
@@ -27,6 +38,7 @@ MAINTAINER_STATUSES = (
     AreaToImproveStatus.STRUGGLING.value,
     AreaToImproveStatus.IMPROVING.value,
 )
+WATERMARK_DOMAIN = MemoryCategory.AREA_TO_IMPROVE.value
 UNVERSIONED_KEY_PATTERN = re.compile(r"^[a-z0-9]+(?:_[a-z0-9]+)*$")
 MERGED_KEY_PATTERN = re.compile(r"^[a-z0-9]+(?:_[a-z0-9]+)*_v[0-9]+$")
 VERSIONED_OR_UNVERSIONED_KEY_PATTERN = re.compile(r"^(?P<base>[a-z0-9]+(?:_[a-z0-9]+)*?)(?:_v(?P<version>[0-9]+))?$")
@@ -248,6 +260,24 @@ class PlannedGroup:
     target_key: str | None = None
 
 
+@dataclass
+class ResolvedMerge:
+    """One reviewed group whose generated merge passed validation."""
+
+    item_ids: list[int]
+    merge_generation: MergeGeneration
+    final_status: str
+
+
+@dataclass
+class BucketResolution:
+    """Outcome of the step-2 review/generate/validate passes for one bucket."""
+
+    merges: list[ResolvedMerge]
+    step_errors: list[str]
+    elapsed_ms: int
+
+
 class AreaToImproveMemoryMaintainer(BaseSpecialist):
     """Background specialist that consolidates start-of-session learning-focus memory."""
 
@@ -255,6 +285,9 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         super().__init__(name="memory_maintainer")
         self.settings = settings
         self.model = build_chat_model(settings, "memory_maintainer")
+        self.bucketer = EmbeddingBucketer(
+            similarity_threshold=settings.memory_maintainer_embedding_similarity_threshold
+        )
         logger.info(
             "[agents:memorymaintainer] Initialized AreaToImproveMemoryMaintainer with provider=%s, model=%s",
             settings.memory_maintainer_provider,
@@ -265,13 +298,18 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         """Run the background chat-reset maintenance flow via the shared specialist contract."""
         return await self.run_for_user(context.user)
 
-    async def run_for_user(self, user: Any) -> SpecialistResult:
-        """Run chat-reset maintenance for one user without building a full specialist context."""
+    async def run_for_user(
+        self,
+        user: Any,
+        *,
+        trigger_source: Literal["chat_reset", "scheduled"] = "chat_reset",
+    ) -> SpecialistResult:
+        """Run background maintenance for one user without building a full specialist context."""
         return await self.run_session(
             user=user,
             dry_run=False,
             with_priority_review=False,
-            trigger_source="chat_reset",
+            trigger_source=trigger_source,
         )
 
     async def run_cli_for_user(
@@ -295,7 +333,7 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         *,
         dry_run: bool,
         with_priority_review: bool,
-        trigger_source: Literal["chat_reset", "cli"],
+        trigger_source: Literal["chat_reset", "scheduled", "cli"],
     ) -> SpecialistResult:
         """Execute the full structured maintenance pipeline."""
         started_at = perf_counter()
@@ -306,6 +344,8 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
             dry_run=dry_run,
             with_priority_review=with_priority_review,
         )
+        stage_timings = artifacts["stage_timings_ms"]
+        artifacts["bucket_concurrency"] = self.settings.memory_maintainer_concurrency
         logger.info(
             "[agents:memorymaintainer] run started user_id=%s trigger=%s dry_run=%s priority_review=%s",
             user_id,
@@ -315,20 +355,14 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         )
 
         try:
-            async with provide_memory_item_service() as service:
-                scope_items = await service.list_memory_items(
-                    user_id=user_id,
-                    category=MemoryCategory.AREA_TO_IMPROVE,
-                    statuses=list(MAINTAINER_STATUSES),
-                    limit=200,
-                    offset=0,
-                )
+            scope_items = await self._load_scope_items(user_id=user_id)
         except Exception as exc:
             logger.warning("[agents:memorymaintainer] Failed to load scope items: %s", exc, exc_info=True)
             artifacts["summary"] = "scope_load_failed"
             artifacts["step_errors"].append("scope_load_failed")
             return self._error_result("Failed to load maintainer scope", artifacts)
 
+        stage_timings["scope_load"] = elapsed_ms(started_at)
         artifacts["reviewed_item_count"] = len(scope_items)
         logger.info(
             "[agents:memorymaintainer] scope loaded user_id=%s item_count=%s elapsed_s=%.2f",
@@ -345,9 +379,44 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         # in-scope snapshot unless execution-time drift is detected explicitly.
         items_by_id = {item.id: item for item in scope_items}
 
+        # Incremental background runs only bucket items changed since the last clean run,
+        # next to one representative per already-reconciled cluster.
+        change_set: ChangeSet | None = None
+        if self.settings.memory_maintainer_incremental_enabled and trigger_source != "cli":
+            change_set = await load_change_set(user_id=user_id, domain=WATERMARK_DOMAIN, scope_items=scope_items)
+        bucket_scope_items = scope_items
+        representative_ids: list[int] | None = None
+        if change_set is not None:
+            representative_ids = list(change_set.representatives())
+            sent_ids = {*change_set.changed_ids, *representative_ids}
+            bucket_scope_items = [item for item in scope_items if item.id in sent_ids]
+            artifacts["incremental"] = change_set_artifact(change_set, sent_item_count=len(bucket_scope_items))
+            if not change_set.changed_ids:
+                logger.info(
+                    "[agents:memorymaintainer] skipping unchanged scope user_id=%s item_count=%s elapsed_s=%.2f",
+                    user_id,
+                    len(scope_items),
+                    perf_counter() - started_at,
+                )
+                artifacts["summary"] = "noop"
+                artifacts["no_change_reason"] = "unchanged_since_last_run"
+                return self._no_action_result(artifacts)
+        bucket_items_by_id = {item.id: item for item in bucket_scope_items}
+
         # Step 1: ask the model for broad candidate buckets, then deterministically
         # repair common output defects like duplicate ids or dropped singleton items.
-        bucket_plan = await self._bucket_topics(scope_items=scope_items, target_language=language)
+        stage_started_at = perf_counter()
+        bucket_plan = None
+        if self.settings.memory_maintainer_bucketing == "embedding":
+            bucket_plan = await self._embedding_bucket_plan(bucket_scope_items)
+        artifacts["bucketing"] = "embedding" if bucket_plan is not None else "llm"
+        if bucket_plan is None:
+            bucket_plan = await self._bucket_topics(
+                scope_items=bucket_scope_items,
+                target_language=language,
+                representative_ids=representative_ids,
+            )
+        stage_timings["bucket_topics"] = elapsed_ms(stage_started_at)
         if bucket_plan is None:
             artifacts["summary"] = "bucket_plan_failed"
             artifacts["step_errors"].append("bucket_plan_failed")
@@ -359,12 +428,18 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
             perf_counter() - started_at,
         )
 
-        repaired_bucket_plan = self._repair_bucket_plan(bucket_plan, items_by_id)
-        validated_buckets = self._validate_bucket_plan(repaired_bucket_plan, items_by_id)
+        repaired_bucket_plan = self._repair_bucket_plan(bucket_plan, bucket_items_by_id)
+        validated_buckets = self._validate_bucket_plan(repaired_bucket_plan, bucket_items_by_id)
         if validated_buckets is None:
             artifacts["summary"] = "invalid_bucket_plan"
             artifacts["step_errors"].append("invalid_bucket_plan")
             return self._error_result("Bucket plan was invalid", artifacts)
+        if change_set is not None:
+            # Representatives expand back into their clusters; buckets without any
+            # changed item were reconciled before and are not reviewed again.
+            changed_ids = set(change_set.changed_ids)
+            for bucket in validated_buckets:
+                bucket.item_ids = change_set.expand(bucket.item_ids)
 
         artifacts["buckets"] = [
             {
@@ -378,7 +453,11 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
 
         planned_groups: list[PlannedGroup] = []
         next_group_number = 1
-        merge_candidate_buckets = [bucket for bucket in validated_buckets if len(bucket.item_ids) > 1]
+        merge_candidate_buckets = [
+            bucket
+            for bucket in validated_buckets
+            if len(bucket.item_ids) > 1 and (change_set is None or changed_ids.intersection(bucket.item_ids))
+        ]
         singleton_item_ids = [bucket.item_ids[0] for bucket in validated_buckets if len(bucket.item_ids) == 1]
         if singleton_item_ids:
             logger.info(
@@ -391,96 +470,60 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
 
         # Step 2: process only multi-item candidate buckets. Each bucket goes through
         # a review pass, merge generation pass, and final validator pass before it can
-        # become an executable planned merge.
-        for bucket in merge_candidate_buckets:
-            bucket_items = [items_by_id[item_id] for item_id in bucket.item_ids]
-            logger.info(
-                "[agents:memorymaintainer] resolving bucket user_id=%s label=%s item_count=%s elapsed_s=%.2f",
-                user_id,
-                bucket.bucket_label,
-                len(bucket.item_ids),
-                perf_counter() - started_at,
-            )
-            review = await self._review_bucket(
-                bucket_label=bucket.bucket_label,
-                bucket_why=bucket.why,
-                scope_items=bucket_items,
-            )
-            if review is None:
-                artifacts["step_errors"].append(f"bucket_review_failed:{bucket.bucket_label}")
-                continue
-
-            validated_groups = self._validate_review_plan(review, bucket_items)
-            if validated_groups is None:
-                artifacts["step_errors"].append(f"invalid_bucket_review:{bucket.bucket_label}")
-                continue
-
-            for group in validated_groups:
-                if len(group.item_ids) < 2:
-                    logger.info(
-                        "[agents:memorymaintainer] resolution produced singleton group "
-                        "user_id=%s label=%s item_ids=%s; leaving untouched",
-                        user_id,
-                        bucket.bucket_label,
-                        group.item_ids,
-                    )
-                    continue
-                merge_generation = await self._generate_merge_group(
-                    bucket_label=bucket.bucket_label,
-                    reviewed_group=group,
-                    scope_items=[items_by_id[item_id] for item_id in group.item_ids],
-                    target_language=language,
-                )
-                if merge_generation is None:
-                    artifacts["step_errors"].append(f"merge_generation_failed:{bucket.bucket_label}:{group.item_ids}")
-                    continue
-                merge_validation = await self._validate_merge_group(
-                    bucket_label=bucket.bucket_label,
-                    reviewed_group=group,
-                    scope_items=[items_by_id[item_id] for item_id in group.item_ids],
-                    merge_generation=merge_generation,
+        # become an executable planned merge. Buckets are independent, so they run
+        # concurrently; results are applied in bucket order to keep group ids stable.
+        stage_started_at = perf_counter()
+        resolutions = await gather_bounded(
+            [
+                lambda bucket=bucket: self._resolve_bucket(
+                    user_id=user_id,
+                    bucket=bucket,
+                    items_by_id=items_by_id,
                     target_language=language,
+                    started_at=started_at,
                 )
-                if merge_validation is None:
-                    artifacts["step_errors"].append(f"merge_validation_failed:{bucket.bucket_label}:{group.item_ids}")
-                    continue
-                if not merge_validation.approved:
-                    # Validator rejections are treated as "leave untouched" instead of
-                    # hard failures because the safest fallback is to keep the original items.
-                    logger.info(
-                        "[agents:memorymaintainer] rejected generated merge user_id=%s label=%s item_ids=%s reason=%s",
-                        user_id,
-                        bucket.bucket_label,
-                        group.item_ids,
-                        merge_validation.why,
-                    )
-                    continue
-                normalized_status = self._latest_status([items_by_id[item_id] for item_id in group.item_ids])
-                if normalized_status != merge_generation.final_status:
-                    logger.info(
-                        "[agents:memorymaintainer] normalized resolved group status "
-                        "user_id=%s label=%s item_ids=%s from=%s to=%s",
-                        user_id,
-                        bucket.bucket_label,
-                        group.item_ids,
-                        merge_generation.final_status,
-                        normalized_status,
-                    )
+                for bucket in merge_candidate_buckets
+            ],
+            limit=self.settings.memory_maintainer_concurrency,
+        )
+        stage_timings["bucket_resolution"] = elapsed_ms(stage_started_at)
+        artifacts["bucket_resolution_serial_ms"] = sum(resolution.elapsed_ms for resolution in resolutions)
+        logger.info(
+            "[agents:memorymaintainer] bucket resolution completed user_id=%s bucket_count=%s concurrency=%s "
+            "wall_ms=%s serial_ms=%s elapsed_s=%.2f",
+            user_id,
+            len(merge_candidate_buckets),
+            self.settings.memory_maintainer_concurrency,
+            stage_timings["bucket_resolution"],
+            artifacts["bucket_resolution_serial_ms"],
+            perf_counter() - started_at,
+        )
+        for bucket, resolution in zip(merge_candidate_buckets, resolutions):
+            artifacts["step_errors"].extend(resolution.step_errors)
+            for merge in resolution.merges:
                 planned_groups.append(
                     PlannedGroup(
                         group_id=f"group_{next_group_number}",
                         bucket_label=bucket.bucket_label,
-                        source_item_ids=group.item_ids,
-                        source_keys=[items_by_id[item_id].key for item_id in group.item_ids],
-                        final_key=merge_generation.final_key,
-                        final_content=merge_generation.final_content,
-                        final_status=normalized_status,
-                        why=merge_generation.why,
+                        source_item_ids=merge.item_ids,
+                        source_keys=[items_by_id[item_id].key for item_id in merge.item_ids],
+                        final_key=merge.merge_generation.final_key,
+                        final_content=merge.merge_generation.final_content,
+                        final_status=merge.final_status,
+                        why=merge.merge_generation.why,
                     )
                 )
                 next_group_number += 1
 
         if not planned_groups:
+            await self._record_watermark(
+                user_id=user_id,
+                scope_items=scope_items,
+                buckets=validated_buckets,
+                planned_groups=planned_groups,
+                artifacts=artifacts,
+                dry_run=dry_run,
+            )
             artifacts["summary"] = "no_valid_groups"
             artifacts["no_change_reason"] = "no_merge_candidates"
             logger.info(
@@ -500,11 +543,13 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
                 len(planned_groups),
                 perf_counter() - started_at,
             )
+            stage_started_at = perf_counter()
             priority_review = await self._review_priorities(
                 planned_groups=planned_groups,
                 items_by_id=items_by_id,
                 target_language=language,
             )
+            stage_timings["priority_review"] = elapsed_ms(stage_started_at)
             if priority_review is None:
                 artifacts["step_errors"].append("priority_review_failed")
             else:
@@ -512,11 +557,13 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
 
         # Step 4: execute the accepted merge groups in Python with per-group validation,
         # create-first persistence, and partial-failure tolerance.
+        stage_started_at = perf_counter()
         execution_report = await self._execute_groups(
             user_id=user_id,
             planned_groups=planned_groups,
             dry_run=dry_run,
         )
+        stage_timings["execution"] = elapsed_ms(stage_started_at)
         artifacts.update(execution_report)
 
         if with_priority_review and priority_suggestions:
@@ -531,6 +578,14 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         else:
             artifacts["priority_updates"] = []
             artifacts["priority_skips"] = []
+        await self._record_watermark(
+            user_id=user_id,
+            scope_items=scope_items,
+            buckets=validated_buckets,
+            planned_groups=planned_groups,
+            artifacts=artifacts,
+            dry_run=dry_run,
+        )
 
         planned_merge_count = len(artifacts["merged_groups"]) if dry_run else 0
         applied_merge_count = len(artifacts["merged_groups"]) if not dry_run else 0
@@ -561,11 +616,176 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
         artifacts["no_change_reason"] = "no_merge_candidates"
         return self._no_action_result(artifacts)
 
+    async def _resolve_bucket(
+        self,
+        *,
+        user_id: int,
+        bucket: BucketTopicGroup,
+        items_by_id: dict[int, Any],
+        target_language: str,
+        started_at: float,
+    ) -> BucketResolution:
+        """Run review, merge generation, and validation for one multi-item bucket."""
+        bucket_started_at = perf_counter()
+        merges: list[ResolvedMerge] = []
+        step_errors: list[str] = []
+        bucket_items = [items_by_id[item_id] for item_id in bucket.item_ids]
+        logger.info(
+            "[agents:memorymaintainer] resolving bucket user_id=%s label=%s item_count=%s elapsed_s=%.2f",
+            user_id,
+            bucket.bucket_label,
+            len(bucket.item_ids),
+            perf_counter() - started_at,
+        )
+        review = await self._review_bucket(
+            bucket_label=bucket.bucket_label,
+            bucket_why=bucket.why,
+            scope_items=bucket_items,
+        )
+        if review is None:
+            step_errors.append(f"bucket_review_failed:{bucket.bucket_label}")
+            return BucketResolution(merges=merges, step_errors=step_errors, elapsed_ms=elapsed_ms(bucket_started_at))
+
+        validated_groups = self._validate_review_plan(review, bucket_items)
+        if validated_groups is None:
+            step_errors.append(f"invalid_bucket_review:{bucket.bucket_label}")
+            return BucketResolution(merges=merges, step_errors=step_errors, elapsed_ms=elapsed_ms(bucket_started_at))
+
+        for group in validated_groups:
+            if len(group.item_ids) < 2:
+                logger.info(
+                    "[agents:memorymaintainer] resolution produced singleton group "
+                    "user_id=%s label=%s item_ids=%s; leaving untouched",
+                    user_id,
+                    bucket.bucket_label,
+                    group.item_ids,
+                )
+                continue
+            merge_generation = await self._generate_merge_group(
+                bucket_label=bucket.bucket_label,
+                reviewed_group=group,
+                scope_items=[items_by_id[item_id] for item_id in group.item_ids],
+                target_language=target_language,
+            )
+            if merge_generation is None:
+                step_errors.append(f"merge_generation_failed:{bucket.bucket_label}:{group.item_ids}")
+                continue
+            merge_validation = await self._validate_merge_group(
+                bucket_label=bucket.bucket_label,
+                reviewed_group=group,
+                scope_items=[items_by_id[item_id] for item_id in group.item_ids],
+                merge_generation=merge_generation,
+                target_language=target_language,
+            )
+            if merge_validation is None:
+                step_errors.append(f"merge_validation_failed:{bucket.bucket_label}:{group.item_ids}")
+                continue
+            if not merge_validation.approved:
+                # Validator rejections are treated as "leave untouched" instead of
+                # hard failures because the safest fallback is to keep the original items.
+                logger.info(
+                    "[agents:memorymaintainer] rejected generated merge user_id=%s label=%s item_ids=%s reason=%s",
+                    user_id,
+                    bucket.bucket_label,
+                    group.item_ids,
+                    merge_validation.why,
+                )
+                continue
+            normalized_status = self._latest_status([items_by_id[item_id] for item_id in group.item_ids])
+            if normalized_status != merge_generation.final_status:
+                logger.info(
+                    "[agents:memorymaintainer] normalized resolved group status "
+                    "user_id=%s label=%s item_ids=%s from=%s to=%s",
+                    user_id,
+                    bucket.bucket_label,
+                    group.item_ids,
+                    merge_generation.final_status,
+                    normalized_status,
+                )
+            merges.append(
+                ResolvedMerge(
+                    item_ids=group.item_ids,
+                    merge_generation=merge_generation,
+                    final_status=normalized_status,
+                )
+            )
+        return BucketResolution(merges=merges, step_errors=step_errors, elapsed_ms=elapsed_ms(bucket_started_at))
+
+    async def _record_watermark(
+        self,
+        *,
+        user_id: int,
+        scope_items: list[Any],
+        buckets: list[BucketTopicGroup],
+        planned_groups: list[PlannedGroup],
+        artifacts: dict[str, Any],
+        dry_run: bool,
+    ) -> None:
+        """Persist the incremental watermark after a clean, applied run."""
+        if dry_run or not self.settings.memory_maintainer_incremental_enabled:
+            return
+        if artifacts["step_errors"] or artifacts["failed_groups"]:
+            # Leave the previous watermark so the failed items are reconsidered next time.
+            return
+        merges = []
+        created_ids = [group.target_item_id for group in planned_groups if group.target_item_id is not None]
+        if created_ids:
+            try:
+                async with provide_memory_item_service() as service:
+                    created_by_id = {item.id: item for item in await service.get_items_by_ids(created_ids)}
+            except Exception as exc:
+                logger.warning("[agents:memorymaintainer] Failed to load merged items for watermark: %s", exc)
+                return
+            merges = [
+                (group.source_item_ids, created_by_id[group.target_item_id])
+                for group in planned_groups
+                if group.target_item_id in created_by_id
+            ]
+        watermark = build_watermark(
+            scope_items=scope_items,
+            clusters=[bucket.item_ids for bucket in buckets],
+            deleted_ids=artifacts["deleted_item_ids"],
+            merges=merges,
+        )
+        artifacts["watermark_saved"] = await save_watermark(
+            user_id=user_id,
+            domain=WATERMARK_DOMAIN,
+            watermark=watermark,
+        )
+
+    async def _load_scope_items(self, *, user_id: int) -> list[Any]:
+        """Load the in-scope struggling/improving area_to_improve items."""
+        async with provide_memory_item_service() as service:
+            return await service.list_memory_items(
+                user_id=user_id,
+                category=MemoryCategory.AREA_TO_IMPROVE,
+                statuses=list(MAINTAINER_STATUSES),
+                limit=200,
+                offset=0,
+            )
+
+    async def _embedding_bucket_plan(self, scope_items: list[Any]) -> BucketTopicsPlan | None:
+        """Bucket items locally by embedding similarity; None falls back to LLM bucketing."""
+        try:
+            buckets = await self.bucketer.bucket(scope_items)
+        except Exception as exc:
+            logger.warning(
+                "[agents:memorymaintainer] Embedding bucketing failed, falling back to LLM: %s", exc, exc_info=True
+            )
+            return None
+        return BucketTopicsPlan(
+            buckets=[
+                BucketTopicGroup(bucket_label=bucket.label, item_ids=bucket.item_ids, why=bucket.why)
+                for bucket in buckets
+            ]
+        )
+
     async def _bucket_topics(
         self,
         *,
         scope_items: list[Any],
         target_language: str,
+        representative_ids: list[int] | None = None,
     ) -> BucketTopicsPlan | None:
         """Run the step-1 topic bucketing model."""
         payload = {
@@ -573,9 +793,13 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
             "all_item_ids": [item.id for item in scope_items],
             "items": [self._serialize_scope_item(item) for item in scope_items],
         }
+        system_prompt = BUCKET_TOPICS_PROMPT
+        if representative_ids is not None:
+            payload["representative_item_ids"] = representative_ids
+            system_prompt = f"{BUCKET_TOPICS_PROMPT}\n\n{INCREMENTAL_BUCKET_NOTE}"
         return await self._invoke_structured_model(
             BucketTopicsPlan,
-            system_prompt=BUCKET_TOPICS_PROMPT,
+            system_prompt=system_prompt,
             payload=payload,
             step_name="bucket_topics",
         )
@@ -707,7 +931,7 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
             logger.warning("[agents:memorymaintainer] Model does not support structured output for %s", step_name)
             return None
 
-        structured_model = with_structured_output(schema)
+        structured_model = guarded_structured_output(self.model, schema)
         call_started_at = perf_counter()
         logger.info(
             "[agents:memorymaintainer] llm step started step=%s item_count=%s",
@@ -1288,9 +1512,7 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
     ) -> dict[str, Any]:
         """Create the shared artifacts payload for one maintenance run."""
         return {
-            "maintenance_type": (
-                "cli_memory_maintenance" if trigger_source == "cli" else "chat_reset_memory_maintenance"
-            ),
+            "maintenance_type": f"{trigger_source}_memory_maintenance",
             "scope": {"category": "area_to_improve", "statuses": list(MAINTAINER_STATUSES)},
             "trigger_source": trigger_source,
             "dry_run": dry_run,
@@ -1304,6 +1526,7 @@ class AreaToImproveMemoryMaintainer(BaseSpecialist):
             "created_item_ids": [],
             "deleted_item_ids": [],
             "step_errors": [],
+            "stage_timings_ms": {},
             "summary": "",
             "no_change_reason": None,
         }
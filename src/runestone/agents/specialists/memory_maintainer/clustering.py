@@ -0,0 +1,158 @@
+"""Local embedding-based topic bucketing for memory maintainers."""
+
+import asyncio
+import itertools
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from runestone.rag.index import get_embeddings
+
+# Mirrors the step-1 prompt rule: larger buckets are almost always too broad to review.
+MAX_BUCKET_SIZE = 15
+
+
+@dataclass(frozen=True)
+class EmbeddingBucket:
+    """One similarity cluster, anchored on its most central item."""
+
+    item_ids: list[int]
+    anchor_id: int
+    anchor_key: str
+    cohesion: float
+
+    @property
+    def label(self) -> str:
+        return self.anchor_key
+
+    @property
+    def why(self) -> str | None:
+        """Validation-only explanation in the same shape the LLM bucketing step returns."""
+        if len(self.item_ids) < 2:
+            return None
+        return (
+            f"Embedding cluster anchored on item id={self.anchor_id} key={self.anchor_key} "
+            f"with mean cosine similarity {self.cohesion:.2f}."
+        )
+
+
+def cluster_vectors(vectors: Sequence[Sequence[float]], *, threshold: float, max_size: int) -> list[list[int]]:
+    """
+    Group vector indexes by average-linkage agglomerative clustering on cosine similarity.
+
+    The two clusters with the highest mean pairwise similarity are merged until no pair
+    reaches `threshold` without exceeding `max_size`. Clusters are returned in order of
+    their first index, each sorted.
+    """
+    count = len(vectors)
+    if count == 0:
+        return []
+    matrix = np.asarray(vectors, dtype=float)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    unit = matrix / norms
+    # Cluster-by-cluster sums of pairwise similarity; divided by size products they give average linkage.
+    link_sums = unit @ unit.T
+    sizes = np.ones(count)
+    active = np.ones(count, dtype=bool)
+    members = [[index] for index in range(count)]
+
+    while active.sum() > 1:
+        average = link_sums / np.outer(sizes, sizes)
+        mergeable = np.outer(active, active) & (np.add.outer(sizes, sizes) <= max_size)
+        np.fill_diagonal(mergeable, False)
+        average = np.where(mergeable, average, -np.inf)
+        left, right = np.unravel_index(np.argmax(average), average.shape)
+        if average[left, right] < threshold:
+            break
+        link_sums[left, :] += link_sums[right, :]
+        link_sums[:, left] = link_sums[left, :]
+        sizes[left] += sizes[right]
+        active[right] = False
+        members[left].extend(members[right])
+
+    return sorted((sorted(members[index]) for index in np.flatnonzero(active)), key=lambda cluster: cluster[0])
+
+
+def item_text(item: Any) -> str:
+    """Text embedded for one memory item: its key as words plus its content."""
+    return f"{item.key.replace('_', ' ')}: {item.content}"
+
+
+class EmbeddingBucketer:
+    """Group memory items into topic buckets by embedding similarity instead of an LLM call."""
+
+    def __init__(
+        self,
+        *,
+        similarity_threshold: float,
+        max_bucket_size: int = MAX_BUCKET_SIZE,
+        embeddings_loader: Callable[[], Any] = get_embeddings,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_bucket_size = max_bucket_size
+        self.embeddings_loader = embeddings_loader
+
+    async def bucket(self, items: Sequence[Any]) -> list[EmbeddingBucket]:
+        """Embed and cluster items off the event loop; model loading happens on first use."""
+        if not items:
+            return []
+        texts = [item_text(item) for item in items]
+        vectors = await asyncio.to_thread(lambda: self.embeddings_loader().embed_documents(texts))
+        clusters = cluster_vectors(vectors, threshold=self.similarity_threshold, max_size=self.max_bucket_size)
+
+        unit = np.asarray(vectors, dtype=float)
+        unit /= np.maximum(np.linalg.norm(unit, axis=1, keepdims=True), 1e-12)
+        buckets = []
+        for cluster in clusters:
+            similarity = unit[cluster] @ unit[cluster].T
+            if len(cluster) > 1:
+                centrality = (similarity.sum(axis=1) - 1.0) / (len(cluster) - 1)
+                cohesion = float(centrality.mean())
+            else:
+                centrality = np.ones(1)
+                cohesion = 1.0
+            anchor = items[cluster[int(np.argmax(centrality))]]
+            buckets.append(
+                EmbeddingBucket(
+                    item_ids=[items[index].id for index in cluster],
+                    anchor_id=anchor.id,
+                    anchor_key=anchor.key,
+                    cohesion=cohesion,
+                )
+            )
+        return buckets
+
+
+def partition_stats(buckets: Sequence[Sequence[int]]) -> dict[str, int]:
+    """Shape of one bucketing result."""
+    sizes = [len(bucket) for bucket in buckets]
+    return {
+        "bucket_count": len(sizes),
+        "singleton_count": sum(1 for size in sizes if size == 1),
+        "max_bucket_size": max(sizes, default=0),
+        "oversized_bucket_count": sum(1 for size in sizes if size > MAX_BUCKET_SIZE),
+    }
+
+
+def pairwise_agreement(reference: Sequence[Sequence[int]], candidate: Sequence[Sequence[int]]) -> dict[str, float]:
+    """
+    Compare two bucketings by the item pairs they put together.
+
+    Precision is the share of candidate pairs the reference also groups; recall the
+    share of reference pairs the candidate recovers. Both are 1.0 when neither side
+    groups anything.
+    """
+
+    def _pairs(buckets: Sequence[Sequence[int]]) -> set[tuple[int, int]]:
+        return {pair for bucket in buckets for pair in itertools.combinations(sorted(bucket), 2)}
+
+    reference_pairs = _pairs(reference)
+    candidate_pairs = _pairs(candidate)
+    shared = len(reference_pairs & candidate_pairs)
+    precision = shared / len(candidate_pairs) if candidate_pairs else 1.0
+    recall = shared / len(reference_pairs) if reference_pairs else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
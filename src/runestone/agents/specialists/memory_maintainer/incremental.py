@@ -0,0 +1,143 @@
+"""Change detection for incremental memory maintenance runs."""
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from runestone.agents.service_providers import provide_memory_maintenance_watermark_service
+from runestone.services.memory_maintenance_watermark_service import MaintenanceWatermark
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_BUCKET_NOTE = (
+    "Items listed in `representative_item_ids` each stand for an existing topic cluster that was already "
+    "reconciled in an earlier run. Put a new item into a representative's bucket only when it belongs to that "
+    "cluster's topic, and keep representatives without related new items in their own buckets."
+)
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Scope items that changed since the last clean run, and the clusters that did not."""
+
+    changed_ids: list[int]
+    removed_ids: list[int]
+    clusters: list[list[int]]
+
+    @property
+    def unchanged(self) -> bool:
+        return not self.changed_ids and not self.removed_ids
+
+    def representatives(self) -> dict[int, list[int]]:
+        """Map each unchanged cluster's representative (its first item) to all of its items."""
+        return {cluster[0]: cluster for cluster in self.clusters}
+
+    def expand(self, item_ids: Sequence[int]) -> list[int]:
+        """Replace representatives in a bucket with the full clusters they stand for."""
+        representatives = self.representatives()
+        expanded: list[int] = []
+        for item_id in item_ids:
+            expanded.extend(representatives.get(item_id, [item_id]))
+        return expanded
+
+
+def item_fingerprint(item: Any) -> str:
+    """Hash the fields a maintainer reviews, so edits to any of them mark the item as changed."""
+    payload = json.dumps(
+        [item.key, item.content, item.status, getattr(item, "priority", None)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compute_change_set(scope_items: Sequence[Any], watermark: MaintenanceWatermark) -> ChangeSet:
+    """Diff the current scope against the watermark of the last clean run."""
+    hashes = {item.id: item_fingerprint(item) for item in scope_items}
+    changed_ids = [item_id for item_id, value in hashes.items() if watermark.item_hashes.get(item_id) != value]
+    removed_ids = [item_id for item_id in watermark.item_hashes if item_id not in hashes]
+
+    changed = set(changed_ids)
+    clustered: set[int] = set()
+    clusters: list[list[int]] = []
+    for cluster in watermark.clusters:
+        kept = [
+            item_id for item_id in cluster if item_id in hashes and item_id not in changed and item_id not in clustered
+        ]
+        if kept:
+            clusters.append(kept)
+            clustered.update(kept)
+    # Unchanged items the watermark never clustered still need a representative.
+    clusters.extend([item_id] for item_id in hashes if item_id not in changed and item_id not in clustered)
+    return ChangeSet(changed_ids=changed_ids, removed_ids=removed_ids, clusters=clusters)
+
+
+def build_watermark(
+    *,
+    scope_items: Sequence[Any],
+    clusters: Iterable[Sequence[int]],
+    deleted_ids: Iterable[int],
+    merges: Iterable[tuple[Sequence[int], Any]],
+) -> MaintenanceWatermark:
+    """
+    Describe the scope as a clean run left it.
+
+    Items keep the fingerprint they were reviewed with, so a concurrent edit during
+    the run still counts as a change next time. Merged items join the cluster of
+    their sources and become its representative.
+    """
+    deleted = set(deleted_ids)
+    item_hashes = {item.id: item_fingerprint(item) for item in scope_items if item.id not in deleted}
+    created_by_source: dict[int, list[Any]] = {}
+    for source_ids, created_item in merges:
+        item_hashes[created_item.id] = item_fingerprint(created_item)
+        created_by_source.setdefault(source_ids[0], []).append(created_item)
+
+    next_clusters: list[list[int]] = []
+    for cluster in clusters:
+        created_ids = [created.id for item_id in cluster for created in created_by_source.get(item_id, [])]
+        kept_ids = [item_id for item_id in cluster if item_id in item_hashes]
+        next_cluster = list(dict.fromkeys([*created_ids, *kept_ids]))
+        if next_cluster:
+            next_clusters.append(next_cluster)
+    return MaintenanceWatermark(
+        item_hashes=item_hashes,
+        clusters=next_clusters,
+        last_run_at=datetime.now(timezone.utc),
+    )
+
+
+async def load_change_set(*, user_id: int, domain: str, scope_items: Sequence[Any]) -> ChangeSet | None:
+    """Return the change set since the last clean run, or None when the full scope must be reviewed."""
+    try:
+        async with provide_memory_maintenance_watermark_service() as service:
+            watermark = await service.load(user_id, domain)
+    except Exception as exc:
+        logger.warning("[agents:memorymaintainer] Failed to load %s watermark: %s", domain, exc)
+        return None
+    if watermark is None:
+        return None
+    return compute_change_set(scope_items, watermark)
+
+
+async def save_watermark(*, user_id: int, domain: str, watermark: MaintenanceWatermark) -> bool:
+    """Persist the watermark of a clean run; failures only cost a full review next time."""
+    try:
+        async with provide_memory_maintenance_watermark_service() as service:
+            return await service.save(user_id, domain, watermark)
+    except Exception as exc:
+        logger.warning("[agents:memorymaintainer] Failed to save %s watermark: %s", domain, exc)
+        return False
+
+
+def change_set_artifact(change_set: ChangeSet, *, sent_item_count: int) -> dict[str, int]:
+    """Summarize a change set for run artifacts."""
+    return {
+        "changed_item_count": len(change_set.changed_ids),
+        "removed_item_count": len(change_set.removed_ids),
+        "unchanged_cluster_count": len(change_set.clusters),
+        "sent_item_count": sent_item_count,
+    }
@@ -11,10 +11,21 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from runestone.agents.circuit_breaker import guarded_structured_output
 from runestone.agents.llm import build_chat_model
 from runestone.agents.schemas import AgentPersonalInfoStatus
 from runestone.agents.service_providers import provide_memory_item_service, provide_user_service
 from runestone.agents.specialists.base import BaseSpecialist, SpecialistAction, SpecialistContext, SpecialistResult
+from runestone.agents.specialists.memory_maintainer.clustering import EmbeddingBucketer
+from runestone.agents.specialists.memory_maintainer.incremental import (
+    INCREMENTAL_BUCKET_NOTE,
+    ChangeSet,
+    build_watermark,
+    change_set_artifact,
+    load_change_set,
+    save_watermark,
+)
+from runestone.agents.specialists.memory_maintainer.shared import elapsed_ms, gather_bounded
 from runestone.api.memory_item_schemas import MemoryCategory
 from runestone.config import Settings
 from runestone.core.exceptions import MemoryItemNotFoundError, PermissionDeniedError
@@ -22,6 +33,7 @@ from runestone.core.exceptions import MemoryItemNotFoundError, PermissionDeniedE
 logger = logging.getLogger(__name__)
 
 PERSONAL_INFO_SUMMARY_MAX_CHARS = 690
+WATERMARK_DOMAIN = MemoryCategory.PERSONAL_INFO.value
 
 PERSONAL_INFO_BUCKET_TOPICS_PROMPT = """
 You are Bjorn, an internal learner-memory maintenance specialist.
@@ -208,6 +220,16 @@ class PlannedGroupResolution:
     created_item_id: int | None = None
 
 
+@dataclass
+class BucketResolution:
+    """Outcome of the review and bake passes for one multi-item personal-info bucket."""
+
+    planned_resolutions: list[PlannedGroupResolution]
+    untouched_active_items: list[Any]
+    step_errors: list[str]
+    elapsed_ms: int
+
+
 class PersonalInfoMemoryMaintainer(BaseSpecialist):
     """Background specialist that reconciles raw personal-info facts."""
 
@@ -218,14 +240,22 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
         super().__init__(name="memory_maintainer")
         self.settings = settings
         self.model = build_chat_model(settings, "memory_maintainer")
+        self.bucketer = EmbeddingBucketer(
+            similarity_threshold=settings.memory_maintainer_embedding_similarity_threshold
+        )
 
     async def run(self, context: SpecialistContext) -> SpecialistResult:
         """Run the personal-info maintainer through the shared specialist contract."""
         return await self.run_for_user(context.user)
 
-    async def run_for_user(self, user: Any) -> SpecialistResult:
+    async def run_for_user(
+        self,
+        user: Any,
+        *,
+        trigger_source: Literal["chat_reset", "scheduled"] = "chat_reset",
+    ) -> SpecialistResult:
         """Run personal-info maintenance in background mode."""
-        return await self.run_session(user=user, dry_run=False, trigger_source="chat_reset")
+        return await self.run_session(user=user, dry_run=False, trigger_source=trigger_source)
 
     async def run_cli_for_user(self, user: Any, *, dry_run: bool) -> SpecialistResult:
         """Run personal-info maintenance for CLI inspection or application."""
@@ -236,12 +266,14 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
         *,
         user: Any,
         dry_run: bool,
-        trigger_source: Literal["chat_reset", "cli"],
+        trigger_source: Literal["chat_reset", "scheduled", "cli"],
     ) -> SpecialistResult:
         """Execute personal-info review, summary synthesis, and optional persistence."""
         started_at = perf_counter()
         user_id = int(getattr(user, "id"))
         artifacts = self._base_artifacts(trigger_source=trigger_source, dry_run=dry_run)
+        stage_timings = artifacts["stage_timings_ms"]
+        artifacts["bucket_concurrency"] = self.settings.memory_maintainer_concurrency
         logger.info(
             "[agents:memorymaintainer] personal_info run started user_id=%s trigger=%s dry_run=%s",
             user_id,
@@ -251,6 +283,7 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
 
         try:
             scope_items = await self._load_scope_items(user_id=user_id)
+            stage_timings["scope_load"] = elapsed_ms(started_at)
         except Exception as exc:
             logger.warning("[agents:memorymaintainer] Failed to load personal_info scope: %s", exc, exc_info=True)
             artifacts["summary"] = "scope_load_failed"
@@ -273,21 +306,79 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
             artifacts["no_change_reason"] = "no_personal_info_items"
             return self._no_action_result(artifacts)
 
+        # Incremental background runs only bucket rows changed since the last clean run,
+        # next to one representative per already-reconciled cluster.
+        change_set: ChangeSet | None = None
+        if self.settings.memory_maintainer_incremental_enabled and trigger_source != "cli":
+            change_set = await load_change_set(user_id=user_id, domain=WATERMARK_DOMAIN, scope_items=scope_items)
+        bucket_scope_items = scope_items
+        representative_ids: list[int] | None = None
+        if change_set is not None:
+            representative_ids = list(change_set.representatives())
+            sent_ids = {*change_set.changed_ids, *representative_ids} if change_set.changed_ids else set()
+            bucket_scope_items = [item for item in scope_items if item.id in sent_ids]
+            artifacts["incremental"] = change_set_artifact(change_set, sent_item_count=len(bucket_scope_items))
+            if change_set.unchanged:
+                logger.info(
+                    "[agents:memorymaintainer] personal_info skipping unchanged scope user_id=%s item_count=%s",
+                    user_id,
+                    len(scope_items),
+                )
+                artifacts["summary"] = "noop"
+                artifacts["no_change_reason"] = "unchanged_since_last_run"
+                return self._no_action_result(artifacts)
+        bucket_items_by_id = {item.id: item for item in bucket_scope_items}
+
         try:
-            # Step 1: ask the model for broad candidate topic buckets, then deterministically
-            # repair common output defects like duplicate ids or dropped singleton items.
-            bucket_plan = await self._bucket_topics(scope_items=scope_items)
-            if bucket_plan is None:
-                artifacts["summary"] = "bucket_plan_failed"
-                artifacts["step_errors"].append("bucket_plan_failed")
-                return self._error_result("Failed to bucket personal_info items", artifacts)
-
-            repaired_bucket_plan = self._repair_bucket_plan(bucket_plan, items_by_id)
-            validated_buckets = self._validate_bucket_plan(repaired_bucket_plan, items_by_id)
-            if validated_buckets is None:
-                artifacts["summary"] = "invalid_bucket_plan"
-                artifacts["step_errors"].append("invalid_bucket_plan")
-                return self._error_result("Personal-info bucket plan was invalid", artifacts)
+            if bucket_scope_items:
+                # Step 1: ask the model for broad candidate topic buckets, then deterministically
+                # repair common output defects like duplicate ids or dropped singleton items.
+                stage_started_at = perf_counter()
+                bucket_plan = None
+                if self.settings.memory_maintainer_bucketing == "embedding":
+                    bucket_plan = await self._embedding_bucket_plan(bucket_scope_items)
+                artifacts["bucketing"] = "embedding" if bucket_plan is not None else "llm"
+                if bucket_plan is None:
+                    bucket_plan = await self._bucket_topics(
+                        scope_items=bucket_scope_items,
+                        representative_ids=representative_ids,
+                    )
+                stage_timings["bucket_topics"] = elapsed_ms(stage_started_at)
+                if bucket_plan is None:
+                    artifacts["summary"] = "bucket_plan_failed"
+                    artifacts["step_errors"].append("bucket_plan_failed")
+                    return self._error_result("Failed to bucket personal_info items", artifacts)
+
+                repaired_bucket_plan = self._repair_bucket_plan(bucket_plan, bucket_items_by_id)
+                validated_buckets = self._validate_bucket_plan(repaired_bucket_plan, bucket_items_by_id)
+                if validated_buckets is None:
+                    artifacts["summary"] = "invalid_bucket_plan"
+                    artifacts["step_errors"].append("invalid_bucket_plan")
+                    return self._error_result("Personal-info bucket plan was invalid", artifacts)
+            else:
+                # Only removals since the last run: no new rows to bucket, but the
+                # summary still has to drop the removed facts.
+                validated_buckets = [
+                    BucketTopicGroup(bucket_label=f"Unchanged cluster {index}", item_ids=cluster)
+                    for index, cluster in enumerate(change_set.clusters, start=1)
+                ]
+
+            # Buckets are reviewed only when they contain a changed row; the rest of an
+            # incremental scope passes through the deterministic singleton path below.
+            review_buckets = validated_buckets
+            if change_set is not None:
+                changed_ids = set(change_set.changed_ids)
+                for bucket in validated_buckets:
+                    bucket.item_ids = change_set.expand(bucket.item_ids)
+                review_buckets = []
+                for bucket in validated_buckets:
+                    if changed_ids.intersection(bucket.item_ids):
+                        review_buckets.append(bucket)
+                    else:
+                        review_buckets.extend(
+                            BucketTopicGroup(bucket_label=bucket.bucket_label, item_ids=[item_id])
+                            for item_id in bucket.item_ids
+                        )
 
             logger.info(
                 "[agents:memorymaintainer] personal_info bucket step completed "
@@ -312,8 +403,31 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
             # Step 2: process each bucket. Singleton buckets are resolved deterministically:
             # active rows stay untouched; correction rows are baked to active in-place;
             # outdated rows are queued for deletion without an LLM call.
-            # Multi-item buckets go through a review pass followed by a bake pass per group.
-            for bucket in validated_buckets:
+            # Multi-item buckets go through a review pass followed by a bake pass per group;
+            # they run concurrently up front and are merged back in bucket order below.
+            multi_item_buckets = [bucket for bucket in review_buckets if len(bucket.item_ids) > 1]
+            stage_started_at = perf_counter()
+            resolutions = await gather_bounded(
+                [
+                    lambda bucket=bucket: self._resolve_bucket(bucket=bucket, items_by_id=items_by_id)
+                    for bucket in multi_item_buckets
+                ],
+                limit=self.settings.memory_maintainer_concurrency,
+            )
+            stage_timings["bucket_resolution"] = elapsed_ms(stage_started_at)
+            artifacts["bucket_resolution_serial_ms"] = sum(resolution.elapsed_ms for resolution in resolutions)
+            logger.info(
+                "[agents:memorymaintainer] personal_info bucket resolution completed user_id=%s bucket_count=%s "
+                "concurrency=%s wall_ms=%s serial_ms=%s elapsed_s=%.2f",
+                user_id,
+                len(multi_item_buckets),
+                self.settings.memory_maintainer_concurrency,
+                stage_timings["bucket_resolution"],
+                artifacts["bucket_resolution_serial_ms"],
+                perf_counter() - started_at,
+            )
+            bucket_resolutions = iter(resolutions)
+            for bucket in review_buckets:
                 bucket_items = [items_by_id[item_id] for item_id in bucket.item_ids]
 
                 if len(bucket.item_ids) == 1:
@@ -353,70 +467,10 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
                         untouched_active_items.append(item)
                     continue
 
-                review = await self._review_bucket(
-                    bucket_label=bucket.bucket_label,
-                    bucket_why=bucket.why,
-                    scope_items=bucket_items,
-                )
-                if review is None:
-                    artifacts["step_errors"].append(f"bucket_review_failed:{bucket.bucket_label}")
-                    # Fallback: preserve existing active items so they are not lost from the summary.
-                    for item in bucket_items:
-                        if item.status == AgentPersonalInfoStatus.ACTIVE.value:
-                            untouched_active_items.append(item)
-                    continue
-
-                validated_groups = self._validate_bucket_review_plan(review, bucket_items)
-                if validated_groups is None:
-                    artifacts["step_errors"].append(f"invalid_bucket_review:{bucket.bucket_label}")
-                    # Fallback: preserve existing active items so they are not lost from the summary.
-                    for item in bucket_items:
-                        if item.status == AgentPersonalInfoStatus.ACTIVE.value:
-                            untouched_active_items.append(item)
-                    continue
-
-                for group in validated_groups:
-                    if len(group.item_ids) == 1:
-                        item = items_by_id[group.item_ids[0]]
-                        status = item.status
-                        if status == AgentPersonalInfoStatus.ACTIVE.value:
-                            untouched_active_items.append(item)
-                        else:
-                            # correction or outdated singleton group → queue for deletion so
-                            # it is actually removed instead of being silently dropped.
-                            planned_resolutions.append(
-                                PlannedGroupResolution(
-                                    bucket_label=bucket.bucket_label,
-                                    source_item_ids=[item.id],
-                                    source_keys=[item.key],
-                                    outcome="delete_all",
-                                    final_key=None,
-                                    final_content=None,
-                                    why=f"Non-active singleton in multi-item bucket review: {group.why}",
-                                )
-                            )
-                        continue
-
-                    bake_plan = await self._bake_group(
-                        bucket_label=bucket.bucket_label,
-                        reviewed_group=group,
-                        scope_items=[items_by_id[item_id] for item_id in group.item_ids],
-                    )
-                    if bake_plan is None:
-                        artifacts["step_errors"].append(f"bake_group_failed:{bucket.bucket_label}:{group.item_ids}")
-                        continue
-
-                    planned_resolutions.append(
-                        PlannedGroupResolution(
-                            bucket_label=bucket.bucket_label,
-                            source_item_ids=group.item_ids,
-                            source_keys=[items_by_id[item_id].key for item_id in group.item_ids],
-                            outcome=bake_plan.outcome,
-                            final_key=bake_plan.final_key,
-                            final_content=bake_plan.final_content,
-                            why=bake_plan.why,
-                        )
-                    )
+                resolution = next(bucket_resolutions)
+                artifacts["step_errors"].extend(resolution.step_errors)
+                planned_resolutions.extend(resolution.planned_resolutions)
+                untouched_active_items.extend(resolution.untouched_active_items)
 
             # Step 3: synthesize summary from the final active fact set.
             synthetic_active_items = [
@@ -456,7 +510,9 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
 
             summary_text: str | None = None
             if active_items:
+                stage_started_at = perf_counter()
                 summary_plan = await self._synthesize_summary(active_items=active_items)
+                stage_timings["summary"] = elapsed_ms(stage_started_at)
                 if summary_plan is None:
                     artifacts["summary"] = "summary_failed"
                     artifacts["step_errors"].append("summary_failed")
@@ -477,12 +533,22 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
                 )
                 return self._action_result(artifacts["summary"], artifacts)
 
+            stage_started_at = perf_counter()
             report = await self._apply_plan(
                 user_id=user_id,
                 planned_resolutions=planned_resolutions,
                 untouched_active_items=untouched_active_items,
                 target_summary=summary_text,
             )
+            stage_timings["execution"] = elapsed_ms(stage_started_at)
+            if self.settings.memory_maintainer_incremental_enabled and not artifacts["step_errors"]:
+                artifacts["watermark_saved"] = await self._record_watermark(
+                    user_id=user_id,
+                    scope_items=scope_items,
+                    buckets=validated_buckets,
+                    planned_resolutions=planned_resolutions,
+                    deleted_ids=report.deleted_item_ids,
+                )
 
             artifacts["kept_active_item_ids"] = report.kept_active_item_ids
             artifacts["outdated_item_ids"] = report.outdated_item_ids
@@ -511,6 +577,117 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
             artifacts["step_errors"].append(f"execution_failed:{type(exc).__name__}")
             return self._error_result("Failed to execute personal_info maintenance", artifacts)
 
+    async def _resolve_bucket(self, *, bucket: BucketTopicGroup, items_by_id: dict[int, Any]) -> BucketResolution:
+        """Run the review pass and per-group bake passes for one multi-item bucket."""
+        bucket_started_at = perf_counter()
+        planned_resolutions: list[PlannedGroupResolution] = []
+        untouched_active_items: list[Any] = []
+        step_errors: list[str] = []
+        bucket_items = [items_by_id[item_id] for item_id in bucket.item_ids]
+
+        review = await self._review_bucket(
+            bucket_label=bucket.bucket_label,
+            bucket_why=bucket.why,
+            scope_items=bucket_items,
+        )
+        validated_groups = None
+        if review is None:
+            step_errors.append(f"bucket_review_failed:{bucket.bucket_label}")
+        else:
+            validated_groups = self._validate_bucket_review_plan(review, bucket_items)
+            if validated_groups is None:
+                step_errors.append(f"invalid_bucket_review:{bucket.bucket_label}")
+        if validated_groups is None:
+            # Fallback: preserve existing active items so they are not lost from the summary.
+            untouched_active_items.extend(
+                item for item in bucket_items if item.status == AgentPersonalInfoStatus.ACTIVE.value
+            )
+            return BucketResolution(
+                planned_resolutions=planned_resolutions,
+                untouched_active_items=untouched_active_items,
+                step_errors=step_errors,
+                elapsed_ms=elapsed_ms(bucket_started_at),
+            )
+
+        for group in validated_groups:
+            if len(group.item_ids) == 1:
+                item = items_by_id[group.item_ids[0]]
+                if item.status == AgentPersonalInfoStatus.ACTIVE.value:
+                    untouched_active_items.append(item)
+                else:
+                    # correction or outdated singleton group → queue for deletion so
+                    # it is actually removed instead of being silently dropped.
+                    planned_resolutions.append(
+                        PlannedGroupResolution(
+                            bucket_label=bucket.bucket_label,
+                            source_item_ids=[item.id],
+                            source_keys=[item.key],
+                            outcome="delete_all",
+                            final_key=None,
+                            final_content=None,
+                            why=f"Non-active singleton in multi-item bucket review: {group.why}",
+                        )
+                    )
+                continue
+
+            bake_plan = await self._bake_group(
+                bucket_label=bucket.bucket_label,
+                reviewed_group=group,
+                scope_items=[items_by_id[item_id] for item_id in group.item_ids],
+            )
+            if bake_plan is None:
+                step_errors.append(f"bake_group_failed:{bucket.bucket_label}:{group.item_ids}")
+                continue
+
+            planned_resolutions.append(
+                PlannedGroupResolution(
+                    bucket_label=bucket.bucket_label,
+                    source_item_ids=group.item_ids,
+                    source_keys=[items_by_id[item_id].key for item_id in group.item_ids],
+                    outcome=bake_plan.outcome,
+                    final_key=bake_plan.final_key,
+                    final_content=bake_plan.final_content,
+                    why=bake_plan.why,
+                )
+            )
+        return BucketResolution(
+            planned_resolutions=planned_resolutions,
+            untouched_active_items=untouched_active_items,
+            step_errors=step_errors,
+            elapsed_ms=elapsed_ms(bucket_started_at),
+        )
+
+    async def _record_watermark(
+        self,
+        *,
+        user_id: int,
+        scope_items: list[Any],
+        buckets: list[BucketTopicGroup],
+        planned_resolutions: list[PlannedGroupResolution],
+        deleted_ids: list[int],
+    ) -> bool:
+        """Persist the incremental watermark after a clean, applied run."""
+        created_ids = [plan.created_item_id for plan in planned_resolutions if plan.created_item_id is not None]
+        created_by_id = {}
+        if created_ids:
+            try:
+                async with provide_memory_item_service() as service:
+                    created_by_id = {item.id: item for item in await service.get_items_by_ids(created_ids)}
+            except Exception as exc:
+                logger.warning("[agents:memorymaintainer] Failed to load baked items for watermark: %s", exc)
+                return False
+        watermark = build_watermark(
+            scope_items=scope_items,
+            clusters=[bucket.item_ids for bucket in buckets],
+            deleted_ids=deleted_ids,
+            merges=[
+                (plan.source_item_ids, created_by_id[plan.created_item_id])
+                for plan in planned_resolutions
+                if plan.created_item_id in created_by_id
+            ],
+        )
+        return await save_watermark(user_id=user_id, domain=WATERMARK_DOMAIN, watermark=watermark)
+
     async def _load_scope_items(self, *, user_id: int) -> list[Any]:
         """Load the full personal-info scope, including internal workflow rows."""
         async with provide_memory_item_service() as service:
@@ -521,20 +698,45 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
             )
         return scope_items
 
-    async def _bucket_topics(self, *, scope_items: list[Any]) -> BucketTopicsPlan | None:
+    async def _embedding_bucket_plan(self, scope_items: list[Any]) -> BucketTopicsPlan | None:
+        """Bucket items locally by embedding similarity; None falls back to LLM bucketing."""
+        try:
+            buckets = await self.bucketer.bucket(scope_items)
+        except Exception as exc:
+            logger.warning(
+                "[agents:memorymaintainer] Embedding bucketing failed, falling back to LLM: %s", exc, exc_info=True
+            )
+            return None
+        return BucketTopicsPlan(
+            buckets=[
+                BucketTopicGroup(bucket_label=bucket.label, item_ids=bucket.item_ids, why=bucket.why)
+                for bucket in buckets
+            ]
+        )
+
+    async def _bucket_topics(
+        self,
+        *,
+        scope_items: list[Any],
+        representative_ids: list[int] | None = None,
+    ) -> BucketTopicsPlan | None:
         """Run the step-1 topic bucketing model."""
-        current_datetime = self._current_datetime_iso()
         payload = {
-            "current_datetime": current_datetime,
+            "current_datetime": self._current_datetime_iso(),
             "all_item_ids": [item.id for item in scope_items],
             "items": [self._serialize_scope_item(item) for item in scope_items],
         }
+        system_prompt = (
+            f"{PERSONAL_INFO_BUCKET_TOPICS_PROMPT}\n\n"
+            "Use the payload current_datetime when deciding whether facts are current, corrected, "
+            "retired, or temporary."
+        )
+        if representative_ids is not None:
+            payload["representative_item_ids"] = representative_ids
+            system_prompt = f"{system_prompt}\n\n{INCREMENTAL_BUCKET_NOTE}"
         return await self._invoke_structured_model(
             BucketTopicsPlan,
-            system_prompt=(
-                f"{PERSONAL_INFO_BUCKET_TOPICS_PROMPT}\n\nCurrent datetime: {current_datetime}\n"
-                "Use this timestamp when deciding whether facts are current, corrected, retired, or temporary."
-            ),
+            system_prompt=system_prompt,
             payload=payload,
             step_name="personal_info_bucket_topics",
         )
@@ -547,10 +749,9 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
         scope_items: list[Any],
     ) -> BucketReviewPlan | None:
         """Run the step-2a bucket review model for one candidate bucket."""
-        current_datetime = self._current_datetime_iso()
         ordered_items = self._sort_items_chronologically(scope_items)
         payload = {
-            "current_datetime": current_datetime,
+            "current_datetime": self._current_datetime_iso(),
             "bucket": {
                 "bucket_label": bucket_label,
                 "why": bucket_why,
@@ -561,8 +762,8 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
         return await self._invoke_structured_model(
             BucketReviewPlan,
             system_prompt=(
-                f"{PERSONAL_INFO_REVIEW_BUCKET_PROMPT}\n\nCurrent datetime: {current_datetime}\n"
-                "Use this timestamp when reasoning about chronology and temporary facts."
+                f"{PERSONAL_INFO_REVIEW_BUCKET_PROMPT}\n\n"
+                "Use the payload current_datetime when reasoning about chronology and temporary facts."
             ),
             payload=payload,
             step_name=f"personal_info_review_bucket:{bucket_label}",
@@ -576,10 +777,9 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
         scope_items: list[Any],
     ) -> BakeGroupPlan | None:
         """Run the step-2b bake model for one reviewed same-topic group."""
-        current_datetime = self._current_datetime_iso()
         ordered_items = self._sort_items_chronologically(scope_items)
         payload = {
-            "current_datetime": current_datetime,
+            "current_datetime": self._current_datetime_iso(),
             "bucket_label": bucket_label,
             "reviewed_group": {
                 "item_ids": reviewed_group.item_ids,
@@ -590,8 +790,8 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
         return await self._invoke_structured_model(
             BakeGroupPlan,
             system_prompt=(
-                f"{PERSONAL_INFO_BAKE_GROUP_PROMPT}\n\nCurrent datetime: {current_datetime}\n"
-                "Use this timestamp when deciding whether the fact still survives."
+                f"{PERSONAL_INFO_BAKE_GROUP_PROMPT}\n\n"
+                "Use the payload current_datetime when deciding whether the fact still survives."
             ),
             payload=payload,
             step_name=f"personal_info_bake_group:{bucket_label}:{reviewed_group.item_ids}",
@@ -599,16 +799,15 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
 
     async def _synthesize_summary(self, *, active_items: list[Any]) -> PersonalInfoSummaryPlan | None:
         """Run the step-3 summary synthesis model over the final active fact set."""
-        current_datetime = self._current_datetime_iso()
         payload = {
-            "current_datetime": current_datetime,
+            "current_datetime": self._current_datetime_iso(),
             "active_items": [self._serialize_scope_item(item) for item in active_items],
         }
         return await self._invoke_structured_model(
             PersonalInfoSummaryPlan,
             system_prompt=(
-                f"{PERSONAL_INFO_SUMMARY_PROMPT}\n\nCurrent datetime: {current_datetime}\n"
-                "Use this timestamp to avoid including expired temporary facts in the summary."
+                f"{PERSONAL_INFO_SUMMARY_PROMPT}\n\n"
+                "Use the payload current_datetime to avoid including expired temporary facts in the summary."
             ),
             payload=payload,
             step_name="personal_info_summary",
@@ -628,7 +827,7 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
             logger.warning("[agents:memorymaintainer] Model does not support structured output for %s", step_name)
             return None
 
-        structured_model = with_structured_output(schema)
+        structured_model = guarded_structured_output(self.model, schema)
         call_started_at = perf_counter()
         logger.info(
             "[agents:memorymaintainer] llm step started step=%s item_count=%s",
@@ -1000,6 +1199,7 @@ class PersonalInfoMemoryMaintainer(BaseSpecialist):
             "summary_preview": None,
             "persisted_summary": None,
             "step_errors": [],
+            "stage_timings_ms": {},
             "summary": "",
             "no_change_reason": None,
         }
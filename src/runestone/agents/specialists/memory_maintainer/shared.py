@@ -1,9 +1,35 @@
 """Shared helpers for memory maintainer package modules."""
 
-from typing import Any
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from time import perf_counter
+from typing import Any, TypeVar
 
 from runestone.agents.specialists.base import SpecialistAction, SpecialistResult
 
+T = TypeVar("T")
+
+
+async def gather_bounded(factories: Sequence[Callable[[], Awaitable[T]]], *, limit: int) -> list[T]:
+    """
+    Run independent steps with at most `limit` in flight.
+
+    Results keep the order of `factories`, so callers can apply them
+    deterministically regardless of which step finished first.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return list(await asyncio.gather(*(_run(factory) for factory in factories)))
+
+
+def elapsed_ms(started_at: float) -> int:
+    """Return elapsed milliseconds from a `perf_counter` start timestamp."""
+    return int((perf_counter() - started_at) * 1000)
+
 
 def build_combined_result(
     *,
@@ -1,7 +1,7 @@
 """High-level memory maintainer orchestrator."""
 
 import asyncio
-from typing import Any
+from typing import Any, Literal
 
 from runestone.agents.specialists.base import BaseSpecialist, SpecialistContext, SpecialistResult
 from runestone.config import Settings
@@ -24,14 +24,19 @@ class CombinedMemoryMaintainerSpecialist(BaseSpecialist):
         """Run the combined background maintenance flow via the specialist contract."""
         return await self.run_for_user(context.user)
 
-    async def run_for_user(self, user: Any) -> SpecialistResult:
+    async def run_for_user(
+        self,
+        user: Any,
+        *,
+        trigger_source: Literal["chat_reset", "scheduled"] = "chat_reset",
+    ) -> SpecialistResult:
         """Run both background maintenance domains for one user."""
         area_result, personal_result = await asyncio.gather(
-            self.area_to_improve.run_for_user(user),
-            self.personal_info.run_for_user(user),
+            self.area_to_improve.run_for_user(user, trigger_source=trigger_source),
+            self.personal_info.run_for_user(user, trigger_source=trigger_source),
         )
         return build_combined_result(
-            trigger_source="chat_reset",
+            trigger_source=trigger_source,
             dry_run=False,
             area_result=area_result,
             personal_result=personal_result,
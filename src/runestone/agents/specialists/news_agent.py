@@ -8,6 +8,7 @@ import logging
 from langchain.agents import create_agent
 from langchain_core.messages import HumanMessage
 
+from runestone.agents.circuit_breaker import CircuitBreakerMiddleware, circuit_breaker_registry
 from runestone.agents.llm import build_chat_model
 from runestone.agents.specialists.base import (
     BaseSpecialist,
@@ -108,6 +109,7 @@ class NewsAgentSpecialist(BaseSpecialist):
             system_prompt=NEWS_AGENT_SYSTEM_PROMPT,
             response_format=SpecialistResult,
             context_schema=AgentContext,
+            middleware=[CircuitBreakerMiddleware()] if circuit_breaker_registry.binding(self.model) else [],
         )
 
     async def run(self, context: SpecialistContext) -> SpecialistResult:
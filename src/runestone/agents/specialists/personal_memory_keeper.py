@@ -8,6 +8,7 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from runestone.agents.circuit_breaker import guarded_structured_output
 from runestone.agents.llm import build_chat_model
 from runestone.agents.service_providers import provide_memory_item_service
 from runestone.agents.specialists.base import BaseSpecialist, SpecialistAction, SpecialistContext, SpecialistResult
@@ -232,7 +233,7 @@ class PersonalMemoryKeeperSpecialist(BaseSpecialist):
         )
 
     async def _extract(self, payload: dict[str, object]) -> PersonalMemoryKeeperExtraction | SpecialistResult:
-        model = self.model.with_structured_output(PersonalMemoryKeeperExtraction)
+        model = guarded_structured_output(self.model, PersonalMemoryKeeperExtraction)
         try:
             return await model.ainvoke(
                 [
@@ -12,10 +12,12 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from langchain.agents import create_agent
 from langchain.agents.middleware import ModelFallbackMiddleware, ToolCallLimitMiddleware
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langgraph.errors import GraphRecursionError
 from pydantic import ValidationError
 
+from runestone.agents.circuit_breaker import CircuitBreakerMiddleware, circuit_breaker_registry
+from runestone.agents.hedging import HedgedModelMiddleware, hedge_policy_from_settings
 from runestone.agents.llm import build_chat_model
 from runestone.agents.prompts import load_persona
 from runestone.agents.schemas import (
@@ -27,6 +29,7 @@ from runestone.agents.schemas import (
     normalize_teacher_emotion,
 )
 from runestone.agents.specialists.base import INFO_FOR_TEACHER_MAX_CHARS
+from runestone.agents.token_budget import ContextSection, TokenBudget, get_token_counter
 from runestone.agents.tools.context import AgentContext
 from runestone.agents.tools.grammar import read_grammar_page, search_grammar
 from runestone.agents.tools.memory import read_active_learning_focus
@@ -86,6 +89,18 @@ class TeacherAgent:
     RECENT_SIDE_EFFECTS_MAX_CHARS = 2000
     RECALL_WORDS_MAX_ITEMS = 50
     RECALL_WORD_MAX_CHARS = 120
+    # Context sections trimmed first when the turn exceeds its token budget; profile,
+    # current datetime, and the student message are never trimmed.
+    CONTEXT_SECTION_PRIORITIES = {
+        "current_recall_words": 10,
+        "recent_side_effects": 20,
+        "personal_info_summary": 30,
+        "history": 40,
+        "chat_summary": 50,
+        "active_learning_focus": 60,
+        "pre_results": 70,
+    }
+    MIN_HISTORY_MESSAGES = 2
     TOOL_LIMIT_FALLBACK_NOTE = (
         "Internal note: the prior attempt exceeded an internal operation budget this turn. "
         "Answer the student naturally using already available context and do not mention internal limits."
@@ -109,6 +124,7 @@ class TeacherAgent:
         self.persona = load_persona(settings.agent_persona)
         self.agent = self._build_agent()
         self._tool_limit_fallback_agent = None
+        self.token_counter = get_token_counter() if settings.teacher_context_token_budget else None
 
         logger.info(
             "[agents:teacher] Initialized TeacherAgent with provider=%s, " "model=%s, persona=%s",
@@ -277,6 +293,15 @@ Rules:
 - Use it when it helps you personalize the response.
 - Do not mention the tag or raw structure to the student.
 
+### CONVERSATION SUMMARY (INTERNAL)
+You may receive an internal system message starting with `[CONVERSATION_SUMMARY]`.
+This summarizes earlier messages of this chat that are no longer included verbatim.
+
+Rules:
+- Treat it as internal context; the messages that follow it continue the same conversation.
+- Use it to keep continuity (exercises in progress, earlier corrections, introduced words).
+- Do not mention the tag or raw structure to the student.
+
 ### CURRENT RECALL WORDS (INTERNAL)
 You may receive an internal system message starting with `[CURRENT_RECALL_WORDS]`.
 This contains today's current vocabulary queue prepared by RuneRecall.
@@ -301,7 +326,8 @@ Rules:
 - **OUTPUT CONTRACT (MANDATORY):** Your final student-facing reply must never include
   internal markers or wrappers such as
   `[PRE_RESPONSE_SPECIALISTS]`, `[/PRE_RESPONSE_SPECIALISTS]`, `[ACTIVE_LEARNING_FOCUS]`,
-  `[PERSONAL_INFO_SUMMARY]`, `[RECENT_SIDE_EFFECTS]`, `[CURRENT_DATETIME]`, `info_for_teacher`,
+  `[PERSONAL_INFO_SUMMARY]`, `[CONVERSATION_SUMMARY]`, `[RECENT_SIDE_EFFECTS]`, `[CURRENT_DATETIME]`,
+  `info_for_teacher`,
   or raw internal JSON objects copied from internal context blocks.
 - Before finalizing your answer, run a quick self-check and remove any internal tags/JSON wrappers if present.
 </input_context_handling>
@@ -479,9 +505,25 @@ already names a clear topic.
                     ),
                 ]
             )
+        backup_model = None
+        circuit_bound = circuit_breaker_registry.binding(chat_model) is not None
         if settings.teacher_backup_model is not None:
             backup_model = build_chat_model(settings, "teacher_backup")
-            middleware.append(ModelFallbackMiddleware(backup_model))
+            if not circuit_bound:
+                middleware.append(ModelFallbackMiddleware(backup_model))
+        if settings.teacher_hedging_enabled:
+            # Innermost, so a hedge that also fails still falls back to the backup model.
+            middleware.append(
+                HedgedModelMiddleware(
+                    "teacher",
+                    hedge_model=backup_model,
+                    policy=hedge_policy_from_settings(settings),
+                )
+            )
+        if circuit_bound:
+            # Innermost, so every attempt (primary, hedge, fallback) passes its own breaker;
+            # it also fails over to the backup on errors, replacing ModelFallbackMiddleware.
+            middleware.append(CircuitBreakerMiddleware())
 
         agent = create_agent(
             model=chat_model,
@@ -505,70 +547,31 @@ already names a clear topic.
         personal_info_summary: str = "",
         recent_side_effects: list[TeacherSideEffect] | None = None,
         current_recall_words: list[str] | None = None,
+        chat_summary: str = "",
     ) -> TeacherGenerationResult:
         """Generate the final user-facing response.
 
         Note: source extraction is done by `AgentsManager`, not here.
         """
 
-        # Build conversation messages
-        messages = [SystemMessage(content=self._format_current_datetime(user))]
-
-        # Add user's mother tongue if available
-        explanation_language = user.mother_tongue.strip() if user.mother_tongue else ""
-        if explanation_language:
-            language_msg = (
-                f"[IMPORTANT] STUDENT'S MOTHER TONGUE: {explanation_language}\n\n"
-                f"Use {explanation_language} for the surrounding student-facing conversation, including "
-                "explanations, feedback, praise, corrections, instructions, transitions, and follow-up questions. "
-                "Keep Swedish for the language being learned: words, quotations, examples, and the actual content "
-                "of exercises. A student's answer written in Swedish does not by itself request a change of "
-                "conversation language. Only change the surrounding conversation language when the student "
-                "explicitly asks."
-            )
-            messages.append(SystemMessage(content=language_msg))
-
-        # Add foundational context before derived specialist outputs.
-        if active_learning_focus_memory:
-            messages.append(
-                SystemMessage(content=self._format_active_learning_focus_memory(active_learning_focus_memory))
-            )
-        if personal_info_summary:
-            messages.append(SystemMessage(content=self._format_personal_info_summary(personal_info_summary)))
-        if current_recall_words:
-            safe_recall_words = self._sanitize_current_recall_words(current_recall_words)
-            if safe_recall_words:
-                logger.info(
-                    "[agents:teacher] Injecting %s current recall words into teacher prompt for user_id=%s: %s",
-                    len(safe_recall_words),
-                    user.id,
-                    json.dumps(safe_recall_words, ensure_ascii=False),
-                )
-                messages.append(SystemMessage(content=self._format_current_recall_words(current_recall_words)))
-        if pre_results:
-            messages.append(SystemMessage(content=self._format_pre_results(pre_results)))
-        if recent_side_effects:
-            messages.append(SystemMessage(content=self._format_recent_side_effects(recent_side_effects)))
-
-        # Add conversation history
-        truncated_history = history[-self.MAX_HISTORY_MESSAGES :] if history else []
-        if history and len(history) > self.MAX_HISTORY_MESSAGES:
-            logger.warning(
-                "[agents:teacher] Truncated chat history from %s to %s messages",
-                len(history),
-                len(truncated_history),
-            )
-        for msg in truncated_history:
-            if msg.role == "user":
-                messages.append(HumanMessage(content=msg.content))
-            elif msg.role == "assistant":
-                content = msg.content
-                if msg.sources:
-                    content += self._format_sources(msg.sources)
-                messages.append(AIMessage(content=content))
-
-        # Add current user message
-        messages.append(HumanMessage(content=message))
+        # Order context from most to least stable so provider prefix caching can reuse
+        # the static system prompt, slow-changing user context, and earlier history.
+        sections = [
+            *self._build_user_context_sections(
+                user,
+                active_learning_focus_memory=active_learning_focus_memory,
+                personal_info_summary=personal_info_summary,
+            ),
+            *self._build_history_sections(history, chat_summary=chat_summary),
+            *self._build_turn_context_sections(
+                user,
+                pre_results=pre_results,
+                recent_side_effects=recent_side_effects,
+                current_recall_words=current_recall_words,
+            ),
+        ]
+        current_message = HumanMessage(content=message)
+        messages = [*self._fit_context_budget(sections, current_message, user=user), current_message]
 
         try:
             result = await self.agent.ainvoke(
@@ -628,6 +631,165 @@ already names a clear topic.
             final_messages=final_messages,
         )
 
+    def _build_user_context_sections(
+        self,
+        user: User,
+        *,
+        active_learning_focus_memory: str,
+        personal_info_summary: str,
+    ) -> list[ContextSection[BaseMessage]]:
+        """Build slow-changing per-user context that stays byte-identical across turns."""
+        sections: list[ContextSection[BaseMessage]] = []
+
+        # Add user's mother tongue if available
+        explanation_language = user.mother_tongue.strip() if user.mother_tongue else ""
+        if explanation_language:
+            language_msg = (
+                f"[IMPORTANT] STUDENT'S MOTHER TONGUE: {explanation_language}\n\n"
+                f"Use {explanation_language} for the surrounding student-facing conversation, including "
+                "explanations, feedback, praise, corrections, instructions, transitions, and follow-up questions. "
+                "Keep Swedish for the language being learned: words, quotations, examples, and the actual content "
+                "of exercises. A student's answer written in Swedish does not by itself request a change of "
+                "conversation language. Only change the surrounding conversation language when the student "
+                "explicitly asks."
+            )
+            sections.append(self._required_section("profile", [SystemMessage(content=language_msg)]))
+
+        # Add foundational context before derived specialist outputs.
+        if active_learning_focus_memory:
+            sections.append(
+                self._optional_section(
+                    "active_learning_focus",
+                    SystemMessage(content=self._format_active_learning_focus_memory(active_learning_focus_memory)),
+                )
+            )
+        if personal_info_summary:
+            sections.append(
+                self._optional_section(
+                    "personal_info_summary",
+                    SystemMessage(content=self._format_personal_info_summary(personal_info_summary)),
+                )
+            )
+        return sections
+
+    def _build_history_sections(
+        self,
+        history: list[ChatMessage],
+        *,
+        chat_summary: str,
+    ) -> list[ContextSection[BaseMessage]]:
+        """Build the conversation summary and the raw history window, oldest message first."""
+        sections: list[ContextSection[BaseMessage]] = []
+        if chat_summary:
+            sections.append(
+                self._optional_section("chat_summary", SystemMessage(content=self._format_chat_summary(chat_summary)))
+            )
+
+        truncated_history = history[-self.MAX_HISTORY_MESSAGES :] if history else []
+        if history and len(history) > self.MAX_HISTORY_MESSAGES:
+            logger.warning(
+                "[agents:teacher] Truncated chat history from %s to %s messages",
+                len(history),
+                len(truncated_history),
+            )
+        messages: list[BaseMessage] = []
+        for msg in truncated_history:
+            if msg.role == "user":
+                messages.append(HumanMessage(content=msg.content))
+            elif msg.role == "assistant":
+                content = msg.content
+                if msg.sources:
+                    content += self._format_sources(msg.sources)
+                messages.append(AIMessage(content=content))
+        if messages:
+            sections.append(
+                ContextSection(
+                    name="history",
+                    priority=self.CONTEXT_SECTION_PRIORITIES["history"],
+                    units=messages,
+                    min_units=min(self.MIN_HISTORY_MESSAGES, len(messages)),
+                )
+            )
+        return sections
+
+    def _build_turn_context_sections(
+        self,
+        user: User,
+        *,
+        pre_results: list[dict] | None,
+        recent_side_effects: list[TeacherSideEffect] | None,
+        current_recall_words: list[str] | None,
+    ) -> list[ContextSection[BaseMessage]]:
+        """Build volatile context that changes every turn; it goes after history, right before the message."""
+        sections = [
+            self._required_section("current_datetime", [SystemMessage(content=self._format_current_datetime(user))])
+        ]
+        if current_recall_words:
+            safe_recall_words = self._sanitize_current_recall_words(current_recall_words)
+            if safe_recall_words:
+                logger.info(
+                    "[agents:teacher] Injecting %s current recall words into teacher prompt for user_id=%s: %s",
+                    len(safe_recall_words),
+                    user.id,
+                    json.dumps(safe_recall_words, ensure_ascii=False),
+                )
+                sections.append(
+                    self._optional_section(
+                        "current_recall_words",
+                        SystemMessage(content=self._format_current_recall_words(current_recall_words)),
+                    )
+                )
+        if pre_results:
+            sections.append(
+                self._optional_section("pre_results", SystemMessage(content=self._format_pre_results(pre_results)))
+            )
+        if recent_side_effects:
+            sections.append(
+                self._optional_section(
+                    "recent_side_effects",
+                    SystemMessage(content=self._format_recent_side_effects(recent_side_effects)),
+                )
+            )
+        return sections
+
+    @staticmethod
+    def _required_section(name: str, messages: list[BaseMessage]) -> ContextSection[BaseMessage]:
+        return ContextSection(name=name, priority=0, units=messages, min_units=len(messages))
+
+    def _optional_section(self, name: str, message: BaseMessage) -> ContextSection[BaseMessage]:
+        return ContextSection(name=name, priority=self.CONTEXT_SECTION_PRIORITIES[name], units=[message])
+
+    def _fit_context_budget(
+        self,
+        sections: list[ContextSection[BaseMessage]],
+        current_message: HumanMessage,
+        *,
+        user: User,
+    ) -> list[BaseMessage]:
+        """Trim the lowest-priority context so the turn fits `teacher_context_token_budget`."""
+        if self.token_counter is None:
+            return [message for section in sections for message in section.units]
+
+        budget = TokenBudget(self.settings.teacher_context_token_budget, self.token_counter.count_message)
+        allocation = budget.allocate(sections, reserved_tokens=self.token_counter.count_message(current_message))
+        logger.info(
+            "[agents:teacher] Context tokens user_id=%s total=%s budget=%s message=%s sections=%s trimmed=%s",
+            user.id,
+            allocation.total_tokens,
+            allocation.budget,
+            allocation.reserved_tokens,
+            allocation.format_fields(allocation.used_tokens),
+            allocation.format_fields(allocation.trimmed_tokens),
+        )
+        if allocation.over_budget:
+            logger.warning(
+                "[agents:teacher] Context exceeds token budget after trimming user_id=%s total=%s budget=%s",
+                user.id,
+                allocation.total_tokens,
+                allocation.budget,
+            )
+        return allocation.units()
+
     def _get_tool_limit_fallback_agent(self):
         """Lazily build a variant without tools for graceful fallback runs."""
         if self._tool_limit_fallback_agent is None:
@@ -803,6 +965,16 @@ already names a clear topic.
             ]
         )
 
+    @staticmethod
+    def _format_chat_summary(chat_summary: str) -> str:
+        return "\n".join(
+            [
+                "[CONVERSATION_SUMMARY]",
+                "This summarizes earlier messages of this chat; the history below continues from it.",
+                chat_summary,
+            ]
+        )
+
     @classmethod
     def _sanitize_current_recall_words(cls, current_recall_words: list[str]) -> list[str]:
         """Normalize recall words before logging or injecting them into prompts."""
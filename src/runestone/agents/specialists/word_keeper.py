@@ -12,6 +12,7 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field, field_validator
 
+from runestone.agents.circuit_breaker import guarded_structured_output
 from runestone.agents.llm import build_chat_model
 from runestone.agents.service_providers import provide_vocabulary_service
 from runestone.agents.specialists.base import BaseSpecialist, SpecialistAction, SpecialistContext, SpecialistResult
@@ -19,9 +20,12 @@ from runestone.config import Settings
 from runestone.core.observability import elapsed_ms_since
 from runestone.schemas.vocabulary_save import (
     PriorityWordSaveItem,
+    SharedWordEnrichment,
     VocabularyPrioritizationAction,
     WordSaveCandidate,
     decode_unicode_escapes,
+    enrichment_prompt_version,
+    word_enrichment_key,
 )
 
 logger = logging.getLogger(__name__)
@@ -123,6 +127,9 @@ If unsure, leave `extra_info` empty rather than guess.
 Return valid JSON matching the provided schema. Include one item for each requested word you can complete.
 """
 
+WORDKEEPER_ENRICHMENT_PROMPT_VERSION = enrichment_prompt_version("word_keeper", WORDKEEPER_ENRICHMENT_PROMPT)
+PREWARM_BATCH_SIZE = 25
+
 
 class WordKeeperExtraction(BaseModel):
     """Structured result for WordKeeper extraction."""
@@ -283,14 +290,18 @@ class WordKeeperSpecialist(BaseSpecialist):
         if not new_candidates:
             return
 
-        enrichment = await self._enrich_new_words(context, new_candidates)
-        if enrichment is None:
-            state.skipped_words.extend(
-                {"word_phrase": candidate.word_phrase, "reason": "enrichment_failed"} for candidate in new_candidates
-            )
+        enriched_items, failed_candidates = await self._enrich_with_shared_cache(
+            context, vocabulary_service, new_candidates
+        )
+        state.skipped_words.extend(
+            {"word_phrase": candidate.word_phrase, "reason": "enrichment_failed"} for candidate in failed_candidates
+        )
+        failed_ids = {candidate.candidate_id for candidate in failed_candidates}
+        new_candidates = [candidate for candidate in new_candidates if candidate.candidate_id not in failed_ids]
+        if not new_candidates:
             return
 
-        enriched_by_id = {item.candidate_id.strip(): item for item in enrichment.items if item.candidate_id.strip()}
+        enriched_by_id = {item.candidate_id.strip(): item for item in enriched_items if item.candidate_id.strip()}
         completed_words: list[PriorityWordSaveItem] = []
         for action in new_candidates:
             item = enriched_by_id.get(action.candidate_id)
@@ -317,6 +328,150 @@ class WordKeeperSpecialist(BaseSpecialist):
         if completed_words:
             await self._save_enriched_words(context, vocabulary_service, completed_words, state)
 
+    async def _enrich_with_shared_cache(
+        self,
+        context: SpecialistContext,
+        vocabulary_service,
+        new_candidates: list[VocabularyPrioritizationAction],
+    ) -> tuple[list[WordEnrichmentItem], list[VocabularyPrioritizationAction]]:
+        """
+        Enrich new words from the cross-user cache first and send only misses to the LLM.
+
+        Returns the enrichment items plus the candidates whose LLM enrichment failed.
+        """
+        target_language = self._target_translation_language(context)
+        cached = await vocabulary_service.get_shared_enrichments(
+            [candidate.word_phrase for candidate in new_candidates],
+            target_language=target_language,
+            prompt_version=WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
+        )
+
+        items: list[WordEnrichmentItem] = []
+        misses: list[VocabularyPrioritizationAction] = []
+        for candidate in new_candidates:
+            hit = cached.get(word_enrichment_key(candidate.word_phrase))
+            # The learner's own context sentence beats the generic cached example.
+            example_phrase = (candidate.context_phrase or "").strip() or (hit.example_phrase if hit else None)
+            if hit is None or not hit.translation or not example_phrase:
+                misses.append(candidate)
+                continue
+            items.append(
+                WordEnrichmentItem(
+                    candidate_id=candidate.candidate_id,
+                    word_phrase=candidate.word_phrase,
+                    translation=hit.translation,
+                    example_phrase=example_phrase,
+                    extra_info=hit.extra_info,
+                )
+            )
+
+        if cached:
+            logger.info(
+                "[agents:wordkeeper] Shared enrichment cache hits=%s misses=%s language=%s",
+                len(items),
+                len(misses),
+                target_language,
+            )
+        if not misses:
+            return items, []
+
+        enrichment = await self._enrich_new_words(misses, target_language)
+        if enrichment is None:
+            return items, misses
+
+        items.extend(enrichment.items)
+        misses_by_id = {candidate.candidate_id: candidate for candidate in misses}
+        await vocabulary_service.store_shared_enrichments(
+            [
+                self._shared_enrichment(item, misses_by_id[item.candidate_id.strip()])
+                for item in enrichment.items
+                if item.candidate_id.strip() in misses_by_id
+            ],
+            target_language=target_language,
+            prompt_version=WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
+        )
+        return items, []
+
+    @staticmethod
+    def _shared_enrichment(item: WordEnrichmentItem, candidate: VocabularyPrioritizationAction) -> SharedWordEnrichment:
+        # Examples built from a learner's chat sentence stay private to that learner.
+        return SharedWordEnrichment(
+            word_phrase=candidate.word_phrase,
+            translation=(item.translation or "").strip() or None,
+            example_phrase=None if candidate.context_phrase else (item.example_phrase or "").strip() or None,
+            extra_info=(item.extra_info or "").strip() or None,
+        )
+
+    async def prewarm_shared_enrichment(
+        self,
+        vocabulary_service,
+        *,
+        languages: list[str] | None = None,
+        limit: int = 1000,
+        batch_size: int = PREWARM_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Fill the cross-user enrichment cache from phrases already saved in vocabulary.
+
+        Only the phrases are read from user vocabulary; translations, examples and
+        notes are generated fresh so no user-authored text enters the shared table.
+
+        Returns:
+            Per-language counts of candidate phrases, cache hits, generated rows and failures
+        """
+        phrases_by_language: dict[str, dict[str, str]] = {}
+        for word_phrase, mother_tongue, _user_count in await vocabulary_service.repo.list_shared_word_phrases(limit):
+            language = mother_tongue.strip() if isinstance(mother_tongue, str) and mother_tongue.strip() else "English"
+            if languages and language.lower() not in {item.lower() for item in languages}:
+                continue
+            phrases_by_language.setdefault(language, {}).setdefault(word_enrichment_key(word_phrase), word_phrase)
+
+        summary: dict[str, dict[str, int]] = {}
+        for language, phrases in phrases_by_language.items():
+            cached = await vocabulary_service.get_shared_enrichments(
+                list(phrases.values()),
+                target_language=language,
+                prompt_version=WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
+            )
+            pending = [phrase for key, phrase in phrases.items() if key not in cached]
+            stats = {"phrases": len(phrases), "cached": len(phrases) - len(pending), "generated": 0, "failed": 0}
+            summary[language] = stats
+            if dry_run:
+                continue
+
+            for start in range(0, len(pending), batch_size):
+                batch = [
+                    VocabularyPrioritizationAction(
+                        candidate_id=str(index),
+                        word_phrase=word_phrase,
+                        source_form=None,
+                        context_phrase=None,
+                        action="missing",
+                        word_id=None,
+                        changed=False,
+                    )
+                    for index, word_phrase in enumerate(pending[start : start + batch_size])
+                ]
+                enrichment = await self._enrich_new_words(batch, language)
+                by_id = {candidate.candidate_id: candidate for candidate in batch}
+                entries = [
+                    self._shared_enrichment(item, by_id[item.candidate_id.strip()])
+                    for item in (enrichment.items if enrichment else [])
+                    if item.candidate_id.strip() in by_id and (item.translation or "").strip()
+                ]
+                await vocabulary_service.store_shared_enrichments(
+                    entries,
+                    target_language=language,
+                    prompt_version=WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
+                )
+                # Nothing else commits the prewarm session; keep each finished batch.
+                await vocabulary_service.repo.db.commit()
+                stats["generated"] += len(entries)
+                stats["failed"] += len(batch) - len(entries)
+            logger.info("[agents:wordkeeper] Prewarmed shared enrichment language=%s stats=%s", language, stats)
+        return summary
+
     async def _save_enriched_words(
         self,
         context: SpecialistContext,
@@ -379,7 +534,7 @@ class WordKeeperSpecialist(BaseSpecialist):
         )
 
     async def _extract_candidates(self, context: SpecialistContext) -> WordKeeperExtraction:
-        model = self.model.with_structured_output(WordKeeperExtraction)
+        model = guarded_structured_output(self.model, WordKeeperExtraction)
         payload = {
             "message": context.message,
             "teacher_response": context.teacher_response,
@@ -401,13 +556,13 @@ class WordKeeperSpecialist(BaseSpecialist):
 
     async def _enrich_new_words(
         self,
-        context: SpecialistContext,
         new_candidates: list[VocabularyPrioritizationAction],
+        target_translation_language: str,
     ) -> WordKeeperEnrichment | None:
-        model = self.model.with_structured_output(WordKeeperEnrichment)
+        model = guarded_structured_output(self.model, WordKeeperEnrichment)
         payload = {
             "new_words": [candidate.as_artifact() for candidate in new_candidates],
-            "target_translation_language": self._target_translation_language(context),
+            "target_translation_language": target_translation_language,
         }
         try:
             return await model.ainvoke(
@@ -0,0 +1,163 @@
+"""
+Token budget for per-turn agent context assembly.
+
+A prompt is described as ordered sections of units (messages). When the
+sections exceed the budget, units are dropped from the lowest-priority section
+first, oldest unit first, so the most valuable context survives and each turn's
+input size stays bounded.
+"""
+
+import logging
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Generic, TypeVar
+
+import tiktoken
+from langchain_core.messages import BaseMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_ENCODING = "o200k_base"
+# Used only when the tiktoken encoding cannot be loaded (e.g. no network on first use).
+CHARS_PER_TOKEN_ESTIMATE = 4
+# Role and framing tokens that chat APIs add around every message.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+T = TypeVar("T")
+
+
+class TokenCounter:
+    """Count tokens locally with tiktoken, falling back to a character estimate."""
+
+    def __init__(self, encoding_name: str = DEFAULT_TOKEN_ENCODING):
+        self.encoding_name = encoding_name
+        try:
+            self._encoding = tiktoken.get_encoding(encoding_name)
+        except Exception as exc:
+            logger.warning(
+                "[agents:token-budget] Tokenizer %s unavailable, estimating %s chars per token: %s",
+                encoding_name,
+                CHARS_PER_TOKEN_ESTIMATE,
+                exc,
+            )
+            self._encoding = None
+
+    @property
+    def exact(self) -> bool:
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is None:
+            return math.ceil(len(text) / CHARS_PER_TOKEN_ESTIMATE)
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def count_message(self, message: BaseMessage) -> int:
+        return self.count(message.text) + MESSAGE_OVERHEAD_TOKENS
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(encoding_name: str = DEFAULT_TOKEN_ENCODING) -> TokenCounter:
+    """Return the process-wide counter for an encoding; the encoding is loaded once."""
+    return TokenCounter(encoding_name)
+
+
+@dataclass
+class ContextSection(Generic[T]):
+    """
+    One named part of a prompt.
+
+    Lower `priority` is trimmed first. Units are dropped from the front (oldest
+    first) until only `min_units` remain; set `min_units=len(units)` for context
+    that must never be dropped.
+    """
+
+    name: str
+    priority: int
+    units: list[T]
+    min_units: int = 0
+
+
+@dataclass(frozen=True)
+class BudgetAllocation(Generic[T]):
+    """Result of fitting sections into a token budget."""
+
+    budget: int
+    reserved_tokens: int
+    sections: list[ContextSection[T]]
+    used_tokens: dict[str, int]
+    trimmed_tokens: dict[str, int] = field(default_factory=dict)
+    dropped_units: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.reserved_tokens + sum(self.used_tokens.values())
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total_tokens > self.budget
+
+    def units(self) -> list[T]:
+        """Kept units of all sections, in section order."""
+        return [unit for section in self.sections for unit in section.units]
+
+    @staticmethod
+    def format_fields(values: dict[str, int]) -> str:
+        return ",".join(f"{name}:{value}" for name, value in values.items()) or "-"
+
+
+class TokenBudget:
+    """Allocate a fixed token budget across prioritized prompt sections."""
+
+    def __init__(self, max_tokens: int, measure: Callable[[T], int]):
+        self.max_tokens = max_tokens
+        self.measure = measure
+
+    def allocate(self, sections: Sequence[ContextSection[T]], *, reserved_tokens: int = 0) -> BudgetAllocation[T]:
+        """
+        Drop the lowest-value units until the sections fit next to `reserved_tokens`.
+
+        Sections keep their order; when even the minimum units exceed the budget,
+        the allocation is returned with `over_budget` set instead of failing the turn.
+        """
+        unit_tokens = {section.name: [self.measure(unit) for unit in section.units] for section in sections}
+        overflow = reserved_tokens + sum(sum(tokens) for tokens in unit_tokens.values()) - self.max_tokens
+        drop_counts = {section.name: 0 for section in sections}
+        for section in sorted(sections, key=lambda item: item.priority):
+            tokens = unit_tokens[section.name]
+            while overflow > 0 and len(tokens) - drop_counts[section.name] > section.min_units:
+                overflow -= tokens[drop_counts[section.name]]
+                drop_counts[section.name] += 1
+            if overflow <= 0:
+                break
+
+        kept_sections = []
+        used_tokens = {}
+        trimmed_tokens = {}
+        dropped_units = {}
+        for section in sections:
+            dropped = drop_counts[section.name]
+            tokens = unit_tokens[section.name]
+            kept_sections.append(
+                ContextSection(
+                    name=section.name,
+                    priority=section.priority,
+                    units=section.units[dropped:],
+                    min_units=section.min_units,
+                )
+            )
+            used_tokens[section.name] = sum(tokens[dropped:])
+            if dropped:
+                trimmed_tokens[section.name] = sum(tokens[:dropped])
+                dropped_units[section.name] = dropped
+        return BudgetAllocation(
+            budget=self.max_tokens,
+            reserved_tokens=reserved_tokens,
+            sections=kept_sections,
+            used_tokens=used_tokens,
+            trimmed_tokens=trimmed_tokens,
+            dropped_units=dropped_units,
+        )
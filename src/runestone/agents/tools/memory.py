@@ -22,7 +22,9 @@ from runestone.api.memory_item_schemas import (
     MemorySortBy,
     SortDirection,
 )
+from runestone.config import settings
 from runestone.core.exceptions import PermissionDeniedError, UserNotFoundError
+from runestone.services.learning_focus_cache import learning_focus_cache
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +167,13 @@ async def read_active_learning_focus(runtime: ToolRuntime[AgentContext]) -> str:
     """Read the student's current high-priority learning focus for Teacher."""
     logger.info("Agent tool call: read_active_learning_focus")
     user = runtime.context.user
+    cache_enabled = settings.learning_focus_cache_enabled
+    if cache_enabled:
+        # The live bundle does not depend on the chat, so it is cached under chat_id=None.
+        cached_focus = learning_focus_cache.get(user.id, None)
+        if cached_focus is not None:
+            return cached_focus
+        cache_version = learning_focus_cache.version(user.id)
 
     async with provide_memory_item_service() as service:
         items = await service.list_memory_items(
@@ -178,10 +187,10 @@ async def read_active_learning_focus(runtime: ToolRuntime[AgentContext]) -> str:
             offset=0,
         )
 
-    if not items:
-        return "No active learning focus items found."
-
-    return serialize_active_learning_focus(items)
+    focus = serialize_active_learning_focus(items) if items else "No active learning focus items found."
+    if cache_enabled:
+        learning_focus_cache.put(user.id, None, focus, version=cache_version)
+    return focus
 
 
 @tool
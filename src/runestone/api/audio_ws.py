@@ -1,21 +1,65 @@
 """
-WebSocket endpoint for audio streaming.
+WebSocket endpoints for audio streaming.
 
-This module provides a WebSocket endpoint for streaming TTS audio to clients.
+This module provides WebSocket endpoints for streaming TTS audio to clients
+and for receiving voice recordings while the user is still speaking.
 """
 
+import json
 import logging
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
+from runestone.api.chat_endpoints import SUPPORTED_TRANSCRIPTION_LANGUAGES
 from runestone.auth.security import verify_token
+from runestone.auth.user_cache import AuthenticatedUser
+from runestone.config import settings
 from runestone.core.connection_manager import connection_manager
+from runestone.core.exceptions import InactiveUserError, InvalidAccessTokenError, RunestoneError
+from runestone.db.database import provide_db_session
+from runestone.db.user_repository import UserRepository
+from runestone.services.auth_service import AuthService
+from runestone.services.voice_service import VoiceRecordingBuffer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _user_id_from_token(token: str) -> int | None:
+    """Return the authenticated user id, or None when the token is invalid."""
+    try:
+        payload = verify_token(token)
+        if not payload:
+            return None
+        return int(payload.get("sub"))
+    except Exception as e:
+        logger.warning(f"WebSocket token validation failed: {e}")
+        return None
+
+
+async def _resolve_active_user(token: str) -> AuthenticatedUser | None:
+    """Return the active user for a token, or None when authentication fails."""
+    try:
+        async with provide_db_session() as session:
+            return await AuthService(UserRepository(session), settings).resolve_access_token(token)
+    except (InvalidAccessTokenError, InactiveUserError) as e:
+        logger.warning(f"Voice WebSocket authentication failed: {e}")
+        return None
+
+
+def _resolve_voice_language(user: AuthenticatedUser, language: str | None) -> str | None:
+    """Resolve the STT language like the upload endpoint: explicit, then profile, then Swedish."""
+    if language is not None:
+        selected_language = language.strip()
+        if not selected_language or selected_language not in SUPPORTED_TRANSCRIPTION_LANGUAGES:
+            return None
+        return selected_language
+
+    profile_language = user.mother_tongue.strip() if user.mother_tongue else None
+    return profile_language if profile_language in SUPPORTED_TRANSCRIPTION_LANGUAGES else "Swedish"
+
+
 @router.websocket("/ws/audio")
 async def audio_websocket(
     websocket: WebSocket,
@@ -31,20 +75,17 @@ async def audio_websocket(
     4. Server sends JSON: {"status": "complete"} when audio is done
     5. Connection stays open for subsequent messages
 
+    A user may hold several connections (e.g. multiple tabs); each one receives
+    the same audio stream.
+
     Args:
         websocket: The WebSocket connection
         token: JWT authentication token
     """
     # Validate token and extract user_id
-    try:
-        payload = verify_token(token)
-        if not payload:
-            logger.warning("WebSocket connection rejected: invalid token")
-            await websocket.close(code=4001)
-            return
-        user_id = int(payload.get("sub"))
-    except Exception as e:
-        logger.warning(f"WebSocket token validation failed: {e}")
+    user_id = _user_id_from_token(token)
+    if user_id is None:
+        logger.warning("WebSocket connection rejected: invalid token")
         await websocket.close(code=4001)
         return
 
@@ -62,4 +103,83 @@ async def audio_websocket(
     except Exception as e:
         logger.error(f"Audio WebSocket error for user {user_id}: {e}")
     finally:
-        connection_manager.disconnect(user_id)
+        connection_manager.disconnect(user_id, websocket)
+
+
+@router.websocket("/ws/voice")
+async def voice_input_websocket(
+    websocket: WebSocket,
+    token: str = Query(...),
+    improve: bool = Query(True),
+    language: str | None = Query(None),
+):
+    """
+    WebSocket endpoint for streaming one voice recording while the user speaks.
+
+    Protocol:
+    1. Client connects with auth token (and optional improve/language) as query params
+    2. Client sends binary recorder frames as they are produced
+    3. Client sends JSON {"type": "stop"} when recording ends, or {"type": "cancel"}
+    4. Server transcribes the already-buffered audio immediately and replies with
+       {"status": "transcribed", "text": ...} or {"status": "error", "detail": ...}
+    5. Server closes the connection
+
+    Args:
+        websocket: The WebSocket connection
+        token: JWT authentication token
+        improve: Whether to enhance the transcription
+        language: Speech language as a supported full name or ISO-639-1 code
+    """
+    user = await _resolve_active_user(token)
+    if user is None:
+        await websocket.close(code=4001)
+        return
+
+    user_id = user.id
+    await websocket.accept()
+    transcription_language = _resolve_voice_language(user, language)
+    if transcription_language is None:
+        await websocket.send_json({"status": "error", "detail": "Unsupported speech language."})
+        await websocket.close(code=1008)
+        return
+
+    recording = VoiceRecordingBuffer(max_bytes=settings.voice_max_file_size_mb * 1024 * 1024)
+    voice_service = websocket.app.state.voice_service
+    logger.info("voice stream connected user_id=%s improve=%s", user_id, improve)
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                logger.info("voice stream disconnected before stop user_id=%s", user_id)
+                return
+            if message.get("bytes") is not None:
+                recording.append(message["bytes"])
+                continue
+
+            command = json.loads(message.get("text") or "{}").get("type")
+            if command == "cancel":
+                await websocket.close()
+                return
+            if command == "stop":
+                break
+
+        if len(recording) == 0:
+            raise RunestoneError("Empty audio file.")
+
+        transcribed_text = await voice_service.process_voice_input(
+            recording.getvalue(), improve=improve, language=transcription_language, user_id=user_id
+        )
+        logger.info("voice stream transcription completed user_id=%s bytes=%s", user_id, len(recording))
+        await websocket.send_json({"status": "transcribed", "text": transcribed_text})
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info("voice stream disconnected user_id=%s", user_id)
+    except RunestoneError as e:
+        logger.error("voice stream transcription failed: %s", e, exc_info=True)
+        await websocket.send_json({"status": "error", "detail": str(e)})
+        await websocket.close(code=1011)
+    except Exception as e:
+        logger.error("voice stream processing failed: %s", e, exc_info=True)
+        await websocket.send_json({"status": "error", "detail": "Failed to transcribe voice. Please try again."})
+        await websocket.close(code=1011)
@@ -18,10 +18,10 @@ from runestone.agents.schemas import (
     VoiceTranscriptionResponse,
 )
 from runestone.auth.dependencies import get_current_user
+from runestone.auth.user_cache import AuthenticatedUser
 from runestone.config import settings
 from runestone.core.constants import LANGUAGE_CODE_MAP
 from runestone.core.exceptions import RunestoneError
-from runestone.db.models import User
 from runestone.dependencies import get_chat_service, get_voice_service
 from runestone.services.chat_service import ChatService
 from runestone.services.voice_service import VoiceService
@@ -52,7 +52,7 @@ def _validate_transcription_language(language: str | None) -> str | None:
 async def send_message(
     request: ChatRequest,
     chat_service: Annotated[ChatService, Depends(get_chat_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> ChatResponse:
     """
     Send a message to the chat agent and receive a response.
@@ -80,7 +80,7 @@ async def send_message(
 @router.get("/history", response_model=ChatHistoryResponse)
 async def get_history(
     chat_service: Annotated[ChatService, Depends(get_chat_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     after_id: int = Query(0, ge=0),
     limit: int = Query(200, ge=1, le=500),
     client_chat_id: str | None = Query(None),
@@ -104,7 +104,7 @@ async def get_history(
 async def send_image(
     file: Annotated[UploadFile, File(description="Image file to process")],
     chat_service: Annotated[ChatService, Depends(get_chat_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> ImageChatResponse:
     """
     Upload an image with Swedish text for OCR and translation.
@@ -175,7 +175,7 @@ async def send_image(
 )
 async def start_new_chat(
     chat_service: Annotated[ChatService, Depends(get_chat_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ):
     """
     Start a new chat session for the current user.
@@ -203,7 +203,7 @@ async def transcribe_voice(
         str | None, Form(description="Speech language as a supported full name or ISO-639-1 code")
     ] = None,
     voice_service: Annotated[VoiceService, Depends(get_voice_service)] = None,
-    current_user: Annotated[User, Depends(get_current_user)] = None,
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)] = None,
 ) -> VoiceTranscriptionResponse:
     """
     Transcribe voice audio to text.
@@ -246,7 +246,7 @@ async def transcribe_voice(
     try:
         logger.info("voice transcription requested user_id=%s improve=%s", current_user.id, improve)
         transcribed_text = await voice_service.process_voice_input(
-            content, improve=improve, language=transcription_language
+            content, improve=improve, language=transcription_language, user_id=current_user.id
         )
 
         logger.info("voice transcription completed user_id=%s", current_user.id)
@@ -28,7 +28,8 @@ from runestone.api.schemas import (
     VocabularyStatsResponse,
     VocabularyUpdate,
 )
-from runestone.auth.dependencies import get_current_user
+from runestone.auth.dependencies import get_current_user, get_current_user_record
+from runestone.auth.user_cache import AuthenticatedUser
 from runestone.core.exceptions import RunestoneError, VocabularyItemExists
 from runestone.core.logging_config import get_logger
 from runestone.core.processor import RunestoneProcessor
@@ -64,7 +65,7 @@ logger = get_logger(__name__)
 async def process_ocr(
     file: Annotated[UploadFile, File(description="Image file to process")],
     processor: Annotated[RunestoneProcessor, Depends(get_runestone_processor)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> OCRResult:
     """
     Extract text from a Swedish textbook image using OCR.
@@ -101,7 +102,7 @@ async def process_ocr(
 
     try:
         # Run OCR on image bytes (async call)
-        async with track_model_costs("ocr"):
+        async with track_model_costs("ocr", user_id=current_user.id):
             ocr_result = await processor.run_ocr(content)
 
         # OCRResult object - return directly (unified schema)
@@ -138,7 +139,7 @@ async def process_ocr(
 async def analyze_content(
     request: AnalysisRequest,
     processor: Annotated[RunestoneProcessor, Depends(get_runestone_processor)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_current_user_record)],
 ) -> ContentAnalysis:
     """
     Analyze extracted text content.
@@ -159,7 +160,7 @@ async def analyze_content(
 
     try:
         # Run content analysis
-        async with track_model_costs("content_analysis"):
+        async with track_model_costs("content_analysis", user_id=current_user.id):
             analysis_result = await processor.run_analysis(request.text, current_user)
 
         # ContentAnalysis object - return directly (unified schema)
@@ -196,7 +197,7 @@ async def analyze_content(
 async def save_vocabulary(
     request: VocabularySaveRequest,
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> dict:
     """
     Save vocabulary items to the database.
@@ -238,7 +239,7 @@ async def save_vocabulary(
 async def save_vocabulary_item(
     request: VocabularyItemCreate,
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> Vocabulary:
     """
     Save a single vocabulary item to the database.
@@ -282,7 +283,7 @@ async def save_vocabulary_item(
 )
 async def get_vocabulary_stats(
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VocabularyStatsResponse:
     """Return current-user vocabulary stats for the Vocabulary tab."""
     try:
@@ -305,7 +306,7 @@ async def get_vocabulary_stats(
 )
 async def get_vocabulary_distribution(
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VocabularyDistributionResponse:
     """Return priority and learned-times distributions for the current user's active vocabulary."""
     try:
@@ -330,7 +331,7 @@ async def get_vocabulary_distribution(
 async def get_vocabulary_item(
     item_id: int,
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> Vocabulary:
     """
     Retrieve a single vocabulary item by ID.
@@ -372,7 +373,7 @@ async def get_vocabulary_item(
 )
 async def get_vocabulary(
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     limit: int = 100,
     offset: int = 0,
     search_query: str | None = None,
@@ -439,7 +440,7 @@ async def update_vocabulary(
     recall_service: Annotated[RecallService, Depends(get_recall_service)],
     vocabulary_service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> Vocabulary:
     """
     Update a vocabulary item.
@@ -527,7 +528,7 @@ async def delete_vocabulary(
     recall_service: Annotated[RecallService, Depends(get_recall_service)],
     vocabulary_service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> dict:
     """
     Delete a vocabulary item completely from the database.
@@ -590,7 +591,7 @@ async def delete_vocabulary(
 async def improve_vocabulary(
     request: VocabularyImproveRequest,
     service: Annotated[VocabularyService, Depends(get_vocabulary_service)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VocabularyImproveResponse:
     """
     Improve a vocabulary item using LLM.
@@ -609,7 +610,7 @@ async def improve_vocabulary(
         HTTPException: For LLM errors
     """
     try:
-        result = await service.improve_item(request)
+        result = await service.improve_item(request, user_id=current_user.id)
         return result
 
     except Exception:
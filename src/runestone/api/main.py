@@ -19,18 +19,24 @@ from runestone.api.chat_endpoints import router as chat_router
 from runestone.api.endpoints import grammar_router
 from runestone.api.endpoints import router as api_router
 from runestone.api.memory_endpoints import router as memory_router
+from runestone.api.metrics_endpoints import router as metrics_router
+from runestone.api.middleware import QueryStatsMiddleware
 from runestone.api.recall_endpoints import router as recall_router
 from runestone.api.user_endpoints import router as user_router
 from runestone.config import settings
+from runestone.core.audio_normalizer import AudioNormalizer
 from runestone.core.clients.voice.voice_factory import (
     create_voice_enhancement_client,
     create_voice_synthesis_client,
     create_voice_transcription_client,
 )
 from runestone.core.error_tracking import setup_error_tracking
+from runestone.core.llm_registry import llm_registry
 from runestone.core.logging_config import setup_logging
 from runestone.core.service_llm import build_service_llm_model
+from runestone.core.tts_cache import TTSAudioCache, build_tts_cache_namespace
 from runestone.db.database import setup_database
+from runestone.model_costs.persistence import start_interaction_persistence, stop_interaction_persistence
 from runestone.model_costs.startup import refresh_startup_model_prices
 from runestone.rag.index import GrammarIndex
 from runestone.services.grammar_service import GrammarService
@@ -70,16 +76,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.tts_service = TTSService(
         settings=settings,
         synthesis_client=create_voice_synthesis_client(settings),
+        audio_cache=(
+            TTSAudioCache(
+                settings.tts_cache_dir,
+                max_bytes=settings.tts_cache_max_mb * 1024 * 1024,
+                namespace=build_tts_cache_namespace(settings),
+            )
+            if settings.tts_cache_enabled
+            else None
+        ),
+        max_concurrency=settings.resolve_tts_max_concurrency(),
     )
     app.state.voice_service = VoiceService(
         settings=settings,
         transcription_client=create_voice_transcription_client(settings),
         enhancement_client=create_voice_enhancement_client(settings),
+        audio_normalizer=(
+            AudioNormalizer(
+                codec=settings.voice_audio_normalization_codec,
+                trim_silence=settings.voice_audio_trim_silence,
+            )
+            if settings.voice_audio_normalization_enabled
+            else None
+        ),
     )
     app.state.model_price_refresh_task = asyncio.create_task(
         refresh_startup_model_prices(settings),
         name="model-price-refresh",
     )
+    start_interaction_persistence(settings)
     try:
         yield
     finally:
@@ -88,6 +113,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             refresh_task.cancel()
         with suppress(asyncio.CancelledError):
             await refresh_task
+        await stop_interaction_persistence()
+        await llm_registry.aclose()
 
 
 def create_application() -> FastAPI:
@@ -108,6 +135,8 @@ def create_application() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.db_query_stats_enabled:
+        app.add_middleware(QueryStatsMiddleware, repeat_threshold=settings.db_query_repeat_threshold)
 
     # Include API routers
     app.include_router(
@@ -165,6 +194,10 @@ def create_application() -> FastAPI:
         tags=["recall"],
     )
 
+    # Metrics are unauthenticated; expose the path only on internal networks.
+    if settings.metrics_enabled:
+        app.include_router(metrics_router, tags=["metrics"])
+
     return app
 
 
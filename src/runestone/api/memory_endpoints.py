@@ -21,9 +21,9 @@ from runestone.api.memory_item_schemas import (
 )
 from runestone.api.schemas import MemoryMaintenanceStatusResponse
 from runestone.auth.dependencies import get_current_user
+from runestone.auth.user_cache import AuthenticatedUser
 from runestone.core.exceptions import MemoryItemNotFoundError, PermissionDeniedError
 from runestone.core.logging_config import get_logger
-from runestone.db.models import User
 from runestone.dependencies import get_agents_manager, get_memory_item_service
 from runestone.services.memory_item_service import MemoryItemService
 
@@ -40,7 +40,7 @@ logger = get_logger(__name__)
     },
 )
 async def list_memory_items(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
     category: Optional[MemoryCategory] = Query(None, description="Filter by category"),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -86,7 +86,7 @@ async def list_memory_items(
 )
 async def create_memory_item(
     item_data: MemoryItemCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
 ) -> MemoryItemResponse:
     """
@@ -122,7 +122,7 @@ async def create_memory_item(
 async def update_memory_item(
     item_id: int,
     item_data: MemoryItemUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
 ) -> MemoryItemResponse:
     """Update a memory item by id."""
@@ -160,7 +160,7 @@ async def update_memory_item(
 async def update_memory_item_status(
     item_id: int,
     status_data: MemoryItemStatusUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
 ) -> MemoryItemResponse:
     """
@@ -200,7 +200,7 @@ async def update_memory_item_status(
 async def update_memory_item_priority(
     item_id: int,
     priority_data: MemoryItemPriorityUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
 ) -> MemoryItemResponse:
     """
@@ -231,7 +231,7 @@ async def update_memory_item_priority(
 )
 async def delete_memory_item(
     item_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
 ) -> None:
     """
@@ -259,7 +259,7 @@ async def delete_memory_item(
     },
 )
 async def clear_memory_category(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[MemoryItemService, Depends(get_memory_item_service)],
     category: MemoryCategory = Query(..., description="Category to clear"),
 ) -> dict:
@@ -283,7 +283,7 @@ async def clear_memory_category(
     },
 )
 async def get_memory_maintenance_status(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     agents_manager: Annotated[AgentsManager, Depends(get_agents_manager)],
 ) -> MemoryMaintenanceStatusResponse:
     """
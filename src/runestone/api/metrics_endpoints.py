@@ -0,0 +1,16 @@
+"""Prometheus-format metrics of the API process."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from runestone.core.metrics import metrics_registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Render every in-process metric for a scraper."""
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,55 @@
+"""
+ASGI middleware for the Runestone API.
+"""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from runestone.core.observability import elapsed_ms_since
+from runestone.db.query_stats import track_queries, warn_repeated_statements
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Log the SQL statements each HTTP request issued and warn about repeated ones."""
+
+    def __init__(self, app: ASGIApp, *, repeat_threshold: int):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int | None = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.monotonic()
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # The router fills in the matched route; its name groups requests by endpoint.
+                route_name = getattr(scope.get("route"), "name", None)
+                logger.info(
+                    "[api:queries] request finished method=%s path=%s route=%s status=%s latency_ms=%s "
+                    "db_statements=%s db_ms=%.1f db_rows=%s",
+                    scope["method"],
+                    scope["path"],
+                    route_name,
+                    status_code,
+                    elapsed_ms_since(started),
+                    stats.statements,
+                    stats.db_ms,
+                    stats.rows,
+                )
+                warn_repeated_statements(stats, threshold=self.repeat_threshold, scope=route_name or scope["path"])
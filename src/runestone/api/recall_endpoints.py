@@ -8,10 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from runestone.api.recall_schemas import RecallResponse, RecallWordResponse
 from runestone.auth.dependencies import get_current_user
+from runestone.auth.user_cache import AuthenticatedUser
 from runestone.core.exceptions import RecallOperationError, RecallQueueWordNotFoundError, RecallStateNotFoundError
 from runestone.core.logging_config import get_logger
 from runestone.db.database import get_db
-from runestone.db.models import User
 from runestone.dependencies import get_recall_service
 from runestone.recall.service import RecallService
 from runestone.recall.types import RecallState
@@ -81,7 +81,7 @@ async def _run_mutation(
     },
 )
 async def get_recall(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[RecallService, Depends(get_recall_service)],
 ) -> RecallResponse:
     """Return the authenticated user's recall configuration and ordered queue."""
@@ -105,7 +105,7 @@ async def get_recall(
     },
 )
 async def bump_recall(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[RecallService, Depends(get_recall_service)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> RecallResponse:
@@ -128,7 +128,7 @@ async def bump_recall(
 )
 async def postpone_recall_word(
     vocabulary_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[RecallService, Depends(get_recall_service)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> RecallResponse:
@@ -151,7 +151,7 @@ async def postpone_recall_word(
 )
 async def remove_recall_word(
     vocabulary_id: int,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     service: Annotated[RecallService, Depends(get_recall_service)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> RecallResponse:
@@ -9,7 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 
 from runestone.api.schemas import UserProfileResponse, UserProfileUpdate
-from runestone.auth.dependencies import get_current_user
+from runestone.auth.dependencies import get_current_user_record
 from runestone.core.logging_config import get_logger
 from runestone.db.models import User
 from runestone.dependencies import get_user_service
@@ -28,7 +28,7 @@ logger = get_logger(__name__)
     },
 )
 async def get_user_profile(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_current_user_record)],
     service: Annotated[UserService, Depends(get_user_service)],
 ) -> UserProfileResponse:
     """
@@ -59,7 +59,7 @@ async def get_user_profile(
 )
 async def update_user_profile(
     update_data: UserProfileUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_current_user_record)],
     service: Annotated[UserService, Depends(get_user_service)],
 ) -> UserProfileResponse:
     """
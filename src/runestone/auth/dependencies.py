@@ -2,7 +2,8 @@
 Authentication dependencies for FastAPI.
 
 This module provides dependency functions for user authentication,
-including the get_current_user dependency for securing endpoints.
+including the get_current_user dependency for securing endpoints and
+get_current_user_record for endpoints that need the live ORM user.
 """
 
 from typing import Annotated
@@ -10,10 +11,12 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from runestone.auth.user_cache import AuthenticatedUser
 from runestone.core.exceptions import InactiveUserError, InvalidAccessTokenError
 from runestone.db.models import User
-from runestone.dependencies import get_auth_service
+from runestone.dependencies import get_auth_service, get_user_service
 from runestone.services.auth_service import AuthService
+from runestone.services.user_service import UserService
 
 security = HTTPBearer()
 
@@ -21,19 +24,19 @@ security = HTTPBearer()
 async def get_current_user(
     token: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     service: Annotated[AuthService, Depends(get_auth_service)],
-) -> User:
+) -> AuthenticatedUser:
     """
     FastAPI dependency to get the current authenticated user.
 
-    Extracts JWT token from Authorization header, verifies it, and retrieves
-    the corresponding user from the database.
+    Extracts JWT token from Authorization header, verifies it, and resolves
+    the corresponding user, from the authentication cache when enabled.
 
     Args:
         token: JWT token from Authorization header
         service: Authentication use-case service
 
     Returns:
-        User model instance for the authenticated user
+        Read-only snapshot of the authenticated user
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -51,3 +54,26 @@ async def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(exc),
         ) from exc
+
+
+async def get_current_user_record(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    service: Annotated[UserService, Depends(get_user_service)],
+) -> User:
+    """
+    FastAPI dependency to load the authenticated user's ORM row.
+
+    Use it only where a request reads fields outside the snapshot or writes the
+    user; it always queries the database.
+
+    Raises:
+        HTTPException: If the user no longer exists
+    """
+    user = await service.get_user_by_id(current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
@@ -0,0 +1,179 @@
+"""
+In-process caches behind request authentication.
+
+`resolve_access_token` otherwise decodes the JWT and loads the user row on every
+API request. Verified tokens are cached until they expire, and the fields
+endpoints read from the authenticated user are cached as an immutable snapshot
+for a short TTL. `UserService` drops a user's snapshot after every write to the
+user row; writes from other processes (admin activation, the Telegram bot) are
+picked up once the TTL runs out.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from runestone.config import settings
+from runestone.core.metrics import cache_stats_collector, metrics_registry
+from runestone.db.models import User
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Read-only view of the authenticated user; load the ORM `User` when a request must write it."""
+
+    id: int
+    email: str
+    name: str
+    surname: str | None
+    timezone: str
+    telegram_username: str | None
+    mother_tongue: str | None
+    active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            surname=user.surname,
+            timezone=user.timezone,
+            telegram_username=user.telegram_username,
+            mother_tongue=user.mother_tongue,
+            active=user.active,
+        )
+
+
+@dataclass
+class AuthCacheStats:
+    """Running counters for one authentication cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _ExpiringLRU:
+    """Size-bounded LRU whose entries carry their own expiry time."""
+
+    def __init__(self, max_entries: int, clock: Callable[[], float]):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[object, tuple[object, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = AuthCacheStats()
+
+    def get(self, key: object) -> object | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def put(self, key: object, value: object, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def pop(self, key: object) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = AuthCacheStats()
+
+
+class VerifiedTokenCache:
+    """Subject of access tokens whose signature was already verified, kept until the token expires."""
+
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.time):
+        # Token expiry is wall-clock time, so this cache uses `time.time` rather than a monotonic clock.
+        self._clock = clock
+        self._entries = _ExpiringLRU(max_entries, clock)
+
+    @property
+    def stats(self) -> AuthCacheStats:
+        return self._entries.stats
+
+    @staticmethod
+    def _key(token: str) -> str:
+        # Only a digest is kept, so a heap dump does not hold usable tokens.
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> str | None:
+        """Return the `sub` claim of a verified, unexpired token."""
+        subject = self._entries.get(self._key(token))
+        return subject if isinstance(subject, str) else None
+
+    def put(self, token: str, payload: dict) -> None:
+        """Remember a verified payload; tokens without an `exp` claim are not cached."""
+        subject = payload.get("sub")
+        expires_at = payload.get("exp")
+        if isinstance(subject, str) and isinstance(expires_at, (int, float)):
+            self._entries.put(self._key(token), subject, float(expires_at))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class AuthenticatedUserCache:
+    """Short-lived snapshots of active users keyed by user id."""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = _ExpiringLRU(max_entries, clock)
+
+    @property
+    def stats(self) -> AuthCacheStats:
+        return self._entries.stats
+
+    def get(self, user_id: int) -> AuthenticatedUser | None:
+        snapshot = self._entries.get(user_id)
+        return snapshot if isinstance(snapshot, AuthenticatedUser) else None
+
+    def put(self, snapshot: AuthenticatedUser) -> None:
+        self._entries.put(snapshot.id, snapshot, self._clock() + self.ttl_seconds)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's snapshot so the next request reloads the row."""
+        self._entries.pop(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(max_entries=settings.auth_cache_max_entries)
+authenticated_user_cache = AuthenticatedUserCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_user_cache_ttl_seconds,
+)
+metrics_registry.register_collector(cache_stats_collector("verified_token", lambda: verified_token_cache.stats))
+metrics_registry.register_collector(cache_stats_collector("authenticated_user", lambda: authenticated_user_cache.stats))
@@ -7,16 +7,31 @@ This module provides the main CLI commands and handles user interaction.
 import asyncio
 import csv
 import json
+import statistics
 import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
 from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from runestone.agents.specialists.base import SpecialistResult
-from runestone.agents.specialists.memory_maintainer.area_to_improve import AreaToImproveMemoryMaintainer
-from runestone.agents.specialists.memory_maintainer.personal_info import PersonalInfoMemoryMaintainer
+from runestone.agents.specialists.memory_maintainer.area_to_improve import (
+    BUCKET_TOPICS_PROMPT,
+    AreaToImproveMemoryMaintainer,
+)
+from runestone.agents.specialists.memory_maintainer.clustering import pairwise_agreement, partition_stats
+from runestone.agents.specialists.memory_maintainer.personal_info import (
+    PERSONAL_INFO_BUCKET_TOPICS_PROMPT,
+    PersonalInfoMemoryMaintainer,
+)
+from runestone.agents.specialists.word_keeper import WordKeeperSpecialist
+from runestone.agents.token_budget import get_token_counter
 from runestone.agents.tools.read_url import read_url
 from runestone.api.schemas import VocabularyItemCreate
 from runestone.config import Settings
@@ -29,12 +44,22 @@ from runestone.core.processor import RunestoneProcessor
 from runestone.core.prompt_builder.builder import PromptBuilder
 from runestone.core.prompt_builder.types import ImprovementMode
 from runestone.core.service_llm import build_service_llm_model, get_available_service_llm_providers
+from runestone.db.agent_side_effect_repository import AgentSideEffectRepository
+from runestone.db.chat_repository import ChatRepository
+from runestone.db.chat_session_learning_focus_repository import ChatSessionLearningFocusRepository
 from runestone.db.database import provide_db_session
+from runestone.db.memory_item_repository import MemoryItemRepository
+from runestone.db.model_cost_repository import ModelCostInteractionRepository
 from runestone.db.models import User
+from runestone.db.recall_repository import RecallRepository
+from runestone.db.turn_context_repository import TurnContextRepository
 from runestone.db.user_repository import UserRepository
 from runestone.db.vocabulary_repository import VocabularyRepository
 from runestone.model_costs.tracking import track_model_costs
 from runestone.rag.index import GrammarIndex
+from runestone.services.agent_side_effect_service import AgentSideEffectService
+from runestone.services.model_cost_service import CostRollupRow, ModelCostService
+from runestone.services.turn_context_service import TurnContextService
 from runestone.services.user_service import UserService
 from runestone.services.vocabulary_service import VocabularyService
 
@@ -53,7 +78,7 @@ settings = Settings()
 
 async def _process_image_cli(processor: RunestoneProcessor, image_path: Path, user: User) -> dict:
     """Run the complete paid image workflow under one CLI-owned cost scope."""
-    async with track_model_costs("image_analysis"):
+    async with track_model_costs("image_analysis", user_id=user.id):
         return await processor.process_image(image_path, user)
 
 
@@ -283,7 +308,7 @@ async def _run_area_memory_maintainer_cli(user_id: int, dry_run: bool, with_prio
     """Load a real user and run the area_to_improve maintainer in CLI mode."""
     user = await _load_cli_user(user_id)
     specialist = AreaToImproveMemoryMaintainer(settings)
-    async with track_model_costs("memory_maintenance"):
+    async with track_model_costs("memory_maintenance", user_id=user.id):
         return await specialist.run_cli_for_user(
             user,
             dry_run=dry_run,
@@ -295,7 +320,7 @@ async def _run_personal_info_memory_maintainer_cli(user_id: int, dry_run: bool)
     """Load a real user and run the personal_info maintainer in CLI mode."""
     user = await _load_cli_user(user_id)
     specialist = PersonalInfoMemoryMaintainer(settings)
-    async with track_model_costs("memory_maintenance"):
+    async with track_model_costs("memory_maintenance", user_id=user.id):
         return await specialist.run_cli_for_user(user, dry_run=dry_run)
 
 
@@ -435,6 +460,116 @@ def maintain_personal_info_memory(user_id: int, dry_run: bool):
         sys.exit(1)
 
 
+async def _evaluate_memory_bucketing(user_id: int, domain: str, threshold: float | None) -> dict[str, Any]:
+    """Bucket one user's maintenance scope with the LLM and locally, then compare shape, agreement, and cost."""
+    user = await _load_cli_user(user_id)
+    if domain == "area_to_improve":
+        specialist = AreaToImproveMemoryMaintainer(settings)
+        language = specialist._memory_item_language(user)
+        prompt = BUCKET_TOPICS_PROMPT
+
+        def bucket_with_llm(items):
+            return specialist._bucket_topics(scope_items=items, target_language=language)
+
+    else:
+        specialist = PersonalInfoMemoryMaintainer(settings)
+        prompt = PERSONAL_INFO_BUCKET_TOPICS_PROMPT
+
+        def bucket_with_llm(items):
+            return specialist._bucket_topics(scope_items=items)
+
+    if threshold is not None:
+        specialist.bucketer.similarity_threshold = threshold
+    scope_items = await specialist._load_scope_items(user_id=user_id)
+    if not scope_items:
+        raise RunestoneError(f"User {user_id} has no {domain} items to bucket")
+    items_by_id = {item.id: item for item in scope_items}
+
+    started = time.perf_counter()
+    async with track_model_costs("memory_maintenance", user_id=user_id):
+        llm_plan = await bucket_with_llm(scope_items)
+    llm_ms = (time.perf_counter() - started) * 1000
+    if llm_plan is None:
+        raise RunestoneError("LLM bucketing failed")
+    llm_buckets = [bucket.item_ids for bucket in specialist._repair_bucket_plan(llm_plan, items_by_id).buckets]
+    counter = get_token_counter()
+    payload = json.dumps([specialist._serialize_scope_item(item) for item in scope_items], ensure_ascii=False)
+
+    # The first local run includes loading the embedding model; later runs reuse it.
+    started = time.perf_counter()
+    await specialist.bucketer.bucket(scope_items)
+    cold_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    local_buckets = [bucket.item_ids for bucket in await specialist.bucketer.bucket(scope_items)]
+    warm_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "domain": domain,
+        "item_count": len(scope_items),
+        "similarity_threshold": specialist.bucketer.similarity_threshold,
+        "llm": {
+            **partition_stats(llm_buckets),
+            "elapsed_ms": llm_ms,
+            "estimated_tokens": counter.count(prompt)
+            + counter.count(payload)
+            + counter.count(llm_plan.model_dump_json()),
+        },
+        "embedding": {**partition_stats(local_buckets), "cold_ms": cold_ms, "warm_ms": warm_ms, "estimated_tokens": 0},
+        "agreement": pairwise_agreement(llm_buckets, local_buckets),
+    }
+
+
+@cli.command("evaluate-memory-bucketing")
+@click.argument("user_id", type=int)
+@click.option(
+    "--domain",
+    type=click.Choice(["area_to_improve", "personal_info"]),
+    default="area_to_improve",
+    show_default=True,
+    help="Maintenance scope to bucket.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    default=None,
+    help="Cosine similarity threshold for local clustering (defaults to the configured value).",
+)
+def evaluate_memory_bucketing(user_id: int, domain: str, threshold: float | None):
+    """Compare LLM and local embedding bucketing of USER_ID's memory items without writing changes."""
+    try:
+        report = asyncio.run(_evaluate_memory_bucketing(user_id, domain, threshold))
+        console.print(
+            f"[bold cyan]Memory Bucketing Evaluation[/bold cyan] domain={report['domain']} "
+            f"items={report['item_count']} threshold={report['similarity_threshold']:.2f}"
+        )
+        for name in ("llm", "embedding"):
+            stats = report[name]
+            timing = (
+                f"elapsed_ms={stats['elapsed_ms']:.0f}"
+                if name == "llm"
+                else f"cold_ms={stats['cold_ms']:.0f} warm_ms={stats['warm_ms']:.0f}"
+            )
+            console.print(
+                f"{name}: buckets={stats['bucket_count']} singletons={stats['singleton_count']} "
+                f"max_size={stats['max_bucket_size']} oversized={stats['oversized_bucket_count']} "
+                f"{timing} est_tokens={stats['estimated_tokens']}"
+            )
+        agreement = report["agreement"]
+        console.print(
+            f"agreement vs llm: precision={agreement['precision']:.2f} recall={agreement['recall']:.2f} "
+            f"f1={agreement['f1']:.2f}"
+        )
+    except RunestoneError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
 async def _load_vocabulary_items(
     items: list[VocabularyItemCreate],
     skip_existence_check: bool,
@@ -448,6 +583,175 @@ async def _load_vocabulary_items(
         return await service.load_vocab_from_csv(items, skip_existence_check, user_id=user_id)
 
 
+async def _prewarm_word_enrichment(languages: list[str], limit: int, batch_size: int, dry_run: bool) -> dict:
+    """Prewarm the shared enrichment cache through the configured WordKeeper model."""
+    specialist = WordKeeperSpecialist(settings)
+    async with provide_db_session() as session:
+        repository = VocabularyRepository(session)
+        llm_model = build_service_llm_model(settings=settings)
+        service = VocabularyService(repository, settings, llm_model)
+        async with track_model_costs("word_enrichment_prewarm"):
+            return await specialist.prewarm_shared_enrichment(
+                service,
+                languages=languages or None,
+                limit=limit,
+                batch_size=batch_size,
+                dry_run=dry_run,
+            )
+
+
+@cli.command("prewarm-word-enrichment")
+@click.option(
+    "--language",
+    "languages",
+    multiple=True,
+    help="Target translation language to prewarm (repeatable). Defaults to every learner language.",
+)
+@click.option("--limit", type=int, default=1000, show_default=True, help="Most widely saved phrases to consider")
+@click.option("--batch-size", type=int, default=25, show_default=True, help="Phrases per enrichment call")
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Report cache coverage without calling the model or writing rows.",
+)
+def prewarm_word_enrichment(languages: tuple[str, ...], limit: int, batch_size: int, dry_run: bool):
+    """Fill the cross-user word enrichment cache from existing vocabulary."""
+    try:
+        summary = asyncio.run(_prewarm_word_enrichment(list(languages), limit, batch_size, dry_run))
+        if not summary:
+            console.print("[yellow]Warning:[/yellow] No vocabulary phrases found to prewarm.")
+            return
+        console.print("[bold cyan]Word Enrichment Prewarm[/bold cyan]")
+        for language, stats in summary.items():
+            console.print(
+                f"{language}: phrases={stats['phrases']} cached={stats['cached']} "
+                f"generated={stats['generated']} failed={stats['failed']}"
+            )
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
+async def _load_turn_context_sequentially(session: AsyncSession, user_id: int, chat_id: str) -> None:
+    """Issue the per-part reads a chat turn makes when the turn-context preload is disabled."""
+    chat_repository = ChatRepository(session)
+    await chat_repository.get_context_for_agent(user_id, chat_id)
+    await chat_repository.get_summary(user_id, chat_id)
+    await RecallRepository(session).get_current_recall_words(user_id)
+    await UserRepository(session).get_by_id(user_id)
+    focus = await ChatSessionLearningFocusRepository(session).get_by_user_chat(user_id, chat_id)
+    if focus is not None:
+        await MemoryItemRepository(session).get_by_ids(json.loads(focus.memory_item_ids_json))
+    await AgentSideEffectRepository(session).get_recent_for_teacher(
+        user_id,
+        chat_id,
+        limit=AgentSideEffectService.RECENT_SIDE_EFFECT_LIMIT,
+    )
+
+
+async def _benchmark_turn_context(user_id: int, iterations: int) -> dict[str, dict[str, float]]:
+    """Measure database round-trips and latency per turn for both turn-context loaders."""
+    async with provide_db_session() as session:
+        user = await UserRepository(session).get_by_id(user_id)
+        if user is None:
+            raise RunestoneError(f"User {user_id} not found")
+        if not user.current_chat_id:
+            raise RunestoneError(f"User {user_id} has no active chat")
+        chat_id = user.current_chat_id
+        turn_context_service = TurnContextService(TurnContextRepository(session))
+        loaders = {
+            "sequential": lambda: _load_turn_context_sequentially(session, user_id, chat_id),
+            "preloaded": lambda: turn_context_service.load(user_id, chat_id, after_summary=True),
+        }
+
+        statement_count = 0
+
+        def _count_statement(*_args) -> None:
+            nonlocal statement_count
+            statement_count += 1
+
+        engine = session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _count_statement)
+        results = {}
+        try:
+            for name, load in loaders.items():
+                await load()  # warm up connection and statement caches
+                statement_count = 0
+                timings_ms = []
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    await load()
+                    timings_ms.append((time.perf_counter() - started) * 1000)
+                results[name] = {
+                    "round_trips": statement_count / iterations,
+                    "median_ms": statistics.median(timings_ms),
+                    "p90_ms": statistics.quantiles(timings_ms, n=10)[-1] if iterations > 1 else timings_ms[0],
+                }
+        finally:
+            event.remove(engine, "before_cursor_execute", _count_statement)
+            await session.rollback()
+        return results
+
+
+@cli.command("benchmark-turn-context")
+@click.argument("user_id", type=int)
+@click.option("--iterations", type=click.IntRange(min=1), default=50, show_default=True, help="Loads per loader")
+def benchmark_turn_context(user_id: int, iterations: int):
+    """Compare per-part and single round-trip turn-context loading for USER_ID's active chat."""
+    try:
+        results = asyncio.run(_benchmark_turn_context(user_id, iterations))
+        console.print("[bold cyan]Turn Context Benchmark[/bold cyan]")
+        for name, stats in results.items():
+            console.print(
+                f"{name}: round_trips={stats['round_trips']:.1f} "
+                f"median_ms={stats['median_ms']:.2f} p90_ms={stats['p90_ms']:.2f}"
+            )
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
+async def _model_cost_rollup(days: int, user_id: int | None) -> list[CostRollupRow]:
+    """Load daily per-user, per-component cost totals for the last `days` UTC days, today included."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    async with provide_db_session() as session:
+        service = ModelCostService(ModelCostInteractionRepository(session))
+        return await service.daily_rollup(since=today - timedelta(days=days - 1), user_id=user_id)
+
+
+@cli.command("model-cost-rollup")
+@click.option("--days", type=click.IntRange(min=1), default=7, show_default=True, help="UTC days to include")
+@click.option("--user-id", type=int, default=None, help="Only report this user")
+def model_cost_rollup(days: int, user_id: int | None):
+    """Print persisted model cost per day, user, and component (requires MODEL_COST_PERSISTENCE_ENABLED)."""
+    try:
+        rows = asyncio.run(_model_cost_rollup(days, user_id))
+        if not rows:
+            console.print("[yellow]Warning:[/yellow] No persisted model cost interactions in this period.")
+            return
+        console.print("[bold cyan]Model Cost Rollup[/bold cyan]")
+        for row in rows:
+            console.print(
+                f"{row.day.isoformat()} user={row.user_id if row.user_id is not None else '-'} {row.component}: "
+                f"calls={row.calls} unknown={row.unknown_calls} known_usd={row.known_cost_usd:.6f}"
+            )
+        total = sum((row.known_cost_usd for row in rows), start=Decimal("0"))
+        console.print(f"total known_usd={total:.6f}")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("csv_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
@@ -58,6 +58,7 @@ AgentName = Literal[
     "memory_maintainer",
     "learning_memory_keeper",
     "personal_memory_keeper",
+    "chat_summarizer",
 ]
 
 # Canonical paid agent profiles used when resolving model-price coverage. The
@@ -71,6 +72,7 @@ PAID_AGENT_NAMES: tuple[AgentName, ...] = (
     "learning_memory_keeper",
     "personal_memory_keeper",
     "memory_maintainer",
+    "chat_summarizer",
 )
 
 # Each entry corresponds to one independently configured agent timeout. Keep this
@@ -92,6 +94,7 @@ AGENT_TIMEOUT_FIELDS: tuple[tuple[AgentName, str, str], ...] = (
         "personal_memory_keeper_llm_timeout_seconds",
     ),
     ("memory_maintainer", "memory_maintainer_provider", "memory_maintainer_llm_timeout_seconds"),
+    ("chat_summarizer", "chat_summarizer_provider", "chat_summarizer_llm_timeout_seconds"),
 )
 
 
@@ -132,6 +135,9 @@ class Settings(BaseSettings):
     sentry_dsn: Optional[str] = None
     sentry_environment: Optional[str] = None
     sentry_release: Optional[str] = None
+    # Serve in-process latency, token, pool, queue, and background task metrics at `/metrics`
+    # in the Prometheus text format, and time database pool checkouts.
+    metrics_enabled: bool = False
 
     # HuggingFace / sentence-transformers cache (must be writable in containers)
     hf_cache_dir: str = "state/hf-cache"
@@ -148,6 +154,16 @@ class Settings(BaseSettings):
     database_pool_recycle_seconds: int = 1800
     database_pool_pre_ping: bool = True
     startup_db_check: bool = True
+    # Count SQL statements, database time, and rows per API request and per `timed_operation`,
+    # and warn when one request repeats the same statement `db_query_repeat_threshold` times.
+    db_query_stats_enabled: bool = False
+    db_query_repeat_threshold: int = Field(default=5, ge=2)
+    # Persist every model-cost interaction to `model_cost_interactions`. Records are queued in
+    # memory and bulk-inserted every `batch_size` records or `flush_seconds`; a full queue drops.
+    model_cost_persistence_enabled: bool = False
+    model_cost_persistence_batch_size: int = Field(default=200, ge=1)
+    model_cost_persistence_flush_seconds: float = Field(default=5.0, gt=0)
+    model_cost_persistence_queue_size: int = Field(default=10000, ge=1)
 
     # Telegram polling cursor configuration
     telegram_offset_file_path: str = "state/offset.txt"
@@ -162,6 +178,11 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_days: int = 7
     min_password_length: int = 6
+    # Cache verified access tokens and a snapshot of the authenticated user, so most API
+    # requests resolve the user without a query. Snapshot writes by other processes show after the TTL.
+    auth_user_cache_enabled: bool = False
+    auth_user_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+    auth_cache_max_entries: int = Field(default=10000, gt=0)
 
     # Vocabulary Learning Configuration
     words_per_day: int = 5
@@ -182,6 +203,9 @@ class Settings(BaseSettings):
     teacher_backup_reasoning_level: ReasoningLevel = ReasoningLevel.NONE
     teacher_backup_llm_timeout_seconds: float = Field(default=10.0, gt=0)
     teacher_backup_max_retries: int = Field(default=1, ge=0)
+    # Token cap for the teacher's per-turn context (everything except the static system prompt
+    # and tool schemas); lowest-priority sections are trimmed first. 0 disables the budget.
+    teacher_context_token_budget: int = Field(default=0, ge=0)
 
     coordinator_provider: Optional[Literal["openrouter", "openai", "gemini"]] = None
     coordinator_model: str
@@ -189,6 +213,34 @@ class Settings(BaseSettings):
     coordinator_reasoning_level: ReasoningLevel = ReasoningLevel.NONE
     coordinator_llm_timeout_seconds: float = Field(default=3.0, gt=0)
     coordinator_max_retries: int = Field(default=DEFAULT_AGENT_MAX_RETRIES, ge=0)
+    # Local pre-router for trivial turns: "shadow" only logs agreement with the coordinator,
+    # "active" skips the pre-response coordinator call when confident.
+    coordinator_pre_router_mode: Literal["off", "shadow", "active"] = "shadow"
+    coordinator_pre_router_confidence: float = Field(default=0.9, gt=0, le=1)
+    # Start the teacher concurrently with coordinator planning; a non-empty pre-response
+    # plan cancels the speculative run and re-runs the teacher with specialist results.
+    teacher_speculative_enabled: bool = False
+
+    # Hedged LLM requests: after the rolling latency percentile for an agent/model,
+    # fire a second request (teacher: to the backup model when configured) and keep the first answer.
+    teacher_hedging_enabled: bool = False
+    coordinator_hedging_enabled: bool = False
+    llm_hedge_percentile: float = Field(default=0.9, gt=0, lt=1)
+    llm_hedge_min_samples: int = Field(default=20, ge=1)
+    llm_hedge_min_delay_seconds: float = Field(default=0.5, ge=0)
+
+    # Circuit breakers shared per provider/model: when the rolling share of failed or slow
+    # calls crosses the threshold, calls go straight to the fallback model (teacher: the
+    # backup model when configured) until a half-open probe succeeds.
+    llm_circuit_breaker_enabled: bool = False
+    llm_fallback_provider: Literal["openrouter", "openai", "gemini"] = "gemini"
+    llm_fallback_model: Optional[str] = None
+    llm_circuit_failure_rate: float = Field(default=0.5, gt=0, le=1)
+    llm_circuit_slow_call_seconds: Optional[float] = Field(default=20.0, gt=0)
+    llm_circuit_min_calls: int = Field(default=10, ge=1)
+    llm_circuit_window_seconds: float = Field(default=60.0, gt=0)
+    llm_circuit_open_seconds: float = Field(default=30.0, gt=0)
+    llm_circuit_half_open_probes: int = Field(default=1, ge=1)
 
     word_keeper_provider: Optional[Literal["openrouter", "openai", "gemini"]] = None
     word_keeper_model: Optional[str] = None
@@ -221,16 +273,61 @@ class Settings(BaseSettings):
     memory_maintainer_reasoning_level: Optional[ReasoningLevel] = None
     memory_maintainer_llm_timeout_seconds: float = Field(default=30.0, gt=0)
     memory_maintainer_max_retries: int = Field(default=DEFAULT_AGENT_MAX_RETRIES, ge=0)
+    # Candidate buckets reviewed and merged concurrently per maintenance run.
+    memory_maintainer_concurrency: int = Field(default=4, ge=1)
+    # Chat-reset runs only review items changed since the last clean run (per-domain watermark).
+    memory_maintainer_incremental_enabled: bool = False
+    # Step-1 bucketing: "embedding" clusters items locally with the grammar index's MiniLM model
+    # and keeps the LLM for merge decisions only; it falls back to "llm" if the model is unavailable.
+    memory_maintainer_bucketing: Literal["llm", "embedding"] = "llm"
+    memory_maintainer_embedding_similarity_threshold: float = Field(default=0.7, gt=0, le=1)
+
+    # Rolling chat summaries: messages older than the live window are folded into
+    # `chat_summaries` in the background, and the teacher gets summary + recent tail.
+    chat_summary_enabled: bool = False
+    chat_summary_live_window_messages: int = Field(default=4, ge=2)
+    chat_summary_batch_messages: int = Field(default=6, ge=1)
+    chat_summarizer_provider: Optional[Literal["openrouter", "openai", "gemini"]] = None
+    chat_summarizer_model: Optional[str] = None
+    chat_summarizer_temperature: Optional[float] = None
+    chat_summarizer_reasoning_level: Optional[ReasoningLevel] = None
+    chat_summarizer_llm_timeout_seconds: float = Field(default=30.0, gt=0)
+    chat_summarizer_max_retries: int = Field(default=DEFAULT_AGENT_MAX_RETRIES, ge=0)
 
     agent_persona: str = "default"
 
+    # Post-turn Job Queue Configuration
+    # When enabled, post-turn specialist work is queued in Postgres and executed by
+    # `post_turn_worker_main.py` processes instead of in-process background tasks.
+    post_turn_queue_enabled: bool = False
+    post_turn_worker_concurrency: int = Field(default=4, ge=1)
+    post_turn_worker_poll_seconds: float = Field(default=1.0, gt=0)
+    post_turn_job_lease_seconds: float = Field(default=60.0, gt=0)
+    post_turn_job_max_attempts: int = Field(default=2, ge=1)
+
     # Chat History Configuration
     chat_history_retention_days: int = 7
+    # Load user, history, recall words, learning focus, and recent side effects for a
+    # turn with one database round-trip instead of one query per part.
+    turn_context_preload_enabled: bool = False
+    # Keep each chat's serialized learning-focus bundle in process memory between turns;
+    # memory item writes in this process invalidate it, other processes' writes show after the TTL.
+    learning_focus_cache_enabled: bool = False
+    learning_focus_cache_ttl_seconds: float = Field(default=300.0, gt=0)
+    learning_focus_cache_max_entries: int = Field(default=4096, gt=0)
     memory_mastered_cleanup_days: int = 3
     memory_maintenance_timeout_seconds: float = Field(
         default=MEMORY_MAINTENANCE_TIMEOUT_SECONDS_DEFAULT,
         gt=0,
     )
+    # Scheduled memory maintenance (`memory_maintenance_worker_main.py`): one sweep a day at the
+    # given UTC hour over active users whose maintained memory grew since their last run.
+    memory_maintenance_schedule_hour_utc: int = Field(default=3, ge=0, le=23)
+    memory_maintenance_schedule_min_growth: int = Field(default=5, ge=1)
+    memory_maintenance_schedule_max_users: int = Field(default=200, ge=1)
+    memory_maintenance_schedule_concurrency: int = Field(default=2, ge=1)
+    # Known model cost per sweep in USD after which no further runs start; 0 disables the budget.
+    memory_maintenance_schedule_budget_usd: float = Field(default=1.0, ge=0)
 
     # Image Upload Configuration
     chat_image_max_size_mb: int = 10
@@ -241,11 +338,22 @@ class Settings(BaseSettings):
     voice_enhancement_model: str = "gpt-4o-mini"
     voice_max_duration_seconds: int = 300
     voice_max_file_size_mb: int = 25
+    voice_audio_normalization_enabled: bool = True
+    voice_audio_normalization_codec: Literal["opus", "flac"] = "opus"
+    voice_audio_trim_silence: bool = True
+    # Return transcripts that already look finished (capitalized, punctuated, no fillers or stutters)
+    # without the enhancement pass. The check only sees formatting, so grammar errors slip through.
+    voice_enhancement_skip_clean_transcripts: bool = False
 
     # TTS (Text-to-Speech) Configuration
     tts_provider: Literal["openai", "elevenlabs"] = "openai"
     tts_model: str = "gpt-4o-mini-tts"
     tts_voice: str = "onyx"
+    tts_cache_enabled: bool = True
+    tts_cache_dir: str = "state/tts-cache"
+    tts_cache_max_mb: int = Field(default=256, gt=0)
+    tts_openai_max_concurrency: int = Field(default=5, gt=0)
+    tts_elevenlabs_max_concurrency: int = Field(default=5, gt=0)
 
     # ElevenLabs Voice Configuration
     elevenlabs_api_key: Optional[str] = None
@@ -294,6 +402,14 @@ class Settings(BaseSettings):
             self.memory_maintainer_temperature = self.memory_keeper_temperature
         if self.memory_maintainer_reasoning_level is None:
             self.memory_maintainer_reasoning_level = self.memory_keeper_reasoning_level
+        if self.chat_summarizer_provider is None:
+            self.chat_summarizer_provider = self.memory_keeper_provider
+        if self.chat_summarizer_model is None:
+            self.chat_summarizer_model = self.memory_keeper_model
+        if self.chat_summarizer_temperature is None:
+            self.chat_summarizer_temperature = self.memory_keeper_temperature
+        if self.chat_summarizer_reasoning_level is None:
+            self.chat_summarizer_reasoning_level = self.memory_keeper_reasoning_level
 
         self._apply_gemini_timeout_floor()
 
@@ -343,6 +459,12 @@ class Settings(BaseSettings):
             return self.ocr_llm_model_name
         return self.resolve_service_llm_model(provider=self.resolve_ocr_llm_provider())
 
+    def resolve_tts_max_concurrency(self) -> int:
+        """Return the concurrent synthesis limit for the configured TTS provider."""
+        if self.tts_provider == "elevenlabs":
+            return self.tts_elevenlabs_max_concurrency
+        return self.tts_openai_max_concurrency
+
     def resolve_openrouter_disallowed_providers(self) -> list[str]:
         """Return OpenRouter provider slugs to avoid routing through."""
         if not self.openrouter_disallowed_providers:
@@ -453,8 +575,39 @@ class Settings(BaseSettings):
                 max_retries=self.memory_maintainer_max_retries,
             )
 
+        if agent_name == "chat_summarizer":
+            return AgentLLMSettings(
+                provider=self.chat_summarizer_provider,
+                model=self.chat_summarizer_model,
+                temperature=self.chat_summarizer_temperature,
+                reasoning_level=self.chat_summarizer_reasoning_level,
+                timeout_seconds=self.chat_summarizer_llm_timeout_seconds,
+                max_retries=self.chat_summarizer_max_retries,
+            )
+
         raise ValueError(f"Unsupported agent name: {agent_name}")
 
+    def get_agent_fallback_llm_settings(
+        self,
+        agent_name: AgentName,
+    ) -> Optional[AgentLLMSettings]:
+        """Return the circuit-breaker fallback model settings for an agent, if one applies."""
+        if agent_name == "teacher_backup" or self.llm_fallback_model is None:
+            return None
+        primary = self.get_agent_llm_settings(agent_name)
+        if (primary.provider, primary.model) == (self.llm_fallback_provider, self.llm_fallback_model):
+            return None
+        timeout_seconds = primary.timeout_seconds
+        if self.llm_fallback_provider == "gemini":
+            timeout_seconds = max(timeout_seconds, GEMINI_MINIMUM_TIMEOUT_SECONDS)
+        return primary.model_copy(
+            update={
+                "provider": self.llm_fallback_provider,
+                "model": self.llm_fallback_model,
+                "timeout_seconds": timeout_seconds,
+            }
+        )
+
     class Config:
         """Pydantic configuration."""
 
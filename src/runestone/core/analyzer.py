@@ -12,6 +12,7 @@ from langchain_core.language_models.chat_models import BaseChatModel
 
 from runestone.config import Settings
 from runestone.core.exceptions import ContentAnalysisError
+from runestone.core.llm_registry import structured_output
 from runestone.core.logging_config import get_logger
 from runestone.core.prompt_builder.builder import PromptBuilder
 from runestone.schemas.analysis import ContentAnalysis
@@ -67,7 +68,7 @@ class ContentAnalyzer:
                 self.settings.resolve_service_llm_provider(),
                 self.settings.resolve_service_llm_model(),
             )
-            structured_model = self.model.with_structured_output(ContentAnalysis)
+            structured_model = structured_output(self.model, ContentAnalysis)
             response = await structured_model.ainvoke(analysis_prompt)
             if response is None:
                 raise ContentAnalysisError("No analysis returned from LLM")
@@ -0,0 +1,167 @@
+"""
+Audio normalization applied to voice recordings before speech-to-text.
+
+Browser recorders produce high-bitrate WebM/Opus or WAV. Providers only need
+mono 16 kHz speech, so recordings are re-encoded with ffmpeg (and leading and
+trailing silence trimmed) to cut upload size, provider latency, and
+duration-billed STT cost.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+from runestone.core.observability import elapsed_ms_since
+
+logger = logging.getLogger(__name__)
+
+AudioCodec = Literal["opus", "flac"]
+
+TARGET_SAMPLE_RATE_HZ = 16000
+OPUS_BITRATE = "24k"
+SILENCE_THRESHOLD = "-50dB"
+SILENCE_MIN_DURATION_SECONDS = 0.5
+
+_CODEC_OUTPUT: dict[str, tuple[list[str], str, str]] = {
+    "opus": (["-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip", "-f", "ogg"], "ogg", "audio/ogg"),
+    "flac": (["-c:a", "flac", "-f", "flac"], "flac", "audio/flac"),
+}
+
+ORIGINAL_FILENAME = "recording.webm"
+ORIGINAL_CONTENT_TYPE = "audio/webm"
+
+
+@dataclass(frozen=True)
+class NormalizedAudio:
+    """Audio ready for upload plus the measurements of the normalization stage."""
+
+    content: bytes
+    filename: str
+    content_type: str
+    input_bytes: int
+    output_bytes: int
+    latency_ms: int
+    normalized: bool
+
+
+def _silence_filter() -> str:
+    # silenceremove only trims from the start; reversing twice trims the tail too
+    trim = (
+        f"silenceremove=start_periods=1:start_duration={SILENCE_MIN_DURATION_SECONDS}"
+        f":start_threshold={SILENCE_THRESHOLD}"
+    )
+    return f"{trim},areverse,{trim},areverse"
+
+
+class AudioNormalizer:
+    """Re-encode recordings to compact mono speech audio with ffmpeg."""
+
+    def __init__(
+        self,
+        codec: AudioCodec = "opus",
+        trim_silence: bool = True,
+        ffmpeg_path: str = "ffmpeg",
+        timeout_seconds: float = 30.0,
+    ):
+        """
+        Initialize the normalizer.
+
+        Args:
+            codec: Output codec, "opus" (smallest) or "flac" (lossless)
+            trim_silence: Whether to trim leading and trailing silence
+            ffmpeg_path: ffmpeg executable name or path
+            timeout_seconds: Upper bound for one ffmpeg run
+        """
+        if codec not in _CODEC_OUTPUT:
+            raise ValueError(f"Unsupported audio codec: {codec}")
+        self._codec = codec
+        self._trim_silence = trim_silence
+        self._ffmpeg = shutil.which(ffmpeg_path)
+        self._timeout_seconds = timeout_seconds
+        if self._ffmpeg is None:
+            logger.warning("ffmpeg not found; voice recordings will be sent to STT unnormalized path=%s", ffmpeg_path)
+
+    @property
+    def available(self) -> bool:
+        return self._ffmpeg is not None
+
+    async def normalize(self, audio_content: bytes) -> NormalizedAudio:
+        """
+        Return normalized audio, or the original recording when normalization fails or does not help.
+
+        The ffmpeg run happens in a worker thread so the event loop is never blocked.
+        """
+        started = time.monotonic()
+        output: bytes | None = None
+        if self._ffmpeg is not None:
+            try:
+                output = await asyncio.to_thread(self._transcode, audio_content)
+            except (OSError, subprocess.SubprocessError) as exc:
+                logger.warning("Audio normalization failed; using original recording error=%s", exc)
+        latency_ms = elapsed_ms_since(started)
+
+        if not output or len(output) >= len(audio_content):
+            return NormalizedAudio(
+                content=audio_content,
+                filename=ORIGINAL_FILENAME,
+                content_type=ORIGINAL_CONTENT_TYPE,
+                input_bytes=len(audio_content),
+                output_bytes=len(audio_content),
+                latency_ms=latency_ms,
+                normalized=False,
+            )
+
+        _args, extension, content_type = _CODEC_OUTPUT[self._codec]
+        return NormalizedAudio(
+            content=output,
+            filename=f"recording.{extension}",
+            content_type=content_type,
+            input_bytes=len(audio_content),
+            output_bytes=len(output),
+            latency_ms=latency_ms,
+            normalized=True,
+        )
+
+    def _command(self, input_path: str) -> list[str]:
+        codec_args, _extension, _content_type = _CODEC_OUTPUT[self._codec]
+        command = [
+            self._ffmpeg or "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-nostdin",
+            "-i",
+            input_path,
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            str(TARGET_SAMPLE_RATE_HZ),
+        ]
+        if self._trim_silence:
+            command += ["-af", _silence_filter()]
+        return command + codec_args + ["pipe:1"]
+
+    def _transcode(self, audio_content: bytes) -> bytes:
+        # Input goes through a temporary file because MP4 recordings (Safari) need a seekable source
+        file_descriptor, input_path = tempfile.mkstemp(prefix="runestone-voice-", suffix=".input")
+        try:
+            with os.fdopen(file_descriptor, "wb") as stream:
+                stream.write(audio_content)
+            result = subprocess.run(
+                self._command(input_path),
+                capture_output=True,
+                timeout=self._timeout_seconds,
+                check=False,
+            )
+        finally:
+            os.unlink(input_path)
+        if result.returncode != 0:
+            raise subprocess.SubprocessError(result.stderr.decode("utf-8", "replace").strip()[:500])
+        return result.stdout
@@ -39,6 +39,8 @@ class ElevenLabsSTTClient:
         self,
         audio_content: bytes,
         language: str | None = None,
+        filename: str = "recording.webm",
+        content_type: str = "audio/webm",
     ) -> str:
         """
         Transcribe raw audio bytes with ElevenLabs Scribe.
@@ -46,16 +48,18 @@ class ElevenLabsSTTClient:
         Args:
             audio_content: Raw audio bytes from the browser recorder
             language: Optional ISO-639-1 language code
+            filename: Upload filename; its extension tells the provider the container
+            content_type: MIME type of the audio container
 
         Returns:
             Transcribed text or an empty string when provider returns no text
         """
         audio_file = io.BytesIO(audio_content)
-        audio_file.name = "recording.webm"
+        audio_file.name = filename
 
         params = {
             "model_id": self._transcription_model,
-            "file": ("recording.webm", audio_file, "audio/webm"),
+            "file": (filename, audio_file, content_type),
         }
         if language:
             params["language_code"] = language
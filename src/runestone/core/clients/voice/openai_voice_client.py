@@ -49,6 +49,8 @@ class OpenAISTTClient:
         self,
         audio_content: bytes,
         language: str | None = None,
+        filename: str = "recording.webm",
+        content_type: str = "audio/webm",
     ) -> str:
         """
         Transcribe raw audio bytes into text.
@@ -56,12 +58,14 @@ class OpenAISTTClient:
         Args:
             audio_content: Raw audio bytes from the browser recorder (currently WebM Opus)
             language: Optional ISO-639-1 language code
+            filename: Upload filename; its extension tells the provider the container
+            content_type: MIME type of the audio container
 
         Returns:
             Transcribed text or an empty string when provider returns no text
         """
         audio_file = io.BytesIO(audio_content)
-        audio_file.name = "recording.webm"
+        audio_file.name = filename
 
         params = {
             "model": self._transcription_model,
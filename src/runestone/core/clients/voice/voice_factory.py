@@ -21,6 +21,8 @@ class VoiceTranscriptionClient(Protocol):
         self,
         audio_content: bytes,
         language: str | None = None,
+        filename: str = "recording.webm",
+        content_type: str = "audio/webm",
     ) -> str:
         """Transcribe raw audio bytes to text."""
 
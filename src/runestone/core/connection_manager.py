@@ -6,7 +6,9 @@ across the application, allowing services to interact with connected clients
 without direct dependencies on API endpoints.
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import WebSocket
@@ -14,26 +16,140 @@ from fastapi import WebSocket
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _FinalMessage:
+    """Last item of a socket's queue; its sender stops after delivering it."""
+
+    message: dict
+
+
+class AudioBroadcast:
+    """
+    Fan out one audio stream to every socket a user has open.
+
+    Each socket gets its own bounded queue drained by a sender task, so one
+    slow tab cannot stall the provider stream. A socket whose queue overflows
+    is dropped from the broadcast instead of blocking the producer.
+    """
+
+    def __init__(self, user_id: int, websockets: list[WebSocket], max_pending_chunks: int):
+        self._user_id = user_id
+        self._queues: dict[WebSocket, asyncio.Queue] = {}
+        self._senders: dict[WebSocket, asyncio.Task] = {}
+        self.dropped = 0
+        for websocket in websockets:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending_chunks)
+            self._queues[websocket] = queue
+            self._senders[websocket] = asyncio.create_task(self._drain(websocket, queue))
+
+    @property
+    def active(self) -> bool:
+        """Return whether at least one socket is still receiving this stream."""
+        return any(not task.done() for task in self._senders.values())
+
+    def send_bytes(self, chunk: bytes) -> None:
+        """Queue one chunk for every live socket without waiting on any of them."""
+        for websocket in list(self._queues):
+            self._enqueue(websocket, chunk)
+
+    async def finish(self, message: dict, timeout: float) -> None:
+        """Queue a final JSON message and wait for live sockets to drain."""
+        final = _FinalMessage(message)
+        for websocket in list(self._queues):
+            self._enqueue(websocket, final)
+        pending = [task for task in self._senders.values() if not task.done()]
+        if not pending:
+            return
+        _done, not_done = await asyncio.wait(pending, timeout=timeout)
+        for task in not_done:
+            task.cancel()
+        if not_done:
+            self.dropped += len(not_done)
+            logger.warning(
+                "Audio broadcast drain timed out user_id=%s sockets=%s",
+                self._user_id,
+                len(not_done),
+            )
+
+    def cancel(self) -> None:
+        """Stop every sender task, e.g. when the producing stream is cancelled."""
+        for task in self._senders.values():
+            if not task.done():
+                task.cancel()
+        self._queues.clear()
+
+    def _enqueue(self, websocket: WebSocket, item: object) -> bool:
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+        if self._senders[websocket].done():
+            self._queues.pop(websocket, None)
+            return False
+        try:
+            queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self._queues.pop(websocket, None)
+            self._senders[websocket].cancel()
+            self.dropped += 1
+            logger.warning("Dropped slow audio consumer user_id=%s", self._user_id)
+            return False
+
+    async def _drain(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                if isinstance(item, _FinalMessage):
+                    await websocket.send_json(item.message)
+                    return
+                await websocket.send_bytes(item)
+            except Exception as e:
+                self._queues.pop(websocket, None)
+                logger.debug(f"Audio send failed for user {self._user_id}: {e}")
+                return
+
+
 class ConnectionManager:
     """Singleton manager for active WebSocket connections."""
 
+    MAX_PENDING_CHUNKS = 64
+
     def __init__(self):
-        self._active_connections: dict[int, WebSocket] = {}
+        self._active_connections: dict[int, set[WebSocket]] = {}
 
     def connect(self, user_id: int, websocket: WebSocket):
         """Register a new WebSocket connection for a user."""
-        self._active_connections[user_id] = websocket
+        self._active_connections.setdefault(user_id, set()).add(websocket)
         logger.debug(f"User {user_id} connected to audio WebSocket")
 
-    def disconnect(self, user_id: int):
-        """Unregister a WebSocket connection for a user."""
-        if user_id in self._active_connections:
+    def disconnect(self, user_id: int, websocket: Optional[WebSocket] = None):
+        """Unregister one WebSocket connection, or all of them when none is given."""
+        connections = self._active_connections.get(user_id)
+        if connections is None:
+            return
+        if websocket is None:
+            connections.clear()
+        else:
+            connections.discard(websocket)
+        if not connections:
             del self._active_connections[user_id]
-            logger.debug(f"User {user_id} disconnected from audio WebSocket")
+        logger.debug(f"User {user_id} disconnected from audio WebSocket")
+
+    def get_connections(self, user_id: int) -> list[WebSocket]:
+        """Get every active WebSocket connection for a user."""
+        return list(self._active_connections.get(user_id, ()))
 
     def get_connection(self, user_id: int) -> Optional[WebSocket]:
-        """Get the active WebSocket connection for a user."""
-        return self._active_connections.get(user_id)
+        """Get one active WebSocket connection for a user."""
+        connections = self.get_connections(user_id)
+        return connections[0] if connections else None
+
+    def open_broadcast(self, user_id: int) -> Optional[AudioBroadcast]:
+        """Start fanning out audio to all of a user's sockets, or None when none are connected."""
+        websockets = self.get_connections(user_id)
+        if not websockets:
+            return None
+        return AudioBroadcast(user_id, websockets, max_pending_chunks=self.MAX_PENDING_CHUNKS)
 
 
 # Global instance
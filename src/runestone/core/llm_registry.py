@@ -0,0 +1,105 @@
+"""
+Process-wide reuse of LangChain chat models, structured-output runnables, and HTTP clients.
+
+Every agent, service provider, and CLI command used to construct its own chat
+model, and with it a fresh HTTP client and TLS session. The registry memoizes
+models by their full configuration, keeps one pooled keep-alive HTTP client pair
+per provider for OpenAI-compatible models, and caches `with_structured_output`
+runnables per (model, schema) so schema conversion happens once per process.
+HTTP/2 is negotiated when the optional `h2` package is installed.
+"""
+
+import importlib.util
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_MAX_CONNECTIONS = 50
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+class LLMClientRegistry:
+    """Thread-safe memo of chat models, structured runnables, and per-provider HTTP clients."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._models: dict[Hashable, BaseChatModel] = {}
+        self._structured: dict[Hashable, tuple[Any, Runnable]] = {}
+        self._http_clients: dict[str, tuple[httpx.Client, httpx.AsyncClient]] = {}
+
+    def http_clients(self, provider: str) -> tuple[httpx.Client, httpx.AsyncClient]:
+        """Return the shared (sync, async) HTTP client pair for a provider."""
+        with self._lock:
+            clients = self._http_clients.get(provider)
+            if clients is None:
+                # Per-request timeouts are set by the SDK, so one pool can serve every model.
+                clients = (
+                    httpx.Client(http2=HTTP2_AVAILABLE, limits=_http_limits()),
+                    httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=_http_limits()),
+                )
+                self._http_clients[provider] = clients
+                logger.debug("[llm:registry] HTTP clients created provider=%s http2=%s", provider, HTTP2_AVAILABLE)
+            return clients
+
+    def chat_model(self, key: Hashable, factory: Callable[[], BaseChatModel]) -> BaseChatModel:
+        """Return the model cached under `key`, building it with `factory` on first use."""
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = factory()
+                self._models[key] = model
+            return model
+
+    def structured_output(self, model: Any, schema: Any, **kwargs: Any) -> Runnable:
+        """Return `model.with_structured_output(schema, **kwargs)`, built once per model and schema."""
+        key = (id(model), schema, tuple(sorted(kwargs.items())))
+        with self._lock:
+            cached = self._structured.get(key)
+            # The model is kept in the entry so its id cannot be reused while cached.
+            if cached is not None and cached[0] is model:
+                return cached[1]
+            runnable = model.with_structured_output(schema, **kwargs)
+            self._structured[key] = (model, runnable)
+            return runnable
+
+    def clear(self) -> None:
+        """Drop cached models and runnables. HTTP clients stay open for in-flight requests."""
+        with self._lock:
+            self._models.clear()
+            self._structured.clear()
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP clients and drop everything cached; used at process shutdown."""
+        with self._lock:
+            clients = list(self._http_clients.values())
+            self._http_clients.clear()
+            self._models.clear()
+            self._structured.clear()
+        for sync_client, async_client in clients:
+            sync_client.close()
+            await async_client.aclose()
+
+
+llm_registry = LLMClientRegistry()
+
+
+def structured_output(model: Any, schema: Any, **kwargs: Any) -> Runnable:
+    """Return a cached structured-output runnable for `model` and `schema`."""
+    return llm_registry.structured_output(model, schema, **kwargs)
@@ -0,0 +1,421 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Counters, gauges, and histograms are updated where the work happens and kept
+in process memory; nothing is pushed anywhere. Values that already live on
+other objects (pool status, cache stats, background task registries) are read
+at render time through collectors. With `METRICS_ENABLED` the API serves
+`metrics_registry.render()` at `/metrics` for an optional scraper.
+
+Each process has its own registry, so the API only reports work the API
+process did.
+"""
+
+import asyncio
+import inspect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Literal, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+LabelValues = tuple[str, ...]
+
+# Seconds; covers sub-millisecond pool checkouts up to multi-minute agent runs.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+@dataclass
+class CollectedMetric:
+    """One metric family produced by a collector at render time."""
+
+    name: str
+    kind: MetricKind
+    help: str
+    samples: list[tuple[dict[str, str], float]] = field(default_factory=list)
+
+
+Collector = Callable[[], Iterable[CollectedMetric]]
+
+
+class _Metric(ABC):
+    kind: MetricKind
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels_dict(self, values: LabelValues) -> dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Return the exposition lines of every sample, without HELP and TYPE."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every recorded sample."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing total per label set."""
+
+    kind: MetricKind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [_sample_line(self.name, self._labels_dict(key), value) for key, value in values]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Current value per label set."""
+
+    kind: MetricKind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [_sample_line(self.name, self._labels_dict(key), value) for key, value in values]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: list[int]
+    count: int = 0
+    sum: float = 0.0
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum, and count of observed values per label set."""
+
+    kind: MetricKind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries(bucket_counts=[0] * len(self.buckets))
+                self._series[key] = series
+            series.count += 1
+            series.sum += value
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    series.bucket_counts[index] += 1
+                    break
+
+    def count(self, **labels: Any) -> int:
+        key = self._label_values(labels)
+        with self._lock:
+            series = self._series.get(key)
+            return series.count if series else 0
+
+    def time(self, **labels: Any) -> "_Timer":
+        """Observe the duration of a block or of every call to a decorated function."""
+        self._label_values(labels)
+        return _Timer(self, labels)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            series_items = sorted(
+                (key, list(series.bucket_counts), series.count, series.sum) for key, series in self._series.items()
+            )
+        lines = []
+        for key, bucket_counts, count, total in series_items:
+            labels = self._labels_dict(key)
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(
+                    _sample_line(f"{self.name}_bucket", {**labels, "le": _format_value(upper_bound)}, cumulative)
+                )
+            lines.append(_sample_line(f"{self.name}_bucket", {**labels, "le": "+Inf"}, count))
+            lines.append(_sample_line(f"{self.name}_sum", labels, total))
+            lines.append(_sample_line(f"{self.name}_count", labels, count))
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class _Timer:
+    """Context manager and decorator observing elapsed seconds; cancelled work is not observed."""
+
+    def __init__(self, histogram: Histogram, labels: dict[str, Any]):
+        self._histogram = histogram
+        self._labels = labels
+        self._started: float | None = None
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._started is not None and not (exc_type and issubclass(exc_type, asyncio.CancelledError)):
+            self._histogram.observe(time.monotonic() - self._started, **self._labels)
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with _Timer(self._histogram, self._labels):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with _Timer(self._histogram, self._labels):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+
+class MetricsRegistry:
+    """Named metrics and render-time collectors of one process."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, collector: Collector) -> Collector:
+        """Add a callable that reports metric families whenever the registry is rendered."""
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def unregister_collector(self, collector: Collector) -> None:
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+            collectors = list(self._collectors)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(_family_header(metric.name, metric.kind, metric.help))
+            lines.extend(metric.render())
+        collected: dict[str, CollectedMetric] = {}
+        for collector in collectors:
+            for family in collector():
+                existing = collected.setdefault(family.name, CollectedMetric(family.name, family.kind, family.help))
+                existing.samples.extend(family.samples)
+        for family in sorted(collected.values(), key=lambda family: family.name):
+            lines.extend(_family_header(family.name, family.kind, family.help))
+            lines.extend(_sample_line(family.name, labels, value) for labels, value in family.samples)
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset every recorded value; collectors stay registered."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+
+def _family_header(name: str, kind: MetricKind, help: str) -> list[str]:
+    return [f"# HELP {name} {_escape_help(help)}", f"# TYPE {name} {kind}"]
+
+
+def _sample_line(name: str, labels: dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    rendered = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+    return f"{name}{{{rendered}}} {_format_value(value)}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+metrics_registry = MetricsRegistry()
+
+TURN_PHASE_SECONDS = metrics_registry.histogram(
+    "runestone_turn_phase_seconds",
+    "Duration of chat turn phases (coordinator, pre_specialists, teacher, post_turn).",
+    ("phase",),
+)
+SPECIALIST_SECONDS = metrics_registry.histogram(
+    "runestone_specialist_seconds",
+    "Duration of specialist runs by specialist and result status.",
+    ("specialist", "status"),
+)
+LLM_REQUEST_SECONDS = metrics_registry.histogram(
+    "runestone_llm_request_seconds",
+    "Duration of LLM completions by provider, model, and status.",
+    ("provider", "model", "status"),
+)
+LLM_TOKENS = metrics_registry.counter(
+    "runestone_llm_tokens_total",
+    "Tokens reported by LLM completions by provider, model, and usage unit.",
+    ("provider", "model", "unit"),
+)
+DB_POOL_CHECKOUT_SECONDS = metrics_registry.histogram(
+    "runestone_db_pool_checkout_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+TTS_QUEUE_DEPTH = metrics_registry.gauge(
+    "runestone_tts_queue_depth",
+    "TTS requests waiting for a synthesis slot.",
+)
+TTS_QUEUE_WAIT_SECONDS = metrics_registry.histogram(
+    "runestone_tts_queue_wait_seconds",
+    "Time TTS requests waited for a synthesis slot.",
+)
+RECALL_DELIVERIES = metrics_registry.counter(
+    "runestone_recall_deliveries_total",
+    "Recall delivery attempts by outcome (delivered, skipped, failed).",
+    ("outcome",),
+)
+RECALL_DELIVERY_SECONDS = metrics_registry.histogram(
+    "runestone_recall_delivery_seconds",
+    "Duration of one user's recall delivery, including the Telegram send.",
+)
+MODEL_COST_RECORDS = metrics_registry.counter(
+    "runestone_model_cost_records_total",
+    "Model-cost interactions handed to the persistence writer by outcome (queued, written, dropped, failed).",
+    ("outcome",),
+)
+MODEL_COST_QUEUE_DEPTH = metrics_registry.gauge(
+    "runestone_model_cost_queue_depth",
+    "Model-cost interactions waiting to be written to the database.",
+)
+
+
+def cache_stats_collector(cache: str, stats: Callable[[], Any]) -> Collector:
+    """Build a collector exporting the hits, misses, and evictions of a cache stats object."""
+
+    def collect() -> list[CollectedMetric]:
+        current = stats()
+        labels = {"cache": cache}
+        return [
+            CollectedMetric(
+                "runestone_cache_lookups_total",
+                "counter",
+                "In-process cache lookups by cache and result.",
+                [({**labels, "result": "hit"}, current.hits), ({**labels, "result": "miss"}, current.misses)],
+            ),
+            CollectedMetric(
+                "runestone_cache_evictions_total",
+                "counter",
+                "Entries evicted from in-process caches to stay within their size bound.",
+                [(labels, current.evictions)],
+            ),
+        ]
+
+    return collect
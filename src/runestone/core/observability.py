@@ -8,6 +8,8 @@ import time
 from functools import wraps
 from typing import Any, Callable, ParamSpec, TypeVar
 
+from runestone.db.query_stats import QueryStats, is_instrumented, track_queries
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -31,7 +33,8 @@ def timed_operation(
     Decorate a sync or async function and log its execution latency.
 
     The log line always includes `latency_ms` plus any extra fields returned by
-    `fields_factory`.
+    `fields_factory`. When the database engine is instrumented it also includes
+    the statements, database time, and rows of the call.
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
@@ -43,7 +46,8 @@ def timed_operation(
                 result: Any | None = None
                 error: BaseException | None = None
                 try:
-                    result = await func(*args, **kwargs)
+                    with track_queries() as query_stats:
+                        result = await func(*args, **kwargs)
                     return result
                 except BaseException as exc:
                     error = exc
@@ -60,6 +64,7 @@ def timed_operation(
                         kwargs=kwargs,
                         result=result,
                         error=error,
+                        query_stats=query_stats,
                     )
 
             return async_wrapper
@@ -70,7 +75,8 @@ def timed_operation(
             result: Any | None = None
             error: BaseException | None = None
             try:
-                result = func(*args, **kwargs)
+                with track_queries() as query_stats:
+                    result = func(*args, **kwargs)
                 return result
             except BaseException as exc:
                 error = exc
@@ -87,6 +93,7 @@ def timed_operation(
                     kwargs=kwargs,
                     result=result,
                     error=error,
+                    query_stats=query_stats,
                 )
 
         return sync_wrapper
@@ -106,9 +113,12 @@ def _log_timing(
     kwargs: dict[str, Any],
     result: Any | None,
     error: BaseException | None,
+    query_stats: QueryStats,
 ) -> None:
     latency_ms = elapsed_ms_since(started)
-    fields = {"latency_ms": latency_ms}
+    fields: dict[str, Any] = {"latency_ms": latency_ms}
+    if is_instrumented():
+        fields.update(query_stats.log_fields())
     if fields_factory is not None:
         extra_fields = fields_factory(args, kwargs, result, error) or {}
         fields.update({key: value for key, value in extra_fields.items() if value is not None})
@@ -10,6 +10,7 @@ from pydantic import SecretStr
 
 from runestone.config import Settings
 from runestone.core.exceptions import APIKeyError
+from runestone.core.llm_registry import llm_registry
 from runestone.model_costs.langchain_callback import LangChainCostCallback
 
 ServiceLLMProvider = Literal["openai", "openrouter", "gemini"]
@@ -31,6 +32,9 @@ def build_service_llm_model(
     """
     Build a LangChain chat model for non-agent OCR and service flows.
 
+    Models are memoized process-wide per provider, model, and temperature, so
+    per-request service providers and CLI commands share one pooled client.
+
     Args:
         settings: Application settings.
         provider: Optional provider override. Defaults to ``settings.llm_provider``.
@@ -46,6 +50,47 @@ def build_service_llm_model(
     """
     effective_provider = cast(ServiceLLMProvider, (provider or settings.resolve_service_llm_provider()).lower())
     effective_model_name = model_name or settings.resolve_service_llm_model(provider=effective_provider)
+    if effective_provider not in get_available_service_llm_providers():
+        raise ValueError(
+            f"Unsupported LLM provider: {effective_provider}. "
+            f"Supported providers: {', '.join(get_available_service_llm_providers())}"
+        )
+    api_key = _service_api_key(settings, effective_provider)
+    cache_key = (
+        "service",
+        effective_provider,
+        effective_model_name,
+        temperature,
+        tuple(settings.resolve_openrouter_disallowed_providers()),
+        api_key,
+    )
+    return llm_registry.chat_model(
+        cache_key,
+        lambda: _create_service_llm_model(settings, effective_provider, effective_model_name, temperature, api_key),
+    )
+
+
+def _service_api_key(settings: Settings, provider: ServiceLLMProvider) -> str:
+    if provider == "openrouter":
+        if not settings.openrouter_api_key:
+            raise APIKeyError("OpenRouter API key is required. Set OPENROUTER_API_KEY environment variable.")
+        return settings.openrouter_api_key
+    if provider == "gemini":
+        if not settings.gemini_api_key:
+            raise APIKeyError("Gemini API key is required. Set GEMINI_API_KEY environment variable.")
+        return settings.gemini_api_key
+    if not settings.openai_api_key:
+        raise APIKeyError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
+    return settings.openai_api_key
+
+
+def _create_service_llm_model(
+    settings: Settings,
+    effective_provider: ServiceLLMProvider,
+    effective_model_name: str,
+    temperature: float,
+    api_key: str,
+) -> BaseChatModel:
     callbacks = [
         LangChainCostCallback(
             provider=effective_provider,
@@ -54,16 +99,8 @@ def build_service_llm_model(
         )
     ]
 
-    if effective_provider not in get_available_service_llm_providers():
-        raise ValueError(
-            f"Unsupported LLM provider: {effective_provider}. "
-            f"Supported providers: {', '.join(get_available_service_llm_providers())}"
-        )
-
     if effective_provider == "openrouter":
-        api_key = settings.openrouter_api_key
-        if not api_key:
-            raise APIKeyError("OpenRouter API key is required. Set OPENROUTER_API_KEY environment variable.")
+        http_client, http_async_client = llm_registry.http_clients(effective_provider)
         extra_body: dict[str, object] | None = None
         disallowed_providers = settings.resolve_openrouter_disallowed_providers()
         if disallowed_providers:
@@ -80,12 +117,11 @@ def build_service_llm_model(
             timeout=SERVICE_LLM_TIMEOUT_SECONDS,
             extra_body=extra_body,
             callbacks=callbacks,
+            http_client=http_client,
+            http_async_client=http_async_client,
         )
 
     if effective_provider == "gemini":
-        api_key = settings.gemini_api_key
-        if not api_key:
-            raise APIKeyError("Gemini API key is required. Set GEMINI_API_KEY environment variable.")
         return ChatGoogleGenerativeAI(
             model=effective_model_name,
             api_key=SecretStr(api_key),
@@ -94,10 +130,7 @@ def build_service_llm_model(
             callbacks=callbacks,
         )
 
-    api_key = settings.openai_api_key
-    if not api_key:
-        raise APIKeyError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
-
+    http_client, http_async_client = llm_registry.http_clients(effective_provider)
     return ChatOpenAI(
         model=effective_model_name,
         api_key=SecretStr(api_key),
@@ -105,6 +138,8 @@ def build_service_llm_model(
         timeout=SERVICE_LLM_TIMEOUT_SECONDS,
         max_retries=OPENAI_SERVICE_LLM_MAX_RETRIES,
         callbacks=callbacks,
+        http_client=http_client,
+        http_async_client=http_async_client,
     )
 
 
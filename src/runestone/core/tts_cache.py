@@ -0,0 +1,201 @@
+"""
+Content-addressed disk cache for synthesized TTS audio.
+
+Entries are MP3 files named by a hash of everything that influences the
+provider output (provider, voice, model, speed, normalized text), so repeated
+greetings, recall words, and replays are served without a provider call.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+from runestone.config import Settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".mp3"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """Normalize text so trivially different inputs share one cache entry."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+@dataclass
+class TTSCacheStats:
+    """Running counters for cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    hit_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTSAudioCache:
+    """Size-bounded LRU cache of synthesized MP3 audio stored on disk."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_bytes: int,
+        namespace: Mapping[str, object],
+    ):
+        """
+        Initialize the cache and index entries already on disk.
+
+        Args:
+            cache_dir: Directory holding cached MP3 files
+            max_bytes: Upper bound for the total size of cached audio
+            namespace: Provider settings that influence synthesized audio
+                (provider, voice, model, output tuning); part of every key
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self.provider = str(namespace.get("provider", "unknown"))
+        self.model = str(namespace.get("model", "unknown"))
+        self._namespace = json.dumps(dict(namespace), sort_keys=True, separators=(",", ":"), default=str)
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = TTSCacheStats()
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def key_for(self, text: str, speed: float) -> str:
+        """Return the content address for one synthesis request."""
+        payload = f"{self._namespace}\x00{speed:.3f}\x00{normalize_tts_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> bytes | None:
+        """Return cached audio for key, or None on a miss."""
+        audio = await asyncio.to_thread(self._read, key)
+        with self._lock:
+            if audio is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self.stats.hit_bytes += len(audio)
+            hit_rate = self.stats.hit_rate
+        logger.debug(
+            "TTS cache lookup outcome=%s hit_rate=%.3f",
+            "miss" if audio is None else "hit",
+            hit_rate,
+        )
+        return audio
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """Store audio for key, evicting least recently used entries to fit."""
+        if not audio or len(audio) > self._max_bytes:
+            return
+        try:
+            await asyncio.to_thread(self._write, key, audio)
+        except OSError as exc:
+            logger.warning("TTS cache write failed error=%s", exc)
+
+    def _path_for(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _load_index(self) -> None:
+        if not self._cache_dir.exists():
+            return
+        files: list[tuple[float, str, int]] = []
+        for path in self._cache_dir.glob(f"*/*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+        for _mtime, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict_unlocked()
+
+    def _read(self, key: str) -> bytes | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        path = self._path_for(key)
+        try:
+            audio = path.read_bytes()
+            # mtime doubles as the recency marker when the index is rebuilt on startup
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                size = self._entries.pop(key, None)
+                if size is not None:
+                    self._total_bytes -= size
+            return None
+        return audio
+
+    def _write(self, key: str, audio: bytes) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_name: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{key}.", suffix=".tmp", delete=False) as stream:
+                temporary_name = stream.name
+                stream.write(audio)
+            os.replace(temporary_name, path)
+        except Exception:
+            if temporary_name is not None:
+                Path(temporary_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous
+            self._entries[key] = len(audio)
+            self._total_bytes += len(audio)
+            self.stats.stores += 1
+            self._evict_unlocked()
+
+    def _evict_unlocked(self) -> None:
+        while self._total_bytes > self._max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.stats.evictions += 1
+            try:
+                self._path_for(key).unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("TTS cache eviction failed error=%s", exc)
+
+
+def build_tts_cache_namespace(settings: Settings) -> dict[str, object]:
+    """Return the provider settings that make two syntheses byte-identical."""
+    provider = settings.tts_provider.lower()
+    if provider == "elevenlabs":
+        return {
+            "provider": provider,
+            "model": settings.elevenlabs_tts_model,
+            "voice": settings.elevenlabs_tts_voice_id,
+            "output_format": settings.elevenlabs_tts_output_format,
+            "stability": settings.elevenlabs_tts_stability,
+            "similarity_boost": settings.elevenlabs_tts_similarity_boost,
+            "style": settings.elevenlabs_tts_style,
+            "use_speaker_boost": settings.elevenlabs_tts_use_speaker_boost,
+        }
+    return {"provider": provider, "model": settings.tts_model, "voice": settings.tts_voice}
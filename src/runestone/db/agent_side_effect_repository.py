@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-from sqlalchemy import delete, desc, select, update
+from sqlalchemy import Select, delete, desc, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from runestone.db.models import AgentSideEffect
@@ -59,7 +59,22 @@ class AgentSideEffectRepository:
         limit: int = 5,
     ) -> list[AgentSideEffect]:
         """Load specialist result rows; excludes coordinator tracking rows."""
-        stmt = (
+        stmt = self.recent_for_teacher_query(user_id, chat_id, phase=phase, statuses=statuses, limit=limit)
+        result = await self.db.execute(stmt)
+        records = list(result.scalars().all())
+        return list(reversed(records))
+
+    @staticmethod
+    def recent_for_teacher_query(
+        user_id: int,
+        chat_id: str,
+        *,
+        phase: str = "post_response",
+        statuses: tuple[str, ...] = ("action_taken",),
+        limit: int = 5,
+    ) -> Select[tuple[AgentSideEffect]]:
+        """Newest-first selection behind `get_recent_for_teacher`, reusable as a subquery."""
+        return (
             select(AgentSideEffect)
             .where(
                 AgentSideEffect.user_id == user_id,
@@ -71,9 +86,6 @@ class AgentSideEffectRepository:
             .order_by(desc(AgentSideEffect.created_at), desc(AgentSideEffect.id))
             .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        records = list(result.scalars().all())
-        return list(reversed(records))
 
     async def delete_for_chat_phase(
         self,
@@ -2,10 +2,11 @@ import json
 from datetime import datetime, timedelta, timezone
 from typing import List
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import ColumnElement, Select, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from runestone.db.models import ChatMessage
+from runestone.db.models import ChatMessage, ChatSummary
 
 
 class ChatRepository:
@@ -84,17 +85,21 @@ class ChatRepository:
         Returns:
             List of ChatMessage objects
         """
-        stmt = (
-            select(ChatMessage)
-            .where(ChatMessage.user_id == user_id, ChatMessage.chat_id == chat_id)
-            .order_by(ChatMessage.created_at.desc())
-            .limit(limit)
-        )
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(self.context_window_query(user_id, chat_id, limit=limit))
         messages = list(result.scalars().all())
         # Return in chronological order
         return sorted(messages, key=lambda x: x.created_at)
 
+    @staticmethod
+    def context_window_query(
+        user_id: int, chat_id: str, *, limit: int, after_id: ColumnElement[int] | int | None = None
+    ) -> Select[tuple[ChatMessage]]:
+        """Newest-first selection of the agent context window, optionally only messages after `after_id`."""
+        stmt = select(ChatMessage).where(ChatMessage.user_id == user_id, ChatMessage.chat_id == chat_id)
+        if after_id is not None:
+            stmt = stmt.where(ChatMessage.id > after_id)
+        return stmt.order_by(ChatMessage.created_at.desc()).limit(limit)
+
     async def get_history_after_id(
         self, user_id: int, chat_id: str, after_id: int = 0, limit: int = 200
     ) -> List[ChatMessage]:
@@ -161,6 +166,13 @@ class ChatRepository:
         if preserve_chat_id:
             stmt = stmt.where(ChatMessage.chat_id != preserve_chat_id)
         await self.db.execute(stmt)
+        # Summaries of chats whose messages are all gone have nothing left to describe.
+        await self.db.execute(
+            delete(ChatSummary).where(
+                ChatSummary.user_id == user_id,
+                ~exists().where(ChatMessage.user_id == user_id, ChatMessage.chat_id == ChatSummary.chat_id),
+            )
+        )
         await self.db.commit()
 
     async def clear_all_history(self, user_id: int):
@@ -172,4 +184,46 @@ class ChatRepository:
         """
         stmt = delete(ChatMessage).where(ChatMessage.user_id == user_id)
         await self.db.execute(stmt)
+        await self.db.execute(delete(ChatSummary).where(ChatSummary.user_id == user_id))
+        await self.db.commit()
+
+    async def get_summary(self, user_id: int, chat_id: str) -> ChatSummary | None:
+        """
+        Fetch the rolling summary for a chat session.
+
+        Returns:
+            The ChatSummary row, or None when the chat has not been summarized yet
+        """
+        stmt = select(ChatSummary).where(ChatSummary.user_id == user_id, ChatSummary.chat_id == chat_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save_summary(self, user_id: int, chat_id: str, summary_content: str, last_message_id: int) -> bool:
+        """
+        Create or advance the rolling summary for a chat session.
+
+        The row only moves forward: a write whose `last_message_id` is not newer
+        than the stored one (for example from a slower concurrent refresh) is ignored.
+
+        Returns:
+            True when the summary was written
+        """
+        stmt = insert(ChatSummary).values(
+            user_id=user_id,
+            chat_id=chat_id,
+            summary_content=summary_content,
+            last_message_id=last_message_id,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_chat_summaries_user_chat",
+            set_={
+                "summary_content": stmt.excluded.summary_content,
+                "last_message_id": stmt.excluded.last_message_id,
+                "updated_at": func.now(),
+            },
+            where=ChatSummary.last_message_id < stmt.excluded.last_message_id,
+        ).returning(ChatSummary.id)
+        result = await self.db.execute(stmt)
+        written = result.scalar_one_or_none() is not None
         await self.db.commit()
+        return written
@@ -17,6 +17,9 @@ from sqlalchemy.orm import declarative_base
 from alembic import command
 from alembic.config import Config
 from runestone.config import settings
+from runestone.core.metrics import metrics_registry
+from runestone.db.pool_metrics import TimedAsyncAdaptedQueuePool, pool_status_collector
+from runestone.db.query_stats import instrument_engine
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +37,14 @@ db_url_params = {
 
 logger.info("DB connection params: %s", db_url_params)
 
+if settings.metrics_enabled:
+    db_url_params["poolclass"] = TimedAsyncAdaptedQueuePool
+
 engine = create_async_engine(settings.database_url, **db_url_params)
+if settings.db_query_stats_enabled:
+    instrument_engine(engine)
+if settings.metrics_enabled:
+    metrics_registry.register_collector(pool_status_collector(engine))
 
 # Create async_sessionmaker
 SessionLocal = async_sessionmaker(
@@ -1,13 +1,18 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import and_, delete, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from runestone.constants import MEMORY_DEFAULT_AREA_TO_IMPROVE_PRIORITY
 from runestone.db.models import MemoryItem
 
 
+def _inline(value: str | int):
+    """Render a constant into the SQL text so the planner sees it even in generic plans."""
+    return literal(value, literal_execute=True)
+
+
 class MemoryItemRepository:
     """Repository for memory item-related database operations."""
 
@@ -122,16 +127,21 @@ class MemoryItemRepository:
         *,
         area_limit: int,
     ) -> list[MemoryItem]:
-        """Fetch compact start-of-chat learning-focus memory in a single query."""
+        """
+        Fetch compact start-of-chat learning-focus memory in a single query.
+
+        Filter and sort constants are rendered inline rather than bound, so cached
+        generic plans can still match the partial `ix_memory_items_learning_focus`.
+        """
         stmt = (
             select(MemoryItem)
             .where(
                 MemoryItem.user_id == user_id,
-                MemoryItem.category == "area_to_improve",
-                MemoryItem.status.in_(["struggling", "improving"]),
+                MemoryItem.category == _inline("area_to_improve"),
+                MemoryItem.status.in_([_inline("struggling"), _inline("improving")]),
             )
             .order_by(
-                func.coalesce(MemoryItem.priority, MEMORY_DEFAULT_AREA_TO_IMPROVE_PRIORITY).asc(),
+                func.coalesce(MemoryItem.priority, _inline(MEMORY_DEFAULT_AREA_TO_IMPROVE_PRIORITY)).asc(),
                 MemoryItem.updated_at.desc(),
                 MemoryItem.id.asc(),
             )
@@ -0,0 +1,94 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from runestone.db.models import MemoryItem, MemoryMaintenanceRun, User
+
+# Runs after which the maintained scope counts as reviewed; failed runs leave the growth in place.
+COMPLETED_RUN_STATUSES = ("action_taken", "no_action")
+MAINTAINED_CATEGORIES = ("area_to_improve", "personal_info")
+# First key of the two-key advisory lock taken per user while their memory is maintained.
+MAINTENANCE_LOCK_NAMESPACE = 7301
+
+
+class MemoryMaintenanceRunRepository:
+    """Repository for recorded memory-maintenance runs and the users that need the next one."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with database session."""
+        self.db = db
+
+    async def try_lock_user(self, user_id: int) -> bool:
+        """
+        Take the user's maintenance advisory lock without waiting.
+
+        The lock is transaction-scoped: it is held until this session's transaction
+        ends. Returns False when another session already holds it.
+        """
+        stmt = select(func.pg_try_advisory_xact_lock(MAINTENANCE_LOCK_NAMESPACE, user_id))
+        return bool(await self.db.scalar(stmt))
+
+    async def list_candidates(self, *, min_growth: int, limit: int) -> list[tuple[int, int]]:
+        """
+        Return `(user_id, item_growth)` for active users, largest growth first.
+
+        Growth counts maintained memory items created or updated since the user's
+        last completed run finished, or all of them when the user has never completed
+        one. Measuring from the end of the run keeps the items the run itself merged
+        or rewrote from counting as new growth.
+        """
+        last_runs = (
+            select(
+                MemoryMaintenanceRun.user_id,
+                func.max(MemoryMaintenanceRun.finished_at).label("last_run_at"),
+            )
+            .where(MemoryMaintenanceRun.status.in_(COMPLETED_RUN_STATUSES))
+            .group_by(MemoryMaintenanceRun.user_id)
+            .subquery()
+        )
+        growth = func.count(MemoryItem.id).label("item_growth")
+        stmt = (
+            select(MemoryItem.user_id, growth)
+            .join(User, User.id == MemoryItem.user_id)
+            .outerjoin(last_runs, last_runs.c.user_id == MemoryItem.user_id)
+            .where(
+                User.active.is_(True),
+                MemoryItem.category.in_(MAINTAINED_CATEGORIES),
+                or_(last_runs.c.last_run_at.is_(None), MemoryItem.updated_at > last_runs.c.last_run_at),
+            )
+            .group_by(MemoryItem.user_id)
+            .having(func.count(MemoryItem.id) >= min_growth)
+            .order_by(growth.desc(), MemoryItem.user_id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return [(row.user_id, row.item_growth) for row in result]
+
+    async def add(
+        self,
+        user_id: int,
+        *,
+        trigger_source: str,
+        status: str,
+        item_growth: int,
+        known_cost_usd: Decimal | None,
+        summary: str | None,
+        started_at: datetime,
+        finished_at: datetime,
+    ) -> MemoryMaintenanceRun:
+        """Record one run outcome."""
+        run = MemoryMaintenanceRun(
+            user_id=user_id,
+            trigger_source=trigger_source,
+            status=status,
+            item_growth=item_growth,
+            known_cost_usd=known_cost_usd,
+            summary=summary,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+        self.db.add(run)
+        await self.db.commit()
+        return run
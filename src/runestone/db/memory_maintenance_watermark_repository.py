@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from runestone.db.models import MemoryMaintenanceWatermark
+
+
+class MemoryMaintenanceWatermarkRepository:
+    """Repository for per-user, per-domain memory-maintenance watermarks."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with database session."""
+        self.db = db
+
+    async def get(self, user_id: int, domain: str) -> Optional[MemoryMaintenanceWatermark]:
+        """Return the watermark of one maintenance domain for the user."""
+        stmt = select(MemoryMaintenanceWatermark).where(
+            MemoryMaintenanceWatermark.user_id == user_id,
+            MemoryMaintenanceWatermark.domain == domain,
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+    async def upsert(
+        self,
+        user_id: int,
+        domain: str,
+        *,
+        item_hashes_json: str,
+        clusters_json: str,
+        last_run_at: datetime,
+    ) -> None:
+        """Create or replace the watermark of one maintenance domain."""
+        stmt = insert(MemoryMaintenanceWatermark).values(
+            user_id=user_id,
+            domain=domain,
+            item_hashes_json=item_hashes_json,
+            clusters_json=clusters_json,
+            last_run_at=last_run_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_memory_maintenance_watermarks_user_domain",
+            set_={
+                "item_hashes_json": stmt.excluded.item_hashes_json,
+                "clusters_json": stmt.excluded.clusters_json,
+                "last_run_at": stmt.excluded.last_run_at,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
@@ -0,0 +1,51 @@
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from sqlalchemy import Date, cast, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from runestone.db.models import ModelCostInteraction
+
+
+class ModelCostInteractionRepository:
+    """Repository for persisted model-cost interactions and their rollups."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with database session."""
+        self.db = db
+
+    async def add_many(self, rows: Sequence[Mapping[str, object]]) -> int:
+        """Insert interaction rows with one multi-row INSERT and return how many were written."""
+        if not rows:
+            return 0
+        await self.db.execute(insert(ModelCostInteraction).values(list(rows)))
+        await self.db.commit()
+        return len(rows)
+
+    async def daily_rollup(self, *, since: datetime, user_id: int | None = None) -> list[tuple]:
+        """
+        Return `(day, user_id, component, calls, unknown_calls, known_cost_usd)` per UTC day.
+
+        Rows are ordered by day, then user, then component; interactions without a
+        user are grouped under a null `user_id`.
+        """
+        day = cast(func.timezone("UTC", ModelCostInteraction.recorded_at), Date).label("day")
+        stmt = (
+            select(
+                day,
+                ModelCostInteraction.user_id,
+                ModelCostInteraction.component,
+                func.count(ModelCostInteraction.id).label("calls"),
+                func.count(ModelCostInteraction.id)
+                .filter(ModelCostInteraction.cost_quality == "unknown")
+                .label("unknown_calls"),
+                func.sum(ModelCostInteraction.known_cost_usd).label("known_cost_usd"),
+            )
+            .where(ModelCostInteraction.recorded_at >= since)
+            .group_by(day, ModelCostInteraction.user_id, ModelCostInteraction.component)
+            .order_by(day, ModelCostInteraction.user_id.nulls_first(), ModelCostInteraction.component)
+        )
+        if user_id is not None:
+            stmt = stmt.where(ModelCostInteraction.user_id == user_id)
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result]
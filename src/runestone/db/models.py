@@ -4,6 +4,7 @@ SQLAlchemy models for the database.
 This module defines the database table models using SQLAlchemy ORM.
 """
 
+from decimal import Decimal
 from uuid import uuid4
 
 from sqlalchemy import (
@@ -16,6 +17,7 @@ from sqlalchemy import (
     ForeignKeyConstraint,
     Index,
     Integer,
+    Numeric,
     String,
     Text,
     UniqueConstraint,
@@ -57,7 +59,7 @@ class MemoryItem(Base):
     __tablename__ = "memory_items"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     category: Mapped[str] = mapped_column(String(50), nullable=False)
     key: Mapped[str] = mapped_column(String(100), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -77,6 +79,34 @@ class MemoryItem(Base):
             unique=True,
             postgresql_where=text("category = 'area_to_improve'"),
         ),
+        # Memory modal tabs, status filters, counts, and cleanup deletes.
+        Index(
+            "ix_memory_items_user_category_status_updated",
+            "user_id",
+            "category",
+            "status",
+            text("updated_at DESC"),
+            "id",
+        ),
+        Index("ix_memory_items_user_category_updated", "user_id", "category", text("updated_at DESC"), "id"),
+        Index(
+            "ix_memory_items_user_category_priority",
+            "user_id",
+            "category",
+            text("priority ASC NULLS LAST"),
+            text("updated_at DESC"),
+            "id",
+        ),
+        Index("ix_memory_items_user_id_updated_at", "user_id", "updated_at"),
+        # Teacher learning-focus starter; the query inlines these constants so generic plans can use it.
+        Index(
+            "ix_memory_items_learning_focus",
+            "user_id",
+            text("coalesce(priority, 9)"),
+            text("updated_at DESC"),
+            "id",
+            postgresql_where=text("category = 'area_to_improve' AND status IN ('struggling', 'improving')"),
+        ),
         CheckConstraint("priority IS NULL OR (priority >= 0 AND priority <= 9)", name="ck_memory_items_priority_range"),
     )
 
@@ -117,6 +147,31 @@ class Vocabulary(Base):
     )
 
 
+class WordEnrichment(Base):
+    """Cross-user cache of LLM-generated vocabulary fields, keyed by normalized phrase."""
+
+    __tablename__ = "word_enrichments"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    word_key: Mapped[str] = mapped_column(Text, nullable=False)
+    target_language: Mapped[str] = mapped_column(String(64), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    translation: Mapped[str | None] = mapped_column(Text, nullable=True)
+    example_phrase: Mapped[str | None] = mapped_column(Text, nullable=True)
+    extra_info: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "word_key",
+            "target_language",
+            "prompt_version",
+            name="uq_word_enrichments_key_language_version",
+        ),
+    )
+
+
 class RecallUserStateDB(Base):
     """Recall-delivery settings and cursor state for one user."""
 
@@ -207,6 +262,42 @@ class AgentSideEffect(Base):
     )
 
 
+class PostTurnJob(Base):
+    """Durable post-turn specialist work claimed by post-turn worker processes."""
+
+    __tablename__ = "post_turn_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    chat_id: Mapped[str] = mapped_column(String, nullable=False)
+    coordinator_row_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    # queued | running | completed | failed | timed_out | cancelled | stale_replaced
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued", server_default="queued")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_post_turn_jobs_queued",
+            "available_at",
+            "id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_post_turn_jobs_user_chat_active",
+            "user_id",
+            "chat_id",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+
 class ChatSessionLearningFocus(Base):
     """Persist ordered area_to_improve item ids for one active chat session."""
 
@@ -228,12 +319,90 @@ class ChatSessionLearningFocus(Base):
 
 
 class ChatSummary(Base):
-    """Chat summary table model for future compression."""
+    """Rolling summary of one chat session, covering messages up to `last_message_id`."""
 
     __tablename__ = "chat_summaries"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    chat_id: Mapped[str] = mapped_column(String, nullable=False)
     summary_content: Mapped[str] = mapped_column(Text, nullable=False)
     last_message_id: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (UniqueConstraint("user_id", "chat_id", name="uq_chat_summaries_user_chat"),)
+
+
+class MemoryMaintenanceWatermark(Base):
+    """Item fingerprints and topic clusters left by the last clean memory-maintenance run of one domain."""
+
+    __tablename__ = "memory_maintenance_watermarks"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    domain: Mapped[str] = mapped_column(String(50), nullable=False)
+    item_hashes_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    clusters_json: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    last_run_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (UniqueConstraint("user_id", "domain", name="uq_memory_maintenance_watermarks_user_domain"),)
+
+
+class MemoryMaintenanceRun(Base):
+    """Outcome of one memory-maintenance run for a user, written by the scheduled maintenance worker."""
+
+    __tablename__ = "memory_maintenance_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    trigger_source: Mapped[str] = mapped_column(String(20), nullable=False)
+    # action_taken | no_action | error | timed_out | failed | user_not_found
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    item_growth: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    known_cost_usd: Mapped[Decimal | None] = mapped_column(Numeric(12, 6), nullable=True)
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (Index("ix_memory_maintenance_runs_user_started", "user_id", "started_at"),)
+
+
+class ModelCostInteraction(Base):
+    """One paid provider interaction persisted from model-cost tracking for cost rollups."""
+
+    __tablename__ = "model_cost_interactions"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # Null for operations that run without a user, such as the CLI enrichment prewarm.
+    user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    operation_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    operation_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    component: Mapped[str] = mapped_column(String(100), nullable=False)
+    phase: Mapped[str] = mapped_column(String(20), nullable=False)
+    provider: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[str] = mapped_column(String(200), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    usage_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    known_cost_usd: Mapped[Decimal] = mapped_column(Numeric(18, 10), nullable=False)
+    cost_quality: Mapped[str] = mapped_column(String(20), nullable=False)
+    cost_source: Mapped[str] = mapped_column(String(50), nullable=False)
+    recorded_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_model_cost_interactions_recorded_at", "recorded_at"),
+        Index("ix_model_cost_interactions_user_recorded", "user_id", "recorded_at"),
+    )
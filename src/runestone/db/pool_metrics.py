@@ -0,0 +1,60 @@
+"""
+Connection pool metrics for the application engine.
+
+`TimedAsyncAdaptedQueuePool` observes how long each checkout takes, which
+includes waiting for a free connection, opening a new one within the overflow,
+and the pre-ping. `pool_status_collector` reports at render time how many
+connections are checked out against the pool's capacity.
+"""
+
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from runestone.core.metrics import DB_POOL_CHECKOUT_SECONDS, CollectedMetric, Collector
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout latency."""
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+
+
+def pool_status_collector(engine: AsyncEngine) -> Collector:
+    """Build a collector for the checked-out connections and saturation of `engine`'s pool."""
+
+    def collect() -> list[CollectedMetric]:
+        # Read the pool on every render: `engine.dispose()` replaces it.
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return []
+        checked_out = pool.checkedout()
+        capacity = pool.size() + max(pool._max_overflow, 0)
+        return [
+            CollectedMetric(
+                "runestone_db_pool_checked_out",
+                "gauge",
+                "Database connections currently checked out of the pool.",
+                [({}, checked_out)],
+            ),
+            CollectedMetric(
+                "runestone_db_pool_capacity",
+                "gauge",
+                "Maximum database connections of the pool (pool size plus overflow).",
+                [({}, capacity)],
+            ),
+            CollectedMetric(
+                "runestone_db_pool_saturation",
+                "gauge",
+                "Checked-out connections as a fraction of pool capacity.",
+                [({}, checked_out / capacity if capacity else 0.0)],
+            ),
+        ]
+
+    return collect
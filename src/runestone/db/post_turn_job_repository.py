@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from runestone.db.models import PostTurnJob
+
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+
+class PostTurnJobRepository:
+    """Repository for the durable post-turn job queue."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, user_id: int, chat_id: str, coordinator_row_id: int, payload_json: str) -> PostTurnJob:
+        """Queue a job and supersede every queued or running job for the same chat in one transaction."""
+        await self.db.execute(
+            update(PostTurnJob)
+            .where(
+                PostTurnJob.user_id == user_id,
+                PostTurnJob.chat_id == chat_id,
+                PostTurnJob.status.in_(ACTIVE_JOB_STATUSES),
+            )
+            .values(status="stale_replaced", updated_at=func.now())
+        )
+        job = PostTurnJob(
+            user_id=user_id,
+            chat_id=chat_id,
+            coordinator_row_id=coordinator_row_id,
+            payload_json=payload_json,
+        )
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+
+    async def claim(self, worker_id: str, limit: int) -> list[PostTurnJob]:
+        """
+        Atomically claim up to `limit` due jobs.
+
+        `FOR UPDATE SKIP LOCKED` lets any number of workers poll the same table
+        without claiming the same row twice or blocking on each other.
+        """
+        due_ids = (
+            select(PostTurnJob.id)
+            .where(PostTurnJob.status == "queued", PostTurnJob.available_at <= func.now())
+            .order_by(PostTurnJob.available_at, PostTurnJob.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(PostTurnJob)
+            .where(PostTurnJob.id.in_(due_ids))
+            .values(
+                status="running",
+                locked_by=worker_id,
+                locked_at=func.now(),
+                attempts=PostTurnJob.attempts + 1,
+                updated_at=func.now(),
+            )
+            .returning(PostTurnJob)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        jobs = list(result.scalars().all())
+        await self.db.commit()
+        return sorted(jobs, key=lambda job: job.id)
+
+    async def get_status(self, job_id: int) -> str | None:
+        result = await self.db.execute(select(PostTurnJob.status).where(PostTurnJob.id == job_id))
+        return result.scalar_one_or_none()
+
+    async def finish(self, job_id: int, worker_id: str, status: str, error: str | None = None) -> bool:
+        """Record a terminal status unless the job was cancelled or reclaimed meanwhile."""
+        result = await self.db.execute(
+            update(PostTurnJob)
+            .where(
+                PostTurnJob.id == job_id,
+                PostTurnJob.status == "running",
+                PostTurnJob.locked_by == worker_id,
+            )
+            .values(status=status, error=error, locked_at=None, updated_at=func.now())
+        )
+        await self.db.commit()
+        return bool(result.rowcount)
+
+    async def cancel_for_chat(self, user_id: int, chat_id: str, status: str = "cancelled") -> int:
+        """Flag every queued or running job for a chat; running workers observe the flag and stop."""
+        result = await self.db.execute(
+            update(PostTurnJob)
+            .where(
+                PostTurnJob.user_id == user_id,
+                PostTurnJob.chat_id == chat_id,
+                PostTurnJob.status.in_(ACTIVE_JOB_STATUSES),
+            )
+            .values(status=status, updated_at=func.now())
+        )
+        await self.db.commit()
+        return int(result.rowcount or 0)
+
+    async def release_expired(self, lease_seconds: float, max_attempts: int) -> int:
+        """Requeue jobs whose worker stopped heartbeating, or fail them once attempts are exhausted."""
+        result = await self.db.execute(
+            update(PostTurnJob)
+            .where(
+                PostTurnJob.status == "running",
+                PostTurnJob.locked_at < func.now() - timedelta(seconds=lease_seconds),
+            )
+            .values(
+                status=case((PostTurnJob.attempts < max_attempts, "queued"), else_="failed"),
+                error=case((PostTurnJob.attempts < max_attempts, None), else_="lease expired"),
+                locked_by=None,
+                locked_at=None,
+                available_at=func.now(),
+                updated_at=func.now(),
+            )
+        )
+        await self.db.commit()
+        return int(result.rowcount or 0)
+
+    async def heartbeat(self, job_id: int, worker_id: str) -> str | None:
+        """Extend the lease of a running job and return its current status."""
+        result = await self.db.execute(
+            update(PostTurnJob)
+            .where(PostTurnJob.id == job_id, PostTurnJob.locked_by == worker_id, PostTurnJob.status == "running")
+            .values(locked_at=func.now())
+            .returning(PostTurnJob.status)
+        )
+        status = result.scalar_one_or_none()
+        await self.db.commit()
+        if status is not None:
+            return status
+        return await self.get_status(job_id)
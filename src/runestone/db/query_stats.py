@@ -0,0 +1,105 @@
+"""
+Per-request and per-operation SQL statement accounting.
+
+`instrument_engine` hooks the cursor events of an engine. Every statement it
+executes is added to each `track_queries` scope active in the current async
+context, so a request scope and a nested `timed_operation` scope both see it.
+Statements are compared by their SQL text, which SQLAlchemy emits with bound
+parameters, so the same query for different ids counts as a repeat.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Generator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_STATEMENT_LOG_CHARS = 200
+
+_active_scopes: ContextVar[tuple["QueryStats", ...]] = ContextVar("db_query_scopes", default=())
+_instrumented = False
+
+
+@dataclass
+class QueryStats:
+    """Statements, database time, and rows seen by one tracking scope."""
+
+    statements: int = 0
+    db_ms: float = 0.0
+    rows: int = 0
+    statement_counts: Counter[str] = field(default_factory=Counter)
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statements executed at least `threshold` times, most frequent first."""
+        return [(sql, count) for sql, count in self.statement_counts.most_common() if count >= threshold]
+
+    def log_fields(self) -> dict[str, Any]:
+        return {"db_statements": self.statements, "db_ms": round(self.db_ms, 1), "db_rows": self.rows}
+
+    def _record(self, statement: str, elapsed_ms: float, rows: int) -> None:
+        self.statements += 1
+        self.db_ms += elapsed_ms
+        self.rows += rows
+        self.statement_counts[statement] += 1
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _active_scopes.get():
+        conn.info.setdefault("query_stats_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    scopes = _active_scopes.get()
+    started = conn.info.get("query_stats_started")
+    if not scopes or not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    # DDL and some driver paths report -1.
+    rows = max(cursor.rowcount, 0)
+    for stats in scopes:
+        stats._record(statement, elapsed_ms, rows)
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """Count statements of `engine` in active tracking scopes; calling it again is a no-op."""
+    global _instrumented
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    _instrumented = True
+
+
+def is_instrumented() -> bool:
+    """Whether any engine reports statements, i.e. whether tracked counts mean anything."""
+    return _instrumented
+
+
+@contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """Collect the statements executed in this async context until the block exits."""
+    stats = QueryStats()
+    token = _active_scopes.set((*_active_scopes.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_scopes.reset(token)
+
+
+def warn_repeated_statements(stats: QueryStats, *, threshold: int, scope: str) -> None:
+    """Log statements that ran `threshold` or more times in one scope, the usual shape of an N+1 query."""
+    for statement, count in stats.repeated_statements(threshold):
+        logger.warning(
+            "[db:queries] repeated statement scope=%s count=%s sql=%s",
+            scope,
+            count,
+            " ".join(statement.split())[:_STATEMENT_LOG_CHARS],
+        )
@@ -0,0 +1,133 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import JSON, Integer, cast, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from runestone.db.agent_side_effect_repository import AgentSideEffectRepository
+from runestone.db.chat_repository import ChatRepository
+from runestone.db.models import ChatSessionLearningFocus, ChatSummary, MemoryItem, RecallQueueItemDB, User, Vocabulary
+
+# Only well-formed integer lists are expanded in SQL; anything else is left to the service's own decoding.
+_FOCUS_IDS_PATTERN = r"^\s*\[[0-9,\s]*\]\s*$"
+
+
+@dataclass(frozen=True)
+class TurnContextRows:
+    """Raw rows for one chat turn; JSON-aggregated parts are plain dicts in chronological order."""
+
+    user: User | None
+    history: list[dict[str, Any]] = field(default_factory=list)
+    summary_content: str | None = None
+    summary_last_message_id: int | None = None
+    recall_words: list[str] = field(default_factory=list)
+    learning_focus_item_ids_json: str | None = None
+    learning_focus_items: list[dict[str, Any]] = field(default_factory=list)
+    recent_side_effects: list[dict[str, Any]] = field(default_factory=list)
+
+
+class TurnContextRepository:
+    """Repository that loads everything the teacher reads before a turn in one statement."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with database session."""
+        self.db = db
+
+    async def load(
+        self,
+        user_id: int,
+        chat_id: str,
+        *,
+        history_limit: int,
+        side_effect_limit: int,
+        after_summary: bool,
+        include_learning_focus: bool = True,
+    ) -> TurnContextRows:
+        """
+        Fetch user, history window, chat summary, recall queue, frozen learning focus,
+        and recent side effects in a single round-trip.
+
+        Each part is a scalar subquery on the user row, so the statement returns one
+        row; list parts are aggregated with `json_agg`. With `after_summary`, history
+        only covers messages newer than the chat summary. Without
+        `include_learning_focus`, the focus subqueries are left out.
+        """
+        summary_filter = (ChatSummary.user_id == user_id, ChatSummary.chat_id == chat_id)
+        summary_content = select(ChatSummary.summary_content).where(*summary_filter).scalar_subquery()
+        summary_last_id = select(ChatSummary.last_message_id).where(*summary_filter).scalar_subquery()
+
+        history_rows = ChatRepository.context_window_query(
+            user_id,
+            chat_id,
+            limit=history_limit,
+            after_id=func.coalesce(summary_last_id, 0) if after_summary else None,
+        ).subquery("history_rows")
+        history = select(
+            func.json_agg(aggregate_order_by(history_rows.table_valued(), history_rows.c.created_at, history_rows.c.id))
+        ).scalar_subquery()
+
+        recall_words = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        Vocabulary.word_phrase,
+                        RecallQueueItemDB.position.asc(),
+                        RecallQueueItemDB.vocabulary_id.asc(),
+                    )
+                )
+            )
+            .select_from(RecallQueueItemDB)
+            .join(Vocabulary, Vocabulary.id == RecallQueueItemDB.vocabulary_id)
+            .where(RecallQueueItemDB.user_id == user_id)
+            .scalar_subquery()
+        )
+
+        focus_filter = (ChatSessionLearningFocus.user_id == user_id, ChatSessionLearningFocus.chat_id == chat_id)
+        focus_ids_json = select(ChatSessionLearningFocus.memory_item_ids_json).where(*focus_filter).scalar_subquery()
+        focus_ids = select(
+            cast(func.json_array_elements_text(cast(ChatSessionLearningFocus.memory_item_ids_json, JSON)), Integer)
+        ).where(*focus_filter, ChatSessionLearningFocus.memory_item_ids_json.regexp_match(_FOCUS_IDS_PATTERN))
+        focus_item_rows = select(MemoryItem).where(MemoryItem.id.in_(focus_ids)).subquery("focus_item_rows")
+        focus_items = select(func.json_agg(focus_item_rows.table_valued())).scalar_subquery()
+
+        side_effect_rows = AgentSideEffectRepository.recent_for_teacher_query(
+            user_id, chat_id, limit=side_effect_limit
+        ).subquery("side_effect_rows")
+        side_effects = select(
+            func.json_agg(
+                aggregate_order_by(
+                    side_effect_rows.table_valued(),
+                    side_effect_rows.c.created_at,
+                    side_effect_rows.c.id,
+                )
+            )
+        ).scalar_subquery()
+
+        empty = func.json_build_array()
+        columns = [
+            User,
+            func.coalesce(history, empty, type_=JSON).label("history"),
+            summary_content.label("summary_content"),
+            summary_last_id.label("summary_last_message_id"),
+            func.coalesce(recall_words, empty, type_=JSON).label("recall_words"),
+            func.coalesce(side_effects, empty, type_=JSON).label("recent_side_effects"),
+        ]
+        if include_learning_focus:
+            columns += [
+                focus_ids_json.label("learning_focus_item_ids_json"),
+                func.coalesce(focus_items, empty, type_=JSON).label("learning_focus_items"),
+            ]
+        row = (await self.db.execute(select(*columns).where(User.id == user_id))).one_or_none()
+        if row is None:
+            return TurnContextRows(user=None)
+        return TurnContextRows(
+            user=row.User,
+            history=row.history,
+            summary_content=row.summary_content,
+            summary_last_message_id=row.summary_last_message_id,
+            recall_words=row.recall_words,
+            learning_focus_item_ids_json=row.learning_focus_item_ids_json if include_learning_focus else None,
+            learning_focus_items=row.learning_focus_items if include_learning_focus else [],
+            recent_side_effects=row.recent_side_effects,
+        )
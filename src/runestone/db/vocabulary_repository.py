@@ -14,7 +14,7 @@ from ..schemas.vocabulary_save import (
     priority_word_action_name,
 )
 from ..utils.search import parse_search_query_with_wildcards
-from .models import Vocabulary
+from .models import User, Vocabulary, WordEnrichment
 
 
 class VocabularyRepository:
@@ -633,3 +633,65 @@ class VocabularyRepository:
         learned_counts: dict[str, int] = {row.bucket: row.cnt for row in learned_result.all()}
 
         return priority_counts, learned_counts
+
+    async def get_word_enrichments(
+        self, word_keys: List[str], target_language: str, prompt_version: str
+    ) -> List[WordEnrichment]:
+        """Return cached cross-user enrichment rows for the given normalized phrase keys."""
+        if not word_keys:
+            return []
+
+        stmt = select(WordEnrichment).where(
+            WordEnrichment.word_key.in_(word_keys),
+            WordEnrichment.target_language == target_language,
+            WordEnrichment.prompt_version == prompt_version,
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def upsert_word_enrichments(self, rows: List[dict], target_language: str, prompt_version: str) -> None:
+        """Insert or refresh cross-user enrichment rows keyed by normalized phrase; the caller commits."""
+        if not rows:
+            return
+
+        data = [
+            {
+                "word_key": row["word_key"],
+                "target_language": target_language,
+                "prompt_version": prompt_version,
+                "translation": row.get("translation"),
+                "example_phrase": row.get("example_phrase"),
+                "extra_info": row.get("extra_info"),
+            }
+            for row in rows
+        ]
+        stmt = insert(WordEnrichment).values(data)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_word_enrichments_key_language_version",
+            set_={
+                "translation": func.coalesce(stmt.excluded.translation, WordEnrichment.translation),
+                "example_phrase": func.coalesce(stmt.excluded.example_phrase, WordEnrichment.example_phrase),
+                "extra_info": func.coalesce(stmt.excluded.extra_info, WordEnrichment.extra_info),
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def list_shared_word_phrases(self, limit: int) -> List[tuple[str, Optional[str], int]]:
+        """
+        Return the most widely saved phrases across users with each owner's mother tongue.
+
+        Rows are (word_phrase, mother_tongue, user_count), most shared first, so a
+        bounded prewarm covers the phrases that save the most enrichment calls.
+        """
+        phrase_key = func.lower(Vocabulary.word_phrase)
+        user_count = func.count(func.distinct(Vocabulary.user_id)).label("user_count")
+        stmt = (
+            select(func.min(Vocabulary.word_phrase), User.mother_tongue, user_count)
+            .join(User, User.id == Vocabulary.user_id)
+            .group_by(phrase_key, User.mother_tongue)
+            .order_by(user_count.desc(), phrase_key)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return [(row[0], row[1], row[2]) for row in result.all()]
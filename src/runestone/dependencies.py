@@ -13,6 +13,7 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from runestone.agents.manager import AgentsManager
+from runestone.auth.user_cache import authenticated_user_cache, verified_token_cache
 from runestone.config import Settings, settings
 from runestone.core.analyzer import ContentAnalyzer
 from runestone.core.ocr import OCRProcessor
@@ -23,6 +24,7 @@ from runestone.db.chat_session_learning_focus_repository import ChatSessionLearn
 from runestone.db.database import get_db
 from runestone.db.memory_item_repository import MemoryItemRepository
 from runestone.db.recall_repository import RecallRepository
+from runestone.db.turn_context_repository import TurnContextRepository
 from runestone.db.user_repository import UserRepository
 from runestone.db.vocabulary_repository import VocabularyRepository
 from runestone.rag.index import GrammarIndex
@@ -34,6 +36,7 @@ from runestone.services.chat_session_learning_focus_service import ChatSessionLe
 from runestone.services.grammar_service import GrammarService
 from runestone.services.memory_item_service import MemoryItemService
 from runestone.services.tts_service import TTSService
+from runestone.services.turn_context_service import TurnContextService
 from runestone.services.user_service import UserService
 from runestone.services.vocabulary_service import VocabularyService
 from runestone.services.voice_service import VoiceService
@@ -170,7 +173,14 @@ def get_auth_service(
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> AuthService:
     """Build request-scoped authentication over the user repository."""
-    return AuthService(user_repo, settings)
+    if not settings.auth_user_cache_enabled:
+        return AuthService(user_repo, settings)
+    return AuthService(
+        user_repo,
+        settings,
+        token_cache=verified_token_cache,
+        user_cache=authenticated_user_cache,
+    )
 
 
 def get_memory_item_service(
@@ -251,6 +261,11 @@ def get_recall_service(
     return RecallService(recall_repository, vocabulary_service, user_service, settings)
 
 
+def get_turn_context_service(db: Annotated[AsyncSession, Depends(get_db)]) -> TurnContextService:
+    """Dependency injection for the single round-trip turn-context loader."""
+    return TurnContextService(TurnContextRepository(db))
+
+
 def get_ocr_processor(
     settings: Annotated[Settings, Depends(get_settings)],
     ocr_llm_model: Annotated[BaseChatModel, Depends(get_ocr_llm_model)],
@@ -373,6 +388,7 @@ def get_chat_service(
     chat_session_learning_focus_service: Annotated[
         ChatSessionLearningFocusService, Depends(get_chat_session_learning_focus_service)
     ],
+    turn_context_service: Annotated[TurnContextService, Depends(get_turn_context_service)],
 ) -> ChatService:
     """
     Get chat service instance.
@@ -385,6 +401,7 @@ def get_chat_service(
         agents_manager: AgentsManager from dependency injection
         processor: RunestoneProcessor from dependency injection
         tts_service: TTSService from dependency injection
+        turn_context_service: Single round-trip turn-context loader from dependency injection
 
     Returns:
         ChatService: Service instance for chat operations
@@ -400,6 +417,7 @@ def get_chat_service(
         tts_service,
         memory_item_service,
         chat_session_learning_focus_service,
+        turn_context_service,
     )
 
 
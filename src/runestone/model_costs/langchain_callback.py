@@ -1,6 +1,8 @@
 """LangChain callback that records standardized, content-free token usage."""
 
 import logging
+import threading
+import time
 from typing import Any
 from uuid import UUID
 
@@ -8,6 +10,7 @@ from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import AIMessage, UsageMetadata
 from langchain_core.outputs import ChatGeneration, LLMResult
 
+from runestone.core.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
 from runestone.model_costs.tracking import record_model_interaction
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,15 @@ def _detail_tokens(details: object, key: str) -> int | None:
     return None
 
 
+def _cache_read_tokens(details: object) -> int | None:
+    """Return prompt-cache reads, including service-tier variants such as `priority_cache_read`."""
+    if not isinstance(details, dict):
+        return None
+    keys = [key for key in details if key == "cache_read" or (isinstance(key, str) and key.endswith("_cache_read"))]
+    values = [value for value in (_detail_tokens(details, key) for key in keys) if value is not None]
+    return sum(values) if values else None
+
+
 def _normalized_side(
     base_unit: str,
     total: int,
@@ -46,7 +58,7 @@ def _normalized_side(
 def _usage_from_metadata(metadata: UsageMetadata) -> dict[str, int]:
     input_details = metadata.get("input_token_details")
     output_details = metadata.get("output_token_details")
-    cached_read_tokens = _detail_tokens(input_details, "cache_read")
+    cached_read_tokens = _cache_read_tokens(input_details)
     cached_write_tokens = _detail_tokens(input_details, "cache_creation")
     input_audio_tokens = _detail_tokens(input_details, "audio")
     reasoning_tokens = _detail_tokens(output_details, "reasoning")
@@ -86,6 +98,19 @@ class LangChainCostCallback(BaseCallbackHandler):
         self.provider = provider
         self.model = model
         self.component = component
+        # One callback serves every concurrent call of its model; runs are told apart by run_id.
+        self._started: dict[UUID, float] = {}
+        self._started_lock = threading.Lock()
+
+    def on_chat_model_start(self, serialized: dict[str, Any], messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Remember when a chat completion started for its latency metric."""
+        del serialized, messages, kwargs
+        self._mark_started(run_id)
+
+    def on_llm_start(self, serialized: dict[str, Any], prompts: list[str], *, run_id: UUID, **kwargs: Any) -> None:
+        """Remember when a text completion started for its latency metric."""
+        del serialized, prompts, kwargs
+        self._mark_started(run_id)
 
     def on_llm_end(
         self,
@@ -96,14 +121,16 @@ class LangChainCostCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Record standardized returned usage without affecting model results."""
-        del run_id, parent_run_id, kwargs
+        del parent_run_id, kwargs
         try:
+            usage = extract_usage(response)
+            self._observe(run_id, "completed", usage)
             record_model_interaction(
                 component=self.component,
                 provider=self.provider,
                 model=self.model,
                 status="completed",
-                usage=extract_usage(response),
+                usage=usage,
                 provider_cost_usd=None,
             )
         except Exception as exc:  # pragma: no cover - defensive callback boundary
@@ -123,7 +150,8 @@ class LangChainCostCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Record failed calls with unknown usage and cost."""
-        del error, run_id, parent_run_id, kwargs
+        del error, parent_run_id, kwargs
+        self._observe(run_id, "failed", {})
         record_model_interaction(
             component=self.component,
             provider=self.provider,
@@ -132,3 +160,17 @@ class LangChainCostCallback(BaseCallbackHandler):
             usage={},
             provider_cost_usd=None,
         )
+
+    def _mark_started(self, run_id: UUID) -> None:
+        with self._started_lock:
+            self._started[run_id] = time.monotonic()
+
+    def _observe(self, run_id: UUID, status: str, usage: dict[str, int]) -> None:
+        with self._started_lock:
+            started = self._started.pop(run_id, None)
+        if started is not None:
+            LLM_REQUEST_SECONDS.observe(
+                time.monotonic() - started, provider=self.provider, model=self.model, status=status
+            )
+        for unit, tokens in usage.items():
+            LLM_TOKENS.inc(tokens, provider=self.provider, model=self.model, unit=unit)
@@ -0,0 +1,211 @@
+"""
+Batched background persistence of model-cost interactions.
+
+`InteractionRecordWriter` is installed as the tracking sink. Recording an
+interaction only appends it to a bounded in-memory buffer, so the request path
+never waits on the database; a background task bulk-inserts the buffer every
+`batch_size` records or `flush_interval_seconds`, whichever comes first. When
+the buffer is full, new records are dropped and counted rather than blocking,
+and a failed batch is counted and discarded rather than retried, so a database
+outage costs cost history, not latency.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+from runestone.agents.service_providers import provide_model_cost_service
+from runestone.config import Settings
+from runestone.core.metrics import MODEL_COST_QUEUE_DEPTH, MODEL_COST_RECORDS
+from runestone.model_costs.tracking import InteractionRecord, set_interaction_sink
+
+logger = logging.getLogger(__name__)
+
+BatchWriter = Callable[[Sequence[InteractionRecord]], Awaitable[bool]]
+
+
+@dataclass
+class InteractionWriterStats:
+    """Running counters of one writer."""
+
+    queued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+
+async def write_interactions_to_database(records: Sequence[InteractionRecord]) -> bool:
+    """Insert one batch through its own database session."""
+    async with provide_model_cost_service() as service:
+        return await service.record_batch(records)
+
+
+class InteractionRecordWriter:
+    """Bounded buffer of interaction records drained into the database by a background task."""
+
+    def __init__(
+        self,
+        write_batch: BatchWriter = write_interactions_to_database,
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 5.0,
+    ):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.stats = InteractionWriterStats()
+        self._write_batch = write_batch
+        # Records arrive from LangChain callbacks that may run in worker threads.
+        self._buffer: deque[InteractionRecord] = deque()
+        self._lock = threading.Lock()
+        self._dropping = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(cls, app_settings: Settings) -> "InteractionRecordWriter":
+        return cls(
+            max_queue=app_settings.model_cost_persistence_queue_size,
+            batch_size=app_settings.model_cost_persistence_batch_size,
+            flush_interval_seconds=app_settings.model_cost_persistence_flush_seconds,
+        )
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def offer(self, record: InteractionRecord) -> bool:
+        """Queue one record without blocking. Returns False when the buffer is full and the record is dropped."""
+        with self._lock:
+            if len(self._buffer) >= self.max_queue:
+                self.stats.dropped += 1
+                first_drop = not self._dropping
+                self._dropping = True
+                depth = None
+            else:
+                self._buffer.append(record)
+                self.stats.queued += 1
+                depth = len(self._buffer)
+        if depth is None:
+            MODEL_COST_RECORDS.inc(outcome="dropped")
+            if first_drop:
+                logger.warning(
+                    "[model_costs:persistence] Interaction queue full max_queue=%s; dropping records until it drains",
+                    self.max_queue,
+                )
+            return False
+        MODEL_COST_RECORDS.inc(outcome="queued")
+        MODEL_COST_QUEUE_DEPTH.set(depth)
+        if depth == self.batch_size:
+            self._request_flush()
+        return True
+
+    def start(self) -> None:
+        """Start the background drain task on the running event loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="model-cost-writer")
+
+    async def aclose(self) -> None:
+        """Stop the drain task and write everything still buffered."""
+        self._closing = True
+        task, self._task = self._task, None
+        if task is not None:
+            self._wake.set()
+            await task
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write buffered records in batches and return how many were written.
+
+        Stops at the first failed batch; the remaining records wait for the next cycle.
+        """
+        written = 0
+        async with self._flush_lock:
+            while True:
+                with self._lock:
+                    count = min(self.batch_size, len(self._buffer))
+                    batch = [self._buffer.popleft() for _ in range(count)]
+                    depth = len(self._buffer)
+                    if depth < self.max_queue:
+                        self._dropping = False
+                if not batch:
+                    return written
+                MODEL_COST_QUEUE_DEPTH.set(depth)
+                try:
+                    ok = await self._write_batch(batch)
+                except Exception:
+                    logger.exception("[model_costs:persistence] Interaction batch write raised size=%s", len(batch))
+                    ok = False
+                if not ok:
+                    self.stats.failed += len(batch)
+                    MODEL_COST_RECORDS.inc(len(batch), outcome="failed")
+                    return written
+                written += len(batch)
+                self.stats.written += len(batch)
+                MODEL_COST_RECORDS.inc(len(batch), outcome="written")
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_seconds)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def _request_flush(self) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        # `offer` may run outside the loop's thread, where `Event.set` is not safe.
+        try:
+            loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass
+
+
+_writer: InteractionRecordWriter | None = None
+
+
+def start_interaction_persistence(app_settings: Settings) -> InteractionRecordWriter | None:
+    """Start persisting recorded interactions when `MODEL_COST_PERSISTENCE_ENABLED` is set."""
+    global _writer
+    if not app_settings.model_cost_persistence_enabled or _writer is not None:
+        return _writer
+    _writer = InteractionRecordWriter.from_settings(app_settings)
+    _writer.start()
+    set_interaction_sink(_writer.offer)
+    logger.info(
+        "[model_costs:persistence] Interaction writer started batch_size=%s flush_seconds=%s max_queue=%s",
+        _writer.batch_size,
+        _writer.flush_interval_seconds,
+        _writer.max_queue,
+    )
+    return _writer
+
+
+async def stop_interaction_persistence() -> None:
+    """Detach the writer from tracking and flush what it still holds."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is None:
+        return
+    set_interaction_sink(None)
+    await writer.aclose()
+    logger.info(
+        "[model_costs:persistence] Interaction writer stopped written=%s dropped=%s failed=%s",
+        writer.stats.written,
+        writer.stats.dropped,
+        writer.stats.failed,
+    )
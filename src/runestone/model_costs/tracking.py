@@ -7,10 +7,11 @@ import threading
 import uuid
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, contextmanager
 from contextvars import ContextVar, Token
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Generator, Mapping
+from typing import Callable, Generator, Mapping
 
 from runestone.model_costs.pricing import DEFAULT_PRICE_PATH, PriceSnapshot, load_price_snapshot, model_price_key
 
@@ -19,8 +20,9 @@ logger = logging.getLogger(__name__)
 COST_QUALITY_EXACT = "exact"
 COST_QUALITY_ESTIMATED = "estimated"
 COST_QUALITY_UNKNOWN = "unknown"
+COST_SOURCE_CACHE = "cache"
 TERMINAL_CHILD_ERRORS = {"failed", "timed_out", "cancelled", "stale_replaced", "cancelled_with_unknown_usage"}
-NEUTRAL_CHILD_STATUSES = {"completed", "skipped_no_websocket"}
+NEUTRAL_CHILD_STATUSES = {"completed", "deferred_to_worker", "skipped_no_websocket"}
 DEGRADED_INTERACTION_STATUSES = {
     "cancelled",
     "cancelled_with_unknown_usage",
@@ -57,6 +59,11 @@ class InteractionRecord:
     cost_quality: str
     cost_source: str
     applied_rates_usd: Mapping[str, Decimal]
+    user_id: int | None = None
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+InteractionSink = Callable[[InteractionRecord], None]
 
 
 @dataclass(frozen=True)
@@ -68,6 +75,13 @@ class _TrackingBinding:
 
 
 _current_binding: ContextVar[_TrackingBinding | None] = ContextVar("model_cost_context", default=None)
+_interaction_sink: InteractionSink | None = None
+
+
+def set_interaction_sink(sink: InteractionSink | None) -> None:
+    """Also hand every recorded interaction to `sink`, e.g. a persistence queue; it must not block."""
+    global _interaction_sink
+    _interaction_sink = sink
 
 
 def _as_decimal(value: object, *, field: str) -> Decimal:
@@ -101,8 +115,14 @@ def calculate_cost(
     *,
     provider_cost_usd: object | None = None,
     snapshot: PriceSnapshot | None = None,
+    cached: bool = False,
 ) -> CostCalculation:
-    """Calculate one interaction cost, preferring provider-reported request cost."""
+    """Calculate one interaction cost, preferring provider-reported request cost.
+
+    Interactions served from a local cache never reach the provider and are exact zero-cost.
+    """
+    if cached:
+        return CostCalculation(Decimal("0"), COST_QUALITY_EXACT, COST_SOURCE_CACHE, {})
     if provider_cost_usd is not None:
         return CostCalculation(
             known_cost_usd=_as_decimal(provider_cost_usd, field="provider_cost_usd"),
@@ -172,6 +192,27 @@ def _summary_counts(
     return counts
 
 
+PROMPT_INPUT_UNITS = ("input_token", "cached_input_token", "cached_input_write_token", "input_audio_token")
+
+
+def _prompt_cache_fields(records: tuple[InteractionRecord, ...] | list[InteractionRecord]) -> dict[str, object]:
+    """Summarize how much of the prompt input providers served from their prefix cache."""
+    prompt_tokens = sum(
+        (record.usage.get(unit, Decimal("0")) for record in records for unit in PROMPT_INPUT_UNITS),
+        start=Decimal("0"),
+    )
+    if not prompt_tokens:
+        return {}
+    cached_tokens = sum(
+        (record.usage.get("cached_input_token", Decimal("0")) for record in records), start=Decimal("0")
+    )
+    return {
+        "prompt_tokens": prompt_tokens,
+        "cached_prompt_tokens": cached_tokens,
+        "prompt_cache_hit_rate": format(cached_tokens / prompt_tokens, ".3f"),
+    }
+
+
 def _known_total(records: tuple[InteractionRecord, ...] | list[InteractionRecord]) -> Decimal:
     return sum((record.known_cost_usd for record in records), start=Decimal("0"))
 
@@ -238,11 +279,13 @@ class _CostCollector:
         operation_type: str,
         *,
         operation_id: str | None = None,
+        user_id: int | None = None,
         snapshot: PriceSnapshot | None = None,
         price_path: str | Path = DEFAULT_PRICE_PATH,
     ) -> None:
         self.operation_type = operation_type
         self.operation_id = operation_id or str(uuid.uuid4())
+        self.user_id = user_id
         self.snapshot = snapshot if snapshot is not None else load_price_snapshot(price_path)
         self._interactions: list[InteractionRecord] = []
         self._children: dict[str, str | None] = {}
@@ -328,6 +371,7 @@ class _CostCollector:
         status: str,
         usage: Mapping[str, object] | None = None,
         provider_cost_usd: object | None = None,
+        cached: bool = False,
     ) -> InteractionRecord | None:
         """Record one interaction and swallow malformed tracking metadata."""
         try:
@@ -338,6 +382,7 @@ class _CostCollector:
                 normalized_usage,
                 provider_cost_usd=provider_cost_usd,
                 snapshot=self.snapshot,
+                cached=cached,
             )
             record = InteractionRecord(
                 operation_id=self.operation_id,
@@ -352,6 +397,7 @@ class _CostCollector:
                 cost_quality=calculation.cost_quality,
                 cost_source=calculation.cost_source,
                 applied_rates_usd=calculation.applied_rates_usd,
+                user_id=self.user_id,
             )
             with self._lock:
                 if self._state in {"corrected_emitted", "final_failed", "final_emitted"}:
@@ -377,6 +423,7 @@ class _CostCollector:
                     }
                 ),
             )
+            self._hand_to_sink(record)
             return record
         except Exception as exc:
             _safe_log(
@@ -388,6 +435,22 @@ class _CostCollector:
             )
             return None
 
+    @staticmethod
+    def _hand_to_sink(record: InteractionRecord) -> None:
+        sink = _interaction_sink
+        if sink is None:
+            return
+        try:
+            sink(record)
+        except Exception as exc:
+            _safe_log(
+                logging.WARNING,
+                "Model cost interaction sink failed operation_id=%s component=%s error=%s",
+                record.operation_id,
+                record.component,
+                exc,
+            )
+
     def emit_preliminary(self) -> Mapping[str, object] | None:
         """Freeze and log foreground records, then allow a ready correction."""
         should_correct = False
@@ -405,6 +468,7 @@ class _CostCollector:
                 "cost_quality": aggregate_quality(self._preliminary_records),
                 "background": "pending",
                 **_record_counts(self._preliminary_records),
+                **_prompt_cache_fields(self._preliminary_records),
             }
             self._state = "preliminary_emitted"
             should_correct = bool(self._children) and self._all_children_closed_unlocked()
@@ -437,6 +501,7 @@ class _CostCollector:
                 "cost_breakdown_usd": _cost_breakdown(all_records),
                 "cost_quality": _summary_quality(all_records, unknown_children=unknown_children),
                 **_summary_counts(all_records, unknown_children=unknown_children),
+                **_prompt_cache_fields(all_records),
             }
             self._state = "corrected_emitted"
         _safe_log(logging.INFO, "model_cost %s", _render_fields(fields))
@@ -458,6 +523,7 @@ class _CostCollector:
                 "cost_breakdown_usd": _cost_breakdown(records),
                 "cost_quality": _summary_quality(records, unknown_children=unknown_children),
                 **_summary_counts(records, unknown_children=unknown_children),
+                **_prompt_cache_fields(records),
             }
             self._state = "final_failed" if status == "failed" else "final_emitted"
         _safe_log(logging.INFO, "model_cost %s", _render_fields(fields))
@@ -485,10 +551,10 @@ class _CostCollector:
 class _OrdinaryCostScope(AbstractAsyncContextManager[None]):
     """Own one ordinary summary or inherit the active collector fail-open."""
 
-    def __init__(self, activity: str) -> None:
+    def __init__(self, activity: str, user_id: int | None = None) -> None:
         parent_binding = _current_binding.get()
         self._owned = parent_binding is None
-        self._collector = _CostCollector(activity) if self._owned else parent_binding.collector
+        self._collector = _CostCollector(activity, user_id=user_id) if self._owned else parent_binding.collector
         self._phase = "foreground" if self._owned else parent_binding.phase
         self._token: Token[_TrackingBinding | None] | None = None
         if parent_binding is not None:
@@ -527,8 +593,8 @@ class _OrdinaryCostScope(AbstractAsyncContextManager[None]):
 class _BackgroundCostScope(AbstractAsyncContextManager["_BackgroundController"]):
     """Own the foreground-to-background summary lifecycle."""
 
-    def __init__(self, activity: str) -> None:
-        self._collector = _CostCollector(activity)
+    def __init__(self, activity: str, user_id: int | None = None) -> None:
+        self._collector = _CostCollector(activity, user_id=user_id)
         self._controller = _BackgroundController(self._collector)
         self._token: Token[_TrackingBinding | None] | None = None
 
@@ -557,17 +623,18 @@ class _BackgroundController:
         return self._collector.transfer(name)
 
 
-def track_model_costs(activity: str) -> _OrdinaryCostScope:
+def track_model_costs(activity: str, *, user_id: int | None = None) -> _OrdinaryCostScope:
     """Track one awaited operation and automatically emit exactly one final summary.
 
     Nested calls inherit the active collector, warn without content, and do not summarize.
+    `user_id` attributes the operation's interactions to a user for persisted rollups.
     """
-    return _OrdinaryCostScope(activity)
+    return _OrdinaryCostScope(activity, user_id)
 
 
-def track_model_costs_with_background(activity: str) -> _BackgroundCostScope:
+def track_model_costs_with_background(activity: str, *, user_id: int | None = None) -> _BackgroundCostScope:
     """Track foreground work and explicit transferred background segments."""
-    return _BackgroundCostScope(activity)
+    return _BackgroundCostScope(activity, user_id)
 
 
 @contextmanager
@@ -580,6 +647,14 @@ def suspend_model_cost_tracking() -> Generator[None]:
         _current_binding.reset(token)
 
 
+def current_known_cost_usd() -> Decimal | None:
+    """Return the known cost recorded so far by the active operation, or None outside one."""
+    binding = _current_binding.get()
+    if binding is None:
+        return None
+    return _known_total(binding.collector.interactions)
+
+
 @contextmanager
 def _bind_collector(collector: _CostCollector, phase: str) -> Generator[None]:
     token: Token[_TrackingBinding | None] = _current_binding.set(_TrackingBinding(collector, phase))
@@ -596,8 +671,12 @@ def record_model_interaction(
     status: str,
     usage: Mapping[str, object] | None = None,
     provider_cost_usd: object | None = None,
+    cached: bool = False,
 ) -> InteractionRecord | None:
-    """Fail-open recorder used by callbacks and direct provider clients."""
+    """Fail-open recorder used by callbacks and direct provider clients.
+
+    Pass `cached=True` for results served from a local cache; they are recorded as exact zero-cost.
+    """
     try:
         binding = _current_binding.get()
         if binding is None:
@@ -619,6 +698,7 @@ def record_model_interaction(
             status=status,
             usage=usage,
             provider_cost_usd=provider_cost_usd,
+            cached=cached,
         )
     except Exception as exc:  # pragma: no cover - defensive public boundary
         _safe_log(logging.WARNING, "Model cost recording failed component=%s error=%s", component, exc)
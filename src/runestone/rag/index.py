@@ -4,6 +4,7 @@ Grammar search index using hybrid BM25 + FAISS retrieval.
 
 import logging
 import threading
+from functools import lru_cache
 from pathlib import Path
 
 from langchain_classic.retrievers.ensemble import EnsembleRetriever
@@ -20,6 +21,41 @@ logger = logging.getLogger(__name__)
 EMBEDDING_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
 
 
+@lru_cache(maxsize=1)
+def get_embeddings() -> HuggingFaceEmbeddings:
+    """
+    Load the multilingual embedding model once per process, attempting local cache first.
+
+    Shared by the grammar index and local memory-maintenance bucketing.
+    """
+    Path(settings.hf_cache_dir).mkdir(parents=True, exist_ok=True)
+
+    # First try loading from cache only, avoiding any online HEAD requests
+    try:
+        model_kwargs = {"local_files_only": True}
+        if settings.hf_token:
+            model_kwargs["token"] = settings.hf_token
+        return HuggingFaceEmbeddings(
+            model_name=EMBEDDING_MODEL_NAME,
+            cache_folder=settings.hf_cache_dir,
+            model_kwargs=model_kwargs,
+        )
+    except Exception as e:
+        logger.info(
+            "Local model not found or failed to load (%s: %s). Downloading from Hugging Face...",
+            type(e).__name__,
+            e,
+        )
+        model_kwargs = {"local_files_only": False}
+        if settings.hf_token:
+            model_kwargs["token"] = settings.hf_token
+        return HuggingFaceEmbeddings(
+            model_name=EMBEDDING_MODEL_NAME,
+            cache_folder=settings.hf_cache_dir,
+            model_kwargs=model_kwargs,
+        )
+
+
 class GrammarIndex:
     """
     Hybrid search index for grammar cheatsheets using BM25 (keywords) + FAISS (vectors).
@@ -76,33 +112,8 @@ class GrammarIndex:
             logger.info("Grammar index initialized successfully")
 
     def _load_embeddings(self) -> HuggingFaceEmbeddings:
-        """Load HuggingFaceEmbeddings model, attempting local cache first."""
-        Path(settings.hf_cache_dir).mkdir(parents=True, exist_ok=True)
-
-        # First try loading from cache only, avoiding any online HEAD requests
-        try:
-            model_kwargs = {"local_files_only": True}
-            if settings.hf_token:
-                model_kwargs["token"] = settings.hf_token
-            return HuggingFaceEmbeddings(
-                model_name=EMBEDDING_MODEL_NAME,
-                cache_folder=settings.hf_cache_dir,
-                model_kwargs=model_kwargs,
-            )
-        except Exception as e:
-            logger.info(
-                "Local model not found or failed to load (%s: %s). Downloading from Hugging Face...",
-                type(e).__name__,
-                e,
-            )
-            model_kwargs = {"local_files_only": False}
-            if settings.hf_token:
-                model_kwargs["token"] = settings.hf_token
-            return HuggingFaceEmbeddings(
-                model_name=EMBEDDING_MODEL_NAME,
-                cache_folder=settings.hf_cache_dir,
-                model_kwargs=model_kwargs,
-            )
+        """Load the shared embedding model."""
+        return get_embeddings()
 
     def search(self, query: str, top_k: int = 5) -> list[Document]:
         """
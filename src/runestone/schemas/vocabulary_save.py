@@ -1,5 +1,6 @@
 """Shared internal schemas for vocabulary save planning and persistence."""
 
+import hashlib
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 
@@ -28,6 +29,27 @@ def decode_unicode_escapes(value: str | None) -> str | None:
     return value
 
 
+def word_enrichment_key(word_phrase: str) -> str:
+    """Normalize a Swedish phrase into the cross-user enrichment cache key."""
+    return " ".join(word_phrase.split()).lower()
+
+
+def enrichment_prompt_version(name: str, prompt: str) -> str:
+    """Version cached enrichment by prompt content so prompt edits never serve stale rows."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+    return f"{name}:{digest}"
+
+
+@dataclass(frozen=True)
+class SharedWordEnrichment:
+    """LLM-generated vocabulary fields shared across users for one phrase and language."""
+
+    word_phrase: str
+    translation: str | None = None
+    example_phrase: str | None = None
+    extra_info: str | None = None
+
+
 class WordSaveCandidate(BaseModel):
     """Canonical vocabulary candidate extracted before enrichment or persistence."""
 
@@ -3,6 +3,7 @@
 from datetime import timedelta
 
 from runestone.auth.security import create_access_token, hash_password, verify_password, verify_token
+from runestone.auth.user_cache import AuthenticatedUser, AuthenticatedUserCache, VerifiedTokenCache
 from runestone.config import Settings
 from runestone.core.exceptions import (
     InactiveUserError,
@@ -18,10 +19,19 @@ from runestone.db.user_repository import UserRepository
 class AuthService:
     """Coordinate account registration and authentication for API transports."""
 
-    def __init__(self, user_repository: UserRepository, settings: Settings):
-        """Initialize authentication with required persistence and configuration."""
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        settings: Settings,
+        *,
+        token_cache: VerifiedTokenCache | None = None,
+        user_cache: AuthenticatedUserCache | None = None,
+    ):
+        """Initialize authentication with required persistence, configuration, and optional caches."""
         self.user_repository = user_repository
         self.settings = settings
+        self.token_cache = token_cache
+        self.user_cache = user_cache
 
     async def register_user(self, email: str | None, password: str | None) -> User:
         """Validate and persist a new inactive user in one transaction."""
@@ -65,21 +75,30 @@ class AuthService:
             expires_delta=timedelta(days=self.settings.jwt_expiration_days),
         )
 
-    async def resolve_access_token(self, token: str) -> User:
-        """Verify an access token and return its current active user."""
-        payload = verify_token(token)
-        if not payload:
-            raise InvalidAccessTokenError("Invalid authentication credentials")
+    async def resolve_access_token(self, token: str) -> AuthenticatedUser:
+        """Verify an access token and return a snapshot of its current active user."""
+        user_id = self.token_cache.get(token) if self.token_cache is not None else None
+        if user_id is None:
+            payload = verify_token(token)
+            if not payload:
+                raise InvalidAccessTokenError("Invalid authentication credentials")
 
-        user_id = payload.get("sub")
-        if not user_id:
-            raise InvalidAccessTokenError("Invalid token payload")
+            user_id = payload.get("sub")
+            if not user_id:
+                raise InvalidAccessTokenError("Invalid token payload")
+            if self.token_cache is not None:
+                self.token_cache.put(token, payload)
 
         try:
             user_id_int = int(user_id)
         except (TypeError, ValueError) as exc:
             raise InvalidAccessTokenError("Invalid user ID in token") from exc
 
+        # Only active users are cached, so a hit needs no further checks.
+        snapshot = self.user_cache.get(user_id_int) if self.user_cache is not None else None
+        if snapshot is not None:
+            return snapshot
+
         user = await self.user_repository.get_by_id(user_id_int)
         if not user:
             raise InvalidAccessTokenError("User not found")
@@ -87,4 +106,7 @@ class AuthService:
         if not user.active:
             raise InactiveUserError("User is not active")
 
-        return user
+        snapshot = AuthenticatedUser.from_user(user)
+        if self.user_cache is not None:
+            self.user_cache.put(snapshot)
+        return snapshot
@@ -19,8 +19,10 @@ from runestone.model_costs.tracking import CostTrackingHandle, track_model_costs
 from runestone.recall.service import RecallService
 from runestone.services.agent_side_effect_service import AgentSideEffectService
 from runestone.services.chat_session_learning_focus_service import ChatSessionLearningFocusService
+from runestone.services.learning_focus_cache import learning_focus_cache
 from runestone.services.memory_item_service import MemoryItemService
 from runestone.services.tts_service import TTSService
+from runestone.services.turn_context_service import TurnContext, TurnContextService
 from runestone.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,7 @@ class ChatService:
         tts_service: TTSService,
         memory_item_service: MemoryItemService,
         chat_session_learning_focus_service: ChatSessionLearningFocusService,
+        turn_context_service: TurnContextService | None = None,
     ):
         """
         Wire together the collaborators needed for a full chat turn.
@@ -76,11 +79,13 @@ class ChatService:
         self.tts_service = tts_service
         self.memory_item_service = memory_item_service
         self.chat_session_learning_focus_service = chat_session_learning_focus_service
+        self.turn_context_service = turn_context_service
 
     async def _fail_foreground_operation(
         self,
         cost_tracking: CostTrackingHandle,
         chat_id: str | None,
+        user_id: int,
     ) -> None:
         """Bound foreground failure cleanup without replacing the application error."""
         if chat_id is not None:
@@ -89,6 +94,7 @@ class ChatService:
                     chat_id,
                     cost_tracking,
                     grace_seconds=1.0,
+                    user_id=user_id,
                 )
             except BaseException:
                 logger.warning(
@@ -122,7 +128,7 @@ class ChatService:
         """
 
         chat_id: str | None = None
-        async with track_model_costs_with_background("chat") as cost_tracking:
+        async with track_model_costs_with_background("chat", user_id=user_id) as cost_tracking:
             post_turn_cost_tracking = cost_tracking.transfer("post_turn")
             tts_cost_tracking = cost_tracking.transfer("tts") if tts_expected else None
             try:
@@ -135,41 +141,22 @@ class ChatService:
                     user_id, self.settings.chat_history_retention_days, preserve_chat_id=chat_id
                 )
 
-                # 3. Fetch context for agent
-                context_models = await self.repository.get_context_for_agent(user_id, chat_id)
-
-                # Convert models to schemas for the agent service
-                history = [
-                    ChatMessageSchema(
-                        id=m.id,
-                        role=m.role,
-                        content=m.content,
-                        sources=m.sources,
-                        teacher_emotion=m.teacher_emotion,
-                        created_at=m.created_at,
-                    )
-                    for m in context_models
-                ]
-
-                # 4. Build recall context before loading the ORM user. A handled recall
-                # database failure rolls back the shared session and expires loaded ORM
-                # instances, so the user must be fetched after that recovery boundary.
-                current_recall_words = await self._load_current_recall_words(user_id)
-                user = await self.user_service.get_user_by_id(user_id)
-                if not user:
-                    raise ValueError(f"User {user_id} not found")
+                # 3-4. Fetch history, recall words, and the user for the agent
+                context = await self._load_turn_context(user_id, chat_id)
 
                 # 5. Generate response using agents
                 assistant_text, sources, teacher_emotion = await self.agents_manager.process_turn(
                     message=message_text,
                     chat_id=chat_id,
-                    history=history[:-1],
-                    user=user,
+                    history=context.history[:-1],
+                    user=context.user,
                     memory_item_service=self.memory_item_service,
                     chat_session_learning_focus_service=self.chat_session_learning_focus_service,
                     side_effect_service=self.side_effect_service,
-                    current_recall_words=current_recall_words,
+                    current_recall_words=context.current_recall_words,
                     cost_tracking=post_turn_cost_tracking,
+                    chat_summary=context.chat_summary,
+                    **self._preloaded_turn_kwargs(context),
                 )
 
                 # 6. Save assistant message
@@ -181,8 +168,10 @@ class ChatService:
                     sources=sources,
                     teacher_emotion=teacher_emotion,
                 )
+                if self.settings.chat_summary_enabled:
+                    self.agents_manager.start_background_chat_summary(user_id, chat_id)
             except BaseException:
-                await self._fail_foreground_operation(post_turn_cost_tracking, chat_id)
+                await self._fail_foreground_operation(post_turn_cost_tracking, chat_id, user_id)
                 raise
 
             # 7. Push TTS audio if client expects it (non-blocking)
@@ -200,7 +189,7 @@ class ChatService:
                 except BaseException as exc:
                     status = "cancelled" if isinstance(exc, asyncio.CancelledError) else "failed"
                     tts_cost_tracking.finish(status)
-                    await self._fail_foreground_operation(post_turn_cost_tracking, chat_id)
+                    await self._fail_foreground_operation(post_turn_cost_tracking, chat_id, user_id)
                     raise
 
             return assistant_text, sources, teacher_emotion
@@ -218,7 +207,7 @@ class ChatService:
             image_content: Uploaded image bytes that will be sent through OCR.
         """
         chat_id: str | None = None
-        async with track_model_costs_with_background("chat") as cost_tracking:
+        async with track_model_costs_with_background("chat", user_id=user_id) as cost_tracking:
             post_turn_cost_tracking = cost_tracking.transfer("post_turn")
             try:
                 # 1. Run OCR on image content (async). Part 3 joins this operation.
@@ -237,27 +226,9 @@ class ChatService:
                     user_id, self.settings.chat_history_retention_days, preserve_chat_id=chat_id
                 )
 
-                # 3. Fetch context for agent
-                context_models = await self.repository.get_context_for_agent(user_id, chat_id)
-
-                # Convert models to schemas for the agent service
-                history = [
-                    ChatMessageSchema(
-                        id=m.id,
-                        role=m.role,
-                        content=m.content,
-                        teacher_emotion=m.teacher_emotion,
-                        created_at=m.created_at,
-                    )
-                    for m in context_models
-                ]
-
-                # 4. Build recall context before loading the ORM user. See the text-turn
-                # path above for why this ordering matters after a handled rollback.
-                current_recall_words = await self._load_current_recall_words(user_id)
-                user = await self.user_service.get_user_by_id(user_id)
-                if not user:
-                    raise ValueError(f"User {user_id} not found")
+                # 3-4. Fetch history, recall words, and the user for the agent
+                context = await self._load_turn_context(user_id, chat_id)
+                user = context.user
 
                 # 5. Build translation prompt with OCR text
                 mother_tongue = user.mother_tongue or "English"
@@ -274,13 +245,15 @@ Instructions:
                 assistant_text, _sources, teacher_emotion = await self.agents_manager.process_turn(
                     message=translation_prompt,
                     chat_id=chat_id,
-                    history=history,
+                    history=context.history,
                     user=user,
                     memory_item_service=self.memory_item_service,
                     chat_session_learning_focus_service=self.chat_session_learning_focus_service,
                     side_effect_service=self.side_effect_service,
-                    current_recall_words=current_recall_words,
+                    current_recall_words=context.current_recall_words,
                     cost_tracking=post_turn_cost_tracking,
+                    chat_summary=context.chat_summary,
+                    **self._preloaded_turn_kwargs(context),
                 )
 
                 await self.repository.add_message(
@@ -290,11 +263,97 @@ Instructions:
                     assistant_text,
                     teacher_emotion=teacher_emotion,
                 )
+                if self.settings.chat_summary_enabled:
+                    self.agents_manager.start_background_chat_summary(user_id, chat_id)
             except BaseException:
-                await self._fail_foreground_operation(post_turn_cost_tracking, chat_id)
+                await self._fail_foreground_operation(post_turn_cost_tracking, chat_id, user_id)
                 raise
             return assistant_text, teacher_emotion
 
+    async def _load_turn_context(self, user_id: int, chat_id: str) -> TurnContext:
+        """
+        Load everything the agents read before a turn.
+
+        With `turn_context_preload_enabled` this is one database round-trip; when that
+        is disabled or fails, each part is loaded with its own query. A learning focus
+        already in the learning-focus cache is not read again.
+        """
+        if self.turn_context_service is not None and self.settings.turn_context_preload_enabled:
+            focus_cached = self.settings.learning_focus_cache_enabled and learning_focus_cache.contains(
+                user_id, chat_id
+            )
+            context = await self.turn_context_service.load(
+                user_id,
+                chat_id,
+                after_summary=self.settings.chat_summary_enabled,
+                include_learning_focus=not focus_cached,
+            )
+            if context is not None:
+                if context.user is None:
+                    raise ValueError(f"User {user_id} not found")
+                return context
+
+        context_models = await self.repository.get_context_for_agent(user_id, chat_id)
+
+        # Convert models to schemas for the agent service
+        history = [
+            ChatMessageSchema(
+                id=m.id,
+                role=m.role,
+                content=m.content,
+                sources=m.sources,
+                teacher_emotion=m.teacher_emotion,
+                created_at=m.created_at,
+            )
+            for m in context_models
+        ]
+        chat_summary, history = await self._apply_chat_summary(user_id, chat_id, history)
+
+        # Build recall context before loading the ORM user. A handled recall
+        # database failure rolls back the shared session and expires loaded ORM
+        # instances, so the user must be fetched after that recovery boundary.
+        current_recall_words = await self._load_current_recall_words(user_id)
+        user = await self.user_service.get_user_by_id(user_id)
+        if not user:
+            raise ValueError(f"User {user_id} not found")
+        return TurnContext(
+            user=user,
+            history=history,
+            chat_summary=chat_summary,
+            current_recall_words=current_recall_words,
+        )
+
+    @staticmethod
+    def _preloaded_turn_kwargs(context: TurnContext) -> dict:
+        """Forward preloaded learning focus and side effects so the manager skips those reads."""
+        kwargs = {}
+        if context.learning_focus is not None:
+            kwargs["learning_focus"] = context.learning_focus
+        if context.recent_side_effects is not None:
+            kwargs["recent_side_effects"] = context.recent_side_effects
+        return kwargs
+
+    async def _apply_chat_summary(
+        self,
+        user_id: int,
+        chat_id: str,
+        history: list[ChatMessageSchema],
+    ) -> tuple[str, list[ChatMessageSchema]]:
+        """
+        Replace messages already folded into the chat's rolling summary with the summary text.
+
+        Returns the summary (empty when disabled or not yet written) and the messages
+        newer than it, which stay verbatim for the teacher.
+        """
+        if not self.settings.chat_summary_enabled:
+            return "", history
+        summary = await self.repository.get_summary(user_id, chat_id)
+        if summary is None:
+            return "", history
+        return summary.summary_content, [
+            message for message in history if message.id is None or message.id > summary.last_message_id
+        ]
+
     async def _load_current_recall_words(self, user_id: int) -> list[str]:
         """Load Teacher recall context without leaving the request-scoped session."""
         try:
@@ -1,16 +1,26 @@
 """Service for session-scoped frozen learning-focus selection and cleanup."""
 
 import json
+from dataclasses import dataclass
 
 from runestone.api.memory_item_schemas import AreaToImproveStatus, MemoryCategory, MemoryItemResponse
 from runestone.core.logging_config import get_logger
 from runestone.db.chat_session_learning_focus_repository import ChatSessionLearningFocusRepository
 from runestone.db.models import MemoryItem
+from runestone.services.learning_focus_cache import learning_focus_cache
 from runestone.services.memory_item_service import MemoryItemService
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class LearningFocusSnapshot:
+    """Frozen focus ids and their memory items, preloaded together with the turn context."""
+
+    item_ids_json: str | None
+    items: list[MemoryItemResponse]
+
+
 class ChatSessionLearningFocusService:
     """Own the frozen-per-chat learning-focus lifecycle for Teacher context."""
 
@@ -28,17 +38,27 @@ class ChatSessionLearningFocusService:
         user_id: int,
         chat_id: str,
         area_limit: int,
+        snapshot: LearningFocusSnapshot | None = None,
     ) -> tuple[list[MemoryItemResponse], bool]:
-        """Return the stable ordered learning-focus batch and whether it was reseeded."""
-        focus = await self.repo.get_by_user_chat(user_id, chat_id)
-        if focus is None:
+        """
+        Return the stable ordered learning-focus batch and whether it was reseeded.
+
+        A `snapshot` replaces the focus-row and memory-item reads; reseeding and drift
+        repair still write through the repository.
+        """
+        if snapshot is None:
+            focus = await self.repo.get_by_user_chat(user_id, chat_id)
+            memory_item_ids_json = focus.memory_item_ids_json if focus is not None else None
+        else:
+            memory_item_ids_json = snapshot.item_ids_json
+        if memory_item_ids_json is None:
             return await self._reseed_chat_session_learning_focus(
                 user_id=user_id,
                 chat_id=chat_id,
                 area_limit=area_limit,
             )
 
-        stored_item_ids = self._decode_focus_item_ids(focus.memory_item_ids_json)
+        stored_item_ids = self._decode_focus_item_ids(memory_item_ids_json)
         if stored_item_ids is None:
             return await self._reseed_chat_session_learning_focus(
                 user_id=user_id,
@@ -49,6 +69,7 @@ class ChatSessionLearningFocusService:
         hydrated_items, missing_ids = await self._hydrate_chat_session_learning_focus(
             user_id=user_id,
             stored_item_ids=stored_item_ids,
+            preloaded_items=snapshot.items if snapshot is not None else None,
         )
 
         if stored_item_ids and not hydrated_items:
@@ -87,7 +108,11 @@ class ChatSessionLearningFocusService:
 
     async def cleanup_old_chat_session_learning_focus(self, user_id: int, preserve_chat_id: str) -> int:
         """Delete frozen learning-focus rows from older chat sessions for one user."""
-        return await self.repo.delete_for_user_except_chat(user_id, preserve_chat_id)
+        deleted_count = await self.repo.delete_for_user_except_chat(user_id, preserve_chat_id)
+        if deleted_count:
+            # A cached bundle of a deleted row would outlive it; reopening that chat must reseed.
+            learning_focus_cache.invalidate_user(user_id)
+        return deleted_count
 
     def _decode_focus_item_ids(self, memory_item_ids_json: str) -> list[int] | None:
         """Parse persisted ordered memory ids, returning None on decode error."""
@@ -111,9 +136,13 @@ class ChatSessionLearningFocusService:
         *,
         user_id: int,
         stored_item_ids: list[int],
-    ) -> tuple[list[MemoryItem], list[int]]:
+        preloaded_items: list[MemoryItemResponse] | None = None,
+    ) -> tuple[list[MemoryItem | MemoryItemResponse], list[int]]:
         """Reload stored ids in order while dropping rows that no longer resolve cleanly."""
-        rows = await self.memory_item_service.get_items_by_ids(stored_item_ids)
+        if preloaded_items is None:
+            rows = await self.memory_item_service.get_items_by_ids(stored_item_ids)
+        else:
+            rows = preloaded_items
         rows_by_id = {
             row.id: row
             for row in rows
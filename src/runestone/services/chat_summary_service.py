@@ -0,0 +1,68 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.agents.schemas import ChatMessage as ChatMessageSchema
+from runestone.agents.schemas import ChatSummaryRefreshBatch
+from runestone.db.chat_repository import ChatRepository
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of messages folded per refresh; a long backlog is caught up over several turns.
+MAX_REFRESH_MESSAGES = 40
+
+
+class ChatSummaryService:
+    """Service for reading and advancing rolling per-chat summaries."""
+
+    def __init__(self, repository: ChatRepository):
+        self.repository = repository
+
+    async def load_refresh_batch(
+        self,
+        user_id: int,
+        chat_id: str,
+        *,
+        live_window: int,
+        min_messages: int,
+    ) -> ChatSummaryRefreshBatch | None:
+        """
+        Return unsummarized messages older than the live window, or None when too few are pending.
+
+        The newest `live_window` messages always stay raw so agents keep a verbatim tail.
+        """
+        try:
+            summary = await self.repository.get_summary(user_id, chat_id)
+            live_tail = await self.repository.get_context_for_agent(user_id, chat_id, limit=live_window)
+            if len(live_tail) < live_window:
+                return None
+            pending = await self.repository.get_history_after_id(
+                user_id,
+                chat_id,
+                after_id=summary.last_message_id if summary else 0,
+                limit=MAX_REFRESH_MESSAGES,
+            )
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[agents:chat-summary] Failed to load summary batch chat_id=%s: %s", chat_id, e)
+            return None
+
+        live_tail_start = min(message.id for message in live_tail)
+        messages = [message for message in pending if message.id < live_tail_start]
+        if len(messages) < min_messages:
+            return None
+        return ChatSummaryRefreshBatch(
+            summary=summary.summary_content if summary else "",
+            messages=[
+                ChatMessageSchema(id=message.id, role=message.role, content=message.content) for message in messages
+            ],
+        )
+
+    async def save_summary(self, user_id: int, chat_id: str, summary_content: str, last_message_id: int) -> bool:
+        """Advance the chat summary. Returns False when a newer summary already exists or the write fails."""
+        try:
+            return await self.repository.save_summary(user_id, chat_id, summary_content, last_message_id)
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[agents:chat-summary] Failed to save summary chat_id=%s: %s", chat_id, e)
+            return False
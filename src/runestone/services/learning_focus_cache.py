@@ -0,0 +1,140 @@
+"""
+In-process cache of serialized active learning-focus bundles.
+
+Entries are keyed by (user_id, chat_id) and hold the text the teacher receives;
+`chat_id=None` holds the live bundle returned by `read_active_learning_focus`.
+Every user has a version that memory item writes through `MemoryItemService`
+bump, which makes all of that user's entries stale at once. A reader takes the
+version before it reads the database and stores its result only if no write
+happened in between, so a concurrent write can never be cached over.
+
+Writes from other processes (workers, other API replicas) do not reach this
+cache; the TTL bounds how long they stay invisible.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from runestone.config import settings
+from runestone.core.metrics import cache_stats_collector, metrics_registry
+
+LearningFocusKey = tuple[int, str | None]
+
+
+@dataclass
+class LearningFocusCacheStats:
+    """Running counters for cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    stale_stores: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _Entry:
+    text: str
+    version: int
+    stored_at: float
+
+
+class LearningFocusCache:
+    """Bounded LRU of serialized learning-focus bundles, invalidated per user."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Upper bound for cached bundles across all users
+            ttl_seconds: Age after which an entry is reloaded even without a local write
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[LearningFocusKey, _Entry] = OrderedDict()
+        # Versions are never dropped: a reset to 0 could let a reader that started before a write store stale text.
+        self._versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.stats = LearningFocusCacheStats()
+
+    def version(self, user_id: int) -> int:
+        """Return the user's current version; take it before reading what will be stored."""
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def get(self, user_id: int, chat_id: str | None) -> str | None:
+        """Return the cached bundle, or None when it is missing, stale, or expired."""
+        key = (user_id, chat_id)
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.text
+
+    def contains(self, user_id: int, chat_id: str | None) -> bool:
+        """Whether a `get` would hit right now, without counting a lookup."""
+        with self._lock:
+            return self._live_entry((user_id, chat_id)) is not None
+
+    def put(self, user_id: int, chat_id: str | None, text: str, *, version: int) -> bool:
+        """Store a bundle read at `version`; returns False when a write invalidated it meanwhile."""
+        key = (user_id, chat_id)
+        with self._lock:
+            if self._versions.get(user_id, 0) != version:
+                self.stats.stale_stores += 1
+                return False
+            self._entries[key] = _Entry(text=text, version=version, stored_at=self._clock())
+            self._entries.move_to_end(key)
+            self.stats.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+            return True
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Make every cached bundle of the user stale."""
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = LearningFocusCacheStats()
+
+    def _live_entry(self, key: LearningFocusKey) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expired = self._clock() - entry.stored_at >= self.ttl_seconds
+        if expired or entry.version != self._versions.get(key[0], 0):
+            del self._entries[key]
+            return None
+        return entry
+
+
+learning_focus_cache = LearningFocusCache(
+    max_entries=settings.learning_focus_cache_max_entries,
+    ttl_seconds=settings.learning_focus_cache_ttl_seconds,
+)
+metrics_registry.register_collector(cache_stats_collector("learning_focus", lambda: learning_focus_cache.stats))
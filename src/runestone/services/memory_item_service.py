@@ -20,6 +20,7 @@ from runestone.core.exceptions import MemoryItemNotFoundError, PermissionDeniedE
 from runestone.core.logging_config import get_logger
 from runestone.db.memory_item_repository import MemoryItemRepository
 from runestone.db.models import MemoryItem
+from runestone.services.learning_focus_cache import learning_focus_cache
 
 logger = get_logger(__name__)
 
@@ -40,6 +41,12 @@ class MemoryItemService:
     def _utc_now(self) -> datetime:
         return datetime.now(timezone.utc)
 
+    @staticmethod
+    def _invalidate_learning_focus(user_id: int, category: str) -> None:
+        """Make cached learning-focus bundles stale after an area_to_improve write."""
+        if category == MemoryCategory.AREA_TO_IMPROVE.value:
+            learning_focus_cache.invalidate_user(user_id)
+
     async def get_item_by_id(self, item_id: int) -> Optional[MemoryItem]:
         """Return one memory item by id for service-layer callers that need raw row access."""
         return await self.repo.get_by_id(item_id)
@@ -197,6 +204,7 @@ class MemoryItemService:
             status_changed_at=self._utc_now(),
         )
         created_item = await self.repo.create(new_item)
+        self._invalidate_learning_focus(user_id, category.value)
         return MemoryItemResponse.model_validate(created_item)
 
     async def upsert_memory_item(
@@ -250,6 +258,7 @@ class MemoryItemService:
                 existing_item.priority = priority
             existing_item.updated_at = self._utc_now()
             updated_item = await self.repo.update(existing_item)
+            self._invalidate_learning_focus(user_id, category.value)
             return MemoryItemResponse.model_validate(updated_item)
         else:
             # Create new item
@@ -266,6 +275,7 @@ class MemoryItemService:
                 status_changed_at=self._utc_now(),
             )
             created_item = await self.repo.create(new_item)
+            self._invalidate_learning_focus(user_id, category.value)
             return MemoryItemResponse.model_validate(created_item)
 
     async def update_item_status(self, item_id: int, new_status: str, user_id: int) -> MemoryItemResponse:
@@ -308,6 +318,7 @@ class MemoryItemService:
         item.updated_at = self._utc_now()
 
         updated_item = await self.repo.update(item)
+        self._invalidate_learning_focus(user_id, item.category)
         return MemoryItemResponse.model_validate(updated_item)
 
     async def update_personal_info_status_for_maintenance(
@@ -333,6 +344,7 @@ class MemoryItemService:
             item.status_changed_at = self._utc_now()
         item.updated_at = self._utc_now()
         updated_item = await self.repo.update(item)
+        self._invalidate_learning_focus(user_id, item.category)
         return MemoryItemResponse.model_validate(updated_item)
 
     async def update_item_content_in_category(
@@ -378,6 +390,7 @@ class MemoryItemService:
         item.content = content
         item.updated_at = self._utc_now()
         updated_item = await self.repo.update(item)
+        self._invalidate_learning_focus(user_id, item.category)
         return MemoryItemResponse.model_validate(updated_item)
 
     async def update_item(
@@ -432,6 +445,7 @@ class MemoryItemService:
         item.content = content
         item.updated_at = self._utc_now()
         updated_item = await self.repo.update(item)
+        self._invalidate_learning_focus(user_id, item.category)
         return MemoryItemResponse.model_validate(updated_item)
 
     async def update_item_priority(self, item_id: int, priority: Optional[int], user_id: int) -> MemoryItemResponse:
@@ -470,6 +484,7 @@ class MemoryItemService:
         item.priority = priority
         item.updated_at = self._utc_now()
         updated_item = await self.repo.update(item)
+        self._invalidate_learning_focus(user_id, item.category)
         return MemoryItemResponse.model_validate(updated_item)
 
     async def update_item_priority_with_old_value(
@@ -561,6 +576,7 @@ class MemoryItemService:
             await db.rollback()
             raise RuntimeError(f"commit_failed:{type(exc).__name__}") from exc
 
+        self._invalidate_learning_focus(created_response.user_id, created_response.category)
         return created_response, deleted_ids
 
     async def delete_item(self, item_id: int, user_id: int, *, commit: bool = True) -> None:
@@ -584,7 +600,9 @@ class MemoryItemService:
         if item.user_id != user_id:
             raise PermissionDeniedError("You don't have permission to delete this item")
 
+        category = item.category
         await self.repo.delete(item_id, commit=commit)
+        self._invalidate_learning_focus(user_id, category)
 
     async def cleanup_old_mastered_areas(self, user_id: int, older_than_days: int) -> int:
         """
@@ -598,7 +616,10 @@ class MemoryItemService:
             cutoff,
             user_id,
         )
-        return await self.repo.delete_mastered_older_than(user_id=user_id, cutoff=cutoff)
+        deleted_count = await self.repo.delete_mastered_older_than(user_id=user_id, cutoff=cutoff)
+        if deleted_count:
+            self._invalidate_learning_focus(user_id, MemoryCategory.AREA_TO_IMPROVE.value)
+        return deleted_count
 
     async def cleanup_stale_personal_info_outdated(
         self,
@@ -630,4 +651,6 @@ class MemoryItemService:
         Returns:
             Number of items deleted
         """
-        return await self.repo.delete_by_category(user_id, category.value)
+        deleted_count = await self.repo.delete_by_category(user_id, category.value)
+        self._invalidate_learning_focus(user_id, category.value)
+        return deleted_count
@@ -0,0 +1,76 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.memory_maintenance_run_repository import MemoryMaintenanceRunRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MaintenanceCandidate:
+    """A user due for scheduled maintenance and how many items changed since their last run."""
+
+    user_id: int
+    item_growth: int
+
+
+@dataclass(frozen=True)
+class MaintenanceOutcome:
+    """Result of one scheduled maintenance run for a user."""
+
+    user_id: int
+    status: str
+    item_growth: int
+    started_at: datetime
+    finished_at: datetime
+    known_cost_usd: Decimal | None = None
+    summary: str | None = None
+
+
+class MemoryMaintenanceRunService:
+    """Service for choosing users for scheduled memory maintenance and recording the outcomes."""
+
+    def __init__(self, repository: MemoryMaintenanceRunRepository):
+        self.repository = repository
+
+    async def list_candidates(self, *, min_growth: int, limit: int) -> list[MaintenanceCandidate]:
+        """Return users whose maintained memory grew by at least `min_growth` items, largest growth first."""
+        rows = await self.repository.list_candidates(min_growth=min_growth, limit=limit)
+        return [MaintenanceCandidate(user_id=user_id, item_growth=item_growth) for user_id, item_growth in rows]
+
+    async def try_lock_user(self, user_id: int) -> bool:
+        """Take the user's maintenance lock for this session's transaction. Returns False when it is unavailable."""
+        try:
+            return await self.repository.try_lock_user(user_id)
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[agents:memorymaintainer] Failed to take maintenance lock user_id=%s: %s", user_id, e)
+            return False
+
+    async def record(self, outcome: MaintenanceOutcome, *, trigger_source: str = "scheduled") -> bool:
+        """Persist one run outcome. Returns False when the write fails."""
+        try:
+            await self.repository.add(
+                outcome.user_id,
+                trigger_source=trigger_source,
+                status=outcome.status,
+                item_growth=outcome.item_growth,
+                known_cost_usd=outcome.known_cost_usd,
+                summary=outcome.summary,
+                started_at=outcome.started_at,
+                finished_at=outcome.finished_at,
+            )
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning(
+                "[agents:memorymaintainer] Failed to record maintenance run user_id=%s status=%s: %s",
+                outcome.user_id,
+                outcome.status,
+                e,
+            )
+            return False
+        return True
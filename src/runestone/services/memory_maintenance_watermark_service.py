@@ -0,0 +1,71 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.memory_maintenance_watermark_repository import MemoryMaintenanceWatermarkRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MaintenanceWatermark:
+    """State of one maintenance domain after its last clean run."""
+
+    item_hashes: dict[int, str]
+    clusters: list[list[int]] = field(default_factory=list)
+    last_run_at: datetime | None = None
+
+
+class MemoryMaintenanceWatermarkService:
+    """Service for reading and writing memory-maintenance watermarks."""
+
+    def __init__(self, repository: MemoryMaintenanceWatermarkRepository):
+        self.repository = repository
+
+    async def load(self, user_id: int, domain: str) -> MaintenanceWatermark | None:
+        """
+        Return the domain watermark, or None when there is none or it cannot be read.
+
+        Callers treat None as "no previous run" and review the full scope.
+        """
+        try:
+            row = await self.repository.get(user_id, domain)
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning(
+                "[agents:memorymaintainer] Failed to load watermark user_id=%s domain=%s: %s", user_id, domain, e
+            )
+            return None
+        if row is None:
+            return None
+
+        try:
+            item_hashes = {int(item_id): str(value) for item_id, value in json.loads(row.item_hashes_json).items()}
+            clusters = [[int(item_id) for item_id in cluster] for cluster in json.loads(row.clusters_json)]
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.warning(
+                "[agents:memorymaintainer] Ignoring malformed watermark user_id=%s domain=%s: %s", user_id, domain, e
+            )
+            return None
+        return MaintenanceWatermark(item_hashes=item_hashes, clusters=clusters, last_run_at=row.last_run_at)
+
+    async def save(self, user_id: int, domain: str, watermark: MaintenanceWatermark) -> bool:
+        """Replace the domain watermark. Returns False when the write fails."""
+        try:
+            await self.repository.upsert(
+                user_id,
+                domain,
+                item_hashes_json=json.dumps({str(item_id): value for item_id, value in watermark.item_hashes.items()}),
+                clusters_json=json.dumps(watermark.clusters),
+                last_run_at=watermark.last_run_at,
+            )
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning(
+                "[agents:memorymaintainer] Failed to save watermark user_id=%s domain=%s: %s", user_id, domain, e
+            )
+            return False
+        return True
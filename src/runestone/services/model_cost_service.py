@@ -0,0 +1,75 @@
+import json
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.model_cost_repository import ModelCostInteractionRepository
+from runestone.model_costs.tracking import InteractionRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CostRollupRow:
+    """Interactions and known spend of one component for one user on one UTC day."""
+
+    day: date
+    user_id: int | None
+    component: str
+    calls: int
+    unknown_calls: int
+    known_cost_usd: Decimal
+
+
+class ModelCostService:
+    """Service for persisting model-cost interactions and reading daily cost rollups."""
+
+    def __init__(self, repository: ModelCostInteractionRepository):
+        self.repository = repository
+
+    async def record_batch(self, records: Sequence[InteractionRecord]) -> bool:
+        """Persist a batch of interactions in one statement. Returns False when the write fails."""
+        rows = [
+            {
+                "user_id": record.user_id,
+                "operation_id": record.operation_id,
+                "operation_type": record.operation_type,
+                "component": record.component,
+                "phase": record.phase,
+                "provider": record.provider,
+                "model": record.model,
+                "status": record.status,
+                "usage_json": json.dumps({unit: str(quantity) for unit, quantity in sorted(record.usage.items())}),
+                "known_cost_usd": record.known_cost_usd,
+                "cost_quality": record.cost_quality,
+                "cost_source": record.cost_source,
+                "recorded_at": record.recorded_at,
+            }
+            for record in records
+        ]
+        try:
+            await self.repository.add_many(rows)
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[model_costs:persistence] Failed to write %s interactions: %s", len(rows), e)
+            return False
+        return True
+
+    async def daily_rollup(self, *, since: datetime, user_id: int | None = None) -> list[CostRollupRow]:
+        """Return per-day, per-user, per-component totals of interactions recorded since `since`."""
+        rows = await self.repository.daily_rollup(since=since, user_id=user_id)
+        return [
+            CostRollupRow(
+                day=day,
+                user_id=row_user_id,
+                component=component,
+                calls=calls,
+                unknown_calls=unknown_calls,
+                known_cost_usd=Decimal(known_cost_usd or 0),
+            )
+            for day, row_user_id, component, calls, unknown_calls, known_cost_usd in rows
+        ]
@@ -0,0 +1,100 @@
+import logging
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.agents.schemas import ClaimedPostTurnJob, PostTurnJobPayload
+from runestone.db.post_turn_job_repository import PostTurnJobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PostTurnJobService:
+    """Service for the durable post-turn job queue consumed by post-turn workers."""
+
+    def __init__(self, repository: PostTurnJobRepository):
+        self.repository = repository
+
+    async def enqueue(
+        self,
+        user_id: int,
+        chat_id: str,
+        coordinator_row_id: int,
+        payload: PostTurnJobPayload,
+    ) -> int | None:
+        """Queue post-turn work for a chat, superseding older jobs. Returns None when the queue is unavailable."""
+        try:
+            job = await self.repository.enqueue(
+                user_id=user_id,
+                chat_id=chat_id,
+                coordinator_row_id=coordinator_row_id,
+                payload_json=payload.model_dump_json(),
+            )
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[agents:post-task] Failed to enqueue post-turn job chat_id=%s: %s", chat_id, e)
+            return None
+        logger.debug(
+            "[agents:post-task] Post-turn job queued: user_id=%s chat_id=%s job_id=%s row_id=%s",
+            user_id,
+            chat_id,
+            job.id,
+            coordinator_row_id,
+        )
+        return job.id
+
+    async def claim(self, worker_id: str, limit: int) -> list[ClaimedPostTurnJob]:
+        """Claim due jobs for a worker. Jobs with unreadable payloads are failed immediately."""
+        records = await self.repository.claim(worker_id=worker_id, limit=limit)
+        jobs = []
+        for record in records:
+            try:
+                payload = PostTurnJobPayload.model_validate_json(record.payload_json)
+            except ValidationError as e:
+                logger.error("[agents:post-task] Invalid post-turn job payload job_id=%s: %s", record.id, e)
+                await self.repository.finish(record.id, worker_id, "failed", error="invalid payload")
+                continue
+            jobs.append(
+                ClaimedPostTurnJob(
+                    id=record.id,
+                    user_id=record.user_id,
+                    chat_id=record.chat_id,
+                    coordinator_row_id=record.coordinator_row_id,
+                    attempts=record.attempts,
+                    payload=payload,
+                )
+            )
+        return jobs
+
+    async def heartbeat(self, job_id: int, worker_id: str) -> str | None:
+        """Extend a running job's lease and return its current status."""
+        return await self.repository.heartbeat(job_id=job_id, worker_id=worker_id)
+
+    async def finish(self, job_id: int, worker_id: str, status: str, error: str | None = None) -> bool:
+        """Record a terminal job status; cancelled or superseded jobs keep their status."""
+        return await self.repository.finish(job_id=job_id, worker_id=worker_id, status=status, error=error)
+
+    async def cancel_for_chat(self, user_id: int, chat_id: str, status: str = "cancelled") -> int:
+        """Cancel queued and running jobs for a chat. Best-effort: failures are logged."""
+        try:
+            cancelled = await self.repository.cancel_for_chat(user_id=user_id, chat_id=chat_id, status=status)
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[agents:post-task] Failed to cancel post-turn jobs chat_id=%s: %s", chat_id, e)
+            return 0
+        if cancelled:
+            logger.info(
+                "[agents:post-task] Post-turn jobs cancelled: user_id=%s chat_id=%s count=%s status=%s",
+                user_id,
+                chat_id,
+                cancelled,
+                status,
+            )
+        return cancelled
+
+    async def release_expired(self, lease_seconds: float, max_attempts: int) -> int:
+        """Return jobs whose lease expired to the queue, failing those out of attempts."""
+        released = await self.repository.release_expired(lease_seconds=lease_seconds, max_attempts=max_attempts)
+        if released:
+            logger.warning("[agents:post-task] Released expired post-turn job leases count=%s", released)
+        return released
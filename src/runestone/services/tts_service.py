@@ -7,36 +7,60 @@ via WebSocket. Provider-specific API calls live in voice clients.
 
 import asyncio
 import logging
+import time
 from typing import AsyncIterator
 
 from runestone.config import Settings
 from runestone.core.clients.voice.voice_factory import VoiceSynthesisClient
 from runestone.core.connection_manager import connection_manager
-from runestone.model_costs.tracking import CostTrackingHandle
+from runestone.core.metrics import TTS_QUEUE_DEPTH, TTS_QUEUE_WAIT_SECONDS
+from runestone.core.tts_cache import TTSAudioCache
+from runestone.model_costs.tracking import CostTrackingHandle, record_model_interaction
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TTS_MAX_CONCURRENCY = 5
+
 
 class TTSService:
     """Service that orchestrates text-to-speech streaming to clients."""
 
     CANCELLATION_GRACE_SECONDS = 1.0
+    CACHE_HIT_CHUNK_BYTES = 4096
+    BROADCAST_DRAIN_TIMEOUT_SECONDS = 10.0
+    QUEUE_WAIT_REPORT_MS = 100
 
-    def __init__(self, settings: Settings, synthesis_client: VoiceSynthesisClient):
+    def __init__(
+        self,
+        settings: Settings,
+        synthesis_client: VoiceSynthesisClient,
+        audio_cache: TTSAudioCache | None = None,
+        max_concurrency: int = DEFAULT_TTS_MAX_CONCURRENCY,
+    ):
         """
         Initialize the TTS service.
 
         Args:
             settings: Application settings containing TTS configuration
             synthesis_client: Provider client that performs speech synthesis
+            audio_cache: Optional content-addressed cache of previously synthesized audio
+            max_concurrency: Concurrent synthesis requests allowed for the configured provider
         """
         self.settings = settings
         self._synthesis_client = synthesis_client
+        self._audio_cache = audio_cache
         self._active_tasks: dict[int, asyncio.Task] = {}
         self._active_cost_tracking: dict[int, CostTrackingHandle] = {}
         self._replacement_tasks: set[asyncio.Task] = set()
-        # Global limit on concurrent synthesis requests to avoid overwhelming external providers.
-        self._synthesis_semaphore = asyncio.Semaphore(5)
+        # Per-provider limit on concurrent synthesis requests to avoid overwhelming external providers.
+        self._synthesis_semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._queued_requests = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of synthesis requests waiting for a provider slot."""
+        return self._queued_requests
 
     async def synthesize_speech_stream(
         self,
@@ -47,6 +71,8 @@ class TTSService:
         Synthesize speech from text and yield audio chunks.
 
         Uses streaming to minimize latency - chunks are yielded as they arrive.
+        When an audio cache is configured, cached audio is streamed without a
+        provider call and completed provider streams are stored for reuse.
 
         Args:
             text: Text to synthesize into speech
@@ -59,18 +85,66 @@ class TTSService:
             Exception: If TTS API call fails
         """
         try:
+            cache_key: str | None = None
+            if self._audio_cache is not None:
+                cache_key = self._audio_cache.key_for(text, speed)
+                cached_audio = await self._audio_cache.get(cache_key)
+                if cached_audio is not None:
+                    record_model_interaction(
+                        component="voice_tts",
+                        provider=self._audio_cache.provider,
+                        model=self._audio_cache.model,
+                        status="completed",
+                        usage={"character": len(text)},
+                        cached=True,
+                    )
+                    for offset in range(0, len(cached_audio), self.CACHE_HIT_CHUNK_BYTES):
+                        yield cached_audio[offset : offset + self.CACHE_HIT_CHUNK_BYTES]
+                        # Nothing here awaits I/O; let the broadcast senders drain before the next chunk.
+                        await asyncio.sleep(0)
+                    logger.debug(f"TTS served from cache: {len(cached_audio)} bytes yielded")
+                    return
+
             # Backpressure: limit concurrent provider calls
-            async with self._synthesis_semaphore:
+            queued_at = time.monotonic()
+            self._queued_requests += 1
+            TTS_QUEUE_DEPTH.inc()
+            try:
+                await self._synthesis_semaphore.acquire()
+            finally:
+                self._queued_requests -= 1
+                TTS_QUEUE_DEPTH.dec()
+            queue_wait_seconds = time.monotonic() - queued_at
+            TTS_QUEUE_WAIT_SECONDS.observe(queue_wait_seconds)
+            queue_wait_ms = int(queue_wait_seconds * 1000)
+            logger.log(
+                logging.INFO if queue_wait_ms >= self.QUEUE_WAIT_REPORT_MS else logging.DEBUG,
+                "TTS synthesis slot acquired provider=%s queue_wait_ms=%s queue_depth=%s max_concurrency=%s",
+                self.settings.tts_provider,
+                queue_wait_ms,
+                self._queued_requests,
+                self._max_concurrency,
+            )
+            try:
                 chunk_count = 0
                 total_bytes = 0
+                chunks: list[bytes] = []
                 async for chunk in self._synthesis_client.synthesize_speech_stream(
                     text=text,
                     speed=speed,
                 ):
                     chunk_count += 1
                     total_bytes += len(chunk)
+                    if cache_key is not None:
+                        chunks.append(chunk)
                     yield chunk
                 logger.debug(f"TTS synthesis finished: {chunk_count} chunks, {total_bytes} bytes yielded")
+            finally:
+                self._synthesis_semaphore.release()
+
+            # Only complete provider streams are cached; cancelled streams never reach this point.
+            if cache_key is not None:
+                await self._audio_cache.put(cache_key, b"".join(chunks))
         except Exception as e:
             logger.error(f"TTS synthesis failed: {e}", exc_info=True)
             raise
@@ -158,8 +232,8 @@ class TTSService:
         terminal_status = "completed"
         try:
             with cost_tracking.activate():
-                websocket = connection_manager.get_connection(user_id)
-                if not websocket:
+                broadcast = connection_manager.open_broadcast(user_id)
+                if broadcast is None:
                     terminal_status = "skipped_no_websocket"
                     logger.debug(f"No active WebSocket for user {user_id}, skipping TTS")
                     return
@@ -167,11 +241,15 @@ class TTSService:
                 stream = self.synthesize_speech_stream(text, speed=speed)
                 try:
                     async for chunk in stream:
-                        await websocket.send_bytes(chunk)
+                        broadcast.send_bytes(chunk)
+                        if not broadcast.active:
+                            # Every consumer dropped or disconnected; stop paying for audio nobody hears.
+                            break
+                    await broadcast.finish({"status": "complete"}, timeout=self.BROADCAST_DRAIN_TIMEOUT_SECONDS)
                 finally:
+                    broadcast.cancel()
                     await stream.aclose()
-                await websocket.send_json({"status": "complete"})
-                logger.debug(f"TTS audio pushed to user {user_id}. All chunks sent.")
+                logger.debug(f"TTS audio pushed to user {user_id}. All chunks sent, dropped={broadcast.dropped}")
         except asyncio.CancelledError:
             terminal_status = "stale_replaced" if asyncio.current_task() in self._replacement_tasks else "cancelled"
             logger.debug(f"TTS task for user {user_id} was cancelled")
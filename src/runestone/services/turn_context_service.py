@@ -0,0 +1,106 @@
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.agents.schemas import ChatMessage as ChatMessageSchema
+from runestone.agents.schemas import TeacherSideEffect
+from runestone.api.memory_item_schemas import MemoryItemResponse
+from runestone.core.observability import timed_operation
+from runestone.db.agent_side_effect_repository import AgentSideEffectRepository
+from runestone.db.models import User
+from runestone.db.turn_context_repository import TurnContextRepository
+from runestone.services.agent_side_effect_service import AgentSideEffectService
+from runestone.services.chat_session_learning_focus_service import LearningFocusSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TurnContext:
+    """Everything a chat turn reads before the teacher runs."""
+
+    user: User | None
+    history: list[ChatMessageSchema]
+    chat_summary: str = ""
+    current_recall_words: list[str] | None = None
+    learning_focus: LearningFocusSnapshot | None = None
+    recent_side_effects: list[TeacherSideEffect] | None = None
+
+
+def _turn_context_timing_fields(args, kwargs, result, _error) -> dict[str, int | None]:
+    """Extract stable log fields for the turn-context timing decorator."""
+    user_id = kwargs.get("user_id") if "user_id" in kwargs else (args[1] if len(args) > 1 else None)
+    return {
+        "user_id": user_id,
+        "history_messages": len(result.history) if result is not None else None,
+    }
+
+
+class TurnContextService:
+    """Service that loads a turn's teacher context in one database round-trip."""
+
+    HISTORY_LIMIT = 20
+
+    def __init__(self, repository: TurnContextRepository):
+        self.repository = repository
+
+    @timed_operation(logger, "[chat:turn-context] Turn context loaded", fields_factory=_turn_context_timing_fields)
+    async def load(
+        self,
+        user_id: int,
+        chat_id: str,
+        *,
+        after_summary: bool = False,
+        include_learning_focus: bool = True,
+    ) -> TurnContext | None:
+        """
+        Load the turn context, or None when the combined query fails.
+
+        With `after_summary`, history starts after the chat summary, which is returned
+        alongside it. Without `include_learning_focus` the focus is not read and
+        `learning_focus` is None. Callers fall back to loading each part separately on None.
+        """
+        try:
+            rows = await self.repository.load(
+                user_id,
+                chat_id,
+                history_limit=self.HISTORY_LIMIT,
+                side_effect_limit=AgentSideEffectService.RECENT_SIDE_EFFECT_LIMIT,
+                after_summary=after_summary,
+                include_learning_focus=include_learning_focus,
+            )
+        except SQLAlchemyError as e:
+            await self.repository.db.rollback()
+            logger.warning("[chat:turn-context] Failed to load turn context user_id=%s: %s", user_id, e)
+            return None
+
+        return TurnContext(
+            user=rows.user,
+            history=[ChatMessageSchema.model_validate(row) for row in rows.history],
+            chat_summary=(rows.summary_content or "") if after_summary else "",
+            current_recall_words=[word.strip() for word in rows.recall_words if word and word.strip()],
+            learning_focus=(
+                LearningFocusSnapshot(
+                    item_ids_json=rows.learning_focus_item_ids_json,
+                    items=[MemoryItemResponse.model_validate(row) for row in rows.learning_focus_items],
+                )
+                if include_learning_focus
+                else None
+            ),
+            recent_side_effects=[self._teacher_side_effect(row) for row in rows.recent_side_effects],
+        )
+
+    @staticmethod
+    def _teacher_side_effect(row: dict[str, Any]) -> TeacherSideEffect:
+        return TeacherSideEffect(
+            name=row["specialist_name"],
+            phase=row["phase"],
+            status=row["status"],
+            info_for_teacher=row["info_for_teacher"],
+            artifacts=AgentSideEffectRepository.deserialize_artifacts(row["artifacts_json"]),
+            routing_reason=row["routing_reason"] or "",
+            latency_ms=row["latency_ms"],
+            created_at=row["created_at"],
+        )
@@ -12,6 +12,7 @@ from sqlalchemy.exc import IntegrityError
 
 from ..api.schemas import UserProfileResponse, UserProfileUpdate
 from ..auth.security import hash_password
+from ..auth.user_cache import authenticated_user_cache
 from ..core.exceptions import UserNotFoundError
 from ..core.logging_config import get_logger
 from ..db.models import User
@@ -105,6 +106,7 @@ class UserService:
                 raise ValueError("Telegram username is already linked to another account") from exc
             raise
 
+        authenticated_user_cache.invalidate(user.id)
         return await self.get_user_profile(updated_user)
 
     async def increment_pages_recognised_count(self, user: User) -> None:
@@ -119,6 +121,7 @@ class UserService:
 
         user.hashed_password = hash_password(new_password)
         await self.user_repo.update(user)
+        authenticated_user_cache.invalidate(user.id)
 
         return user
 
@@ -159,6 +162,8 @@ class UserService:
 
         user.current_chat_id = str(uuid4())
         await self.user_repo.update(user)
+        # Starting a chat is the natural point to pick up account changes made by other processes.
+        authenticated_user_cache.invalidate(user_id)
         return user.current_chat_id
 
     async def set_personal_info_summary(self, user_id: int, summary: str | None) -> None:
@@ -9,7 +9,9 @@ from typing import List
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models.chat_models import BaseChatModel
+from sqlalchemy.exc import SQLAlchemyError
 
+from runestone.core.llm_registry import structured_output
 from runestone.recall.types import RecallQueueWord
 
 from ..api.schemas import ImprovementMode, LearnedTimesDistributionItem, PriorityDistributionItem
@@ -29,12 +31,23 @@ from ..core.exceptions import VocabularyItemExists
 from ..core.logging_config import get_logger
 from ..core.prompt_builder.builder import PromptBuilder
 from ..core.prompt_builder.parsers import ResponseParser
+from ..core.prompt_builder.types import PromptType
 from ..core.service_llm import extract_message_text
 from ..db.models import Vocabulary
 from ..db.vocabulary_repository import VocabularyRepository
 from ..model_costs.tracking import track_model_costs
 from ..schemas.vocabulary import VocabularyResponse
-from ..schemas.vocabulary_save import PriorityWordSaveItem, VocabularyPrioritizationAction, WordSaveCandidate
+from ..schemas.vocabulary_save import (
+    PriorityWordSaveItem,
+    SharedWordEnrichment,
+    VocabularyPrioritizationAction,
+    WordSaveCandidate,
+    enrichment_prompt_version,
+    word_enrichment_key,
+)
+
+# Batch extra_info enrichment does not depend on the learner's language.
+EXTRA_INFO_ENRICHMENT_LANGUAGE = "any"
 
 
 class VocabularyService:
@@ -80,7 +93,7 @@ class VocabularyService:
 
         # Enrich filtered items if requested (CHANGED: now uses batch method)
         if enrich and filtered_items:
-            filtered_items = await self._enrich_vocabulary_items(filtered_items)
+            filtered_items = await self._enrich_vocabulary_items(filtered_items, user_id=user_id)
 
         # Batch insert the filtered (and potentially enriched) items
         if filtered_items:
@@ -261,9 +274,11 @@ class VocabularyService:
 
         return {"original_count": original_count, "added_count": added_count, "skipped_count": skipped_count}
 
-    async def improve_item(self, request: VocabularyImproveRequest) -> VocabularyImproveResponse:
+    async def improve_item(
+        self, request: VocabularyImproveRequest, user_id: int | None = None
+    ) -> VocabularyImproveResponse:
         """Improve a vocabulary item using LLM to generate translation, example phrase, and extra info."""
-        async with track_model_costs("vocabulary_improve"):
+        async with track_model_costs("vocabulary_improve", user_id=user_id):
             prompt = self.builder.build_vocabulary_prompt(word_phrase=request.word_phrase, mode=request.mode)
             structured_response = await self._invoke_vocabulary_item_structured(prompt)
             return self._to_improve_response(structured_response, request.mode)
@@ -271,7 +286,7 @@ class VocabularyService:
     async def _invoke_vocabulary_item_structured(self, prompt: str) -> VocabularyResponse:
         """Return schema-backed vocabulary improvement via LangChain structured output."""
         try:
-            structured_model = self.llm_model.with_structured_output(VocabularyResponse)
+            structured_model = structured_output(self.llm_model, VocabularyResponse)
             response = await structured_model.ainvoke(prompt)
             if isinstance(response, VocabularyResponse):
                 return response
@@ -302,7 +317,9 @@ class VocabularyService:
             extra_info=vocab_response.extra_info,
         )
 
-    async def _enrich_vocabulary_items(self, items: List[VocabularyItemCreate]) -> List[VocabularyItemCreate]:
+    async def _enrich_vocabulary_items(
+        self, items: List[VocabularyItemCreate], user_id: int | None = None
+    ) -> List[VocabularyItemCreate]:
         """
         Enrich vocabulary items with extra_info using LLM batch processing.
 
@@ -311,6 +328,7 @@ class VocabularyService:
 
         Args:
             items: List of vocabulary items to enrich
+            user_id: User the enrichment costs are attributed to
 
         Returns:
             List of vocabulary items with extra_info populated where successful
@@ -318,12 +336,48 @@ class VocabularyService:
         if not items:
             return items
 
-        async with track_model_costs("vocabulary_enrichment"):
+        async with track_model_costs("vocabulary_enrichment", user_id=user_id):
             return await self._enrich_vocabulary_items_in_operation(items)
 
     async def _enrich_vocabulary_items_in_operation(
         self, items: List[VocabularyItemCreate]
     ) -> List[VocabularyItemCreate]:
+        """Serve cached extra_info first and run LLM batches only for cache misses."""
+        template = self.builder.get_template(PromptType.VOCABULARY_BATCH_IMPROVE)
+        prompt_version = enrichment_prompt_version(PromptType.VOCABULARY_BATCH_IMPROVE.value, template.content)
+        cached = await self.get_shared_enrichments(
+            [item.word_phrase for item in items],
+            target_language=EXTRA_INFO_ENRICHMENT_LANGUAGE,
+            prompt_version=prompt_version,
+        )
+
+        enriched_by_phrase: dict[str, VocabularyItemCreate] = {}
+        misses: List[VocabularyItemCreate] = []
+        for item in items:
+            hit = cached.get(word_enrichment_key(item.word_phrase))
+            if hit is not None and hit.extra_info:
+                enriched_by_phrase[item.word_phrase] = item.model_copy(update={"extra_info": hit.extra_info})
+            else:
+                misses.append(item)
+
+        if cached:
+            self.logger.info(f"Shared enrichment cache: {len(items) - len(misses)}/{len(items)} hits")
+        if misses:
+            generated = await self._enrich_vocabulary_batches(misses)
+            new_entries = []
+            for original, item in zip(misses, generated, strict=True):
+                enriched_by_phrase.setdefault(item.word_phrase, item)
+                if item.extra_info and item.extra_info != original.extra_info:
+                    new_entries.append(SharedWordEnrichment(word_phrase=item.word_phrase, extra_info=item.extra_info))
+            await self.store_shared_enrichments(
+                new_entries,
+                target_language=EXTRA_INFO_ENRICHMENT_LANGUAGE,
+                prompt_version=prompt_version,
+            )
+
+        return [enriched_by_phrase.get(item.word_phrase, item) for item in items]
+
+    async def _enrich_vocabulary_batches(self, items: List[VocabularyItemCreate]) -> List[VocabularyItemCreate]:
         """Run all enrichment batches within the caller-owned cost operation."""
 
         enriched_items = []
@@ -396,6 +450,63 @@ class VocabularyService:
 
         return enriched_items
 
+    async def get_shared_enrichments(
+        self, word_phrases: List[str], target_language: str, prompt_version: str
+    ) -> dict[str, SharedWordEnrichment]:
+        """
+        Bulk-load cross-user enrichment for the given phrases.
+
+        Returns a mapping keyed by `word_enrichment_key`. Lookup failures are logged
+        and treated as misses so the cache can never block a save. The lookup runs in
+        a savepoint, so a failure leaves the caller's transaction intact.
+        """
+        word_keys = sorted({word_enrichment_key(phrase) for phrase in word_phrases if phrase.strip()})
+        if not word_keys:
+            return {}
+        try:
+            async with self.repo.db.begin_nested():
+                rows = await self.repo.get_word_enrichments(word_keys, target_language.strip().lower(), prompt_version)
+        except SQLAlchemyError as e:
+            self.logger.warning(f"Shared enrichment lookup failed: {e}")
+            return {}
+        return {
+            row.word_key: SharedWordEnrichment(
+                word_phrase=row.word_key,
+                translation=row.translation,
+                example_phrase=row.example_phrase,
+                extra_info=row.extra_info,
+            )
+            for row in rows
+        }
+
+    async def store_shared_enrichments(
+        self, enrichments: List[SharedWordEnrichment], target_language: str, prompt_version: str
+    ) -> None:
+        """
+        Write freshly generated enrichment back to the cross-user cache, ignoring write failures.
+
+        The upsert runs in a savepoint of the caller's transaction and is committed with it.
+        """
+        rows_by_key: dict[str, dict] = {}
+        for enrichment in enrichments:
+            if not (enrichment.translation or enrichment.example_phrase or enrichment.extra_info):
+                continue
+            rows_by_key[word_enrichment_key(enrichment.word_phrase)] = {
+                "word_key": word_enrichment_key(enrichment.word_phrase),
+                "translation": enrichment.translation,
+                "example_phrase": enrichment.example_phrase,
+                "extra_info": enrichment.extra_info,
+            }
+        if not rows_by_key:
+            return
+        try:
+            async with self.repo.db.begin_nested():
+                await self.repo.upsert_word_enrichments(
+                    list(rows_by_key.values()), target_language.strip().lower(), prompt_version
+                )
+        except SQLAlchemyError as e:
+            self.logger.warning(f"Shared enrichment write-back failed: {e}")
+
     async def _invoke_vocabulary_batch(self, prompt: str) -> str:
         """Return batch vocabulary output."""
         response = await self.llm_model.ainvoke(prompt)
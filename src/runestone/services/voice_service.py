@@ -7,15 +7,65 @@ in voice clients.
 """
 
 import logging
+import re
+import time
 
 from runestone.config import Settings
+from runestone.core.audio_normalizer import AudioNormalizer
 from runestone.core.clients.voice.voice_factory import VoiceEnhancementClient, VoiceTranscriptionClient
 from runestone.core.constants import LANGUAGE_CODE_MAP
 from runestone.core.exceptions import RunestoneError
+from runestone.core.observability import elapsed_ms_since
 from runestone.model_costs.tracking import track_model_costs
 
 logger = logging.getLogger(__name__)
 
+_FILLER_WORD_RE = re.compile(r"\b(um+|uh+|erm+|ehm+|öh+|eh+|hmm+|mm+)\b", re.IGNORECASE)
+_REPEATED_WORD_RE = re.compile(r"\b(\w+)\s+\1\b", re.IGNORECASE)
+_SPACE_BEFORE_PUNCTUATION_RE = re.compile(r"\s[,.!?;:]")
+
+
+def transcript_looks_clean(text: str) -> bool:
+    """
+    Cheaply decide whether a raw transcript already reads as finished text.
+
+    Providers usually return punctuated, capitalized sentences; the LLM cleanup
+    pass only pays off for fillers, stutters, and unpunctuated run-ons.
+    """
+    stripped = text.strip()
+    if not stripped or not (stripped[0].isupper() or stripped[0].isdigit()):
+        return False
+    if stripped[-1] not in ".!?…":
+        return False
+    if _FILLER_WORD_RE.search(stripped) or _SPACE_BEFORE_PUNCTUATION_RE.search(stripped):
+        return False
+    return _REPEATED_WORD_RE.search(stripped) is None
+
+
+class VoiceRecordingBuffer:
+    """Accumulate audio frames streamed while the user is still speaking."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def append(self, frame: bytes) -> None:
+        """
+        Add one recorder frame to the recording.
+
+        Raises:
+            RunestoneError: If the recording grows beyond the configured size limit
+        """
+        if len(self._buffer) + len(frame) > self._max_bytes:
+            raise RunestoneError("Recording too large.")
+        self._buffer.extend(frame)
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
 
 class VoiceService:
     """Service coordinating speech-to-text and optional transcript cleanup."""
@@ -25,6 +75,7 @@ class VoiceService:
         settings: Settings,
         transcription_client: VoiceTranscriptionClient,
         enhancement_client: VoiceEnhancementClient,
+        audio_normalizer: AudioNormalizer | None = None,
     ):
         """
         Initialize the voice service.
@@ -33,10 +84,12 @@ class VoiceService:
             settings: Application settings containing model configuration
             transcription_client: Provider client handling raw transcription
             enhancement_client: Provider client handling transcript cleanup
+            audio_normalizer: Optional stage that shrinks recordings before upload
         """
         self.settings = settings
         self._transcription_client = transcription_client
         self._enhancement_client = enhancement_client
+        self._audio_normalizer = audio_normalizer
 
     async def transcribe_audio(
         self,
@@ -56,14 +109,32 @@ class VoiceService:
             RunestoneError: If transcription fails
         """
         try:
+            upload_kwargs: dict[str, str] = {}
+            if self._audio_normalizer is not None:
+                normalized = await self._audio_normalizer.normalize(audio_content)
+                logger.info(
+                    "Voice audio normalization input_bytes=%s output_bytes=%s latency_ms=%s normalized=%s",
+                    normalized.input_bytes,
+                    normalized.output_bytes,
+                    normalized.latency_ms,
+                    normalized.normalized,
+                )
+                audio_content = normalized.content
+                upload_kwargs = {"filename": normalized.filename, "content_type": normalized.content_type}
+
+            started = time.monotonic()
             transcribed_text = await self._transcription_client.transcribe_audio(
                 audio_content=audio_content,
                 language=language,
+                **upload_kwargs,
             )
             if not transcribed_text:
                 raise RunestoneError("Transcription returned empty result")
 
-            logger.info(f"Transcribed {len(audio_content)} bytes to {len(transcribed_text)} characters")
+            logger.info(
+                f"Transcribed {len(audio_content)} bytes to {len(transcribed_text)} characters "
+                f"in {elapsed_ms_since(started)}ms"
+            )
             return transcribed_text.strip()
 
         except RunestoneError:
@@ -110,21 +181,30 @@ class VoiceService:
             logger.warning("Falling back to unenhanced text")
             return text
 
-    async def process_voice_input(self, audio_content: bytes, improve: bool = True, language: str | None = None) -> str:
+    async def process_voice_input(
+        self,
+        audio_content: bytes,
+        improve: bool = True,
+        language: str | None = None,
+        user_id: int | None = None,
+    ) -> str:
         """
         Process voice input:
         1. Transcribe audio with the configured STT provider
-        2. Optionally enhance text with the configured cleanup model
+        2. Optionally enhance text with the configured cleanup model, unless
+           `voice_enhancement_skip_clean_transcripts` is set and the raw
+           transcript already looks clean
 
         Args:
             audio_content: Raw audio bytes
             improve: Whether to apply text enhancement
             language: Optional full language name or ISO-639-1 code (e.g., from user profile)
+            user_id: User the transcription costs are attributed to
 
         Returns:
             Final processed text
         """
-        async with track_model_costs("voice_transcription"):
+        async with track_model_costs("voice_transcription", user_id=user_id):
             whisper_lang = language
             if language and language in LANGUAGE_CODE_MAP:
                 whisper_lang = LANGUAGE_CODE_MAP[language]
@@ -139,6 +219,10 @@ class VoiceService:
             if not improve:
                 return transcribed_text
 
+            if self.settings.voice_enhancement_skip_clean_transcripts and transcript_looks_clean(transcribed_text):
+                logger.info("Skipped transcript enhancement for already clean transcript")
+                return transcribed_text
+
             return await self.enhance_text(
                 transcribed_text,
             )
@@ -1,6 +1,7 @@
 """Scheduled Telegram transport for recall-word delivery."""
 
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from contextlib import AbstractAsyncContextManager
 from datetime import datetime
@@ -8,6 +9,7 @@ from functools import partial
 
 import httpx
 
+from runestone.core.metrics import RECALL_DELIVERIES, RECALL_DELIVERY_SECONDS
 from runestone.recall.service import RecallService
 from runestone.recall.types import RecallQueueWord, RecallState
 from runestone.utils.markdown import escape_markdown
@@ -53,22 +55,37 @@ class TelegramRecallDelivery:
             active_users = await recall_service.get_active_recall_states()
 
         logger.info("Starting recall word sending for %s active users", len(active_users))
+        outcomes: dict[str, int] = {"delivered": 0, "skipped": 0, "failed": 0}
+        run_started = time.monotonic()
         async with httpx.AsyncClient(timeout=10.0) as client:
             send_word = partial(self._send_queue_word, client)
             for user_state in active_users:
+                started = time.monotonic()
+                outcome = "failed"
                 try:
                     # deliver_next_word owns commit/rollback for this session and
                     # deliberately keeps its row lock across the send callback.
                     async with self.recall_session_provider() as recall_service:
-                        await self._process_user_recall_word(recall_service, user_state, send_word)
+                        delivered = await self._process_user_recall_word(recall_service, user_state, send_word)
+                    outcome = "delivered" if delivered else "skipped"
                 except Exception as exc:
                     logger.error(
                         "Failed to process recall word for user %s: %s",
                         user_state.user_id,
                         exc,
                     )
-
-        logger.info("Completed recall word sending process")
+                finally:
+                    outcomes[outcome] += 1
+                    RECALL_DELIVERIES.inc(outcome=outcome)
+                    RECALL_DELIVERY_SECONDS.observe(time.monotonic() - started)
+
+        logger.info(
+            "Completed recall word sending process delivered=%s skipped=%s failed=%s duration_s=%.1f",
+            outcomes["delivered"],
+            outcomes["skipped"],
+            outcomes["failed"],
+            time.monotonic() - run_started,
+        )
 
     async def _process_user_recall_word(
         self,
@@ -76,8 +93,8 @@ class TelegramRecallDelivery:
         user_state: RecallState,
         send_word: SendWord,
         max_attempts: int = 3,
-    ) -> None:
-        """Delegate one user's locked delivery workflow to its recall service."""
+    ) -> bool:
+        """Delegate one user's locked delivery workflow to its recall service; returns whether a word was sent."""
         updated_state = await recall_service.deliver_next_word(
             user_state.user_id,
             send_word,
@@ -89,6 +106,7 @@ class TelegramRecallDelivery:
                 user_state.telegram_username or user_state.user_id,
                 updated_state.next_word_index,
             )
+        return updated_state is not None
 
     async def _send_queue_word(
         self,
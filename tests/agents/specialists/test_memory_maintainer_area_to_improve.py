@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
@@ -14,6 +15,7 @@ from runestone.agents.specialists.memory_maintainer.area_to_improve import (
     AreaToImproveMemoryMaintainer as MemoryMaintainerSpecialist,
 )
 from runestone.agents.specialists.memory_maintainer.area_to_improve import (
+    BucketResolution,
     BucketReviewGroup,
     BucketReviewPlan,
     BucketTopicGroup,
@@ -24,6 +26,7 @@ from runestone.agents.specialists.memory_maintainer.area_to_improve import (
     PriorityReviewPlan,
     PrioritySuggestion,
 )
+from runestone.agents.specialists.memory_maintainer.incremental import build_watermark
 from runestone.config import AgentLLMSettings, ReasoningLevel
 from runestone.db.memory_item_repository import MemoryItemRepository
 from runestone.db.models import MemoryItem
@@ -35,6 +38,8 @@ def mock_settings():
     settings = MagicMock()
     settings.memory_maintainer_provider = "openrouter"
     settings.memory_maintainer_model = "test-model"
+    settings.memory_maintainer_concurrency = 4
+    settings.memory_maintainer_incremental_enabled = False
     settings.get_agent_llm_settings.return_value = AgentLLMSettings(
         provider="openrouter",
         model="test-model",
@@ -279,6 +284,72 @@ async def test_memory_maintainer_uses_structured_output_and_skips_priority_revie
     assert result.artifacts["no_change_reason"] == "no_merge_candidates"
 
 
+@pytest.mark.anyio
+async def test_memory_maintainer_resolves_buckets_concurrently_in_bucket_order(specialist, mock_user):
+    specialist.settings.memory_maintainer_concurrency = 2
+    scope_items = [
+        _scope_item(item_id, key=f"topic_{item_id}_v1", content=f"Topic {item_id}", status="struggling")
+        for item_id in range(1, 7)
+    ]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=scope_items)
+    _wire_structured_models(
+        specialist.model,
+        bucket_plan=BucketTopicsPlan(
+            buckets=[
+                BucketTopicGroup(bucket_label=label, item_ids=item_ids, why=f"Anchor item id={item_ids[0]}.")
+                for label, item_ids in (("slow", [1, 2]), ("medium", [3, 4]), ("fast", [5, 6]))
+            ]
+        ),
+    )
+    delays = {"slow": 0.05, "medium": 0.02, "fast": 0.0}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _review_bucket(*, bucket_label, bucket_why, scope_items):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(delays[bucket_label])
+        in_flight -= 1
+        return BucketReviewPlan(groups=[BucketReviewGroup(item_ids=[item.id for item in scope_items], why="Same.")])
+
+    async def _generate_merge_group(*, bucket_label, reviewed_group, scope_items, target_language):
+        return MergeGeneration(
+            final_key=f"{bucket_label}_topic", final_content="Merged.", final_status="struggling", why="Same."
+        )
+
+    async def _validate_merge_group(**_kwargs):
+        return MergeValidation(approved=True, why="Same topic.")
+
+    specialist._review_bucket = _review_bucket
+    specialist._generate_merge_group = _generate_merge_group
+    specialist._validate_merge_group = _validate_merge_group
+    specialist._execute_groups = AsyncMock(
+        return_value={"merged_groups": [], "failed_groups": [], "created_item_ids": [], "deleted_item_ids": []}
+    )
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    with patch(
+        "runestone.agents.specialists.memory_maintainer.area_to_improve.provide_memory_item_service", fake_provider
+    ):
+        result = await specialist.run_cli_for_user(mock_user, dry_run=True, with_priority_review=False)
+
+    planned_groups = specialist._execute_groups.await_args.kwargs["planned_groups"]
+    assert [(group.group_id, group.bucket_label) for group in planned_groups] == [
+        ("group_1", "slow"),
+        ("group_2", "medium"),
+        ("group_3", "fast"),
+    ]
+    assert max_in_flight == 2
+    assert result.artifacts["bucket_concurrency"] == 2
+    assert set(result.artifacts["stage_timings_ms"]) >= {"scope_load", "bucket_topics", "bucket_resolution"}
+    assert result.artifacts["bucket_resolution_serial_ms"] >= result.artifacts["stage_timings_ms"]["bucket_resolution"]
+
+
 @pytest.mark.anyio
 async def test_memory_maintainer_fails_safely_when_bucket_step_cannot_parse(specialist, mock_user):
     service = MagicMock()
@@ -1671,3 +1742,169 @@ async def test_memory_maintainer_cli_dry_run_priority_review_does_not_count_sugg
     assert second.priority == 3
     assert len(result.artifacts["priority_updates"]) == 1
     assert result.artifacts["priority_updates"][0]["mode"] == "suggested"
+
+
+def _watermark_provider(watermark):
+    watermark_service = MagicMock()
+    watermark_service.load = AsyncMock(return_value=watermark)
+    watermark_service.save = AsyncMock(return_value=True)
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield watermark_service
+
+    return watermark_service, fake_provider
+
+
+@pytest.mark.anyio
+async def test_memory_maintainer_incremental_run_skips_unchanged_scope(specialist, mock_user):
+    specialist.settings.memory_maintainer_incremental_enabled = True
+    scope_items = [
+        _scope_item(item_id, key=f"topic_{item_id}_v1", content=f"Topic {item_id}", status="struggling")
+        for item_id in range(1, 4)
+    ]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=scope_items)
+    watermark_service, fake_watermark_provider = _watermark_provider(
+        build_watermark(scope_items=scope_items, clusters=[[1, 2], [3]], deleted_ids=[], merges=[])
+    )
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    with (
+        patch(
+            "runestone.agents.specialists.memory_maintainer.area_to_improve.provide_memory_item_service", fake_provider
+        ),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.incremental.provide_memory_maintenance_watermark_service",
+            fake_watermark_provider,
+        ),
+    ):
+        result = await specialist.run_for_user(mock_user)
+
+    assert result.status == "no_action"
+    assert result.artifacts["no_change_reason"] == "unchanged_since_last_run"
+    assert result.artifacts["incremental"]["changed_item_count"] == 0
+    specialist.model.with_structured_output.assert_not_called()
+    watermark_service.save.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_memory_maintainer_incremental_run_sends_changes_with_cluster_representatives(specialist, mock_user):
+    specialist.settings.memory_maintainer_incremental_enabled = True
+    previous_items = [
+        _scope_item(item_id, key=f"topic_{item_id}_v1", content=f"Topic {item_id}", status="struggling")
+        for item_id in (1, 2, 3, 5)
+    ]
+    scope_items = [
+        *previous_items,
+        _scope_item(4, key="topic_4_v1", content="Topic 4", status="struggling"),
+    ]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=scope_items)
+    watermark_service, fake_watermark_provider = _watermark_provider(
+        build_watermark(scope_items=previous_items, clusters=[[1, 2], [3, 5]], deleted_ids=[], merges=[])
+    )
+    specialist._bucket_topics = AsyncMock(
+        return_value=BucketTopicsPlan(
+            buckets=[
+                BucketTopicGroup(bucket_label="gender", item_ids=[4, 1], why="Anchor item id=1 key=topic_1_v1."),
+                BucketTopicGroup(bucket_label="word order", item_ids=[3]),
+            ]
+        )
+    )
+    specialist._resolve_bucket = AsyncMock(return_value=BucketResolution(merges=[], step_errors=[], elapsed_ms=0))
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    with (
+        patch(
+            "runestone.agents.specialists.memory_maintainer.area_to_improve.provide_memory_item_service", fake_provider
+        ),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.incremental.provide_memory_maintenance_watermark_service",
+            fake_watermark_provider,
+        ),
+    ):
+        result = await specialist.run_for_user(mock_user)
+
+    bucket_kwargs = specialist._bucket_topics.await_args.kwargs
+    assert [item.id for item in bucket_kwargs["scope_items"]] == [1, 3, 4]
+    assert bucket_kwargs["representative_ids"] == [1, 3]
+    specialist._resolve_bucket.assert_awaited_once()
+    assert specialist._resolve_bucket.await_args.kwargs["bucket"].item_ids == [4, 1, 2]
+    assert result.artifacts["incremental"] == {
+        "changed_item_count": 1,
+        "removed_item_count": 0,
+        "unchanged_cluster_count": 2,
+        "sent_item_count": 3,
+    }
+    assert result.artifacts["watermark_saved"] is True
+    saved_watermark = watermark_service.save.await_args.args[2]
+    assert saved_watermark.clusters == [[4, 1, 2], [3, 5]]
+    assert set(saved_watermark.item_hashes) == {1, 2, 3, 4, 5}
+
+
+@pytest.mark.anyio
+async def test_memory_maintainer_embedding_bucketing_skips_bucket_llm_call(specialist, mock_user):
+    specialist.settings.memory_maintainer_bucketing = "embedding"
+    scope_items = [
+        _scope_item(1, key="en_ett_v1", content="Gender of nouns", status="struggling"),
+        _scope_item(2, key="noun_gender_v1", content="En or ett", status="improving"),
+        _scope_item(3, key="word_order_v1", content="V2 word order", status="struggling"),
+    ]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=scope_items)
+    embeddings = MagicMock()
+    embeddings.embed_documents.return_value = [[1.0, 0.0], [0.99, 0.05], [0.0, 1.0]]
+    specialist.bucketer.embeddings_loader = lambda: embeddings
+    specialist.bucketer.similarity_threshold = 0.9
+    specialist._bucket_topics = AsyncMock()
+    specialist._resolve_bucket = AsyncMock(return_value=BucketResolution(merges=[], step_errors=[], elapsed_ms=0))
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    with patch(
+        "runestone.agents.specialists.memory_maintainer.area_to_improve.provide_memory_item_service", fake_provider
+    ):
+        result = await specialist.run_cli_for_user(mock_user, dry_run=True, with_priority_review=False)
+
+    specialist._bucket_topics.assert_not_awaited()
+    assert result.artifacts["bucketing"] == "embedding"
+    assert [bucket["item_ids"] for bucket in result.artifacts["buckets"]] == [[1, 2], [3]]
+    assert specialist._resolve_bucket.await_args.kwargs["bucket"].why.startswith("Embedding cluster anchored")
+
+
+@pytest.mark.anyio
+async def test_memory_maintainer_embedding_bucketing_falls_back_to_llm(specialist, mock_user):
+    specialist.settings.memory_maintainer_bucketing = "embedding"
+    scope_items = [_scope_item(1, key="en_ett_v1", content="Gender of nouns", status="struggling")]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=scope_items)
+
+    def _missing_model():
+        raise OSError("model not cached")
+
+    specialist.bucketer.embeddings_loader = _missing_model
+    specialist._bucket_topics = AsyncMock(
+        return_value=BucketTopicsPlan(buckets=[BucketTopicGroup(bucket_label="gender", item_ids=[1])])
+    )
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    with patch(
+        "runestone.agents.specialists.memory_maintainer.area_to_improve.provide_memory_item_service", fake_provider
+    ):
+        result = await specialist.run_cli_for_user(mock_user, dry_run=True, with_priority_review=False)
+
+    specialist._bucket_topics.assert_awaited_once()
+    assert result.artifacts["bucketing"] == "llm"
+    assert result.artifacts["no_change_reason"] == "no_merge_candidates"
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from runestone.agents.specialists.memory_maintainer.clustering import (
+    EmbeddingBucketer,
+    cluster_vectors,
+    item_text,
+    pairwise_agreement,
+    partition_stats,
+)
+
+
+def _item(item_id: int, key: str, content: str = "Content"):
+    return SimpleNamespace(id=item_id, key=key, content=content)
+
+
+def test_cluster_vectors_groups_similar_vectors_in_input_order():
+    vectors = [[1.0, 0.0], [0.0, 1.0], [0.98, 0.05], [0.05, 0.99], [-1.0, 0.0]]
+
+    assert cluster_vectors(vectors, threshold=0.9, max_size=15) == [[0, 2], [1, 3], [4]]
+
+
+def test_cluster_vectors_respects_max_size_and_empty_input():
+    vectors = [[1.0, 0.0], [0.99, 0.01], [0.98, 0.02]]
+
+    assert cluster_vectors(vectors, threshold=0.5, max_size=2) == [[0, 1], [2]]
+    assert cluster_vectors([], threshold=0.5, max_size=2) == []
+
+
+@pytest.mark.anyio
+async def test_embedding_bucketer_anchors_buckets_on_central_item():
+    embeddings = MagicMock()
+    embeddings.embed_documents.return_value = [[1.0, 0.1], [1.0, 0.0], [0.0, 1.0], [1.0, -0.1]]
+    bucketer = EmbeddingBucketer(similarity_threshold=0.9, embeddings_loader=lambda: embeddings)
+    items = [_item(11, "en_ett"), _item(12, "noun_gender"), _item(13, "word_order"), _item(14, "ett_words")]
+
+    buckets = await bucketer.bucket(items)
+
+    embeddings.embed_documents.assert_called_once_with([item_text(item) for item in items])
+    assert [bucket.item_ids for bucket in buckets] == [[11, 12, 14], [13]]
+    assert buckets[0].label == "noun_gender"
+    assert "id=12 key=noun_gender" in buckets[0].why
+    assert buckets[1].why is None
+
+
+def test_pairwise_agreement_and_partition_stats():
+    reference = [[1, 2, 3], [4]]
+    candidate = [[1, 2], [3, 4]]
+
+    agreement = pairwise_agreement(reference, candidate)
+
+    assert agreement["precision"] == pytest.approx(0.5)
+    assert agreement["recall"] == pytest.approx(1 / 3)
+    assert agreement["f1"] == pytest.approx(0.4)
+    assert pairwise_agreement([[1], [2]], [[1], [2]]) == {"precision": 1.0, "recall": 1.0, "f1": 1.0}
+    assert partition_stats(reference) == {
+        "bucket_count": 2,
+        "singleton_count": 1,
+        "max_bucket_size": 3,
+        "oversized_bucket_count": 0,
+    }
@@ -14,6 +14,8 @@ def mock_settings():
     settings = MagicMock()
     settings.memory_maintainer_provider = "openrouter"
     settings.memory_maintainer_model = "test-model"
+    settings.memory_maintainer_concurrency = 4
+    settings.memory_maintainer_incremental_enabled = False
     settings.get_agent_llm_settings.return_value = AgentLLMSettings(
         provider="openrouter",
         model="test-model",
@@ -74,8 +76,27 @@ async def test_combined_memory_maintainer_runs_both_domains_and_combines_artifac
         specialist = CombinedMemoryMaintainerSpecialist(mock_settings)
         result = await specialist.run_for_user(mock_user)
 
-    area_instance.run_for_user.assert_awaited_once_with(mock_user)
-    personal_instance.run_for_user.assert_awaited_once_with(mock_user)
+    area_instance.run_for_user.assert_awaited_once_with(mock_user, trigger_source="chat_reset")
+    personal_instance.run_for_user.assert_awaited_once_with(mock_user, trigger_source="chat_reset")
     assert result.status == "action_taken"
     assert result.artifacts["domains"]["area_to_improve"]["summary"] == "area merged"
     assert result.artifacts["domains"]["personal_info"]["summary"] == "noop"
+
+
+@pytest.mark.anyio
+async def test_combined_memory_maintainer_passes_scheduled_trigger_to_both_domains(mock_settings, mock_user):
+    result = SpecialistResult(status="no_action", actions=[], info_for_teacher="", artifacts={"summary": "noop"})
+
+    with (
+        patch("runestone.agents.specialists.memory_maintainer.specialist.AreaToImproveMemoryMaintainer") as area_cls,
+        patch("runestone.agents.specialists.memory_maintainer.specialist.PersonalInfoMemoryMaintainer") as personal_cls,
+    ):
+        area_cls.return_value.run_for_user = AsyncMock(return_value=result)
+        personal_cls.return_value.run_for_user = AsyncMock(return_value=result)
+
+        specialist = CombinedMemoryMaintainerSpecialist(mock_settings)
+        combined = await specialist.run_for_user(mock_user, trigger_source="scheduled")
+
+    area_cls.return_value.run_for_user.assert_awaited_once_with(mock_user, trigger_source="scheduled")
+    personal_cls.return_value.run_for_user.assert_awaited_once_with(mock_user, trigger_source="scheduled")
+    assert combined.artifacts["trigger_source"] == "scheduled"
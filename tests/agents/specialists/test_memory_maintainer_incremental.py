@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from runestone.agents.specialists.memory_maintainer.incremental import (
+    build_watermark,
+    compute_change_set,
+    item_fingerprint,
+)
+from runestone.services.memory_maintenance_watermark_service import MaintenanceWatermark
+
+
+def _item(item_id: int, content: str, *, status: str = "struggling", priority: int | None = None):
+    return SimpleNamespace(id=item_id, key=f"key_{item_id}", content=content, status=status, priority=priority)
+
+
+def test_fingerprint_changes_with_reviewed_fields_only():
+    item = _item(1, "Gender")
+
+    assert item_fingerprint(item) == item_fingerprint(_item(1, "Gender"))
+    assert item_fingerprint(item) != item_fingerprint(_item(1, "Gender agreement"))
+    assert item_fingerprint(item) != item_fingerprint(_item(1, "Gender", status="improving"))
+    assert item_fingerprint(item) != item_fingerprint(_item(1, "Gender", priority=2))
+
+
+def test_compute_change_set_splits_changed_removed_and_unchanged_clusters():
+    previous = [_item(1, "A"), _item(2, "B"), _item(3, "C"), _item(4, "D"), _item(5, "E")]
+    watermark = build_watermark(scope_items=previous, clusters=[[1, 2], [3, 4], [5]], deleted_ids=[], merges=[])
+    current = [_item(1, "A"), _item(2, "B changed"), _item(3, "C"), _item(4, "D"), _item(6, "F")]
+
+    change_set = compute_change_set(current, watermark)
+
+    assert change_set.changed_ids == [2, 6]
+    assert change_set.removed_ids == [5]
+    assert change_set.clusters == [[1], [3, 4]]
+    assert change_set.expand([6, 3]) == [6, 3, 4]
+    assert not change_set.unchanged
+
+
+def test_compute_change_set_keeps_unclustered_items_as_singletons():
+    items = [_item(1, "A"), _item(2, "B")]
+    watermark = MaintenanceWatermark(item_hashes={item.id: item_fingerprint(item) for item in items})
+
+    change_set = compute_change_set(items, watermark)
+
+    assert change_set.unchanged
+    assert change_set.clusters == [[1], [2]]
+
+
+def test_build_watermark_puts_merged_items_first_in_their_cluster():
+    scope = [_item(1, "A"), _item(2, "A again"), _item(3, "C")]
+    merged = _item(9, "A merged")
+
+    watermark = build_watermark(
+        scope_items=scope,
+        clusters=[[1, 2, 3]],
+        deleted_ids=[1, 2],
+        merges=[([1, 2], merged)],
+    )
+
+    assert watermark.clusters == [[9, 3]]
+    assert set(watermark.item_hashes) == {3, 9}
+    assert watermark.item_hashes[9] == item_fingerprint(merged)
+    assert watermark.last_run_at is not None
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from types import SimpleNamespace
@@ -5,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from runestone.agents.specialists.memory_maintainer.incremental import build_watermark
 from runestone.agents.specialists.memory_maintainer.personal_info import (
     PERSONAL_INFO_BAKE_GROUP_PROMPT,
     PERSONAL_INFO_BUCKET_TOPICS_PROMPT,
@@ -27,6 +29,8 @@ def mock_settings():
     settings = MagicMock()
     settings.memory_maintainer_provider = "openrouter"
     settings.memory_maintainer_model = "test-model"
+    settings.memory_maintainer_concurrency = 4
+    settings.memory_maintainer_incremental_enabled = False
     settings.get_agent_llm_settings.return_value = AgentLLMSettings(
         provider="openrouter",
         model="test-model",
@@ -188,13 +192,13 @@ async def test_personal_info_maintainer_injects_current_datetime_into_bucket_rev
     bake_messages = bake_model.ainvoke.await_args.args[0]
     summary_messages = summary_model.ainvoke.await_args.args[0]
 
-    assert "Current datetime: 2026-06-14T10:30:00+00:00" in bucket_messages[0].content
+    assert "2026-06-14" not in bucket_messages[0].content
     assert '"current_datetime": "2026-06-14T10:30:00+00:00"' in bucket_messages[1].content
-    assert "Current datetime: 2026-06-14T10:30:00+00:00" in review_messages[0].content
+    assert "2026-06-14" not in review_messages[0].content
     assert '"current_datetime": "2026-06-14T10:30:00+00:00"' in review_messages[1].content
-    assert "Current datetime: 2026-06-14T10:30:00+00:00" in bake_messages[0].content
+    assert "2026-06-14" not in bake_messages[0].content
     assert '"current_datetime": "2026-06-14T10:30:00+00:00"' in bake_messages[1].content
-    assert "Current datetime: 2026-06-14T10:30:00+00:00" in summary_messages[0].content
+    assert "2026-06-14" not in summary_messages[0].content
     assert '"current_datetime": "2026-06-14T10:30:00+00:00"' in summary_messages[1].content
 
 
@@ -282,6 +286,57 @@ async def test_personal_info_maintainer_deletes_consumed_outdated_group_in_dry_r
     assert result.artifacts["summary_preview"] is None
 
 
+@pytest.mark.anyio
+async def test_personal_info_maintainer_resolves_buckets_concurrently_in_bucket_order(mock_settings, mock_user):
+    mock_settings.memory_maintainer_concurrency = 2
+    items = [
+        _make_item(51, key="lives_in", content="Lives in Uppsala."),
+        _make_item(52, key="lives_in", content="Moved to Stockholm.", status="correction"),
+        _make_item(53, key="pet", content="Has a dog."),
+        _make_item(54, key="pet", content="Dog is called Bamse.", status="correction"),
+        _make_item(55, key="job", content="Works as a nurse."),
+    ]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=items)
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    bucket_plan = BucketTopicsPlan(
+        buckets=[
+            BucketTopicGroup(bucket_label="home", item_ids=[51, 52], why="same home fact"),
+            BucketTopicGroup(bucket_label="job", item_ids=[55]),
+            BucketTopicGroup(bucket_label="pet", item_ids=[53, 54], why="same pet fact"),
+        ]
+    )
+    model, *_ = _build_model(bucket_plan=bucket_plan, summary_plan=PersonalInfoSummaryPlan(summary="Summary."))
+    delays = {"home": 0.03, "pet": 0.0}
+
+    async def _review_bucket(*, bucket_label, bucket_why, scope_items):
+        await asyncio.sleep(delays[bucket_label])
+        return BucketReviewPlan(groups=[BucketReviewGroup(item_ids=[item.id for item in scope_items], why="same")])
+
+    async def _bake_group(*, bucket_label, reviewed_group, scope_items):
+        return BakeGroupPlan(outcome="bake_active", final_key=bucket_label, final_content=f"{bucket_label}.", why="ok")
+
+    with (
+        patch("runestone.agents.specialists.memory_maintainer.personal_info.build_chat_model", return_value=model),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.personal_info.provide_memory_item_service", fake_provider
+        ),
+    ):
+        specialist = PersonalInfoMemoryMaintainer(mock_settings)
+        specialist._review_bucket = _review_bucket
+        specialist._bake_group = _bake_group
+        result = await specialist.run_cli_for_user(mock_user, dry_run=True)
+
+    assert [group["bucket_label"] for group in result.artifacts["baked_groups"]] == ["home", "pet"]
+    assert result.artifacts["summary_source_item_ids"] == [55, 51, 52, 53, 54]
+    assert result.artifacts["bucket_concurrency"] == 2
+    assert "bucket_resolution" in result.artifacts["stage_timings_ms"]
+
+
 @pytest.mark.anyio
 async def test_personal_info_maintainer_bakes_multi_item_bucket_in_apply_mode(mock_settings, mock_user):
     items = [
@@ -477,3 +532,105 @@ def test_personal_info_prompts_require_bucket_review_and_baking_contract():
     assert "produce one final active fact or no surviving fact" in PERSONAL_INFO_BAKE_GROUP_PROMPT
     assert f"at most {PERSONAL_INFO_SUMMARY_MAX_CHARS} characters" in PERSONAL_INFO_SUMMARY_PROMPT
     assert "Omit low-value or overly narrow details" in PERSONAL_INFO_SUMMARY_PROMPT
+
+
+def _watermark_provider(watermark):
+    watermark_service = MagicMock()
+    watermark_service.load = AsyncMock(return_value=watermark)
+    watermark_service.save = AsyncMock(return_value=True)
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield watermark_service
+
+    return watermark_service, fake_provider
+
+
+@pytest.mark.anyio
+async def test_personal_info_maintainer_incremental_run_skips_unchanged_scope(mock_settings, mock_user):
+    mock_settings.memory_maintainer_incremental_enabled = True
+    items = [_make_item(61, key="lives_in", content="Lives in Uppsala."), _make_item(62, key="job", content="Nurse.")]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=items)
+    watermark_service, fake_watermark_provider = _watermark_provider(
+        build_watermark(scope_items=items, clusters=[[61], [62]], deleted_ids=[], merges=[])
+    )
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    model, bucket_model, *_ = _build_model(bucket_plan=None, summary_plan=None)
+    with (
+        patch("runestone.agents.specialists.memory_maintainer.personal_info.build_chat_model", return_value=model),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.personal_info.provide_memory_item_service", fake_provider
+        ),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.incremental.provide_memory_maintenance_watermark_service",
+            fake_watermark_provider,
+        ),
+    ):
+        specialist = PersonalInfoMemoryMaintainer(mock_settings)
+        result = await specialist.run_for_user(mock_user)
+
+    assert result.status == "no_action"
+    assert result.artifacts["no_change_reason"] == "unchanged_since_last_run"
+    model.with_structured_output.assert_not_called()
+    watermark_service.save.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_personal_info_maintainer_incremental_run_resummarizes_after_removal_without_bucketing(
+    mock_settings, mock_user
+):
+    mock_settings.memory_maintainer_incremental_enabled = True
+    previous_items = [
+        _make_item(71, key="lives_in", content="Lives in Uppsala."),
+        _make_item(72, key="job", content="Works as a nurse."),
+        _make_item(73, key="pet", content="Has a dog."),
+    ]
+    items = previous_items[:2]
+    service = MagicMock()
+    service.list_memory_items = AsyncMock(return_value=items)
+    service.get_items_by_ids = AsyncMock(return_value=[])
+    user_service = MagicMock()
+    user_service.set_personal_info_summary = AsyncMock()
+    watermark_service, fake_watermark_provider = _watermark_provider(
+        build_watermark(scope_items=previous_items, clusters=[[71, 73], [72]], deleted_ids=[], merges=[])
+    )
+
+    @asynccontextmanager
+    async def fake_provider():
+        yield service
+
+    @asynccontextmanager
+    async def fake_user_provider():
+        yield user_service
+
+    model, bucket_model, review_model, _bake_model, summary_model = _build_model(
+        bucket_plan=None, summary_plan=PersonalInfoSummaryPlan(summary="Lives in Uppsala and works as a nurse.")
+    )
+    with (
+        patch("runestone.agents.specialists.memory_maintainer.personal_info.build_chat_model", return_value=model),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.personal_info.provide_memory_item_service", fake_provider
+        ),
+        patch("runestone.agents.specialists.memory_maintainer.personal_info.provide_user_service", fake_user_provider),
+        patch(
+            "runestone.agents.specialists.memory_maintainer.incremental.provide_memory_maintenance_watermark_service",
+            fake_watermark_provider,
+        ),
+    ):
+        specialist = PersonalInfoMemoryMaintainer(mock_settings)
+        result = await specialist.run_for_user(mock_user)
+
+    bucket_model.ainvoke.assert_not_awaited()
+    review_model.ainvoke.assert_not_awaited()
+    summary_model.ainvoke.assert_awaited_once()
+    assert result.artifacts["incremental"]["removed_item_count"] == 1
+    assert result.artifacts["kept_active_item_ids"] == [71, 72]
+    user_service.set_personal_info_summary.assert_awaited_once_with(1, "Lives in Uppsala and works as a nurse.")
+    saved_watermark = watermark_service.save.await_args.args[2]
+    assert saved_watermark.clusters == [[71], [72]]
+    assert set(saved_watermark.item_hashes) == {71, 72}
@@ -8,6 +8,7 @@ from runestone.agents.schemas import ChatMessage
 from runestone.agents.specialists.base import SpecialistContext
 from runestone.agents.specialists.word_keeper import (
     WORDKEEPER_ENRICHMENT_PROMPT,
+    WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
     WORDKEEPER_SAVE_REQUEST_EXTRACTION_PROMPT,
     WordEnrichmentItem,
     WordKeeperEnrichment,
@@ -15,7 +16,7 @@ from runestone.agents.specialists.word_keeper import (
     WordKeeperSpecialist,
 )
 from runestone.config import AgentLLMSettings, ReasoningLevel, Settings
-from runestone.schemas.vocabulary_save import VocabularyPrioritizationAction, WordSaveCandidate
+from runestone.schemas.vocabulary_save import SharedWordEnrichment, VocabularyPrioritizationAction, WordSaveCandidate
 
 
 @pytest.fixture
@@ -75,7 +76,12 @@ def _service_provider(service):
     return _provider
 
 
-def _mock_vocabulary_service(priority_actions=None, upsert_return=None, upsert_side_effect=None):
+def _mock_vocabulary_service(
+    priority_actions=None,
+    upsert_return=None,
+    upsert_side_effect=None,
+    shared_enrichments=None,
+):
     service = MagicMock()
     service.prepare_priority_word_save = AsyncMock(return_value=priority_actions or [])
     if upsert_return is None:
@@ -88,6 +94,9 @@ def _mock_vocabulary_service(priority_actions=None, upsert_return=None, upsert_s
     if upsert_side_effect is not None:
         service.insert_or_prioritize_words.side_effect = upsert_side_effect
     service.repo.db.rollback = AsyncMock()
+    service.repo.db.commit = AsyncMock()
+    service.get_shared_enrichments = AsyncMock(return_value=shared_enrichments or {})
+    service.store_shared_enrichments = AsyncMock()
     return service
 
 
@@ -758,3 +767,150 @@ async def test_word_keeper_extraction_payload_includes_teacher_response_for_deic
     assert '"message": "Save that word for me."' in payload
     assert '"target_translation_language": "English"' in payload
     assert '"teacher_response": "Begripa means understand."' in payload
+
+
+@pytest.mark.anyio
+async def test_word_keeper_uses_shared_enrichment_cache_and_enriches_only_misses(
+    specialist, mock_chat_model, mock_user
+):
+    mock_user.mother_tongue = "Spanish"
+    mock_chat_model.enrichment_model.ainvoke.return_value = WordKeeperEnrichment(
+        items=[
+            WordEnrichmentItem(
+                candidate_id="1",
+                word_phrase="begripa",
+                translation="entender",
+                example_phrase="Jag begriper inte frågan.",
+                extra_info="verb; infinitive: begripa",
+            )
+        ]
+    )
+    vocabulary_service = _mock_vocabulary_service(
+        priority_actions=_priority_actions(
+            _priority_entry("hus", "missing", word_id=None, changed=False),
+            _priority_entry(
+                "begripa", "missing", word_id=None, changed=False, context_phrase="Jag begriper inte frågan."
+            ),
+        ),
+        upsert_return=[{"action": "created", "word_id": 3}, {"action": "created", "word_id": 4}],
+        shared_enrichments={
+            "hus": SharedWordEnrichment(
+                word_phrase="hus",
+                translation="casa",
+                example_phrase="Huset är stort.",
+                extra_info="ett-word noun",
+            )
+        },
+    )
+
+    with patch(
+        "runestone.agents.specialists.word_keeper.provide_vocabulary_service",
+        _service_provider(vocabulary_service),
+    ):
+        result = await specialist.run(
+            SpecialistContext(
+                message="Spara hus och begripa",
+                history=[],
+                user=mock_user,
+                vocabulary_candidates=[WordSaveCandidate(word_phrase="hus"), WordSaveCandidate(word_phrase="begripa")],
+                routing_reason="teacher emitted vocabulary_candidates",
+            )
+        )
+
+    assert result.status == "action_taken"
+    vocabulary_service.get_shared_enrichments.assert_awaited_once_with(
+        ["hus", "begripa"],
+        target_language="Spanish",
+        prompt_version=WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
+    )
+    enrichment_payload = mock_chat_model.enrichment_model.ainvoke.call_args[0][0][1].content
+    assert '"word_phrase": "begripa"' in enrichment_payload
+    assert '"word_phrase": "hus"' not in enrichment_payload
+    saved = {item.word_phrase: item for item in vocabulary_service.insert_or_prioritize_words.call_args.args[0]}
+    assert saved["hus"].translation == "casa"
+    assert saved["hus"].example_phrase == "Huset är stort."
+    assert saved["begripa"].translation == "entender"
+    # The example came from the learner's own sentence, so it is not shared across users.
+    vocabulary_service.store_shared_enrichments.assert_awaited_once_with(
+        [
+            SharedWordEnrichment(
+                word_phrase="begripa",
+                translation="entender",
+                example_phrase=None,
+                extra_info="verb; infinitive: begripa",
+            )
+        ],
+        target_language="Spanish",
+        prompt_version=WORDKEEPER_ENRICHMENT_PROMPT_VERSION,
+    )
+
+
+@pytest.mark.anyio
+async def test_word_keeper_saves_cache_hits_when_miss_enrichment_fails(specialist, mock_chat_model, mock_user):
+    mock_chat_model.enrichment_model.ainvoke.side_effect = RuntimeError("provider down")
+    vocabulary_service = _mock_vocabulary_service(
+        priority_actions=_priority_actions(
+            _priority_entry("hus", "missing", word_id=None, changed=False),
+            _priority_entry("begripa", "missing", word_id=None, changed=False),
+        ),
+        shared_enrichments={
+            "hus": SharedWordEnrichment(word_phrase="hus", translation="house", example_phrase="Huset är stort.")
+        },
+    )
+
+    with patch(
+        "runestone.agents.specialists.word_keeper.provide_vocabulary_service",
+        _service_provider(vocabulary_service),
+    ):
+        result = await specialist.run(
+            SpecialistContext(
+                message="Spara hus och begripa",
+                history=[],
+                user=mock_user,
+                vocabulary_candidates=[WordSaveCandidate(word_phrase="hus"), WordSaveCandidate(word_phrase="begripa")],
+                routing_reason="teacher emitted vocabulary_candidates",
+            )
+        )
+
+    assert result.status == "action_taken"
+    assert result.artifacts["saved_words"] == ["hus"]
+    assert {"word_phrase": "begripa", "reason": "enrichment_failed"} in result.artifacts["skipped_words"]
+    vocabulary_service.store_shared_enrichments.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_word_keeper_prewarm_generates_only_uncached_phrases_per_language(specialist, mock_chat_model):
+    mock_chat_model.enrichment_model.ainvoke.return_value = WordKeeperEnrichment(
+        items=[
+            WordEnrichmentItem(
+                candidate_id="0",
+                word_phrase="springa",
+                translation="correr",
+                example_phrase="Jag springer varje dag.",
+                extra_info="verb",
+            )
+        ]
+    )
+    vocabulary_service = _mock_vocabulary_service(
+        shared_enrichments={"hus": SharedWordEnrichment(word_phrase="hus", translation="casa")}
+    )
+    vocabulary_service.repo.list_shared_word_phrases = AsyncMock(
+        return_value=[("hus", "Spanish", 4), ("springa", "Spanish", 2), ("Springa", "Spanish", 1), ("katt", None, 1)]
+    )
+
+    summary = await specialist.prewarm_shared_enrichment(vocabulary_service, languages=["spanish"])
+
+    assert summary == {"Spanish": {"phrases": 2, "cached": 1, "generated": 1, "failed": 0}}
+    vocabulary_service.repo.db.commit.assert_awaited_once()
+    enrichment_payload = mock_chat_model.enrichment_model.ainvoke.call_args[0][0][1].content
+    assert '"word_phrase": "springa"' in enrichment_payload
+    assert '"target_translation_language": "Spanish"' in enrichment_payload
+    stored = vocabulary_service.store_shared_enrichments.call_args.args[0]
+    assert stored == [
+        SharedWordEnrichment(
+            word_phrase="springa",
+            translation="correr",
+            example_phrase="Jag springer varje dag.",
+            extra_info="verb",
+        )
+    ]
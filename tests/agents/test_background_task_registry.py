@@ -4,6 +4,7 @@ import logging
 import pytest
 
 from runestone.agents.background_task_registry import BackgroundTaskRegistry
+from runestone.core.metrics import metrics_registry
 
 
 @pytest.fixture
@@ -84,3 +85,22 @@ async def test_cancel_returns_false_when_task_already_done(registry):
 
     assert cancelled is False
     assert "chat-1" not in registry.tasks
+
+
+async def test_named_registries_report_live_tasks_to_metrics():
+    registry = BackgroundTaskRegistry(logging.getLogger("test"), key_name="chat_id", metrics_name="test_registry")
+
+    async def sleeper():
+        await asyncio.sleep(10)
+
+    live = asyncio.create_task(sleeper())
+    done = asyncio.get_running_loop().create_future()
+    done.set_result(None)
+    registry.register("chat-1", live)
+    registry.register("chat-2", done)
+
+    assert 'runestone_background_tasks{registry="test_registry"} 1' in metrics_registry.render()
+
+    live.cancel()
+    await asyncio.sleep(0)
+    assert 'runestone_background_tasks{registry="test_registry"} 0' in metrics_registry.render()
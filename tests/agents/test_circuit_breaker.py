@@ -0,0 +1,317 @@
+"""Tests for per provider/model circuit breakers and failover, driven by a fake flaky chat model."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from runestone.agents.circuit_breaker import (
+    CircuitBinding,
+    CircuitBreakerMiddleware,
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    CircuitBreakerRunnable,
+    CircuitOpenError,
+    guarded_call,
+    guarded_structured_output,
+)
+from runestone.agents.llm import build_chat_model
+from runestone.config import AgentLLMSettings, ReasoningLevel, Settings
+
+POLICY = CircuitBreakerPolicy(
+    failure_rate_threshold=0.5,
+    slow_call_seconds=None,
+    min_calls=4,
+    window_seconds=60.0,
+    open_seconds=30.0,
+    half_open_max_calls=1,
+)
+PRIMARY_KEY = ("openrouter", "primary-model")
+FALLBACK_KEY = ("gemini", "fallback-model")
+
+
+class FlakyChatModel(BaseChatModel):
+    """Fake chat model whose provider can be switched between healthy, failing, and slow."""
+
+    reply: str = "ok"
+    failing: bool = False
+    latency_seconds: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "flaky-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        raise NotImplementedError
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if self.failing:
+            raise ConnectionError("provider unavailable")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class AsyncMockCallable:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    return CircuitBreakerRegistry(clock=clock)
+
+
+def _runnable(registry, primary, fallback=None, policy=POLICY):
+    binding = CircuitBinding(key=PRIMARY_KEY, policy=policy, fallback=fallback)
+    fallback_runnable = None
+    if fallback is not None:
+        fallback_runnable = CircuitBreakerRunnable(CircuitBinding(FALLBACK_KEY, policy), fallback, None, registry)
+    return CircuitBreakerRunnable(binding, primary, fallback_runnable, registry)
+
+
+async def _invoke(runnable) -> str:
+    result = await runnable.ainvoke([HumanMessage(content="hej")])
+    return result.content
+
+
+@pytest.mark.anyio
+async def test_failures_open_circuit_and_route_to_fallback_instantly(registry):
+    primary = FlakyChatModel(reply="primary", failing=True)
+    fallback = FlakyChatModel(reply="fallback")
+    runnable = _runnable(registry, primary, fallback)
+
+    for _ in range(POLICY.min_calls):
+        assert await _invoke(runnable) == "fallback"
+    assert registry.snapshot()["openrouter/primary-model"]["state"] == "open"
+
+    assert await _invoke(runnable) == "fallback"
+    assert primary.calls == POLICY.min_calls
+    snapshot = registry.snapshot()["openrouter/primary-model"]
+    assert snapshot["rejected"] == 1
+    assert snapshot["transitions"] == {"closed->open": 1}
+
+
+@pytest.mark.anyio
+async def test_half_open_probe_closes_circuit_after_recovery(registry, clock):
+    primary = FlakyChatModel(reply="primary", failing=True)
+    fallback = FlakyChatModel(reply="fallback")
+    runnable = _runnable(registry, primary, fallback)
+    for _ in range(POLICY.min_calls):
+        await _invoke(runnable)
+
+    primary.failing = False
+    clock.now += POLICY.open_seconds
+
+    assert await _invoke(runnable) == "primary"
+    assert registry.snapshot()["openrouter/primary-model"]["state"] == "closed"
+    assert [(t.from_state, t.to_state) for t in registry.transitions()] == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_failed_probe_reopens_circuit(registry, clock):
+    primary = FlakyChatModel(reply="primary", failing=True)
+    fallback = FlakyChatModel(reply="fallback")
+    runnable = _runnable(registry, primary, fallback)
+    for _ in range(POLICY.min_calls):
+        await _invoke(runnable)
+
+    clock.now += POLICY.open_seconds
+    assert await _invoke(runnable) == "fallback"
+    calls_after_probe = primary.calls
+
+    assert await _invoke(runnable) == "fallback"
+    assert primary.calls == calls_after_probe
+    assert registry.snapshot()["openrouter/primary-model"]["transitions"]["half_open->open"] == 1
+
+
+def test_half_open_limits_concurrent_probes(registry, clock):
+    breaker = registry.breaker(PRIMARY_KEY, POLICY)
+    for _ in range(POLICY.min_calls):
+        assert breaker.allow_request()
+        breaker.record(0.1, ok=False)
+    clock.now += POLICY.open_seconds
+
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+    breaker.release()
+    assert breaker.allow_request() is True
+
+
+@pytest.mark.anyio
+async def test_slow_calls_count_as_failures(registry):
+    policy = CircuitBreakerPolicy(min_calls=2, slow_call_seconds=0.01, failure_rate_threshold=0.5)
+    primary = FlakyChatModel(reply="primary", latency_seconds=0.02)
+    runnable = _runnable(registry, primary, policy=policy)
+
+    assert await _invoke(runnable) == "primary"
+    assert await _invoke(runnable) == "primary"
+
+    assert registry.snapshot()["openrouter/primary-model"]["state"] == "open"
+    with pytest.raises(CircuitOpenError):
+        await _invoke(runnable)
+
+
+@pytest.mark.anyio
+async def test_failures_below_min_calls_keep_circuit_closed(registry):
+    primary = FlakyChatModel(failing=True)
+    runnable = _runnable(registry, primary)
+
+    for _ in range(POLICY.min_calls - 1):
+        with pytest.raises(ConnectionError):
+            await _invoke(runnable)
+
+    assert registry.snapshot()["openrouter/primary-model"]["state"] == "closed"
+
+
+def test_outcomes_outside_window_are_forgotten(registry, clock):
+    breaker = registry.breaker(PRIMARY_KEY, POLICY)
+    for _ in range(POLICY.min_calls - 1):
+        breaker.record(0.1, ok=False)
+    clock.now += POLICY.window_seconds + 1
+    breaker.record(0.1, ok=False)
+
+    snapshot = registry.snapshot()["openrouter/primary-model"]
+    assert snapshot["state"] == "closed"
+    assert snapshot["calls"] == 1
+
+
+@pytest.mark.anyio
+async def test_parse_errors_do_not_trip_breaker_or_fail_over(registry):
+    fallback = AsyncMockCallable("fallback")
+    binding = CircuitBinding(key=PRIMARY_KEY, policy=CircuitBreakerPolicy(min_calls=1))
+
+    async def _primary():
+        raise OutputParserException("bad json")
+
+    with pytest.raises(OutputParserException):
+        await guarded_call(binding, _primary, fallback=fallback, registry=registry)
+
+    assert fallback.calls == 0
+    assert registry.snapshot()["openrouter/primary-model"]["failure_rate"] == 0.0
+
+
+@pytest.mark.anyio
+async def test_cancelled_probe_releases_its_slot(registry, clock):
+    breaker = registry.breaker(PRIMARY_KEY, POLICY)
+    for _ in range(POLICY.min_calls):
+        breaker.record(0.1, ok=False)
+    clock.now += POLICY.open_seconds
+    binding = CircuitBinding(key=PRIMARY_KEY, policy=POLICY)
+
+    task = asyncio.create_task(guarded_call(binding, lambda: asyncio.sleep(10), registry=registry))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.allow_request() is True
+
+
+def test_guarded_structured_output_is_plain_for_unbound_models(registry):
+    model = MagicMock()
+
+    runnable = guarded_structured_output(model, dict, registry)
+
+    assert runnable is model.with_structured_output.return_value
+
+
+def test_guarded_structured_output_wraps_bound_models_with_fallback(registry):
+    primary = MagicMock()
+    fallback = MagicMock()
+    registry.bind(primary, CircuitBinding(PRIMARY_KEY, POLICY, fallback=fallback))
+
+    runnable = guarded_structured_output(primary, dict, registry)
+
+    assert isinstance(runnable, CircuitBreakerRunnable)
+    assert runnable.primary is primary.with_structured_output.return_value
+    assert runnable.fallback is fallback.with_structured_output.return_value
+
+
+@pytest.mark.anyio
+async def test_middleware_routes_open_circuit_to_fallback_model(registry):
+    primary_model = MagicMock(model_name="primary-model")
+    fallback_model = MagicMock(model_name="fallback-model")
+    registry.bind(primary_model, CircuitBinding(PRIMARY_KEY, POLICY, fallback=fallback_model))
+    registry.bind(fallback_model, CircuitBinding(FALLBACK_KEY, POLICY))
+    breaker = registry.breaker(PRIMARY_KEY, POLICY)
+    for _ in range(POLICY.min_calls):
+        breaker.record(0.1, ok=False)
+    request = MagicMock(model=primary_model)
+    fallback_request = MagicMock(model=fallback_model)
+    request.override.return_value = fallback_request
+    handled = []
+
+    async def _handler(model_request):
+        handled.append(model_request.model.model_name)
+        return f"response from {model_request.model.model_name}"
+
+    middleware = CircuitBreakerMiddleware(registry)
+
+    assert await middleware.awrap_model_call(request, _handler) == "response from fallback-model"
+    assert handled == ["fallback-model"]
+    request.override.assert_called_once_with(model=fallback_model)
+
+
+def _llm_settings(provider: str, model: str) -> AgentLLMSettings:
+    return AgentLLMSettings(
+        provider=provider,
+        model=model,
+        temperature=0.0,
+        reasoning_level=ReasoningLevel.NONE,
+        timeout_seconds=10.0,
+        max_retries=3,
+    )
+
+
+def test_build_chat_model_binds_breaker_and_shared_fallback():
+    settings = MagicMock(spec=Settings)
+    settings.openrouter_api_key = "test-openrouter-key"
+    settings.gemini_api_key = "test-gemini-key"
+    settings.resolve_openrouter_disallowed_providers.return_value = []
+    settings.get_agent_llm_settings.return_value = _llm_settings("openrouter", "primary-model")
+    settings.get_agent_fallback_llm_settings.return_value = _llm_settings("gemini", "fallback-model")
+    settings.llm_circuit_breaker_enabled = True
+    settings.llm_circuit_failure_rate = 0.5
+    settings.llm_circuit_slow_call_seconds = 20.0
+    settings.llm_circuit_min_calls = 10
+    settings.llm_circuit_window_seconds = 60.0
+    settings.llm_circuit_open_seconds = 30.0
+    settings.llm_circuit_half_open_probes = 1
+
+    with patch("runestone.agents.llm.circuit_breaker_registry", CircuitBreakerRegistry()) as registry:
+        model = build_chat_model(settings, "coordinator")
+        binding = registry.binding(model)
+
+        assert binding.key == ("openrouter", "primary-model")
+        assert binding.policy.min_calls == 10
+        assert registry.binding(binding.fallback) == CircuitBinding(("gemini", "fallback-model"), binding.policy)
+        assert build_chat_model(settings, "coordinator") is model
@@ -25,6 +25,7 @@ def mock_settings():
     settings.coordinator_model = "grok-coordinator"
     settings.openrouter_api_key = "test-api-key"
     settings.openai_api_key = "test-openai-key"
+    settings.coordinator_hedging_enabled = False
     return settings
 
 
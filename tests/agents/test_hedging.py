@@ -0,0 +1,162 @@
+"""Tests for hedged LLM requests and rolling latency histograms."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from runestone.agents.hedging import (
+    HedgedModelMiddleware,
+    HedgePolicy,
+    LatencyRegistry,
+    hedged_call,
+    record_cancelled_attempt,
+)
+from runestone.model_costs.langchain_callback import LangChainCostCallback
+from runestone.model_costs.tracking import _bind_collector, _CostCollector
+
+KEY = ("coordinator", "test-model")
+POLICY = HedgePolicy(percentile=0.9, min_samples=3, min_delay_seconds=0.01)
+
+
+def _warm(registry: LatencyRegistry, key=KEY, seconds: float = 0.01, count: int = 5) -> None:
+    for _ in range(count):
+        registry.record(key, seconds)
+
+
+def test_histogram_percentiles_and_snapshot():
+    registry = LatencyRegistry(window_size=10)
+    for value in range(1, 11):
+        registry.record(KEY, value / 10)
+
+    snapshot = registry.snapshot()["coordinator/test-model"]
+
+    assert snapshot["count"] == 10
+    assert snapshot["p50_seconds"] == 0.5
+    assert snapshot["p90_seconds"] == 0.9
+    assert registry.hedge_delay(KEY, HedgePolicy(min_samples=5, min_delay_seconds=0.0)) == 0.9
+
+
+def test_hedge_delay_waits_for_enough_samples_and_respects_floor():
+    registry = LatencyRegistry()
+    _warm(registry, count=2)
+    assert registry.hedge_delay(KEY, POLICY) is None
+
+    _warm(registry, count=1)
+    assert registry.hedge_delay(KEY, HedgePolicy(min_samples=3, min_delay_seconds=0.2)) == 0.2
+
+
+@pytest.mark.anyio
+async def test_fast_primary_never_hedges():
+    registry = LatencyRegistry()
+    _warm(registry, seconds=0.5)
+    hedge = MagicMock()
+
+    async def _primary():
+        return "primary"
+
+    assert await hedged_call(KEY, _primary, hedge=hedge, policy=POLICY, registry=registry) == "primary"
+    hedge.assert_not_called()
+    assert registry.snapshot()["coordinator/test-model"]["hedges_fired"] == 0
+
+
+@pytest.mark.anyio
+async def test_slow_primary_is_hedged_and_cancelled():
+    registry = LatencyRegistry()
+    _warm(registry)
+    primary_cancelled = asyncio.Event()
+    cancelled_attempts: list[bool] = []
+
+    async def _primary():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            primary_cancelled.set()
+            raise
+
+    async def _hedge():
+        return "hedge"
+
+    result = await hedged_call(
+        KEY,
+        _primary,
+        hedge=_hedge,
+        hedge_key=("coordinator", "backup-model"),
+        policy=POLICY,
+        registry=registry,
+        on_cancelled=cancelled_attempts.append,
+    )
+
+    assert result == "hedge"
+    assert primary_cancelled.is_set()
+    assert cancelled_attempts == [False]
+    stats = registry.snapshot()
+    assert stats["coordinator/test-model"]["hedges_fired"] == 1
+    assert stats["coordinator/test-model"]["hedge_wins"] == 1
+    assert stats["coordinator/backup-model"]["count"] == 1
+
+
+@pytest.mark.anyio
+async def test_failed_hedge_still_returns_primary_result():
+    registry = LatencyRegistry()
+    _warm(registry)
+
+    async def _primary():
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    async def _hedge():
+        raise RuntimeError("hedge failed")
+
+    assert await hedged_call(KEY, _primary, hedge=_hedge, policy=POLICY, registry=registry) == "primary"
+    assert registry.snapshot()["coordinator/test-model"]["hedge_wins"] == 0
+
+
+@pytest.mark.anyio
+async def test_both_failures_raise_primary_error():
+    registry = LatencyRegistry()
+    _warm(registry)
+
+    async def _primary():
+        await asyncio.sleep(0.03)
+        raise ValueError("primary failed")
+
+    async def _hedge():
+        raise RuntimeError("hedge failed")
+
+    with pytest.raises(ValueError, match="primary failed"):
+        await hedged_call(KEY, _primary, hedge=_hedge, policy=POLICY, registry=registry)
+
+
+def test_record_cancelled_attempt_uses_model_cost_identity():
+    collector = _CostCollector("chat_turn")
+    model = MagicMock()
+    model.callbacks = [LangChainCostCallback(provider="openrouter", model="test-model", component="teacher")]
+
+    with _bind_collector(collector, "foreground"):
+        record_cancelled_attempt(model)
+
+    assert [(record.component, record.model, record.status) for record in collector.interactions] == [
+        ("teacher", "test-model", "cancelled")
+    ]
+
+
+@pytest.mark.anyio
+async def test_middleware_hedges_with_backup_model():
+    registry = LatencyRegistry()
+    primary_model = MagicMock(model_name="primary-model")
+    backup_model = MagicMock(model_name="backup-model")
+    _warm(registry, key=("teacher", "primary-model"))
+    request = MagicMock(model=primary_model)
+    hedge_request = MagicMock(model=backup_model)
+    request.override.return_value = hedge_request
+
+    async def _handler(model_request):
+        if model_request is request:
+            await asyncio.sleep(10)
+        return f"response from {model_request.model.model_name}"
+
+    middleware = HedgedModelMiddleware("teacher", hedge_model=backup_model, policy=POLICY, registry=registry)
+
+    assert await middleware.awrap_model_call(request, _handler) == "response from backup-model"
+    request.override.assert_called_once_with(model=backup_model)
@@ -46,6 +46,7 @@ def mock_settings():
     settings.gemini_api_key = "test-gemini-key"
     settings.resolve_openrouter_disallowed_providers.return_value = []
     settings.get_agent_llm_settings.return_value = _make_settings()
+    settings.llm_circuit_breaker_enabled = False
     return settings
 
 
@@ -303,3 +304,33 @@ def test_build_chat_model_missing_api_key(mock_settings):
         with pytest.raises(ValueError, match=f"API key for {provider_name} is not configured"):
             build_chat_model(mock_settings, "teacher")
         setattr(mock_settings, attr_name, f"restored-{provider_name}-key")
+
+
+def test_build_chat_model_reuses_model_for_same_configuration(mock_settings):
+    """Rebuilding an agent returns the memoized model instead of a new client."""
+    first = build_chat_model(mock_settings, "coordinator")
+    second = build_chat_model(mock_settings, "coordinator")
+
+    assert first is second
+
+
+def test_build_chat_model_separates_agents_and_configurations(mock_settings):
+    """Models are keyed by agent name and effective settings."""
+    coordinator = build_chat_model(mock_settings, "coordinator")
+    word_keeper = build_chat_model(mock_settings, "word_keeper")
+    mock_settings.get_agent_llm_settings.return_value = _make_settings(temperature=0.9)
+    warmer_coordinator = build_chat_model(mock_settings, "coordinator")
+
+    assert coordinator is not word_keeper
+    assert coordinator is not warmer_coordinator
+
+
+def test_build_chat_model_shares_http_clients_per_provider(mock_settings):
+    """OpenAI-compatible models of one provider share pooled HTTP clients."""
+    with patch("runestone.agents.llm.ChatOpenAI") as mock_chat_openai:
+        build_chat_model(mock_settings, "coordinator")
+        build_chat_model(mock_settings, "word_keeper")
+
+    first_kwargs, second_kwargs = (call.kwargs for call in mock_chat_openai.call_args_list)
+    assert first_kwargs["http_async_client"] is second_kwargs["http_async_client"]
+    assert first_kwargs["http_client"] is second_kwargs["http_client"]
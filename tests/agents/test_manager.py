@@ -12,10 +12,14 @@ import pytest
 from langchain_core.messages import AIMessage, ToolMessage
 
 from runestone.agents.manager import AgentsManager
+from runestone.agents.pre_router import PreTurnRouter
 from runestone.agents.schemas import (
     ChatMessage,
+    ChatSummaryRefreshBatch,
+    ClaimedPostTurnJob,
     CoordinatorPlan,
     LearningMemorySignal,
+    PostTurnJobPayload,
     RoutingItem,
     TeacherGenerationResult,
     TeacherSideEffect,
@@ -25,6 +29,8 @@ from runestone.config import AgentLLMSettings, ReasoningLevel, Settings
 from runestone.model_costs.tracking import _bind_collector, _CostCollector, record_model_interaction
 from runestone.schemas.vocabulary_save import WordSaveCandidate
 from runestone.services.agent_side_effect_service import AgentSideEffectService
+from runestone.services.chat_session_learning_focus_service import LearningFocusSnapshot
+from runestone.services.learning_focus_cache import LearningFocusCache
 
 
 def _tracking_session(activity: str) -> _CostCollector:
@@ -40,6 +46,15 @@ def mock_settings():
     settings.teacher_backup_model = None
     settings.coordinator_model = "test-coordinator-model"
     settings.coordinator_provider = "openrouter"
+    settings.coordinator_pre_router_mode = "off"
+    settings.coordinator_pre_router_confidence = 0.9
+    settings.teacher_speculative_enabled = False
+    settings.teacher_hedging_enabled = False
+    settings.coordinator_hedging_enabled = False
+    settings.llm_circuit_breaker_enabled = False
+    settings.chat_summary_enabled = False
+    settings.teacher_context_token_budget = 0
+    settings.post_turn_queue_enabled = False
     settings.word_keeper_provider = "openrouter"
     settings.word_keeper_model = "test-model"
     settings.news_agent_provider = "openrouter"
@@ -48,6 +63,9 @@ def mock_settings():
     settings.memory_keeper_model = "test-model"
     settings.memory_maintainer_provider = "openrouter"
     settings.memory_maintainer_model = "test-memory-maintainer-model"
+    settings.memory_maintainer_bucketing = "llm"
+    settings.memory_maintainer_embedding_similarity_threshold = 0.7
+    settings.learning_focus_cache_enabled = False
     settings.memory_mastered_cleanup_days = 7
     settings.memory_maintenance_timeout_seconds = 240.0
     settings.agent_persona = "default"
@@ -120,10 +138,32 @@ def mock_settings():
             timeout_seconds=30.0,
             max_retries=3,
         ),
+        "chat_summarizer": AgentLLMSettings(
+            provider="openrouter",
+            model="test-model",
+            temperature=0.0,
+            reasoning_level=ReasoningLevel.NONE,
+            timeout_seconds=30.0,
+            max_retries=3,
+        ),
     }[agent_name]
     return settings
 
 
+@pytest.fixture(autouse=True)
+def memory_maintenance_lock():
+    """Grant the per-user maintenance lock without a database; set `available` to False to hold it elsewhere."""
+    lock = MagicMock(available=True)
+
+    @asynccontextmanager
+    async def _provide_lock(user_id):
+        lock(user_id)
+        yield lock.available
+
+    with patch("runestone.agents.manager.provide_memory_maintenance_lock", _provide_lock):
+        yield lock
+
+
 @pytest.fixture
 def mock_user():
     user = MagicMock()
@@ -277,6 +317,107 @@ async def test_process_turn_skips_stale_check_on_first_turn(
     manager.handle_stale_post_task.assert_not_awaited()
 
 
+@pytest.mark.anyio
+async def test_process_turn_speculative_hit_keeps_teacher_output_without_pre_results(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+    mock_side_effect_service,
+):
+    manager = _make_manager(mock_settings)
+    manager.teacher_speculative_enabled = True
+    manager.prepare_pre_turn = AsyncMock()
+    teacher_started = asyncio.Event()
+
+    async def _plan(**_kwargs):
+        await teacher_started.wait()
+        return _make_plan()
+
+    async def _teacher(**_kwargs):
+        teacher_started.set()
+        return ("Teacher says hi", None, "neutral", [], [])
+
+    manager.plan_pre_turn = AsyncMock(side_effect=_plan)
+    manager.generate_teacher_response = AsyncMock(side_effect=_teacher)
+    manager._run_specialists = AsyncMock()
+    manager.start_background_post_turn = AsyncMock()
+
+    response, _sources, _emotion = await manager.process_turn(
+        message="Hej!",
+        chat_id="chat-1",
+        history=[],
+        user=mock_user,
+        memory_item_service=mock_memory_item_service,
+        chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+        side_effect_service=mock_side_effect_service,
+        cost_tracking=_make_cost_tracking(),
+    )
+
+    assert response == "Teacher says hi"
+    manager.prepare_pre_turn.assert_not_awaited()
+    manager._run_specialists.assert_not_awaited()
+    manager.generate_teacher_response.assert_awaited_once()
+    assert manager.generate_teacher_response.await_args.kwargs["pre_results"] == []
+    assert manager.start_background_post_turn.await_args.kwargs["pre_results"] == []
+    assert manager.speculation_stats.attempts == 1
+    assert manager.speculation_stats.hits == 1
+
+
+@pytest.mark.anyio
+async def test_process_turn_speculative_miss_cancels_and_reruns_teacher_with_pre_results(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+    mock_side_effect_service,
+):
+    manager = _make_manager(mock_settings)
+    manager.teacher_speculative_enabled = True
+    speculative_started = asyncio.Event()
+    speculative_cancelled = asyncio.Event()
+    teacher_calls: list[list[dict]] = []
+
+    async def _plan(**_kwargs):
+        await speculative_started.wait()
+        return _make_plan(pre=[RoutingItem(name="word_keeper", reason="save")])
+
+    async def _teacher(**kwargs):
+        teacher_calls.append(kwargs["pre_results"])
+        if not kwargs["pre_results"]:
+            speculative_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                speculative_cancelled.set()
+                raise
+        return ("Saved it!", None, "happy", [], [])
+
+    pre_results = [{"name": "word_keeper", "result": {"status": "action_taken"}}]
+    manager.plan_pre_turn = AsyncMock(side_effect=_plan)
+    manager.generate_teacher_response = AsyncMock(side_effect=_teacher)
+    manager._run_specialists = AsyncMock(return_value=pre_results)
+    manager.start_background_post_turn = AsyncMock()
+
+    response, _sources, _emotion = await manager.process_turn(
+        message="Spara ordet begripa",
+        chat_id="chat-1",
+        history=[],
+        user=mock_user,
+        memory_item_service=mock_memory_item_service,
+        chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+        side_effect_service=mock_side_effect_service,
+        cost_tracking=_make_cost_tracking(),
+    )
+
+    assert response == "Saved it!"
+    assert speculative_cancelled.is_set()
+    assert teacher_calls == [[], pre_results]
+    assert manager.start_background_post_turn.await_args.kwargs["pre_results"] == pre_results
+    assert manager.speculation_stats.attempts == 1
+    assert manager.speculation_stats.hits == 0
+
+
 @pytest.mark.anyio
 async def test_start_background_memory_maintenance_runs_specialist_and_clears_registry(mock_settings, mock_user):
     manager = _make_manager(mock_settings)
@@ -459,6 +600,109 @@ async def test_start_background_memory_maintenance_skips_duplicate_run(mock_sett
     await task
 
 
+@pytest.mark.anyio
+async def test_run_memory_maintenance_skips_user_locked_by_scheduled_sweep(
+    mock_settings, mock_user, memory_maintenance_lock
+):
+    manager = _make_manager(mock_settings)
+    manager.memory_maintainer.run_for_user = AsyncMock()
+    memory_maintenance_lock.available = False
+
+    result = await manager.run_memory_maintenance(mock_user)
+
+    assert result.status == "no_action"
+    assert result.artifacts == {"skipped_reason": "already_running"}
+    memory_maintenance_lock.assert_called_once_with(mock_user.id)
+    manager.memory_maintainer.run_for_user.assert_not_awaited()
+
+
+def _enable_chat_summary(mock_settings):
+    mock_settings.chat_summary_enabled = True
+    mock_settings.chat_summary_live_window_messages = 4
+    mock_settings.chat_summary_batch_messages = 6
+    mock_settings.chat_summarizer_provider = "openrouter"
+    mock_settings.chat_summarizer_model = "test-model"
+
+
+def test_start_background_chat_summary_is_noop_when_disabled(mock_settings):
+    manager = _make_manager(mock_settings)
+
+    assert manager.chat_summarizer is None
+    assert manager.start_background_chat_summary(1, "chat-1") is False
+
+
+@pytest.mark.anyio
+async def test_refresh_chat_summary_folds_batch_and_saves_through_last_message(mock_settings):
+    _enable_chat_summary(mock_settings)
+    manager = _make_manager(mock_settings)
+    batch = ChatSummaryRefreshBatch(
+        summary="Earlier summary",
+        messages=[
+            ChatMessage(id=11, role="user", content="Hej"),
+            ChatMessage(id=12, role="assistant", content="Hej hej"),
+        ],
+    )
+    summary_service = MagicMock()
+    summary_service.load_refresh_batch = AsyncMock(return_value=batch)
+    summary_service.save_summary = AsyncMock(return_value=True)
+    manager.chat_summarizer.summarize = AsyncMock(return_value="Updated summary")
+
+    @asynccontextmanager
+    async def _provider():
+        yield summary_service
+
+    with patch("runestone.agents.manager.provide_chat_summary_service", _provider):
+        assert await manager.refresh_chat_summary(user_id=1, chat_id="chat-1") is True
+
+    summary_service.load_refresh_batch.assert_awaited_once_with(1, "chat-1", live_window=4, min_messages=6)
+    manager.chat_summarizer.summarize.assert_awaited_once_with("Earlier summary", batch.messages)
+    summary_service.save_summary.assert_awaited_once_with(1, "chat-1", "Updated summary", 12)
+
+
+@pytest.mark.anyio
+async def test_refresh_chat_summary_skips_save_when_summarizer_fails(mock_settings):
+    _enable_chat_summary(mock_settings)
+    manager = _make_manager(mock_settings)
+    summary_service = MagicMock()
+    summary_service.load_refresh_batch = AsyncMock(
+        return_value=ChatSummaryRefreshBatch(messages=[ChatMessage(id=3, role="user", content="Hej")])
+    )
+    summary_service.save_summary = AsyncMock()
+    manager.chat_summarizer.summarize = AsyncMock(return_value=None)
+
+    @asynccontextmanager
+    async def _provider():
+        yield summary_service
+
+    with patch("runestone.agents.manager.provide_chat_summary_service", _provider):
+        assert await manager.refresh_chat_summary(user_id=1, chat_id="chat-1") is False
+
+    summary_service.save_summary.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_start_background_chat_summary_skips_duplicate_run(mock_settings):
+    _enable_chat_summary(mock_settings)
+    manager = _make_manager(mock_settings)
+    gate = asyncio.Event()
+
+    async def _wait_for_gate(**_kwargs):
+        await gate.wait()
+        return True
+
+    manager.refresh_chat_summary = AsyncMock(side_effect=_wait_for_gate)
+
+    assert manager.start_background_chat_summary(1, "chat-1") is True
+    await asyncio.sleep(0)
+    assert manager.start_background_chat_summary(1, "chat-1") is False
+
+    task = manager._chat_summary_registry.tasks["chat-1"]
+    gate.set()
+    await task
+    manager.refresh_chat_summary.assert_awaited_once_with(user_id=1, chat_id="chat-1")
+    assert "chat-1" not in manager._chat_summary_registry.tasks
+
+
 @pytest.mark.anyio
 async def test_start_background_memory_maintenance_clears_registry_on_failure(mock_settings, mock_user, caplog):
     manager = _make_manager(mock_settings)
@@ -564,6 +808,61 @@ async def test_prepare_pre_turn_delegates_to_coordinator(
     assert current_recall_words == []
 
 
+@pytest.mark.anyio
+async def test_prepare_pre_turn_active_pre_router_skips_coordinator_on_trivial_turn(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+    mock_side_effect_service,
+):
+    manager = _make_manager(mock_settings)
+    manager.pre_router = PreTurnRouter(mode="active")
+    manager.coordinator.plan_pre_turn = AsyncMock(return_value=_make_plan())
+
+    plan, pre_results, *_rest = await manager.prepare_pre_turn(
+        message="Tack så mycket!",
+        chat_id="chat-1",
+        history=[],
+        user=mock_user,
+        memory_item_service=mock_memory_item_service,
+        chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+        side_effect_service=mock_side_effect_service,
+    )
+
+    manager.coordinator.plan_pre_turn.assert_not_awaited()
+    assert plan.pre_response == []
+    assert plan.audit["pre_router"] == "small_talk"
+    assert pre_results == []
+
+
+@pytest.mark.anyio
+async def test_prepare_pre_turn_shadow_pre_router_still_uses_coordinator_plan(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+    mock_side_effect_service,
+):
+    manager = _make_manager(mock_settings)
+    manager.pre_router = PreTurnRouter(mode="shadow")
+    manager.coordinator.plan_pre_turn = AsyncMock(return_value=_make_plan())
+
+    await manager.prepare_pre_turn(
+        message="Hej!",
+        chat_id="chat-1",
+        history=[],
+        user=mock_user,
+        memory_item_service=mock_memory_item_service,
+        chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+        side_effect_service=mock_side_effect_service,
+    )
+
+    manager.coordinator.plan_pre_turn.assert_awaited_once()
+    assert manager.pre_router.stats.shadow_compared == 1
+    assert manager.pre_router.stats.shadow_false_skips == 0
+
+
 @pytest.mark.anyio
 async def test_prepare_pre_turn_runs_cleanup_on_first_turn(
     mock_settings,
@@ -2119,6 +2418,122 @@ async def test_start_background_post_turn_creates_task(mock_settings, mock_user,
         assert "chat-1" not in manager._post_task_registry.tasks
 
 
+@pytest.mark.anyio
+async def test_start_background_post_turn_enqueues_job_when_queue_enabled(mock_settings, mock_user):
+    mock_settings.post_turn_queue_enabled = True
+    manager = _make_manager(mock_settings)
+    manager.run_post_turn = AsyncMock()
+    operation = _tracking_session("chat_turn")
+    child = operation.transfer("post_turn")
+    job_service = MagicMock()
+    job_service.enqueue = AsyncMock(return_value=7)
+
+    @asynccontextmanager
+    async def _provider():
+        yield job_service
+
+    with patch("runestone.agents.manager.provide_post_turn_job_service", _provider):
+        await manager.start_background_post_turn(
+            message="Hello",
+            chat_id="chat-1",
+            history=[ChatMessage(role="user", content="Hej")],
+            user=mock_user,
+            teacher_response="Hi!",
+            vocabulary_candidates=[],
+            learning_memory_signals=[],
+            pre_results=[{"name": "word_keeper", "status": "action_taken"}],
+            coordinator_row_id=42,
+            cost_tracking=child,
+        )
+
+    kwargs = job_service.enqueue.await_args.kwargs
+    assert kwargs["chat_id"] == "chat-1"
+    assert kwargs["coordinator_row_id"] == 42
+    assert kwargs["payload"].teacher_response == "Hi!"
+    assert kwargs["payload"].pre_results == [{"name": "word_keeper", "status": "action_taken"}]
+    assert child.status == "deferred_to_worker"
+    assert "chat-1" not in manager._post_task_registry.tasks
+    manager.run_post_turn.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_start_background_post_turn_runs_in_process_when_enqueue_fails(
+    mock_settings,
+    mock_user,
+    mock_side_effect_service,
+):
+    mock_settings.post_turn_queue_enabled = True
+    manager = _make_manager(mock_settings)
+    manager.run_post_turn = AsyncMock(return_value="completed")
+    job_service = MagicMock()
+    job_service.enqueue = AsyncMock(return_value=None)
+
+    @asynccontextmanager
+    async def _job_provider():
+        yield job_service
+
+    @asynccontextmanager
+    async def _provider():
+        yield mock_side_effect_service
+
+    with (
+        patch("runestone.agents.manager.provide_post_turn_job_service", _job_provider),
+        patch("runestone.agents.manager.provide_agent_side_effect_service", _provider),
+    ):
+        await manager.start_background_post_turn(
+            message="Hello",
+            chat_id="chat-1",
+            history=[],
+            user=mock_user,
+            teacher_response="Hi!",
+            vocabulary_candidates=[],
+            learning_memory_signals=[],
+            pre_results=[],
+            coordinator_row_id=42,
+            cost_tracking=_make_cost_tracking(),
+        )
+        await manager._post_task_registry.tasks["chat-1"]
+
+    manager.run_post_turn.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_run_post_turn_job_marks_row_failed_on_cancellation(mock_settings, mock_user, mock_side_effect_service):
+    manager = _make_manager(mock_settings)
+    started = asyncio.Event()
+
+    async def _slow_post_turn(**_kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    manager.run_post_turn = AsyncMock(side_effect=_slow_post_turn)
+    job = ClaimedPostTurnJob(
+        id=3,
+        user_id=mock_user.id,
+        chat_id="chat-1",
+        coordinator_row_id=42,
+        attempts=1,
+        payload=PostTurnJobPayload(message="Hello", teacher_response="Hi!"),
+    )
+
+    @asynccontextmanager
+    async def _provider():
+        yield mock_side_effect_service
+
+    with patch("runestone.agents.manager.provide_agent_side_effect_service", _provider):
+        task = asyncio.create_task(manager.run_post_turn_job(job, mock_user))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    mock_side_effect_service.mark_coordinator_failed_if_current.assert_awaited_once_with(
+        row_id=42,
+        user_id=mock_user.id,
+        chat_id="chat-1",
+    )
+
+
 @pytest.mark.anyio
 async def test_background_post_turn_activates_and_closes_typed_child(
     mock_settings,
@@ -2663,6 +3078,46 @@ async def test_recent_side_effects_loaded_in_pre_turn(
     mock_side_effect_service.load_recent_for_teacher.assert_awaited_once_with(user_id=mock_user.id, chat_id="chat-1")
 
 
+@pytest.mark.anyio
+async def test_prepare_pre_turn_uses_preloaded_turn_context(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+    mock_side_effect_service,
+):
+    manager = _make_manager(mock_settings)
+    manager.coordinator.plan_pre_turn = AsyncMock(return_value=_make_plan())
+    mock_chat_session_learning_focus_service.get_chat_session_learning_focus.return_value = ([], False)
+    snapshot = LearningFocusSnapshot(item_ids_json="[]", items=[])
+    preloaded_side_effects = [
+        TeacherSideEffect(name="word_keeper", phase="post_response", status="action_taken", info_for_teacher="Saved.")
+    ]
+
+    _plan, _pre, _active_learning_focus_memory, _personal_info_summary, recent, _current_recall_words = (
+        await manager.prepare_pre_turn(
+            message="Hello",
+            chat_id="chat-1",
+            history=[],
+            user=mock_user,
+            memory_item_service=mock_memory_item_service,
+            chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+            side_effect_service=mock_side_effect_service,
+            learning_focus=snapshot,
+            recent_side_effects=preloaded_side_effects,
+        )
+    )
+
+    assert recent == preloaded_side_effects
+    mock_side_effect_service.load_recent_for_teacher.assert_not_awaited()
+    mock_chat_session_learning_focus_service.get_chat_session_learning_focus.assert_awaited_once_with(
+        user_id=mock_user.id,
+        chat_id="chat-1",
+        area_limit=manager.STARTER_MEMORY_AREA_LIMIT,
+        snapshot=snapshot,
+    )
+
+
 @pytest.mark.anyio
 async def test_prepare_pre_turn_loads_active_learning_focus_memory_on_first_turn(
     mock_settings,
@@ -2768,6 +3223,76 @@ async def test_prepare_pre_turn_includes_session_focus_note_when_batch_reseeded(
     assert "The previous learning batch is complete" in active_learning_focus_memory
 
 
+@pytest.mark.anyio
+async def test_load_teacher_context_serves_cached_focus_until_memory_changes(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+):
+    mock_settings.learning_focus_cache_enabled = True
+    manager = _make_manager(mock_settings)
+    cache = LearningFocusCache()
+    starter_item = MagicMock(
+        id=1,
+        category="area_to_improve",
+        key="goal",
+        content="Practice",
+        status="struggling",
+        priority=None,
+        created_at=MagicMock(isoformat=lambda: "2026-02-11T00:00:00+00:00"),
+        updated_at=MagicMock(isoformat=lambda: "2026-02-11T00:00:00+00:00"),
+        status_changed_at=None,
+    )
+    mock_chat_session_learning_focus_service.get_chat_session_learning_focus.return_value = ([starter_item], False)
+    history = [ChatMessage(role="user", content="prev")]
+
+    async def _load() -> str:
+        focus, _summary = await manager.load_teacher_context(
+            chat_id="chat-1",
+            history=history,
+            user=mock_user,
+            memory_item_service=mock_memory_item_service,
+            chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+        )
+        return focus
+
+    with patch("runestone.agents.manager.learning_focus_cache", cache):
+        first = await _load()
+        second = await _load()
+        cache.invalidate_user(mock_user.id)
+        third = await _load()
+
+    assert first == second == third
+    assert first.startswith("UNTRUSTED_ACTIVE_LEARNING_FOCUS")
+    assert mock_chat_session_learning_focus_service.get_chat_session_learning_focus.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_load_teacher_context_does_not_cache_reseeded_focus(
+    mock_settings,
+    mock_user,
+    mock_memory_item_service,
+    mock_chat_session_learning_focus_service,
+):
+    mock_settings.learning_focus_cache_enabled = True
+    manager = _make_manager(mock_settings)
+    cache = LearningFocusCache()
+    mock_chat_session_learning_focus_service.get_chat_session_learning_focus.return_value = ([], True)
+
+    with patch("runestone.agents.manager.learning_focus_cache", cache):
+        focus, _summary = await manager.load_teacher_context(
+            chat_id="chat-1",
+            history=[ChatMessage(role="user", content="prev")],
+            user=mock_user,
+            memory_item_service=mock_memory_item_service,
+            chat_session_learning_focus_service=mock_chat_session_learning_focus_service,
+        )
+
+    assert "[SESSION_FOCUS_NOTE]" in focus
+    assert not cache.contains(mock_user.id, "chat-1")
+
+
 @pytest.mark.anyio
 async def test_prepare_pre_turn_loads_current_recall_words_on_first_turn(
     mock_settings,
@@ -0,0 +1,170 @@
+import asyncio
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runestone.agents.memory_maintenance_scheduler import MemoryMaintenanceSweep
+from runestone.agents.specialists.base import SpecialistResult
+from runestone.services.memory_maintenance_run_service import MaintenanceCandidate
+
+
+@pytest.fixture
+def run_service():
+    service = MagicMock()
+    service.list_candidates = AsyncMock(
+        return_value=[
+            MaintenanceCandidate(user_id=1, item_growth=12),
+            MaintenanceCandidate(user_id=2, item_growth=8),
+            MaintenanceCandidate(user_id=3, item_growth=5),
+        ]
+    )
+    service.record = AsyncMock(return_value=True)
+    return service
+
+
+@pytest.fixture
+def user_service():
+    service = MagicMock()
+    service.get_user_by_id = AsyncMock(side_effect=lambda user_id: SimpleNamespace(id=user_id))
+    return service
+
+
+@pytest.fixture
+def maintainer():
+    maintainer = MagicMock()
+    maintainer.run_for_user = AsyncMock(
+        return_value=SpecialistResult(
+            status="action_taken", actions=[], info_for_teacher="", artifacts={"summary": "ok"}
+        )
+    )
+    return maintainer
+
+
+@pytest.fixture
+def run_costs():
+    """Known cost each run reports, keyed by user id."""
+    return {}
+
+
+@pytest.fixture
+def locked_users():
+    """User ids whose maintenance lock another run already holds."""
+    return set()
+
+
+@pytest.fixture(autouse=True)
+def patched_providers(run_service, user_service, run_costs, locked_users):
+    @asynccontextmanager
+    async def _run_provider():
+        yield run_service
+
+    @asynccontextmanager
+    async def _lock_provider(user_id):
+        yield user_id not in locked_users
+
+    @asynccontextmanager
+    async def _user_provider():
+        yield user_service
+
+    with (
+        patch("runestone.agents.memory_maintenance_scheduler.provide_memory_maintenance_run_service", _run_provider),
+        patch("runestone.agents.memory_maintenance_scheduler.provide_user_service", _user_provider),
+        patch("runestone.agents.memory_maintenance_scheduler.provide_memory_maintenance_lock", _lock_provider),
+        patch(
+            "runestone.agents.memory_maintenance_scheduler.current_known_cost_usd",
+            side_effect=lambda: run_costs.get("last"),
+        ),
+    ):
+        yield
+
+
+def _recorded(run_service) -> list[tuple[int, str]]:
+    return [(call.args[0].user_id, call.args[0].status) for call in run_service.record.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_sweep_maintains_candidates_in_growth_order_and_records_outcomes(maintainer, run_service, user_service):
+    user_service.get_user_by_id.side_effect = lambda user_id: None if user_id == 2 else SimpleNamespace(id=user_id)
+    sweep = MemoryMaintenanceSweep(maintainer, min_growth=5, max_users=10, concurrency=1)
+
+    report = await sweep.run()
+
+    run_service.list_candidates.assert_awaited_once_with(min_growth=5, limit=10)
+    assert [call.kwargs["trigger_source"] for call in maintainer.run_for_user.await_args_list] == ["scheduled"] * 2
+    assert _recorded(run_service) == [(1, "action_taken"), (2, "user_not_found"), (3, "action_taken")]
+    first = run_service.record.await_args_list[0].args[0]
+    assert first.item_growth == 12
+    assert first.summary == "ok"
+    assert report.candidate_count == 3
+    assert report.skipped_for_budget == []
+
+
+@pytest.mark.asyncio
+async def test_sweep_stops_starting_runs_once_budget_is_spent(maintainer, run_service, run_costs):
+    run_costs["last"] = Decimal("0.6")
+    sweep = MemoryMaintenanceSweep(maintainer, concurrency=1, budget_usd=Decimal("1.0"))
+
+    report = await sweep.run()
+
+    assert _recorded(run_service) == [(1, "action_taken"), (2, "action_taken")]
+    assert report.skipped_for_budget == [3]
+    assert report.known_cost_usd == Decimal("1.2")
+
+
+@pytest.mark.asyncio
+async def test_sweep_caps_concurrent_runs(maintainer, run_service):
+    in_flight = 0
+    peak = 0
+
+    async def _run(user, *, trigger_source):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SpecialistResult(status="no_action", actions=[], info_for_teacher="", artifacts={})
+
+    maintainer.run_for_user = AsyncMock(side_effect=_run)
+    sweep = MemoryMaintenanceSweep(maintainer, concurrency=2)
+
+    report = await sweep.run()
+
+    assert peak == 2
+    assert len(report.outcomes) == 3
+
+
+@pytest.mark.asyncio
+async def test_sweep_records_timeouts_and_failures(maintainer, run_service, run_costs):
+    run_costs["last"] = Decimal("0.01")
+
+    async def _run(user, *, trigger_source):
+        if user.id == 1:
+            await asyncio.sleep(1)
+        if user.id == 2:
+            raise RuntimeError("provider down")
+        return SpecialistResult(status="no_action", actions=[], info_for_teacher="", artifacts={})
+
+    maintainer.run_for_user = AsyncMock(side_effect=_run)
+    sweep = MemoryMaintenanceSweep(maintainer, concurrency=3, timeout_seconds=0.05)
+
+    await sweep.run()
+
+    assert sorted(_recorded(run_service)) == [(1, "timed_out"), (2, "failed"), (3, "no_action")]
+    outcomes = {call.args[0].user_id: call.args[0] for call in run_service.record.await_args_list}
+    assert outcomes[1].known_cost_usd == Decimal("0.01")
+    assert outcomes[2].summary == "provider down"
+
+
+@pytest.mark.asyncio
+async def test_sweep_skips_users_already_being_maintained(maintainer, run_service, locked_users):
+    locked_users.add(2)
+    sweep = MemoryMaintenanceSweep(maintainer, concurrency=1)
+
+    report = await sweep.run()
+
+    assert [call.args[0].id for call in maintainer.run_for_user.await_args_list] == [1, 3]
+    assert _recorded(run_service) == [(1, "action_taken"), (3, "action_taken")]
+    assert report.skipped_in_progress == [2]
@@ -0,0 +1,140 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from runestone.agents.post_turn_worker import PostTurnWorker
+from runestone.agents.schemas import ClaimedPostTurnJob, PostTurnJobPayload
+
+
+def _job(job_id: int = 1) -> ClaimedPostTurnJob:
+    return ClaimedPostTurnJob(
+        id=job_id,
+        user_id=5,
+        chat_id="chat-1",
+        coordinator_row_id=42,
+        attempts=1,
+        payload=PostTurnJobPayload(message="Hej", teacher_response="Hej hej!"),
+    )
+
+
+@pytest.fixture
+def job_service():
+    service = MagicMock()
+    service.claim = AsyncMock(return_value=[])
+    service.heartbeat = AsyncMock(return_value="running")
+    service.finish = AsyncMock(return_value=True)
+    service.release_expired = AsyncMock(return_value=0)
+    return service
+
+
+@pytest.fixture
+def user_service():
+    service = MagicMock()
+    service.get_user_by_id = AsyncMock(return_value=MagicMock(id=5))
+    return service
+
+
+@pytest.fixture
+def patched_providers(job_service, user_service):
+    @asynccontextmanager
+    async def _job_provider():
+        yield job_service
+
+    @asynccontextmanager
+    async def _user_provider():
+        yield user_service
+
+    with (
+        patch("runestone.agents.post_turn_worker.provide_post_turn_job_service", _job_provider),
+        patch("runestone.agents.post_turn_worker.provide_user_service", _user_provider),
+    ):
+        yield
+
+
+@pytest.mark.anyio
+async def test_execute_records_manager_status(job_service, patched_providers):
+    manager = MagicMock()
+    manager.run_post_turn_job = AsyncMock(return_value="completed")
+    worker = PostTurnWorker(manager, worker_id="worker-a")
+
+    status = await worker.execute(_job())
+
+    assert status == "completed"
+    manager.run_post_turn_job.assert_awaited_once()
+    job_service.finish.assert_awaited_once_with(1, "worker-a", "completed", error=None)
+
+
+@pytest.mark.anyio
+async def test_execute_cancels_job_superseded_by_newer_turn(job_service, patched_providers):
+    cancelled = asyncio.Event()
+
+    async def _slow_run(_job, _user):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    manager = MagicMock()
+    manager.run_post_turn_job = AsyncMock(side_effect=_slow_run)
+    job_service.heartbeat.return_value = "stale_replaced"
+    worker = PostTurnWorker(manager, worker_id="worker-a", lease_seconds=0.03)
+
+    status = await worker.execute(_job())
+
+    assert status == "stale_replaced"
+    assert cancelled.is_set()
+    job_service.finish.assert_awaited_once_with(1, "worker-a", "stale_replaced", error=None)
+
+
+@pytest.mark.anyio
+async def test_execute_fails_job_for_missing_user(job_service, user_service, patched_providers):
+    manager = MagicMock()
+    manager.run_post_turn_job = AsyncMock()
+    user_service.get_user_by_id.return_value = None
+    worker = PostTurnWorker(manager, worker_id="worker-a")
+
+    assert await worker.execute(_job()) == "failed"
+    manager.run_post_turn_job.assert_not_awaited()
+    job_service.finish.assert_awaited_once_with(1, "worker-a", "failed", error="user not found")
+
+
+@pytest.mark.anyio
+async def test_run_once_claims_only_free_slots(job_service, patched_providers):
+    release = asyncio.Event()
+
+    async def _blocked_run(_job, _user):
+        await release.wait()
+        return "completed"
+
+    manager = MagicMock()
+    manager.run_post_turn_job = AsyncMock(side_effect=_blocked_run)
+    job_service.claim.return_value = [_job(1), _job(2)]
+    worker = PostTurnWorker(manager, worker_id="worker-a", concurrency=3)
+
+    assert await worker.run_once() == 2
+    job_service.claim.assert_awaited_once_with(worker_id="worker-a", limit=3)
+
+    job_service.claim.return_value = []
+    await worker.run_once()
+    assert job_service.claim.await_args.kwargs["limit"] == 1
+
+    release.set()
+    await asyncio.gather(*worker._tasks)
+
+
+@pytest.mark.anyio
+async def test_run_stops_on_shutdown(job_service, patched_providers):
+    worker = PostTurnWorker(MagicMock(), worker_id="worker-a", poll_interval_seconds=0.01)
+    shutdown_event = asyncio.Event()
+
+    async def _stop_soon():
+        await asyncio.sleep(0.03)
+        shutdown_event.set()
+
+    await asyncio.gather(worker.run(shutdown_event), _stop_soon())
+
+    assert job_service.claim.await_count >= 1
+    job_service.release_expired.assert_awaited()
@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+
+from runestone.agents.pre_router import PreTurnRouter
+from runestone.agents.schemas import ChatMessage, CoordinatorPlan, RoutingItem
+
+
+@pytest.mark.parametrize(
+    "message",
+    ["Hej!", "Tack så mycket", "ok", "Jag bor i Malmö.", "en katt, två katter"],
+)
+def test_router_skips_trivial_turns(message):
+    decision = PreTurnRouter().decide(message, history=[])
+
+    assert decision.skip_coordinator is True
+    assert decision.confidence >= 0.9
+
+
+@pytest.mark.parametrize(
+    ("message", "reason"),
+    [
+        ("Spara ordet begripa", "trigger_word"),
+        ("Can you save these words: beskriva, bekräfta", "trigger_word"),
+        ("Finns det några nyheter om Sverige?", "trigger_word"),
+        ("Läs https://example.com", "url"),
+        ("What is going on in Ukraine?", "question"),
+        ("Hur går valet i USA", "question"),
+        ("Сохрани это слово", "non_latin_script"),
+        ("", "empty_message"),
+    ],
+)
+def test_router_defers_possible_specialist_turns(message, reason):
+    decision = PreTurnRouter().decide(message, history=[])
+
+    assert decision.skip_coordinator is False
+    assert decision.reason == reason
+
+
+def test_router_defers_short_answer_to_teacher_news_offer():
+    history = [ChatMessage(role="assistant", content="Vilka nyheter vill du läsa om?")]
+
+    decision = PreTurnRouter().decide("Teknik", history=history)
+
+    assert decision.skip_coordinator is False
+    assert decision.reason == "teacher_offered_specialist"
+
+
+def test_router_threshold_gates_longer_messages():
+    message = "Igår åt jag middag med min syster och vi pratade länge om jobbet"
+
+    assert PreTurnRouter(confidence_threshold=0.9).decide(message, history=[]).skip_coordinator is False
+    assert PreTurnRouter(confidence_threshold=0.8).decide(message, history=[]).skip_coordinator is True
+
+
+def test_shadow_comparison_counts_false_skips(caplog):
+    caplog.set_level(logging.INFO)
+    router = PreTurnRouter(mode="shadow")
+    decision = router.decide("Hej!", history=[])
+    plan = CoordinatorPlan(pre_response=[RoutingItem(name="word_keeper", reason="save request")])
+
+    router.record_shadow(decision, plan, user_id=7)
+
+    assert router.stats.shadow_compared == 1
+    assert router.stats.shadow_false_skips == 1
+    assert router.stats.shadow_skip_precision == 0.0
+    assert "false_skip=True" in caplog.text
+    assert "coordinator_specialists=word_keeper" in caplog.text
@@ -2,6 +2,7 @@
 Tests for the TeacherAgent specialist.
 """
 
+import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +13,13 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langgraph.errors import GraphRecursionError
 from pydantic import ValidationError
 
+from runestone.agents.circuit_breaker import (
+    CircuitBinding,
+    CircuitBreakerMiddleware,
+    CircuitBreakerPolicy,
+    circuit_breaker_registry,
+)
+from runestone.agents.hedging import HedgedModelMiddleware
 from runestone.agents.schemas import ChatMessage, LearningMemorySignal, TeacherOutput, TeacherSideEffect
 from runestone.agents.specialists.base import INFO_FOR_TEACHER_MAX_CHARS
 from runestone.agents.specialists.teacher import TeacherAgent
@@ -33,6 +41,9 @@ def mock_settings():
     settings.allowed_origins = "http://localhost:5173"
     settings.teacher_backup_provider = "gemini"
     settings.teacher_backup_model = None
+    settings.teacher_hedging_enabled = False
+    settings.llm_circuit_breaker_enabled = False
+    settings.teacher_context_token_budget = 0
     settings.get_agent_llm_settings.return_value = AgentLLMSettings(
         provider="openrouter",
         model="test-model",
@@ -353,10 +364,10 @@ async def test_run_with_history(teacher_agent, mock_user):
     invoke_args = teacher_agent.agent.ainvoke.call_args[0][0]
     messages = invoke_args["messages"]
     assert len(messages) == 4
-    assert "[CURRENT_DATETIME]" in messages[0].content
-    assert messages[1].content == "Old user msg"
-    assert "[REFERENCE_SOURCES]" in messages[2].content
-    assert "Old bot msg" in messages[2].content
+    assert messages[0].content == "Old user msg"
+    assert "[REFERENCE_SOURCES]" in messages[1].content
+    assert "Old bot msg" in messages[1].content
+    assert "[CURRENT_DATETIME]" in messages[2].content
     assert messages[3].content == "Current msg"
 
 
@@ -558,6 +569,58 @@ async def test_run_with_personal_info_summary(teacher_agent, mock_user):
     assert any(isinstance(m, SystemMessage) and "[PERSONAL_INFO_SUMMARY]" in m.content for m in messages)
 
 
+@pytest.mark.anyio
+async def test_run_with_chat_summary_precedes_history(teacher_agent, mock_user):
+    teacher_agent.agent.ainvoke.return_value = {"messages": [AIMessage(content="Response")]}
+
+    await teacher_agent.generate_response(
+        message="msg",
+        history=[ChatMessage(role="user", content="Recent message")],
+        user=mock_user,
+        chat_summary="Practised past tense; the student mixes up 'var' and 'blev'.",
+    )
+
+    messages = teacher_agent.agent.ainvoke.call_args[0][0]["messages"]
+    summary_index = next(
+        index
+        for index, message in enumerate(messages)
+        if isinstance(message, SystemMessage) and message.content.startswith("[CONVERSATION_SUMMARY]")
+    )
+    history_index = next(index for index, message in enumerate(messages) if message.content == "Recent message")
+    assert summary_index < history_index
+    assert "'var' and 'blev'" in messages[summary_index].content
+
+
+@pytest.mark.anyio
+async def test_generate_response_trims_context_to_token_budget(teacher_agent, mock_user, caplog):
+    mock_user.mother_tongue = None
+    teacher_agent.settings.teacher_context_token_budget = 60
+    teacher_agent.token_counter = MagicMock()
+    teacher_agent.token_counter.count_message.side_effect = lambda message: len(message.text.split())
+    teacher_agent.agent.ainvoke.return_value = {"messages": [AIMessage(content="Response")]}
+    history = [ChatMessage(role="user", content=" ".join([f"old{i}"] * 20)) for i in range(3)]
+    history.append(ChatMessage(role="assistant", content="latest reply"))
+
+    with caplog.at_level(logging.INFO):
+        await teacher_agent.generate_response(
+            message="msg",
+            history=history,
+            user=mock_user,
+            active_learning_focus_memory="Focus on word order.",
+            current_recall_words=["hund", "katt"],
+        )
+
+    messages = teacher_agent.agent.ainvoke.call_args[0][0]["messages"]
+    contents = [message.content for message in messages]
+    assert not any("[CURRENT_RECALL_WORDS]" in content for content in contents)
+    assert not any(content.startswith("old0") or content.startswith("old1") for content in contents)
+    assert any(content.startswith("old2") for content in contents)
+    assert any("[ACTIVE_LEARNING_FOCUS]" in content for content in contents)
+    assert contents[-1] == "msg"
+    assert "Context tokens user_id=" in caplog.text
+    assert "trimmed=history:40,current_recall_words:24" in caplog.text
+
+
 @pytest.mark.anyio
 async def test_run_with_current_recall_words(teacher_agent, mock_user):
     teacher_agent.agent.ainvoke.return_value = {"messages": [AIMessage(content="Response")]}
@@ -792,6 +855,36 @@ async def test_generate_response_prompt_matches_fixture(teacher_agent, mock_user
     assert len(actual_prompt) > 0
 
 
+@pytest.mark.anyio
+async def test_generate_response_keeps_cacheable_prefix_stable_across_turns(teacher_agent, mock_user):
+    mock_user.mother_tongue = "Spanish"
+    history = [ChatMessage(role="user", content="Hej"), ChatMessage(role="assistant", content="Hej hej!")]
+    teacher_agent.agent.ainvoke.return_value = {"messages": [AIMessage(content="Response")]}
+
+    await teacher_agent.generate_response(
+        message="first",
+        history=history,
+        user=mock_user,
+        personal_info_summary="Lives in Malmö.",
+        current_recall_words=["hej"],
+    )
+    await teacher_agent.generate_response(
+        message="second",
+        history=history,
+        user=mock_user,
+        personal_info_summary="Lives in Malmö.",
+        current_recall_words=["tack"],
+        pre_results=[{"name": "word_keeper", "result": {"status": "no_action", "info_for_teacher": ""}}],
+    )
+
+    first_messages, second_messages = (
+        _serialize_messages(call.args[0]["messages"][:4]) for call in teacher_agent.agent.ainvoke.call_args_list
+    )
+    assert first_messages == second_messages
+    assert "[CURRENT_DATETIME]" not in first_messages
+    assert "[CURRENT_RECALL_WORDS]" not in first_messages
+
+
 @pytest.mark.anyio
 async def test_generate_response_passes_recursion_limit(teacher_agent, mock_user):
     """Test that recursion_limit is passed in the config dict to agent.ainvoke()."""
@@ -1088,6 +1181,51 @@ def test_teacher_build_agent_with_backup_middleware(mock_settings, mock_chat_mod
             assert middleware[-1].models[0] == mock_backup_model
 
 
+def test_teacher_build_agent_with_hedging_hedges_to_backup_model(mock_settings, mock_chat_model):
+    """Verify hedging is the innermost middleware and targets the backup model."""
+    mock_settings.teacher_backup_model = "gemini-2.5-flash"
+    mock_settings.teacher_hedging_enabled = True
+    mock_settings.llm_hedge_percentile = 0.9
+    mock_settings.llm_hedge_min_samples = 20
+    mock_settings.llm_hedge_min_delay_seconds = 0.5
+    mock_backup_model = MagicMock()
+
+    def mock_build(settings, agent_name):
+        return mock_backup_model if agent_name == "teacher_backup" else MagicMock()
+
+    with patch("runestone.agents.specialists.teacher.build_chat_model", side_effect=mock_build):
+        with patch("runestone.agents.specialists.teacher.create_agent") as mock_create_agent:
+            TeacherAgent(mock_settings)
+
+    middleware = mock_create_agent.call_args[1]["middleware"]
+    assert isinstance(middleware[-2], ModelFallbackMiddleware)
+    assert isinstance(middleware[-1], HedgedModelMiddleware)
+    assert middleware[-1].hedge_model is mock_backup_model
+    assert middleware[-1].policy.percentile == 0.9
+
+
+def test_teacher_build_agent_with_circuit_breaker_replaces_model_fallback(mock_settings, mock_chat_model):
+    """Verify a breaker-bound teacher model routes through CircuitBreakerMiddleware instead of fallback."""
+    mock_settings.teacher_backup_model = "gemini-2.5-flash"
+    teacher_model = MagicMock()
+    mock_backup_model = MagicMock()
+    circuit_breaker_registry.bind(
+        teacher_model,
+        CircuitBinding(("openrouter", "test-model"), CircuitBreakerPolicy(), fallback=mock_backup_model),
+    )
+
+    def mock_build(settings, agent_name):
+        return mock_backup_model if agent_name == "teacher_backup" else teacher_model
+
+    with patch("runestone.agents.specialists.teacher.build_chat_model", side_effect=mock_build):
+        with patch("runestone.agents.specialists.teacher.create_agent") as mock_create_agent:
+            TeacherAgent(mock_settings)
+
+    middleware = mock_create_agent.call_args[1]["middleware"]
+    assert not any(isinstance(item, ModelFallbackMiddleware) for item in middleware)
+    assert isinstance(middleware[-1], CircuitBreakerMiddleware)
+
+
 def test_teacher_build_agent_without_backup_middleware(mock_settings, mock_chat_model):
     """Verify ModelFallbackMiddleware is not present if backup is not configured."""
     mock_settings.teacher_backup_model = None
@@ -0,0 +1,76 @@
+"""
+Tests for the per-turn token budget allocator.
+"""
+
+import logging
+
+from langchain_core.messages import HumanMessage
+
+from runestone.agents import token_budget
+from runestone.agents.token_budget import MESSAGE_OVERHEAD_TOKENS, ContextSection, TokenBudget, TokenCounter
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+def test_allocate_keeps_everything_within_budget():
+    budget = TokenBudget(100, _word_count)
+    sections = [
+        ContextSection("history", 40, ["one two", "three"]),
+        ContextSection("recall", 10, ["four five six"]),
+    ]
+
+    allocation = budget.allocate(sections, reserved_tokens=10)
+
+    assert allocation.units() == ["one two", "three", "four five six"]
+    assert allocation.used_tokens == {"history": 3, "recall": 3}
+    assert allocation.trimmed_tokens == {}
+    assert allocation.total_tokens == 16
+    assert not allocation.over_budget
+
+
+def test_allocate_drops_lowest_priority_then_oldest_units_first():
+    budget = TokenBudget(9, _word_count)
+    sections = [
+        ContextSection("focus", 60, ["a b c"]),
+        ContextSection("history", 40, ["old old", "mid mid", "new new"], min_units=1),
+        ContextSection("recall", 10, ["w w w w"]),
+    ]
+
+    allocation = budget.allocate(sections, reserved_tokens=2)
+
+    assert [section.units for section in allocation.sections] == [["a b c"], ["mid mid", "new new"], []]
+    assert allocation.trimmed_tokens == {"history": 2, "recall": 4}
+    assert allocation.dropped_units == {"history": 1, "recall": 1}
+    assert allocation.total_tokens == 9
+
+
+def test_allocate_respects_min_units_and_reports_overflow():
+    budget = TokenBudget(3, _word_count)
+    sections = [
+        ContextSection("profile", 0, ["x x x x"], min_units=1),
+        ContextSection("history", 40, ["y y", "z z"], min_units=1),
+    ]
+
+    allocation = budget.allocate(sections)
+
+    assert allocation.units() == ["x x x x", "z z"]
+    assert allocation.over_budget
+    assert allocation.format_fields(allocation.trimmed_tokens) == "history:2"
+
+
+def test_token_counter_falls_back_to_character_estimate(monkeypatch, caplog):
+    def _unavailable(_name):
+        raise OSError("no network")
+
+    monkeypatch.setattr(token_budget.tiktoken, "get_encoding", _unavailable)
+
+    with caplog.at_level(logging.WARNING):
+        counter = TokenCounter()
+
+    assert not counter.exact
+    assert counter.count("") == 0
+    assert counter.count("abcdefghi") == 3
+    assert counter.count_message(HumanMessage(content="abcd")) == 1 + MESSAGE_OVERHEAD_TOKENS
+    assert "Tokenizer o200k_base unavailable" in caplog.text
@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from runestone.api.main import app
+
+
+@pytest.fixture
+def voice_client():
+    voice_service = MagicMock()
+    voice_service.process_voice_input = AsyncMock(return_value="Hej, hur mår du?")
+    app.state.voice_service = voice_service
+    user = MagicMock(id=1, mother_tongue="English")
+    with patch("runestone.api.audio_ws._resolve_active_user", AsyncMock(return_value=user)):
+        yield TestClient(app), voice_service
+    del app.state.voice_service
+
+
+def test_voice_websocket_transcribes_streamed_frames_on_stop(voice_client):
+    client, voice_service = voice_client
+
+    with client.websocket_connect("/api/ws/voice?token=t&improve=false") as websocket:
+        websocket.send_bytes(b"first")
+        websocket.send_bytes(b"second")
+        websocket.send_json({"type": "stop"})
+        reply = websocket.receive_json()
+
+    assert reply == {"status": "transcribed", "text": "Hej, hur mår du?"}
+    voice_service.process_voice_input.assert_awaited_once_with(
+        b"firstsecond", improve=False, language="English", user_id=1
+    )
+
+
+def test_voice_websocket_rejects_stop_without_audio(voice_client):
+    client, voice_service = voice_client
+
+    with client.websocket_connect("/api/ws/voice?token=t&language=Swedish") as websocket:
+        websocket.send_json({"type": "stop"})
+        reply = websocket.receive_json()
+
+    assert reply == {"status": "error", "detail": "Empty audio file."}
+    voice_service.process_voice_input.assert_not_called()
+
+
+def test_voice_websocket_rejects_invalid_token():
+    with patch("runestone.api.audio_ws._resolve_active_user", AsyncMock(return_value=None)):
+        client = TestClient(app)
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/api/ws/voice?token=bad") as websocket:
+                websocket.receive_json()
+
+    assert exc_info.value.code == 4001
@@ -1,11 +1,14 @@
 """Integration coverage for registration and login contracts."""
 
 from fastapi import status
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 from runestone.auth.dependencies import get_current_user
 from runestone.auth.security import hash_password
+from runestone.auth.user_cache import authenticated_user_cache, verified_token_cache
+from runestone.config import settings
 from runestone.db.models import User
+from runestone.dependencies import get_settings
 
 
 async def test_register_persists_inactive_user_with_existing_response_contract(client):
@@ -68,6 +71,36 @@ async def test_login_returns_token_that_resolves_current_user(client_with_overri
         assert profile_response.json()["id"] == user.id
 
 
+async def test_user_cache_removes_user_query_from_repeat_requests(client_with_overrides, user_factory):
+    email = "cached@example.com"
+    password = "password123"
+    await user_factory(email=email, hashed_password=hash_password(password), active=True)
+    user_queries: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    async for client, _ in client_with_overrides():
+        token = (await client.post("/api/auth/", json={"email": email, "password": password})).json()["access_token"]
+        client.app.dependency_overrides.pop(get_current_user)
+        client.app.dependency_overrides[get_settings] = lambda: settings.model_copy(
+            update={"auth_user_cache_enabled": True}
+        )
+        engine = client.db.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            for _ in range(3):
+                response = await client.get("/api/memory", headers={"Authorization": f"Bearer {token}"})
+                assert response.status_code == status.HTTP_200_OK
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+            authenticated_user_cache.clear()
+            verified_token_cache.clear()
+
+    assert len(user_queries) == 1
+
+
 async def test_login_preserves_incorrect_credentials_error(client):
     response = await client.post(
         "/api/auth/",
@@ -9,8 +9,9 @@ import io
 from unittest.mock import AsyncMock, Mock
 
 from runestone.auth.dependencies import get_current_user
-from runestone.config import settings
+from runestone.config import Settings, settings
 from runestone.dependencies import get_runestone_processor
+from runestone.services.voice_service import VoiceService
 
 
 async def test_send_message_success(client_with_mock_agent_service, db_session):
@@ -374,6 +375,7 @@ async def test_transcribe_voice_uses_explicit_language(client_with_overrides):
             b"audio",
             improve=True,
             language="Finnish",
+            user_id=mocks["current_user"].id,
         )
 
 
@@ -398,9 +400,32 @@ async def test_transcribe_voice_falls_back_to_profile_language(client_with_overr
             b"audio",
             improve=True,
             language="Spanish",
+            user_id=mocks["current_user"].id,
         )
 
 
+async def test_transcribe_voice_enhances_clean_transcript_with_default_settings(client_with_overrides):
+    """Test improve=true still runs enhancement on clean transcripts unless the skip setting is enabled."""
+    transcription_client = Mock()
+    transcription_client.transcribe_audio = AsyncMock(return_value="Jag har bott i Stockholm sedan två år.")
+    enhancement_client = Mock()
+    enhancement_client.enhance_text = AsyncMock(return_value="Jag har bott i Stockholm i två år.")
+    voice_service = VoiceService(Settings(), transcription_client, enhancement_client)
+
+    async for client, _mocks in client_with_overrides(voice_service=voice_service):
+        files = {"file": ("recording.webm", io.BytesIO(b"audio"), "audio/webm")}
+
+        response = await client.post(
+            "/api/chat/transcribe-voice",
+            files=files,
+            data={"improve": "true", "language": "Swedish"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"text": "Jag har bott i Stockholm i två år."}
+        enhancement_client.enhance_text.assert_awaited_once()
+
+
 async def test_transcribe_voice_rejects_unsupported_explicit_language(client_with_overrides):
     """Test unsupported explicit voice languages are rejected before transcription."""
     mock_voice_service = Mock()
@@ -441,6 +466,7 @@ async def test_transcribe_voice_defaults_to_swedish_for_unsupported_profile_lang
             b"audio",
             improve=True,
             language="Swedish",
+            user_id=mocks["current_user"].id,
         )
 
 
@@ -465,4 +491,5 @@ async def test_transcribe_voice_defaults_to_swedish_for_missing_profile_language
             b"audio",
             improve=True,
             language="Swedish",
+            user_id=mocks["current_user"].id,
         )
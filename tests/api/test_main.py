@@ -133,3 +133,18 @@ async def test_shutdown_cancels_unfinished_price_refresh(monkeypatch) -> None:
         task = test_app.state.model_price_refresh_task
 
     assert task.cancelled() is True
+
+
+async def test_metrics_endpoint_is_served_only_when_enabled(monkeypatch) -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/metrics")).status_code == 404
+
+    monkeypatch.setattr(main_module.settings, "metrics_enabled", True)
+    metrics_app = main_module.create_application()
+    async with AsyncClient(transport=ASGITransport(app=metrics_app), base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert "# TYPE runestone_turn_phase_seconds histogram" in response.text
+    assert "# TYPE runestone_background_tasks gauge" in response.text
@@ -0,0 +1,45 @@
+"""
+SQL statement budgets for hot endpoints.
+
+Budgets include the savepoint the test session opens. Raise one only for a
+deliberate new query, never to absorb a per-row query.
+"""
+
+import logging
+
+from httpx import ASGITransport, AsyncClient
+
+from runestone.api.middleware import QueryStatsMiddleware
+
+
+async def test_memory_list_query_budget(client, max_queries):
+    with max_queries(2):
+        response = await client.get("/api/memory")
+
+    assert response.status_code == 200
+
+
+async def test_chat_history_query_budget(client, max_queries):
+    with max_queries(5):
+        response = await client.get("/api/chat/history")
+
+    assert response.status_code == 200
+
+
+async def test_vocabulary_list_query_budget(client, max_queries):
+    with max_queries(2):
+        response = await client.get("/api/vocabulary")
+
+    assert response.status_code == 200
+
+
+async def test_query_stats_middleware_logs_statements_per_route(client, max_queries, caplog):
+    transport = ASGITransport(app=QueryStatsMiddleware(client.app, repeat_threshold=2))
+
+    with max_queries(5), caplog.at_level(logging.INFO, logger="runestone.api.middleware"):
+        async with AsyncClient(transport=transport, base_url="http://test") as instrumented_client:
+            response = await instrumented_client.get("/api/memory?limit=5")
+
+    assert response.status_code == 200
+    assert "request finished method=GET path=/api/memory route=list_memory_items status=200" in caplog.text
+    assert "db_statements=2 " in caplog.text
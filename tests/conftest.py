@@ -8,6 +8,7 @@ including database setup for unit tests.
 import os
 import tempfile
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock
 
@@ -25,10 +26,13 @@ from sqlalchemy.ext.asyncio import (  # noqa: E402
 )
 from sqlalchemy.pool import NullPool  # noqa: E402
 
+from runestone.agents.circuit_breaker import circuit_breaker_registry  # noqa: E402
 from runestone.api.schemas import VocabularyItemCreate  # noqa: E402
 from runestone.config import settings  # noqa: E402
+from runestone.core.llm_registry import llm_registry  # noqa: E402
 from runestone.db.database import Base  # noqa: E402
 from runestone.db.models import User, Vocabulary  # noqa: E402
+from runestone.db.query_stats import instrument_engine, track_queries  # noqa: E402
 from runestone.db.user_repository import UserRepository  # noqa: E402
 from runestone.db.vocabulary_repository import VocabularyRepository  # noqa: E402
 from runestone.schemas.analysis import ContentAnalysis, GrammarFocus  # noqa: E402
@@ -40,6 +44,16 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def clear_llm_registry():
+    """Keep memoized chat models and their circuit breakers from leaking across tests."""
+    llm_registry.clear()
+    circuit_breaker_registry.clear()
+    yield
+    llm_registry.clear()
+    circuit_breaker_registry.clear()
+
+
 @pytest.fixture(scope="session")
 async def db_engine():
     """Create the shared test engine and schema once per test session."""
@@ -139,6 +153,26 @@ async def db_session(db_session_factory):
         await db.close()
 
 
+@pytest.fixture
+def max_queries(db_engine):
+    """
+    Return a context manager asserting that its block issues at most `limit` SQL statements.
+
+    The yielded `QueryStats` lists every statement, so a failure shows what ran.
+    """
+    instrument_engine(db_engine)
+
+    @contextmanager
+    def _max_queries(limit: int):
+        with track_queries() as stats:
+            yield stats
+        assert (
+            stats.statements <= limit
+        ), f"expected at most {limit} SQL statements, got {stats.statements}: {dict(stats.statement_counts)}"
+
+    return _max_queries
+
+
 @pytest.fixture
 def user_repository(db_session):
     """Create a UserRepository instance."""
@@ -0,0 +1,67 @@
+import stat
+
+import pytest
+
+from runestone.core.audio_normalizer import AudioNormalizer
+
+
+def _fake_ffmpeg(tmp_path, script: str) -> str:
+    path = tmp_path / "ffmpeg"
+    path.write_text(f"#!/bin/sh\n{script}\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.anyio
+async def test_normalize_returns_smaller_reencoded_audio(tmp_path):
+    normalizer = AudioNormalizer(codec="opus", ffmpeg_path=_fake_ffmpeg(tmp_path, "printf small"))
+
+    result = await normalizer.normalize(b"x" * 1000)
+
+    assert result.normalized is True
+    assert result.content == b"small"
+    assert (result.filename, result.content_type) == ("recording.ogg", "audio/ogg")
+    assert (result.input_bytes, result.output_bytes) == (1000, 5)
+
+
+@pytest.mark.anyio
+async def test_normalize_passes_through_original_when_ffmpeg_fails(tmp_path):
+    normalizer = AudioNormalizer(ffmpeg_path=_fake_ffmpeg(tmp_path, "echo broken >&2; exit 1"))
+
+    result = await normalizer.normalize(b"original")
+
+    assert result.normalized is False
+    assert result.content == b"original"
+    assert result.filename == "recording.webm"
+
+
+@pytest.mark.anyio
+async def test_normalize_keeps_original_when_reencoding_is_not_smaller(tmp_path):
+    normalizer = AudioNormalizer(codec="flac", ffmpeg_path=_fake_ffmpeg(tmp_path, "printf much-larger-output"))
+
+    result = await normalizer.normalize(b"tiny")
+
+    assert result.normalized is False
+    assert result.content == b"tiny"
+
+
+@pytest.mark.anyio
+async def test_normalize_without_ffmpeg_is_a_passthrough(tmp_path):
+    normalizer = AudioNormalizer(ffmpeg_path=str(tmp_path / "missing-ffmpeg"))
+
+    result = await normalizer.normalize(b"original")
+
+    assert normalizer.available is False
+    assert result.content == b"original"
+    assert result.normalized is False
+
+
+def test_command_downmixes_resamples_and_trims_silence(tmp_path):
+    normalizer = AudioNormalizer(codec="flac", ffmpeg_path=_fake_ffmpeg(tmp_path, "true"))
+
+    command = normalizer._command("input")
+
+    assert command[command.index("-ac") + 1] == "1"
+    assert command[command.index("-ar") + 1] == "16000"
+    assert "silenceremove" in command[command.index("-af") + 1]
+    assert command[-3:] == ["-f", "flac", "pipe:1"]
@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from runestone.core.connection_manager import ConnectionManager
+
+
+def _websocket(send_bytes=None):
+    return MagicMock(send_bytes=send_bytes or AsyncMock(), send_json=AsyncMock())
+
+
+def test_connect_keeps_every_socket_per_user():
+    manager = ConnectionManager()
+    first, second = _websocket(), _websocket()
+
+    manager.connect(1, first)
+    manager.connect(1, second)
+    manager.disconnect(1, first)
+
+    assert manager.get_connections(1) == [second]
+    manager.disconnect(1, second)
+    assert manager.get_connections(1) == []
+    assert manager.open_broadcast(1) is None
+
+
+@pytest.mark.anyio
+async def test_broadcast_fans_out_chunks_to_all_sockets():
+    manager = ConnectionManager()
+    first, second = _websocket(), _websocket()
+    manager.connect(1, first)
+    manager.connect(1, second)
+
+    broadcast = manager.open_broadcast(1)
+    broadcast.send_bytes(b"a")
+    broadcast.send_bytes(b"b")
+    await broadcast.finish({"status": "complete"}, timeout=1.0)
+
+    for websocket in (first, second):
+        assert [call.args[0] for call in websocket.send_bytes.await_args_list] == [b"a", b"b"]
+        websocket.send_json.assert_awaited_once_with({"status": "complete"})
+    assert broadcast.dropped == 0
+
+
+@pytest.mark.anyio
+async def test_broadcast_drops_slow_consumer_without_blocking_producer():
+    manager = ConnectionManager()
+    manager.MAX_PENDING_CHUNKS = 2
+    stalled = asyncio.Event()
+
+    async def never_finishes(_chunk):
+        await stalled.wait()
+
+    slow, fast = _websocket(AsyncMock(side_effect=never_finishes)), _websocket()
+    manager.connect(1, slow)
+    manager.connect(1, fast)
+
+    broadcast = manager.open_broadcast(1)
+    for chunk in (b"1", b"2", b"3", b"4"):
+        broadcast.send_bytes(chunk)
+        await asyncio.sleep(0)
+    await broadcast.finish({"status": "complete"}, timeout=1.0)
+
+    assert broadcast.dropped == 1
+    assert fast.send_bytes.await_count == 4
+    fast.send_json.assert_awaited_once_with({"status": "complete"})
+    slow.send_json.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_broadcast_final_message_needs_only_one_free_slot():
+    manager = ConnectionManager()
+    manager.MAX_PENDING_CHUNKS = 2
+    released = asyncio.Event()
+
+    async def wait_for_release(_chunk):
+        await released.wait()
+
+    websocket = _websocket(AsyncMock(side_effect=wait_for_release))
+    manager.connect(1, websocket)
+
+    broadcast = manager.open_broadcast(1)
+    broadcast.send_bytes(b"1")
+    await asyncio.sleep(0)
+    broadcast.send_bytes(b"2")
+    asyncio.get_running_loop().call_later(0.01, released.set)
+    await broadcast.finish({"status": "complete"}, timeout=1.0)
+
+    assert broadcast.dropped == 0
+    assert websocket.send_bytes.await_count == 2
+    websocket.send_json.assert_awaited_once_with({"status": "complete"})
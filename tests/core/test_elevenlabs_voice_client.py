@@ -46,6 +46,23 @@ class TestElevenLabsSTTClient:
         assert audio_file.getvalue() == b"audio-bytes"
         assert content_type == "audio/webm"
 
+    @patch("runestone.core.clients.voice.elevenlabs_voice_client.AsyncElevenLabs")
+    @pytest.mark.anyio
+    async def test_transcribe_audio_uses_given_container(self, mock_client_class):
+        """Client should label normalized uploads with their actual container."""
+        mock_client = mock_client_class.return_value
+        mock_client.speech_to_text.convert = AsyncMock(return_value=SimpleNamespace(text="hello"))
+
+        client = ElevenLabsSTTClient(
+            api_key="test-key",
+            transcription_model="scribe_v2",
+        )
+
+        await client.transcribe_audio(b"audio-bytes", filename="recording.ogg", content_type="audio/ogg")
+
+        filename, audio_file, content_type = mock_client.speech_to_text.convert.await_args.kwargs["file"]
+        assert (filename, audio_file.name, content_type) == ("recording.ogg", "recording.ogg", "audio/ogg")
+
     @patch("runestone.core.clients.voice.elevenlabs_voice_client.AsyncElevenLabs")
     @pytest.mark.anyio
     async def test_transcribe_audio_omits_language_when_not_provided(self, mock_client_class):
@@ -91,6 +91,24 @@ class TestServiceLLMBuilder:
         call_kwargs = mock_chat_openai.call_args[1]
         assert call_kwargs["model"] == DEFAULT_SERVICE_LLM_MODEL
 
+    @patch("runestone.core.service_llm.ChatOpenAI")
+    def test_build_service_llm_model_is_reused_per_configuration(self, mock_chat_openai):
+        """Repeated builds for one provider/model/temperature should return the same model."""
+        mock_settings = Mock(spec=Settings)
+        mock_settings.resolve_service_llm_provider.return_value = "openai"
+        mock_settings.resolve_service_llm_model.return_value = "gpt-4o-mini"
+        mock_settings.resolve_openrouter_disallowed_providers.return_value = []
+        mock_settings.openai_api_key = "test-openai-key"
+        mock_chat_openai.side_effect = lambda **_kwargs: Mock()
+
+        first = build_service_llm_model(mock_settings)
+        second = build_service_llm_model(mock_settings)
+        warmer = build_service_llm_model(mock_settings, temperature=0.7)
+
+        assert first is second
+        assert warmer is not first
+        assert mock_chat_openai.call_count == 2
+
     @patch("runestone.core.service_llm.ChatOpenAI")
     def test_build_service_llm_model_openrouter(self, mock_chat_openai):
         """OpenRouter builder should preserve base URL, attribution headers, and timeout."""
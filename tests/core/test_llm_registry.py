@@ -0,0 +1,74 @@
+"""Tests for the process-wide LLM client registry."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from runestone.core.llm_registry import LLMClientRegistry
+
+
+class _Schema(BaseModel):
+    value: str
+
+
+class _OtherSchema(BaseModel):
+    value: int
+
+
+def test_chat_model_builds_once_per_key():
+    registry = LLMClientRegistry()
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    first = registry.chat_model(("agent", "teacher"), factory)
+    second = registry.chat_model(("agent", "teacher"), factory)
+    other = registry.chat_model(("agent", "coordinator"), factory)
+
+    assert first is second
+    assert other is not first
+    assert factory.call_count == 2
+
+
+def test_structured_output_is_cached_per_model_and_schema():
+    registry = LLMClientRegistry()
+    model = MagicMock()
+    model.with_structured_output.side_effect = lambda schema, **_kwargs: MagicMock(name=schema.__name__)
+
+    first = registry.structured_output(model, _Schema)
+    second = registry.structured_output(model, _Schema)
+    other = registry.structured_output(model, _OtherSchema)
+
+    assert first is second
+    assert other is not first
+    assert model.with_structured_output.call_count == 2
+
+
+def test_structured_output_is_not_shared_between_models():
+    registry = LLMClientRegistry()
+    first_model = MagicMock()
+    second_model = MagicMock()
+
+    assert registry.structured_output(first_model, _Schema) is not registry.structured_output(second_model, _Schema)
+
+
+def test_clear_drops_models_but_keeps_http_clients():
+    registry = LLMClientRegistry()
+    clients = registry.http_clients("openai")
+    model = registry.chat_model("key", MagicMock)
+
+    registry.clear()
+
+    assert registry.http_clients("openai") is clients
+    assert registry.chat_model("key", MagicMock) is not model
+
+
+@pytest.mark.anyio
+async def test_aclose_closes_pooled_http_clients():
+    registry = LLMClientRegistry()
+    sync_client, async_client = registry.http_clients("openrouter")
+
+    await registry.aclose()
+
+    assert sync_client.is_closed
+    assert async_client.is_closed
+    assert registry.http_clients("openrouter")[1] is not async_client
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from runestone.core.metrics import CollectedMetric, MetricsRegistry, _Metric, cache_stats_collector
+from runestone.services.learning_focus_cache import LearningFocusCacheStats
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_render_counters_and_gauges_in_text_format(registry):
+    tokens = registry.counter("test_tokens_total", "Tokens used.", ("model",))
+    depth = registry.gauge("test_queue_depth", "Queued requests.")
+    tokens.inc(120, model="gpt-test")
+    tokens.inc(5, model="gpt-test")
+    depth.inc()
+    depth.inc()
+    depth.dec()
+
+    assert registry.render() == (
+        "# HELP test_queue_depth Queued requests.\n"
+        "# TYPE test_queue_depth gauge\n"
+        "test_queue_depth 1\n"
+        "# HELP test_tokens_total Tokens used.\n"
+        "# TYPE test_tokens_total counter\n"
+        'test_tokens_total{model="gpt-test"} 125\n'
+    )
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    latency = registry.histogram("test_seconds", "Latency.", ("phase",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.observe(value, phase="teacher")
+
+    lines = registry.render().splitlines()
+
+    assert 'test_seconds_bucket{phase="teacher",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{phase="teacher",le="1"} 3' in lines
+    assert 'test_seconds_bucket{phase="teacher",le="+Inf"} 4' in lines
+    assert 'test_seconds_sum{phase="teacher"} 4.25' in lines
+    assert 'test_seconds_count{phase="teacher"} 4' in lines
+
+
+def test_metrics_reject_mismatched_labels(registry):
+    counter = registry.counter("test_total", "Calls.", ("provider", "model"))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc(provider="openai")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("test_total", "Duplicate.")
+
+
+def test_metric_types_must_implement_render_and_clear():
+    class Incomplete(_Metric):
+        kind = "gauge"
+
+        def render(self) -> list[str]:
+            return []
+
+    with pytest.raises(TypeError, match="clear"):
+        Incomplete("runestone_incomplete", "Missing clear.")
+
+
+def test_label_values_are_escaped(registry):
+    counter = registry.counter("test_total", "Calls.", ("model",))
+    counter.inc(model='a "quoted"\\model')
+
+    assert 'test_total{model="a \\"quoted\\"\\\\model"} 1' in registry.render()
+
+
+async def test_timer_decorator_skips_cancelled_calls(registry):
+    latency = registry.histogram("test_seconds", "Latency.", ("phase",))
+
+    @latency.time(phase="teacher")
+    async def finishes():
+        return "done"
+
+    @latency.time(phase="teacher")
+    async def hangs():
+        await asyncio.sleep(10)
+
+    assert await finishes() == "done"
+    task = asyncio.create_task(hangs())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert latency.count(phase="teacher") == 1
+
+
+def test_collectors_are_read_at_render_time(registry):
+    stats = LearningFocusCacheStats()
+    registry.register_collector(cache_stats_collector("learning_focus", lambda: stats))
+    registry.register_collector(lambda: [CollectedMetric("test_pool_checked_out", "gauge", "Checked out.", [({}, 3)])])
+    stats.hits = 4
+    stats.misses = 1
+
+    rendered = registry.render()
+
+    assert 'runestone_cache_lookups_total{cache="learning_focus",result="hit"} 4' in rendered
+    assert 'runestone_cache_lookups_total{cache="learning_focus",result="miss"} 1' in rendered
+    assert "# TYPE test_pool_checked_out gauge\ntest_pool_checked_out 3\n" in rendered
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from runestone.core.tts_cache import TTSAudioCache, build_tts_cache_namespace, normalize_tts_text
+
+NAMESPACE = {"provider": "openai", "model": "gpt-4o-mini-tts", "voice": "onyx"}
+
+
+def test_normalize_tts_text_collapses_whitespace():
+    assert normalize_tts_text("  Hej\n\tdå  ") == "Hej då"
+
+
+def test_key_depends_on_speed_and_namespace(tmp_path):
+    cache = TTSAudioCache(tmp_path, max_bytes=100, namespace=NAMESPACE)
+    other_voice = TTSAudioCache(tmp_path, max_bytes=100, namespace={**NAMESPACE, "voice": "nova"})
+
+    assert cache.key_for("Hej", 1.0) == cache.key_for(" Hej ", 1.0)
+    assert cache.key_for("Hej", 1.0) != cache.key_for("Hej", 1.25)
+    assert cache.key_for("Hej", 1.0) != other_voice.key_for("Hej", 1.0)
+
+
+@pytest.mark.anyio
+async def test_put_evicts_least_recently_used_entries(tmp_path):
+    cache = TTSAudioCache(tmp_path, max_bytes=10, namespace=NAMESPACE)
+    await cache.put("a" * 64, b"1234")
+    await cache.put("b" * 64, b"5678")
+    assert await cache.get("a" * 64) == b"1234"
+
+    await cache.put("c" * 64, b"9012")
+
+    assert cache.total_bytes == 8
+    assert cache.stats.evictions == 1
+    assert await cache.get("b" * 64) is None
+    assert await cache.get("a" * 64) == b"1234"
+
+
+@pytest.mark.anyio
+async def test_index_is_rebuilt_from_disk(tmp_path):
+    cache = TTSAudioCache(tmp_path, max_bytes=100, namespace=NAMESPACE)
+    key = cache.key_for("Hej", 1.0)
+    await cache.put(key, b"audio")
+
+    reloaded = TTSAudioCache(tmp_path, max_bytes=100, namespace=NAMESPACE)
+
+    assert reloaded.total_bytes == 5
+    assert await reloaded.get(key) == b"audio"
+
+
+@pytest.mark.anyio
+async def test_put_skips_entries_larger_than_cache(tmp_path):
+    cache = TTSAudioCache(tmp_path, max_bytes=3, namespace=NAMESPACE)
+    await cache.put("a" * 64, b"1234")
+
+    assert cache.total_bytes == 0
+    assert cache.stats.stores == 0
+
+
+def test_elevenlabs_namespace_includes_voice_tuning():
+    settings = SimpleNamespace(
+        tts_provider="elevenlabs",
+        elevenlabs_tts_model="eleven_multilingual_v2",
+        elevenlabs_tts_voice_id="voice",
+        elevenlabs_tts_output_format="mp3_44100_128",
+        elevenlabs_tts_stability=0.5,
+        elevenlabs_tts_similarity_boost=0.75,
+        elevenlabs_tts_style=0.0,
+        elevenlabs_tts_use_speaker_boost=True,
+    )
+
+    namespace = build_tts_cache_namespace(settings)
+
+    assert namespace["provider"] == "elevenlabs"
+    assert namespace["stability"] == 0.5
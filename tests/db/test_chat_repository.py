@@ -141,3 +141,45 @@ async def test_clear_all_history(chat_repository, db_with_test_user):
 
     messages = await chat_repository.get_raw_history(user.id, chat_id)
     assert len(messages) == 0
+
+
+async def test_save_summary_only_advances(chat_repository, db_with_test_user):
+    """Test that a chat summary is upserted per chat and never moves backwards."""
+    db, user = db_with_test_user
+
+    chat_id = str(uuid4())
+    assert await chat_repository.get_summary(user.id, chat_id) is None
+
+    assert await chat_repository.save_summary(user.id, chat_id, "First summary", last_message_id=10)
+    assert await chat_repository.save_summary(user.id, chat_id, "Newer summary", last_message_id=20)
+    assert not await chat_repository.save_summary(user.id, chat_id, "Stale summary", last_message_id=15)
+
+    summary = await chat_repository.get_summary(user.id, chat_id)
+    assert summary.summary_content == "Newer summary"
+    assert summary.last_message_id == 20
+    assert await chat_repository.get_summary(user.id, str(uuid4())) is None
+
+
+async def test_summaries_follow_message_cleanup(chat_repository, db_with_test_user, db_session):
+    """Test that truncation drops summaries of emptied chats and clearing drops all of them."""
+    db, user = db_with_test_user
+
+    preserved_chat_id = str(uuid4())
+    archived_chat_id = str(uuid4())
+    old_date = datetime.now(timezone.utc) - timedelta(days=10)
+    db_session.add(
+        ChatMessage(user_id=user.id, chat_id=archived_chat_id, role="user", content="Old", created_at=old_date)
+    )
+    await db_session.commit()
+    await chat_repository.add_message(user.id, preserved_chat_id, "user", "Current")
+    await chat_repository.save_summary(user.id, preserved_chat_id, "Current summary", last_message_id=1)
+    await chat_repository.save_summary(user.id, archived_chat_id, "Archived summary", last_message_id=1)
+
+    await chat_repository.truncate_history(user.id, retention_days=7, preserve_chat_id=preserved_chat_id)
+
+    assert await chat_repository.get_summary(user.id, archived_chat_id) is None
+    assert await chat_repository.get_summary(user.id, preserved_chat_id) is not None
+
+    await chat_repository.clear_all_history(user.id)
+
+    assert await chat_repository.get_summary(user.id, preserved_chat_id) is None
@@ -0,0 +1,167 @@
+"""
+EXPLAIN regressions for the memory_items hot paths.
+
+The table is seeded with enough rows across users for the planner to prefer
+indexes, then each repository query is captured as executed and re-planned.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from runestone.db.memory_item_repository import MemoryItemRepository
+from runestone.db.models import MemoryItem, User
+
+USER_COUNT = 8
+ITEMS_PER_USER = 450
+AREA_STATUSES = ("struggling", "improving", "mastered")
+PERSONAL_STATUSES = ("active", "outdated")
+
+
+@pytest.fixture
+async def seeded(db_session):
+    users = [
+        User(name=f"User {index}", email=f"plans-{index}@example.com", hashed_password="x", active=True)
+        for index in range(USER_COUNT)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for user in users:
+        for index in range(ITEMS_PER_USER):
+            is_area = index % 3 != 0
+            rows.append(
+                {
+                    "user_id": user.id,
+                    "category": "area_to_improve" if is_area else "personal_info",
+                    "key": f"key_{index}",
+                    "content": f"Content {index}",
+                    "status": AREA_STATUSES[index % 3] if is_area else PERSONAL_STATUSES[index % 2],
+                    "priority": index % 10 if is_area and index % 4 else None,
+                    "updated_at": base + timedelta(minutes=index),
+                }
+            )
+    await db_session.execute(insert(MemoryItem), rows)
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE memory_items"))
+    return db_session, users[0]
+
+
+class _StatementRecorder:
+    """Capture the SQL and driver parameters of every statement a repository call executes."""
+
+    def __init__(self, db):
+        self.engine = db.bind.sync_engine
+        self.statements: list[tuple[str, object]] = []
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if "memory_items" in statement:
+            self.statements.append((statement, parameters))
+
+
+async def _plan(db, statement: str, parameters: object) -> dict:
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    payload = result.scalar()
+    return (json.loads(payload) if isinstance(payload, str) else payload)[0]["Plan"]
+
+
+async def _plan_of(db, call) -> dict:
+    with _StatementRecorder(db) as recorder:
+        await call()
+    statement, parameters = recorder.statements[-1]
+    return await _plan(db, statement, parameters)
+
+
+def _nodes(plan: dict) -> list[dict]:
+    return [plan, *(node for child in plan.get("Plans", []) for node in _nodes(child))]
+
+
+def _assert_index_plan(plan: dict, index_name: str, *, sorted_by_index: bool = True) -> None:
+    nodes = _nodes(plan)
+    node_types = [node["Node Type"] for node in nodes]
+    assert "Seq Scan" not in node_types, node_types
+    assert index_name in [node.get("Index Name") for node in nodes], nodes
+    if sorted_by_index:
+        assert "Sort" not in node_types and "Incremental Sort" not in node_types, node_types
+
+
+async def test_memory_modal_area_tab_walks_priority_index(seeded):
+    db, user = seeded
+    repo = MemoryItemRepository(db)
+
+    plan = await _plan_of(db, lambda: repo.list_items(user.id, category="area_to_improve", limit=100))
+
+    _assert_index_plan(plan, "ix_memory_items_user_category_priority")
+
+
+async def test_memory_modal_updated_sort_walks_category_index(seeded):
+    db, user = seeded
+    repo = MemoryItemRepository(db)
+
+    plan = await _plan_of(
+        db, lambda: repo.list_items(user.id, category="area_to_improve", sort_by="updated_at", limit=100)
+    )
+
+    _assert_index_plan(plan, "ix_memory_items_user_category_updated")
+
+
+async def test_memory_modal_status_filter_walks_status_index(seeded):
+    db, user = seeded
+    repo = MemoryItemRepository(db)
+
+    plan = await _plan_of(db, lambda: repo.list_items(user.id, category="personal_info", statuses=["active"]))
+
+    _assert_index_plan(plan, "ix_memory_items_user_category_status_updated")
+
+
+async def test_memory_counts_are_index_only(seeded):
+    db, user = seeded
+    repo = MemoryItemRepository(db)
+
+    plan = await _plan_of(db, lambda: repo.count_items(user.id, category="area_to_improve", status="struggling"))
+
+    _assert_index_plan(plan, "ix_memory_items_user_category_status_updated", sorted_by_index=False)
+    assert "Index Only Scan" in [node["Node Type"] for node in _nodes(plan)]
+
+
+async def test_mastered_cleanup_uses_status_index(seeded):
+    db, user = seeded
+    repo = MemoryItemRepository(db)
+
+    plan = await _plan_of(
+        db, lambda: repo.delete_mastered_older_than(user.id, datetime(2025, 1, 1, tzinfo=timezone.utc))
+    )
+
+    _assert_index_plan(plan, "ix_memory_items_user_category_status_updated", sorted_by_index=False)
+
+
+async def test_learning_focus_starter_uses_partial_index_in_generic_plans(seeded):
+    db, user = seeded
+    repo = MemoryItemRepository(db)
+
+    with _StatementRecorder(db) as recorder:
+        await repo.list_start_area_to_improve_items(user.id, area_limit=8)
+    statement, parameters = recorder.statements[-1]
+    custom_plan = await _plan(db, statement, parameters)
+    # A cached prepared statement may switch to a plan that cannot see parameter values.
+    connection = await db.connection()
+    await connection.exec_driver_sql("SET LOCAL plan_cache_mode = force_generic_plan")
+    await connection.exec_driver_sql(f"PREPARE learning_focus_plan AS {statement}")
+    arguments = ", ".join(str(value) for value in parameters)
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) EXECUTE learning_focus_plan({arguments})")
+    payload = result.scalar()
+    generic_plan = (json.loads(payload) if isinstance(payload, str) else payload)[0]["Plan"]
+
+    _assert_index_plan(custom_plan, "ix_memory_items_learning_focus")
+    _assert_index_plan(generic_plan, "ix_memory_items_learning_focus")
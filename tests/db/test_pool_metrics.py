@@ -0,0 +1,26 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from runestone.config import settings
+from runestone.core.metrics import DB_POOL_CHECKOUT_SECONDS, MetricsRegistry
+from runestone.db.pool_metrics import TimedAsyncAdaptedQueuePool, pool_status_collector
+
+
+async def test_timed_pool_observes_checkouts_and_reports_saturation(db_engine):
+    engine = create_async_engine(
+        settings.database_url, poolclass=TimedAsyncAdaptedQueuePool, pool_size=2, max_overflow=2
+    )
+    registry = MetricsRegistry()
+    registry.register_collector(pool_status_collector(engine))
+    checkouts_before = DB_POOL_CHECKOUT_SECONDS.count()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            rendered = registry.render()
+    finally:
+        await engine.dispose()
+
+    assert DB_POOL_CHECKOUT_SECONDS.count() == checkouts_before + 1
+    assert "runestone_db_pool_checked_out 1\n" in rendered
+    assert "runestone_db_pool_capacity 4\n" in rendered
+    assert "runestone_db_pool_saturation 0.25\n" in rendered
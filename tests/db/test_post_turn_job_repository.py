@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from runestone.db.models import PostTurnJob, User
+from runestone.db.post_turn_job_repository import PostTurnJobRepository
+
+
+@pytest.fixture
+def job_repository(db_session):
+    return PostTurnJobRepository(db_session)
+
+
+async def test_enqueue_supersedes_active_jobs_for_same_chat(job_repository, db_with_test_user):
+    _db, user = db_with_test_user
+    chat_id = str(uuid4())
+    other_chat_id = str(uuid4())
+
+    first = await job_repository.enqueue(user.id, chat_id, coordinator_row_id=1, payload_json="{}")
+    other = await job_repository.enqueue(user.id, other_chat_id, coordinator_row_id=2, payload_json="{}")
+    second = await job_repository.enqueue(user.id, chat_id, coordinator_row_id=3, payload_json="{}")
+
+    assert await job_repository.get_status(first.id) == "stale_replaced"
+    assert await job_repository.get_status(other.id) == "queued"
+    assert await job_repository.get_status(second.id) == "queued"
+
+
+async def test_claim_marks_jobs_running_in_queue_order(job_repository, db_with_test_user):
+    _db, user = db_with_test_user
+    jobs = [
+        await job_repository.enqueue(user.id, str(uuid4()), coordinator_row_id=index, payload_json="{}")
+        for index in range(3)
+    ]
+
+    claimed = await job_repository.claim("worker-a", limit=2)
+
+    assert [job.id for job in claimed] == [jobs[0].id, jobs[1].id]
+    assert all(job.status == "running" and job.locked_by == "worker-a" for job in claimed)
+    assert all(job.attempts == 1 for job in claimed)
+    assert await job_repository.get_status(jobs[2].id) == "queued"
+
+
+async def test_finish_does_not_overwrite_superseded_job(job_repository, db_with_test_user):
+    _db, user = db_with_test_user
+    chat_id = str(uuid4())
+    job = await job_repository.enqueue(user.id, chat_id, coordinator_row_id=1, payload_json="{}")
+    await job_repository.claim("worker-a", limit=1)
+
+    await job_repository.cancel_for_chat(user.id, chat_id, status="stale_replaced")
+
+    assert await job_repository.heartbeat(job.id, "worker-a") == "stale_replaced"
+    assert await job_repository.finish(job.id, "worker-a", "completed") is False
+    assert await job_repository.get_status(job.id) == "stale_replaced"
+
+
+async def test_finish_requires_lock_owner(job_repository, db_with_test_user):
+    _db, user = db_with_test_user
+    job = await job_repository.enqueue(user.id, str(uuid4()), coordinator_row_id=1, payload_json="{}")
+    await job_repository.claim("worker-a", limit=1)
+
+    assert await job_repository.finish(job.id, "worker-b", "completed") is False
+    assert await job_repository.finish(job.id, "worker-a", "completed") is True
+    assert await job_repository.get_status(job.id) == "completed"
+
+
+async def test_release_expired_requeues_then_fails_after_max_attempts(job_repository, db_with_test_user):
+    db, user = db_with_test_user
+    job = await job_repository.enqueue(user.id, str(uuid4()), coordinator_row_id=1, payload_json="{}")
+    expired_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    await job_repository.claim("worker-a", limit=1)
+    await db.execute(update(PostTurnJob).where(PostTurnJob.id == job.id).values(locked_at=expired_at))
+    assert await job_repository.release_expired(lease_seconds=60, max_attempts=2) == 1
+    assert await job_repository.get_status(job.id) == "queued"
+
+    reclaimed = await job_repository.claim("worker-b", limit=1)
+    assert [(claimed.id, claimed.attempts) for claimed in reclaimed] == [(job.id, 2)]
+    await db.execute(update(PostTurnJob).where(PostTurnJob.id == job.id).values(locked_at=expired_at))
+    assert await job_repository.release_expired(lease_seconds=60, max_attempts=2) == 1
+    assert await job_repository.get_status(job.id) == "failed"
+
+
+@pytest.mark.anyio
+@pytest.mark.db_schema_reset
+async def test_concurrent_claims_never_share_a_job(db_session_factory: async_sessionmaker[AsyncSession]):
+    async with db_session_factory() as setup_db:
+        user = User(name="Worker", email=f"worker-{uuid4()}@example.com", hashed_password="x")
+        setup_db.add(user)
+        await setup_db.commit()
+        repository = PostTurnJobRepository(setup_db)
+        for index in range(6):
+            await repository.enqueue(user.id, str(uuid4()), coordinator_row_id=index, payload_json="{}")
+
+    async def claim(worker_id: str) -> list[int]:
+        async with db_session_factory() as db:
+            return [job.id for job in await PostTurnJobRepository(db).claim(worker_id, limit=4)]
+
+    claimed = await asyncio.gather(claim("worker-a"), claim("worker-b"), claim("worker-c"))
+
+    flattened = [job_id for worker_claims in claimed for job_id in worker_claims]
+    assert len(flattened) == 6
+    assert len(set(flattened)) == 6
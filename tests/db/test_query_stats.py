@@ -0,0 +1,55 @@
+import logging
+
+from sqlalchemy import select, text
+
+from runestone.core.observability import timed_operation
+from runestone.db.models import User
+from runestone.db.query_stats import track_queries, warn_repeated_statements
+
+
+async def test_track_queries_counts_statements_and_rows_in_nested_scopes(db_with_test_user, max_queries):
+    db, user = db_with_test_user
+    # Open the test transaction's savepoint before counting.
+    await db.execute(text("SELECT 1"))
+
+    with max_queries(3) as outer:
+        await db.execute(text("SELECT generate_series(1, 4)"))
+        with track_queries() as inner:
+            await db.execute(select(User).where(User.id == user.id))
+
+    assert (outer.statements, outer.rows) == (2, 5)
+    assert (inner.statements, inner.rows) == (1, 1)
+    assert outer.db_ms >= inner.db_ms > 0
+
+
+async def test_repeated_statements_are_flagged_once_per_statement(db_with_test_user, max_queries, caplog):
+    db, user = db_with_test_user
+
+    with max_queries(10) as stats:
+        for user_id in (user.id, user.id + 1, user.id + 2):
+            await db.execute(select(User).where(User.id == user_id))
+        await db.execute(text("SELECT 1"))
+
+    [(statement, count)] = stats.repeated_statements(3)
+    assert count == 3
+    assert "FROM users" in statement
+    with caplog.at_level(logging.WARNING, logger="runestone.db.query_stats"):
+        warn_repeated_statements(stats, threshold=3, scope="GET /api/example")
+    assert "repeated statement scope=GET /api/example count=3 sql=SELECT" in caplog.text
+
+
+async def test_timed_operation_logs_statements_of_the_call(db_with_test_user, max_queries, caplog):
+    db, _user = db_with_test_user
+    await db.execute(text("SELECT 1"))
+    logger = logging.getLogger("tests.query_stats")
+
+    @timed_operation(logger, "loaded")
+    async def _load() -> None:
+        await db.execute(text("SELECT generate_series(1, 2)"))
+
+    with max_queries(1), caplog.at_level(logging.INFO, logger="tests.query_stats"):
+        await _load()
+
+    assert "loaded latency_ms=" in caplog.text
+    assert "db_statements=1 " in caplog.text
+    assert "db_rows=2 " in caplog.text
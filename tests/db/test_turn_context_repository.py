@@ -0,0 +1,173 @@
+"""
+Tests for TurnContextRepository.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from runestone.db.models import (
+    AgentSideEffect,
+    ChatMessage,
+    ChatSessionLearningFocus,
+    ChatSummary,
+    MemoryItem,
+    RecallQueueItemDB,
+    RecallUserStateDB,
+    Vocabulary,
+)
+from runestone.db.turn_context_repository import TurnContextRepository
+
+
+@pytest.fixture
+def turn_context_repository(db_session):
+    """Create a TurnContextRepository instance."""
+    return TurnContextRepository(db_session)
+
+
+def _count_selects(db):
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+async def test_load_returns_all_parts_in_one_statement(turn_context_repository, db_with_test_user):
+    """Every part of the turn context comes back from a single SELECT."""
+    db, user = db_with_test_user
+    chat_id = str(uuid4())
+    now = datetime.now(timezone.utc)
+
+    messages = [
+        ChatMessage(
+            user_id=user.id,
+            chat_id=chat_id,
+            role="user" if i % 2 == 0 else "assistant",
+            content=f"Message {i}",
+            created_at=now - timedelta(minutes=10 - i),
+        )
+        for i in range(6)
+    ]
+    db.add_all(messages)
+    db.add(
+        ChatMessage(user_id=user.id, chat_id="other-chat", role="user", content="Elsewhere", created_at=now),
+    )
+    words = [
+        Vocabulary(user_id=user.id, word_phrase="hund", translation="dog"),
+        Vocabulary(user_id=user.id, word_phrase="katt", translation="cat"),
+    ]
+    db.add_all(words)
+    items = [
+        MemoryItem(user_id=user.id, category="area_to_improve", key="en_ett", content="Gender", status="struggling"),
+        MemoryItem(user_id=user.id, category="area_to_improve", key="v2", content="Word order", status="improving"),
+    ]
+    db.add_all(items)
+    db.add(RecallUserStateDB(user_id=user.id))
+    await db.flush()
+    db.add_all(
+        [
+            RecallQueueItemDB(user_id=user.id, vocabulary_id=words[1].id, position=0),
+            RecallQueueItemDB(user_id=user.id, vocabulary_id=words[0].id, position=1),
+        ]
+    )
+    db.add(ChatSummary(user_id=user.id, chat_id=chat_id, summary_content="Earlier.", last_message_id=messages[1].id))
+    db.add(
+        ChatSessionLearningFocus(
+            user_id=user.id,
+            chat_id=chat_id,
+            memory_item_ids_json=json.dumps([items[1].id, items[0].id]),
+        )
+    )
+    db.add_all(
+        [
+            AgentSideEffect(
+                user_id=user.id,
+                chat_id=chat_id,
+                specialist_name="word_keeper",
+                phase="post_response",
+                status="action_taken",
+                info_for_teacher=f"Saved word {i}",
+                artifacts_json=json.dumps({"words": [i]}),
+                created_at=now - timedelta(minutes=5 - i),
+            )
+            for i in range(2)
+        ]
+    )
+    await db.commit()
+
+    statements, stop = _count_selects(db)
+    try:
+        rows = await turn_context_repository.load(
+            user.id,
+            chat_id,
+            history_limit=3,
+            side_effect_limit=10,
+            after_summary=True,
+        )
+    finally:
+        stop()
+
+    assert len(statements) == 1
+    assert rows.user.id == user.id
+    assert [row["content"] for row in rows.history] == ["Message 3", "Message 4", "Message 5"]
+    assert rows.summary_content == "Earlier."
+    assert rows.summary_last_message_id == messages[1].id
+    assert rows.recall_words == ["katt", "hund"]
+    assert json.loads(rows.learning_focus_item_ids_json) == [items[1].id, items[0].id]
+    assert sorted(row["id"] for row in rows.learning_focus_items) == sorted(item.id for item in items)
+    assert [row["info_for_teacher"] for row in rows.recent_side_effects] == ["Saved word 0", "Saved word 1"]
+
+
+async def test_load_history_after_summary_and_empty_parts(turn_context_repository, db_with_test_user):
+    """History skips summarized messages only when asked; missing parts come back empty."""
+    db, user = db_with_test_user
+    chat_id = str(uuid4())
+    now = datetime.now(timezone.utc)
+    messages = [
+        ChatMessage(
+            user_id=user.id,
+            chat_id=chat_id,
+            role="user",
+            content=f"Message {i}",
+            created_at=now - timedelta(minutes=5 - i),
+        )
+        for i in range(3)
+    ]
+    db.add_all(messages)
+    await db.flush()
+    db.add(ChatSummary(user_id=user.id, chat_id=chat_id, summary_content="Earlier.", last_message_id=messages[1].id))
+    await db.commit()
+
+    after_summary = await turn_context_repository.load(
+        user.id, chat_id, history_limit=20, side_effect_limit=10, after_summary=True
+    )
+    full = await turn_context_repository.load(
+        user.id, chat_id, history_limit=20, side_effect_limit=10, after_summary=False
+    )
+
+    assert [row["content"] for row in after_summary.history] == ["Message 2"]
+    assert [row["content"] for row in full.history] == ["Message 0", "Message 1", "Message 2"]
+    assert full.recall_words == []
+    assert full.learning_focus_item_ids_json is None
+    assert full.learning_focus_items == []
+    assert full.recent_side_effects == []
+
+
+async def test_load_unknown_user(turn_context_repository, db_with_test_user):
+    """A missing user yields an empty result instead of raising."""
+    _db, user = db_with_test_user
+
+    rows = await turn_context_repository.load(
+        user.id + 1000, "chat", history_limit=20, side_effect_limit=10, after_summary=False
+    )
+
+    assert rows.user is None
+    assert rows.history == []
@@ -2048,3 +2048,45 @@ class TestGetVocabularyDistribution:
 
         assert sum(priority_counts.values()) == 2
         assert sum(learned_counts.values()) == 2
+
+
+class TestWordEnrichmentCache:
+    """Tests for the cross-user word enrichment cache queries."""
+
+    pytestmark = pytest.mark.anyio
+
+    async def test_upsert_keeps_existing_fields_when_refresh_omits_them(self, repo):
+        """A refresh without an example keeps the previously cached example."""
+        await repo.upsert_word_enrichments(
+            [{"word_key": "hus", "translation": "house", "example_phrase": "Huset är stort.", "extra_info": None}],
+            "english",
+            "word_keeper:v1",
+        )
+        await repo.upsert_word_enrichments(
+            [{"word_key": "hus", "translation": "house", "example_phrase": None, "extra_info": "ett-word noun"}],
+            "english",
+            "word_keeper:v1",
+        )
+
+        rows = await repo.get_word_enrichments(["hus", "katt"], "english", "word_keeper:v1")
+
+        assert len(rows) == 1
+        assert rows[0].example_phrase == "Huset är stort."
+        assert rows[0].extra_info == "ett-word noun"
+        assert await repo.get_word_enrichments(["hus"], "spanish", "word_keeper:v1") == []
+        assert await repo.get_word_enrichments(["hus"], "english", "word_keeper:v2") == []
+
+    async def test_list_shared_word_phrases_orders_by_user_count(self, repo, db_session):
+        """Phrases saved by more users come first, grouped case-insensitively per mother tongue."""
+        db_session.add_all(
+            [
+                VocabularyModel(user_id=1, word_phrase="katt", translation="cat"),
+                VocabularyModel(user_id=1, word_phrase="Hus", translation="house"),
+                VocabularyModel(user_id=2, word_phrase="hus", translation="house"),
+            ]
+        )
+        await db_session.commit()
+
+        rows = await repo.list_shared_word_phrases(limit=10)
+
+        assert [(row[0].lower(), row[2]) for row in rows] == [("hus", 2), ("katt", 1)]
@@ -6,6 +6,7 @@ import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.outputs import ChatGeneration, LLMResult
 
+from runestone.core.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
 from runestone.model_costs.langchain_callback import LangChainCostCallback, extract_usage
 from runestone.model_costs.pricing import ModelPrice, PriceSnapshot
 from runestone.model_costs.tracking import track_model_costs
@@ -68,6 +69,22 @@ def test_extracts_openai_standardized_usage_and_details() -> None:
     }
 
 
+def test_extracts_service_tier_prompt_cache_reads() -> None:
+    result = response(
+        AIMessage(
+            content="answer",
+            usage_metadata={
+                "input_tokens": 100,
+                "output_tokens": 20,
+                "total_tokens": 120,
+                "input_token_details": {"priority_cache_read": 60, "priority": 40},
+            },
+        )
+    )
+
+    assert extract_usage(result) == {"input_token": 40, "cached_input_token": 60, "output_token": 20}
+
+
 def test_extracts_gemini_standardized_usage_without_details() -> None:
     result = response(
         AIMessage(
@@ -190,3 +207,28 @@ def test_callback_without_ambient_scope_is_fail_open_and_content_free(caplog) ->
 
     assert "without active operation component=orphan" in caplog.text
     assert "TOP SECRET" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_callback_records_latency_and_token_metrics() -> None:
+    callback = LangChainCostCallback(provider="openai", model="gpt-metrics", component="teacher")
+    run_id = uuid4()
+    callback.on_chat_model_start({}, [[HumanMessage(content="hej")]], run_id=run_id)
+    async with track_model_costs("chat"):
+        callback.on_llm_end(
+            response(
+                AIMessage(
+                    content="answer",
+                    usage_metadata={"input_tokens": 30, "output_tokens": 7, "total_tokens": 37},
+                )
+            ),
+            run_id=run_id,
+        )
+        callback.on_llm_error(RuntimeError("provider failed"), run_id=uuid4())
+
+    assert LLM_REQUEST_SECONDS.count(provider="openai", model="gpt-metrics", status="completed") == 1
+    # A run whose start was not seen has no latency to observe.
+    assert LLM_REQUEST_SECONDS.count(provider="openai", model="gpt-metrics", status="failed") == 0
+    assert LLM_TOKENS.value(provider="openai", model="gpt-metrics", unit="input_token") == 30
+    assert LLM_TOKENS.value(provider="openai", model="gpt-metrics", unit="output_token") == 7
+    assert callback._started == {}
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from runestone.core.metrics import MODEL_COST_RECORDS
+from runestone.model_costs import tracking
+from runestone.model_costs.persistence import (
+    InteractionRecordWriter,
+    start_interaction_persistence,
+    stop_interaction_persistence,
+)
+from runestone.model_costs.tracking import InteractionRecord
+
+
+def _record(component: str = "teacher", user_id: int | None = 1) -> InteractionRecord:
+    return InteractionRecord(
+        operation_id="op-1",
+        operation_type="chat",
+        component=component,
+        phase="foreground",
+        provider="openai",
+        model="gpt-test",
+        status="completed",
+        usage={"input_token": Decimal("10")},
+        known_cost_usd=Decimal("0.01"),
+        cost_quality="estimated",
+        cost_source="models.dev",
+        applied_rates_usd={},
+        user_id=user_id,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_sink():
+    yield
+    tracking.set_interaction_sink(None)
+
+
+class RecordingBatchWriter:
+    def __init__(self, results: list[bool] | None = None):
+        self.batches: list[list[InteractionRecord]] = []
+        self.results = list(results or [])
+        self.called = asyncio.Event()
+
+    async def __call__(self, records) -> bool:
+        self.batches.append(list(records))
+        self.called.set()
+        return self.results.pop(0) if self.results else True
+
+
+async def test_writer_flushes_when_a_batch_fills_before_the_interval():
+    write_batch = RecordingBatchWriter()
+    writer = InteractionRecordWriter(write_batch, batch_size=3, flush_interval_seconds=60)
+    writer.start()
+
+    for index in range(3):
+        assert writer.offer(_record(f"c{index}")) is True
+    await asyncio.wait_for(write_batch.called.wait(), timeout=1)
+    await writer.aclose()
+
+    assert [[record.component for record in batch] for batch in write_batch.batches] == [["c0", "c1", "c2"]]
+    assert writer.stats.written == 3
+    assert writer.pending == 0
+
+
+async def test_writer_flushes_partial_batches_on_the_interval():
+    write_batch = RecordingBatchWriter()
+    writer = InteractionRecordWriter(write_batch, batch_size=100, flush_interval_seconds=0.01)
+    writer.start()
+
+    writer.offer(_record())
+    await asyncio.wait_for(write_batch.called.wait(), timeout=1)
+    await writer.aclose()
+
+    assert len(write_batch.batches) == 1
+    assert writer.stats.written == 1
+
+
+async def test_writer_drops_and_counts_records_beyond_the_queue_bound(caplog):
+    write_batch = RecordingBatchWriter()
+    writer = InteractionRecordWriter(write_batch, max_queue=2, batch_size=10)
+    dropped_before = MODEL_COST_RECORDS.value(outcome="dropped")
+
+    results = [writer.offer(_record()) for _ in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert writer.stats.queued == 2
+    assert writer.stats.dropped == 3
+    assert MODEL_COST_RECORDS.value(outcome="dropped") - dropped_before == 3
+    assert caplog.text.count("Interaction queue full") == 1
+
+    assert await writer.flush() == 2
+    assert writer.offer(_record()) is True
+
+
+async def test_failed_batch_is_counted_and_later_batches_wait_for_the_next_cycle():
+    write_batch = RecordingBatchWriter(results=[False])
+    writer = InteractionRecordWriter(write_batch, batch_size=2)
+    for _ in range(3):
+        writer.offer(_record())
+
+    assert await writer.flush() == 0
+    assert writer.stats.failed == 2
+    assert writer.pending == 1
+
+    assert await writer.flush() == 1
+    assert writer.stats.written == 1
+
+
+async def test_writer_accepts_records_from_other_threads_and_flushes_on_close():
+    write_batch = RecordingBatchWriter()
+    writer = InteractionRecordWriter(write_batch, batch_size=50, flush_interval_seconds=60)
+    writer.start()
+
+    threads = [threading.Thread(target=lambda: [writer.offer(_record()) for _ in range(20)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    await writer.aclose()
+
+    assert sum(len(batch) for batch in write_batch.batches) == 80
+    assert all(len(batch) <= 50 for batch in write_batch.batches)
+    assert writer.stats.written == 80
+
+
+async def test_start_installs_the_writer_as_the_tracking_sink(monkeypatch):
+    write_batch = RecordingBatchWriter()
+    monkeypatch.setattr(
+        "runestone.model_costs.persistence.InteractionRecordWriter.from_settings",
+        classmethod(lambda cls, app_settings: cls(write_batch, batch_size=10, flush_interval_seconds=60)),
+    )
+
+    assert start_interaction_persistence(Mock(model_cost_persistence_enabled=False)) is None
+    assert tracking._interaction_sink is None
+
+    writer = start_interaction_persistence(Mock(model_cost_persistence_enabled=True))
+    try:
+        async with tracking.track_model_costs("ocr", user_id=3):
+            tracking.record_model_interaction("ocr", "openai", "gpt-test", "completed", {"input_token": 1})
+    finally:
+        await stop_interaction_persistence()
+
+    assert tracking._interaction_sink is None
+    assert writer.stats.written == 1
+    assert write_batch.batches[0][0].user_id == 3
@@ -9,7 +9,9 @@ from runestone.model_costs.tracking import (
     CostTrackingHandle,
     aggregate_quality,
     calculate_cost,
+    current_known_cost_usd,
     record_model_interaction,
+    set_interaction_sink,
     suspend_model_cost_tracking,
     track_model_costs,
     track_model_costs_with_background,
@@ -91,6 +93,12 @@ def test_manual_character_rate_estimates_streaming_tts_cost() -> None:
     assert result.cost_source == "manual"
 
 
+def test_cached_interactions_are_exact_zero_cost(snapshot: PriceSnapshot) -> None:
+    result = calculate_cost("openai", "gpt-test", {"input_token": 10}, snapshot=snapshot, cached=True)
+
+    assert (result.known_cost_usd, result.cost_quality, result.cost_source) == (Decimal("0"), "exact", "cache")
+
+
 @pytest.mark.asyncio
 async def test_ordinary_scope_owns_one_summary_and_preserves_accounting(caplog) -> None:
     caplog.set_level(logging.DEBUG)
@@ -125,6 +133,19 @@ async def test_summary_aggregates_repeated_components_with_stable_usd_format(cap
     assert 'cost_breakdown_usd={"tts":"0.20100000"}' in caplog.text
 
 
+@pytest.mark.asyncio
+async def test_summary_reports_prompt_cache_hit_rate(caplog) -> None:
+    caplog.set_level(logging.INFO)
+
+    async with track_model_costs("chat"):
+        record_model_interaction("teacher", "openai", "gpt-test", "completed", {"input_token": 250, "output_token": 9})
+        record_model_interaction(
+            "teacher", "openai", "gpt-test", "completed", {"input_token": 50, "cached_input_token": 700}
+        )
+
+    assert "prompt_tokens=1000 cached_prompt_tokens=700 prompt_cache_hit_rate=0.700" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_cached_input_write_rate_is_applied_and_visible_at_debug(caplog) -> None:
     caplog.set_level(logging.DEBUG)
@@ -206,6 +227,19 @@ async def test_concurrent_ordinary_scopes_are_isolated() -> None:
     assert first[1] != second[1]
 
 
+@pytest.mark.asyncio
+async def test_current_known_cost_reads_only_the_active_operation() -> None:
+    assert current_known_cost_usd() is None
+
+    async with track_model_costs("memory_maintenance"):
+        assert current_known_cost_usd() == Decimal("0")
+        record_model_interaction("bucket", "openai", "gpt-test", "completed", {"input_token": 100})
+        record_model_interaction("merge", "openai", "gpt-test", "completed", {"output_token": 50})
+        with suspend_model_cost_tracking():
+            assert current_known_cost_usd() is None
+        assert current_known_cost_usd() == Decimal("0.2")
+
+
 @pytest.mark.parametrize(
     ("exception", "expected_status"),
     [(asyncio.CancelledError, "cancelled"), (asyncio.TimeoutError, "timed_out"), (RuntimeError, "failed")],
@@ -334,3 +368,26 @@ def test_recording_and_logging_fail_open(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr("runestone.model_costs.tracking.logger.log", fail_log)
     monkeypatch.setattr("runestone.model_costs.tracking.logger.warning", fail_log)
     assert record_model_interaction("orphan", "openai", "gpt-test", "completed") is None
+
+
+@pytest.mark.asyncio
+async def test_interaction_sink_receives_user_attributed_records(caplog) -> None:
+    received = []
+
+    def failing_sink(record) -> None:
+        received.append(record)
+        raise RuntimeError("queue unavailable")
+
+    set_interaction_sink(failing_sink)
+    try:
+        async with track_model_costs("ocr", user_id=7):
+            record = record_model_interaction("ocr", "openai", "gpt-test", "completed", {"input_token": 1})
+        async with track_model_costs_with_background("chat", user_id=8):
+            record_model_interaction("teacher", "openai", "gpt-test", "completed", {"input_token": 1})
+    finally:
+        set_interaction_sink(None)
+
+    assert received[0] is record
+    assert [(item.user_id, item.operation_type) for item in received] == [(7, "ocr"), (8, "chat")]
+    assert record.recorded_at.tzinfo is not None
+    assert "Model cost interaction sink failed" in caplog.text
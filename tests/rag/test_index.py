@@ -8,7 +8,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 from langchain_core.documents import Document
 
-from runestone.rag.index import GrammarIndex
+from runestone.rag.index import GrammarIndex, get_embeddings
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_embeddings():
+    """Each test patches the embedding class, so the process-wide model must not leak between tests."""
+    get_embeddings.cache_clear()
+    yield
+    get_embeddings.cache_clear()
 
 
 @pytest.fixture
@@ -1,10 +1,12 @@
 """Tests for authentication use cases and transaction ownership."""
 
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from runestone.auth.user_cache import AuthenticatedUser, AuthenticatedUserCache, VerifiedTokenCache
 from runestone.core.exceptions import (
     InactiveUserError,
     InvalidAccessTokenError,
@@ -195,7 +197,49 @@ async def test_resolve_access_token_rejects_inactive_user(_verify_token, auth_se
 
 @patch("runestone.services.auth_service.verify_token", return_value={"sub": "42"})
 async def test_resolve_access_token_returns_active_user(_verify_token, auth_service, auth_repository):
-    user = User(id=42, email="user@example.com", name="User", active=True)
+    user = User(id=42, email="user@example.com", name="User", timezone="UTC", active=True)
     auth_repository.get_by_id.return_value = user
 
-    assert await auth_service.resolve_access_token("token") is user
+    snapshot = await auth_service.resolve_access_token("token")
+
+    assert snapshot == AuthenticatedUser.from_user(user)
+    assert (snapshot.id, snapshot.email, snapshot.active) == (42, "user@example.com", True)
+
+
+async def test_resolve_access_token_serves_repeat_requests_from_caches(auth_repository):
+    user_cache = AuthenticatedUserCache()
+    service = AuthService(
+        auth_repository,
+        SimpleNamespace(),
+        token_cache=VerifiedTokenCache(),
+        user_cache=user_cache,
+    )
+    auth_repository.get_by_id.return_value = User(id=42, email="user@example.com", name="User", active=True)
+
+    with patch(
+        "runestone.services.auth_service.verify_token",
+        return_value={"sub": "42", "exp": time.time() + 60},
+    ) as verify_token:
+        first = await service.resolve_access_token("token")
+        second = await service.resolve_access_token("token")
+        user_cache.invalidate(42)
+        third = await service.resolve_access_token("token")
+
+    assert first == second == third
+    verify_token.assert_called_once_with("token")
+    assert auth_repository.get_by_id.await_count == 2
+    assert user_cache.stats.hits == 1
+
+
+async def test_resolve_access_token_does_not_cache_inactive_user(auth_repository):
+    user_cache = AuthenticatedUserCache()
+    service = AuthService(auth_repository, SimpleNamespace(), user_cache=user_cache)
+    auth_repository.get_by_id.return_value = User(id=42, email="user@example.com", name="User", active=False)
+
+    with patch("runestone.services.auth_service.verify_token", return_value={"sub": "42"}):
+        for _ in range(2):
+            with pytest.raises(InactiveUserError):
+                await service.resolve_access_token("token")
+
+    assert auth_repository.get_by_id.await_count == 2
+    assert user_cache.get(42) is None
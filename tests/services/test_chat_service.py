@@ -4,7 +4,7 @@ Tests for ChatService.
 
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -12,11 +12,13 @@ from sqlalchemy import text
 
 from runestone.db.chat_repository import ChatRepository
 from runestone.db.recall_repository import RecallRepository
+from runestone.db.turn_context_repository import TurnContextRepository
 from runestone.db.user_repository import UserRepository
 from runestone.model_costs.tracking import record_model_interaction
 from runestone.recall.service import RecallService
 from runestone.services.agent_side_effect_service import AgentSideEffectService
 from runestone.services.chat_service import ChatService
+from runestone.services.turn_context_service import TurnContextService
 from runestone.services.user_service import UserService
 
 
@@ -92,7 +94,7 @@ def mock_processor():
 
 def _make_unit_chat_service() -> tuple[ChatService, SimpleNamespace]:
     """Build a database-free ChatService for cost state-machine tests."""
-    settings = SimpleNamespace(chat_history_retention_days=7)
+    settings = SimpleNamespace(chat_history_retention_days=7, chat_summary_enabled=False)
     repository = AsyncMock()
     repository.get_context_for_agent.return_value = []
     side_effect_service = MagicMock(spec=AgentSideEffectService)
@@ -149,6 +151,7 @@ def chat_service(
 
     mock_settings = Mock()
     mock_settings.chat_history_retention_days = 7
+    mock_settings.chat_summary_enabled = False
     return ChatService(
         mock_settings,
         repository,
@@ -311,6 +314,99 @@ async def test_process_message_with_history(chat_service, db_with_test_user, moc
     assert history[1].content == "Björn's reply"
 
 
+@pytest.mark.anyio
+async def test_process_message_replaces_summarized_history_with_chat_summary(
+    chat_service, db_with_test_user, mock_agent_service, mock_user_service
+):
+    """Test messages folded into the chat summary are passed as the summary, not verbatim."""
+    db, user = db_with_test_user
+    user.current_chat_id = str(uuid4())
+    mock_user_service.get_user_by_id.return_value = user
+    mock_user_service.get_or_create_current_chat_id.return_value = user.current_chat_id
+    chat_service.settings.chat_summary_enabled = True
+    mock_agent_service.start_background_chat_summary = Mock(return_value=True)
+
+    folded = await chat_service.repository.add_message(user.id, user.current_chat_id, "user", "Folded")
+    await chat_service.repository.add_message(user.id, user.current_chat_id, "assistant", "Kept")
+    await chat_service.repository.save_summary(user.id, user.current_chat_id, "Earlier summary", folded.id)
+
+    await chat_service.process_message(user.id, "Message 2")
+
+    kwargs = mock_agent_service.process_turn.call_args.kwargs
+    assert kwargs["chat_summary"] == "Earlier summary"
+    assert [message.content for message in kwargs["history"]] == ["Kept"]
+    mock_agent_service.start_background_chat_summary.assert_called_once_with(user.id, user.current_chat_id)
+
+
+@pytest.mark.anyio
+async def test_process_message_preloads_turn_context_in_one_round_trip(
+    chat_service, db_with_test_user, db_session, mock_agent_service, mock_user_service, mock_recall_service
+):
+    """Test the preloaded turn context replaces the per-part user, recall, and history reads."""
+    db, user = db_with_test_user
+    user.current_chat_id = str(uuid4())
+    mock_user_service.get_or_create_current_chat_id.return_value = user.current_chat_id
+    chat_service.settings.turn_context_preload_enabled = True
+    chat_service.turn_context_service = TurnContextService(TurnContextRepository(db_session))
+    await chat_service.repository.add_message(user.id, user.current_chat_id, "user", "Message 1")
+    await chat_service.repository.add_message(user.id, user.current_chat_id, "assistant", "Reply 1")
+
+    await chat_service.process_message(user.id, "Message 2")
+
+    kwargs = mock_agent_service.process_turn.call_args.kwargs
+    assert kwargs["user"].id == user.id
+    assert [message.content for message in kwargs["history"]] == ["Message 1", "Reply 1"]
+    assert kwargs["current_recall_words"] == []
+    assert kwargs["learning_focus"].item_ids_json is None
+    assert kwargs["recent_side_effects"] == []
+    mock_user_service.get_user_by_id.assert_not_called()
+    mock_recall_service.load_current_recall_words.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_process_message_forwards_preloaded_side_effects_on_learning_focus_cache_hit(
+    chat_service, db_with_test_user, db_session, mock_agent_service, mock_user_service
+):
+    """Test a cached learning focus still forwards the side effects loaded with the turn context."""
+    db, user = db_with_test_user
+    user.current_chat_id = str(uuid4())
+    mock_user_service.get_or_create_current_chat_id.return_value = user.current_chat_id
+    chat_service.settings.turn_context_preload_enabled = True
+    chat_service.settings.learning_focus_cache_enabled = True
+    chat_service.turn_context_service = TurnContextService(TurnContextRepository(db_session))
+    focus_cache = Mock()
+    focus_cache.contains.return_value = True
+
+    with patch("runestone.services.chat_service.learning_focus_cache", focus_cache):
+        await chat_service.process_message(user.id, "Message 1")
+
+    kwargs = mock_agent_service.process_turn.call_args.kwargs
+    assert "learning_focus" not in kwargs
+    assert kwargs["recent_side_effects"] == []
+    focus_cache.contains.assert_called_once_with(user.id, user.current_chat_id)
+
+
+@pytest.mark.anyio
+async def test_process_message_falls_back_when_turn_context_preload_fails(
+    chat_service, db_with_test_user, mock_agent_service, mock_user_service
+):
+    """Test a failed preload falls back to loading each part of the turn context separately."""
+    db, user = db_with_test_user
+    user.current_chat_id = str(uuid4())
+    mock_user_service.get_user_by_id.return_value = user
+    mock_user_service.get_or_create_current_chat_id.return_value = user.current_chat_id
+    chat_service.settings.turn_context_preload_enabled = True
+    chat_service.turn_context_service = Mock()
+    chat_service.turn_context_service.load = AsyncMock(return_value=None)
+
+    await chat_service.process_message(user.id, "Message 1")
+
+    kwargs = mock_agent_service.process_turn.call_args.kwargs
+    assert kwargs["user"] is user
+    assert "learning_focus" not in kwargs
+    mock_user_service.get_user_by_id.assert_awaited_once_with(user.id)
+
+
 @pytest.mark.anyio
 async def test_process_message_logs_total_turn_timing(
     chat_service, db_with_test_user, mock_agent_service, mock_user_service, caplog
@@ -444,6 +540,7 @@ async def test_tts_scheduling_cancellation_cleans_up_post_turn_before_failed_sum
         "chat-cost",
         handles["post_turn"],
         grace_seconds=1.0,
+        user_id=1,
     )
     assert handles["tts"].status == "cancelled"
     assert handles["post_turn"].status == "cancelled_with_unknown_usage"
@@ -5,7 +5,10 @@ from runestone.api.memory_item_schemas import AreaToImproveStatus, MemoryCategor
 from runestone.db.chat_session_learning_focus_repository import ChatSessionLearningFocusRepository
 from runestone.db.memory_item_repository import MemoryItemRepository
 from runestone.db.models import ChatSessionLearningFocus, MemoryItem
-from runestone.services.chat_session_learning_focus_service import ChatSessionLearningFocusService
+from runestone.services.chat_session_learning_focus_service import (
+    ChatSessionLearningFocusService,
+    LearningFocusSnapshot,
+)
 from runestone.services.memory_item_service import MemoryItemService
 
 
@@ -67,6 +70,42 @@ async def test_get_chat_session_learning_focus_reuses_frozen_ids_across_turns(db
     assert was_reseeded is False
 
 
+async def test_get_chat_session_learning_focus_uses_snapshot_instead_of_reads(db_with_test_user):
+    db, user = db_with_test_user
+    memory_item_service = MemoryItemService(MemoryItemRepository(db))
+    focus_repo = ChatSessionLearningFocusRepository(db)
+    service = ChatSessionLearningFocusService(focus_repo, memory_item_service)
+
+    item = MemoryItem(
+        user_id=user.id,
+        category=MemoryCategory.AREA_TO_IMPROVE.value,
+        key="word_order",
+        content="Word order",
+        status=AreaToImproveStatus.STRUGGLING.value,
+    )
+    db.add(item)
+    await db.commit()
+    await db.refresh(item)
+    await focus_repo.upsert_item_ids(chat_id="chat-1", user_id=user.id, item_ids=[item.id])
+    snapshot = LearningFocusSnapshot(
+        item_ids_json=f"[{item.id}]",
+        items=[MemoryItemResponse.model_validate(item)],
+    )
+
+    async def _unexpected_read(*_args, **_kwargs):
+        raise AssertionError("snapshot should replace repository reads")
+
+    focus_repo.get_by_user_chat = _unexpected_read
+    memory_item_service.get_items_by_ids = _unexpected_read
+
+    items, was_reseeded = await service.get_chat_session_learning_focus(
+        user.id, "chat-1", area_limit=2, snapshot=snapshot
+    )
+
+    assert [focus_item.id for focus_item in items] == [item.id]
+    assert was_reseeded is False
+
+
 async def test_get_chat_session_learning_focus_rotates_when_all_items_mastered(db_with_test_user):
     db, user = db_with_test_user
     memory_repo = MemoryItemRepository(db)
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.chat_repository import ChatRepository
+from runestone.db.models import ChatMessage
+from runestone.services.chat_summary_service import ChatSummaryService
+
+
+async def _add_messages(repository: ChatRepository, user_id: int, chat_id: str, count: int) -> list[int]:
+    # Explicit timestamps: server-side now() is constant inside the test transaction.
+    now = datetime.now(timezone.utc)
+    messages = [
+        ChatMessage(
+            user_id=user_id,
+            chat_id=chat_id,
+            role="user" if index % 2 == 0 else "assistant",
+            content=f"Message {index}",
+            created_at=now + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+    repository.db.add_all(messages)
+    await repository.db.commit()
+    return [message.id for message in messages]
+
+
+async def test_load_refresh_batch_keeps_live_window_raw(db_with_test_user):
+    db, user = db_with_test_user
+    repository = ChatRepository(db)
+    service = ChatSummaryService(repository)
+    chat_id = str(uuid4())
+    ids = await _add_messages(repository, user.id, chat_id, 10)
+
+    batch = await service.load_refresh_batch(user.id, chat_id, live_window=4, min_messages=3)
+
+    assert batch is not None
+    assert batch.summary == ""
+    assert [message.id for message in batch.messages] == ids[:6]
+
+
+async def test_load_refresh_batch_resumes_after_saved_summary(db_with_test_user):
+    db, user = db_with_test_user
+    repository = ChatRepository(db)
+    service = ChatSummaryService(repository)
+    chat_id = str(uuid4())
+    ids = await _add_messages(repository, user.id, chat_id, 10)
+    assert await service.save_summary(user.id, chat_id, "Earlier summary", ids[3])
+
+    assert await service.load_refresh_batch(user.id, chat_id, live_window=4, min_messages=3) is None
+
+    batch = await service.load_refresh_batch(user.id, chat_id, live_window=4, min_messages=2)
+    assert batch.summary == "Earlier summary"
+    assert [message.id for message in batch.messages] == ids[4:6]
+
+
+async def test_load_refresh_batch_skips_short_chats(db_with_test_user):
+    db, user = db_with_test_user
+    repository = ChatRepository(db)
+    service = ChatSummaryService(repository)
+    chat_id = str(uuid4())
+    await _add_messages(repository, user.id, chat_id, 3)
+
+    assert await service.load_refresh_batch(user.id, chat_id, live_window=4, min_messages=1) is None
+
+
+async def test_load_refresh_batch_rolls_back_on_database_error(db_with_test_user):
+    db, user = db_with_test_user
+    repository = ChatRepository(db)
+    repository.get_summary = AsyncMock(side_effect=SQLAlchemyError("boom"))
+    repository.db.rollback = AsyncMock()
+    service = ChatSummaryService(repository)
+
+    assert await service.load_refresh_batch(user.id, "chat", live_window=4, min_messages=1) is None
+    repository.db.rollback.assert_awaited_once()
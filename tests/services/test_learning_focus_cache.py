@@ -0,0 +1,61 @@
+from runestone.services.learning_focus_cache import LearningFocusCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_stored_bundle_per_chat():
+    cache = LearningFocusCache()
+
+    assert cache.put(1, "chat-a", "focus a", version=cache.version(1))
+
+    assert cache.get(1, "chat-a") == "focus a"
+    assert cache.get(1, "chat-b") is None
+    assert cache.get(2, "chat-a") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_invalidate_user_drops_entries_and_rejects_reads_started_before_it():
+    cache = LearningFocusCache()
+    cache.put(1, "chat-a", "focus", version=cache.version(1))
+    cache.put(2, "chat-a", "other user", version=cache.version(2))
+    version_before_write = cache.version(1)
+
+    cache.invalidate_user(1)
+
+    assert cache.get(1, "chat-a") is None
+    assert cache.get(2, "chat-a") == "other user"
+    assert not cache.put(1, "chat-a", "stale", version=version_before_write)
+    assert cache.get(1, "chat-a") is None
+    assert cache.put(1, "chat-a", "fresh", version=cache.version(1))
+    assert cache.get(1, "chat-a") == "fresh"
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = LearningFocusCache(ttl_seconds=60, clock=clock)
+    cache.put(1, None, "live focus", version=0)
+
+    clock.now = 59
+    assert cache.contains(1, None)
+    clock.now = 60
+    assert not cache.contains(1, None)
+    assert cache.get(1, None) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LearningFocusCache(max_entries=2)
+    cache.put(1, "a", "a", version=0)
+    cache.put(1, "b", "b", version=0)
+    cache.get(1, "a")
+
+    cache.put(1, "c", "c", version=0)
+
+    assert cache.contains(1, "a")
+    assert not cache.contains(1, "b")
+    assert cache.stats.evictions == 1
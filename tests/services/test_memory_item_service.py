@@ -8,6 +8,7 @@ from runestone.api.memory_item_schemas import AreaToImproveStatus, MemoryCategor
 from runestone.core.exceptions import PermissionDeniedError
 from runestone.db.memory_item_repository import MemoryItemRepository
 from runestone.db.models import MemoryItem
+from runestone.services.learning_focus_cache import learning_focus_cache
 from runestone.services.memory_item_service import MemoryItemService
 
 
@@ -615,3 +616,19 @@ async def test_clear_category_removes_only_matching_items(db_with_test_user):
 
     remaining = await repo.list_items(user.id)
     assert {item.category for item in remaining} == {MemoryCategory.AREA_TO_IMPROVE.value}
+
+
+async def test_area_to_improve_writes_invalidate_learning_focus_cache(db_with_test_user):
+    db, user = db_with_test_user
+    service = MemoryItemService(MemoryItemRepository(db))
+    version = learning_focus_cache.version(user.id)
+
+    await service.append_personal_info_item(user.id, key="city", content="Lives in Malmö", status="active")
+    assert learning_focus_cache.version(user.id) == version
+
+    item = await service.create_item(user.id, MemoryCategory.AREA_TO_IMPROVE, "v2", "Word order")
+    assert learning_focus_cache.version(user.id) == version + 1
+
+    await service.update_item_status(item.id, AreaToImproveStatus.IMPROVING.value, user.id)
+    await service.delete_item(item.id, user.id)
+    assert learning_focus_cache.version(user.id) == version + 3
@@ -0,0 +1,131 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from runestone.db.memory_maintenance_run_repository import MemoryMaintenanceRunRepository
+from runestone.db.models import MemoryItem, User
+from runestone.services.memory_maintenance_run_service import (
+    MaintenanceCandidate,
+    MaintenanceOutcome,
+    MemoryMaintenanceRunService,
+)
+
+OLD = datetime(2026, 10, 1, tzinfo=timezone.utc)
+NEW = datetime(2026, 10, 10, tzinfo=timezone.utc)
+
+
+def _item(user_id: int, key: str, *, category: str = "area_to_improve", updated_at: datetime = OLD) -> MemoryItem:
+    return MemoryItem(
+        user_id=user_id,
+        category=category,
+        key=key,
+        content=key,
+        status="struggling" if category == "area_to_improve" else "active",
+        updated_at=updated_at,
+    )
+
+
+def _outcome(user_id: int, status: str, started_at: datetime) -> MaintenanceOutcome:
+    return MaintenanceOutcome(
+        user_id=user_id,
+        status=status,
+        item_growth=0,
+        started_at=started_at,
+        finished_at=started_at,
+        known_cost_usd=Decimal("0.0125"),
+    )
+
+
+async def test_candidates_count_growth_since_last_completed_run(db_with_test_user):
+    db, user = db_with_test_user
+    inactive = User(
+        name="Inactive",
+        email=f"inactive-{uuid.uuid4()}@example.com",
+        hashed_password="x",
+        timezone="UTC",
+        active=False,
+    )
+    db.add(inactive)
+    await db.commit()
+    db.add_all(
+        [
+            _item(user.id, "en_ett"),
+            _item(user.id, "word_order", updated_at=NEW),
+            _item(user.id, "hobby", category="personal_info", updated_at=NEW),
+            _item(user.id, "knowledge", category="knowledge_strength", updated_at=NEW),
+            *[_item(inactive.id, f"key_{index}") for index in range(5)],
+        ]
+    )
+    await db.commit()
+    service = MemoryMaintenanceRunService(MemoryMaintenanceRunRepository(db))
+
+    assert await service.list_candidates(min_growth=2, limit=10) == [MaintenanceCandidate(user.id, 3)]
+
+    assert await service.record(_outcome(user.id, "no_action", datetime(2026, 10, 5, tzinfo=timezone.utc)))
+    assert await service.list_candidates(min_growth=2, limit=10) == [MaintenanceCandidate(user.id, 2)]
+
+    # Failed runs leave the growth to be picked up again.
+    assert await service.record(_outcome(user.id, "timed_out", datetime(2026, 10, 11, tzinfo=timezone.utc)))
+    assert await service.list_candidates(min_growth=2, limit=10) == [MaintenanceCandidate(user.id, 2)]
+    assert await service.list_candidates(min_growth=3, limit=10) == []
+
+
+async def test_items_written_by_a_run_do_not_count_as_growth(db_with_test_user):
+    db, user = db_with_test_user
+    started_at = datetime(2026, 10, 12, 3, 0, tzinfo=timezone.utc)
+    # The run merges and rewrites items while it is running.
+    db.add_all([_item(user.id, f"merged_{index}", updated_at=started_at + timedelta(seconds=30)) for index in range(3)])
+    await db.commit()
+    service = MemoryMaintenanceRunService(MemoryMaintenanceRunRepository(db))
+
+    assert await service.record(
+        MaintenanceOutcome(
+            user_id=user.id,
+            status="action_taken",
+            item_growth=3,
+            started_at=started_at,
+            finished_at=started_at + timedelta(minutes=1),
+        )
+    )
+
+    assert await service.list_candidates(min_growth=1, limit=10) == []
+
+
+async def test_record_rolls_back_on_database_error():
+    repository = AsyncMock()
+    repository.add.side_effect = SQLAlchemyError("boom")
+    service = MemoryMaintenanceRunService(repository)
+
+    recorded = await service.record(_outcome(1, "action_taken", OLD))
+
+    assert recorded is False
+    repository.db.rollback.assert_awaited_once()
+
+
+async def test_maintenance_lock_is_exclusive_per_user_until_transaction_ends(db_engine):
+    async with AsyncSession(db_engine) as holder, AsyncSession(db_engine) as other:
+        holder_service = MemoryMaintenanceRunService(MemoryMaintenanceRunRepository(holder))
+        other_service = MemoryMaintenanceRunService(MemoryMaintenanceRunRepository(other))
+
+        assert await holder_service.try_lock_user(4242) is True
+        assert await other_service.try_lock_user(4242) is False
+        assert await other_service.try_lock_user(4243) is True
+
+        await holder.rollback()
+        await other.rollback()
+
+        assert await other_service.try_lock_user(4242) is True
+        await other.rollback()
+
+
+async def test_try_lock_user_reports_unavailable_on_database_error():
+    repository = AsyncMock()
+    repository.try_lock_user.side_effect = SQLAlchemyError("boom")
+    service = MemoryMaintenanceRunService(repository)
+
+    assert await service.try_lock_user(1) is False
+    repository.db.rollback.assert_awaited_once()
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.memory_maintenance_watermark_repository import MemoryMaintenanceWatermarkRepository
+from runestone.db.models import MemoryMaintenanceWatermark
+from runestone.services.memory_maintenance_watermark_service import (
+    MaintenanceWatermark,
+    MemoryMaintenanceWatermarkService,
+)
+
+
+async def test_save_and_load_round_trip_per_domain(db_with_test_user):
+    db, user = db_with_test_user
+    service = MemoryMaintenanceWatermarkService(MemoryMaintenanceWatermarkRepository(db))
+    first_run = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    second_run = datetime(2026, 10, 2, tzinfo=timezone.utc)
+
+    assert await service.load(user.id, "area_to_improve") is None
+    assert await service.save(
+        user.id,
+        "area_to_improve",
+        MaintenanceWatermark(item_hashes={1: "a", 2: "b"}, clusters=[[1, 2]], last_run_at=first_run),
+    )
+    assert await service.save(
+        user.id,
+        "area_to_improve",
+        MaintenanceWatermark(item_hashes={3: "c"}, clusters=[[3]], last_run_at=second_run),
+    )
+
+    watermark = await service.load(user.id, "area_to_improve")
+
+    assert watermark == MaintenanceWatermark(item_hashes={3: "c"}, clusters=[[3]], last_run_at=second_run)
+    assert await service.load(user.id, "personal_info") is None
+
+
+async def test_load_ignores_malformed_watermark(db_with_test_user):
+    db, user = db_with_test_user
+    db.add(
+        MemoryMaintenanceWatermark(
+            user_id=user.id,
+            domain="personal_info",
+            item_hashes_json="not json",
+            clusters_json="[]",
+            last_run_at=datetime(2026, 10, 1, tzinfo=timezone.utc),
+        )
+    )
+    await db.commit()
+    service = MemoryMaintenanceWatermarkService(MemoryMaintenanceWatermarkRepository(db))
+
+    assert await service.load(user.id, "personal_info") is None
+
+
+async def test_save_rolls_back_on_database_error():
+    repository = AsyncMock()
+    repository.upsert.side_effect = SQLAlchemyError("boom")
+    service = MemoryMaintenanceWatermarkService(repository)
+
+    saved = await service.save(
+        1,
+        "area_to_improve",
+        MaintenanceWatermark(item_hashes={}, last_run_at=datetime(2026, 10, 1, tzinfo=timezone.utc)),
+    )
+
+    assert saved is False
+    repository.db.rollback.assert_awaited_once()
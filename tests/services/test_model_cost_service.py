@@ -0,0 +1,79 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.model_cost_repository import ModelCostInteractionRepository
+from runestone.db.models import ModelCostInteraction
+from runestone.model_costs.tracking import InteractionRecord
+from runestone.services.model_cost_service import CostRollupRow, ModelCostService
+
+
+def _record(
+    component: str,
+    *,
+    user_id: int | None,
+    recorded_at: datetime,
+    known_cost_usd: str = "0.01",
+    cost_quality: str = "estimated",
+) -> InteractionRecord:
+    return InteractionRecord(
+        operation_id="0f1e2d3c-0000-4000-8000-000000000000",
+        operation_type="chat",
+        component=component,
+        phase="foreground",
+        provider="openai",
+        model="gpt-test",
+        status="completed",
+        usage={"output_token": Decimal("2"), "input_token": Decimal("10")},
+        known_cost_usd=Decimal(known_cost_usd),
+        cost_quality=cost_quality,
+        cost_source="models.dev",
+        applied_rates_usd={},
+        user_id=user_id,
+        recorded_at=recorded_at,
+    )
+
+
+async def test_record_batch_persists_rows_and_rolls_up_per_day_user_and_component(db_with_test_user):
+    db, user = db_with_test_user
+    service = ModelCostService(ModelCostInteractionRepository(db))
+    day_one = datetime(2026, 10, 1, 23, 30, tzinfo=timezone.utc)
+    day_two = datetime(2026, 10, 2, 0, 30, tzinfo=timezone.utc)
+
+    assert await service.record_batch(
+        [
+            _record("teacher", user_id=user.id, recorded_at=day_one, known_cost_usd="0.0125"),
+            _record("teacher", user_id=user.id, recorded_at=day_one, known_cost_usd="0.0005"),
+            _record("coordinator", user_id=user.id, recorded_at=day_one, cost_quality="unknown"),
+            _record("teacher", user_id=user.id, recorded_at=day_two),
+            _record("word_enrichment", user_id=None, recorded_at=day_two, known_cost_usd="0.2"),
+        ]
+    )
+
+    stored = (await db.execute(select(ModelCostInteraction).order_by(ModelCostInteraction.id))).scalars().all()
+    assert len(stored) == 5
+    assert json.loads(stored[0].usage_json) == {"input_token": "10", "output_token": "2"}
+
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    assert await service.daily_rollup(since=since) == [
+        CostRollupRow(date(2026, 10, 1), user.id, "coordinator", 1, 1, Decimal("0.01")),
+        CostRollupRow(date(2026, 10, 1), user.id, "teacher", 2, 0, Decimal("0.013")),
+        CostRollupRow(date(2026, 10, 2), None, "word_enrichment", 1, 0, Decimal("0.2")),
+        CostRollupRow(date(2026, 10, 2), user.id, "teacher", 1, 0, Decimal("0.01")),
+    ]
+    assert [row.day for row in await service.daily_rollup(since=day_two, user_id=user.id)] == [date(2026, 10, 2)]
+
+
+async def test_record_batch_rolls_back_on_database_error():
+    repository = AsyncMock()
+    repository.add_many.side_effect = SQLAlchemyError("boom")
+    service = ModelCostService(repository)
+
+    recorded = await service.record_batch([_record("teacher", user_id=1, recorded_at=datetime.now(timezone.utc))])
+
+    assert recorded is False
+    repository.db.rollback.assert_awaited_once()
@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import AIMessage
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 from runestone.api.schemas import ImprovementMode
 from runestone.api.schemas import Vocabulary as VocabularySchema
@@ -28,7 +28,7 @@ from runestone.db.models import Vocabulary as VocabularyModel
 from runestone.db.vocabulary_repository import VocabularyRepository
 from runestone.model_costs.tracking import record_model_interaction
 from runestone.schemas.vocabulary import VocabularyResponse
-from runestone.schemas.vocabulary_save import PriorityWordSaveItem, WordSaveCandidate
+from runestone.schemas.vocabulary_save import PriorityWordSaveItem, SharedWordEnrichment, WordSaveCandidate
 from runestone.services.vocabulary_service import VocabularyService
 
 
@@ -860,6 +860,49 @@ class TestVocabularyService:
         assert len(enriched_items) == 1
         assert enriched_items[0].extra_info is None
 
+    async def test_shared_cache_failures_leave_callers_transaction_intact(self, service, db_session):
+        """A failing cache lookup or write-back neither discards nor commits the caller's pending work."""
+        db_session.add(VocabularyModel(user_id=1, word_phrase="pending", translation="t"))
+        await db_session.flush()
+
+        async def failing_statement(*_args):
+            await db_session.execute(text("SELECT 1 / 0"))
+
+        service.repo.get_word_enrichments = AsyncMock(side_effect=failing_statement)
+        service.repo.upsert_word_enrichments = AsyncMock(side_effect=failing_statement)
+
+        assert await service.get_shared_enrichments(["hus"], "english", "word_keeper:v1") == {}
+        await service.store_shared_enrichments(
+            [SharedWordEnrichment(word_phrase="hus", translation="house")], "english", "word_keeper:v1"
+        )
+        assert db_session.in_transaction()
+
+        await db_session.commit()
+        saved = await db_session.execute(select(VocabularyModel.word_phrase).where(VocabularyModel.user_id == 1))
+        assert saved.scalars().all() == ["pending"]
+
+    async def test_enrich_vocabulary_items_reuses_shared_cache_across_users(self, service):
+        """Enrichment written for one save is served from the shared cache on the next one."""
+        service.llm_model.ainvoke.return_value = AIMessage(content='{"Ett  Äpple": "en-word, noun"}')
+        first = [VocabularyItemCreate(word_phrase="Ett  Äpple", translation="an apple")]
+
+        await service._enrich_vocabulary_items(first)
+        service.llm_model.ainvoke.reset_mock()
+
+        second = [
+            VocabularyItemCreate(word_phrase="ett äpple", translation="una manzana"),
+            VocabularyItemCreate(word_phrase="vara", translation="ser"),
+        ]
+        service.llm_model.ainvoke.return_value = AIMessage(content='{"vara": "verb"}')
+        enriched_items = await service._enrich_vocabulary_items(second)
+
+        assert [item.extra_info for item in enriched_items] == ["en-word, noun", "verb"]
+        assert [item.translation for item in enriched_items] == ["una manzana", "ser"]
+        service.llm_model.ainvoke.assert_awaited_once()
+        prompt = service.llm_model.ainvoke.await_args.args[0]
+        assert "vara" in prompt
+        assert "äpple" not in prompt
+
     async def test_save_vocabulary_items_with_enrichment(self, service, db_session):
         """Test saving vocabulary items with enrichment enabled."""
         # Mock LLM client
@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from runestone.core.connection_manager import connection_manager
+from runestone.core.tts_cache import TTSAudioCache
 from runestone.model_costs.tracking import _CostCollector, record_model_interaction
 from runestone.services.tts_service import TTSService
 
@@ -62,7 +64,7 @@ async def test_push_audio_to_client_no_connection(mock_settings, mock_synthesis_
     service = TTSService(mock_settings, mock_synthesis_client)
 
     # Should return silently if user_id not in connection_manager
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=None):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[]):
         await service.push_audio_to_client(user_id=1, text="Hello", cost_tracking=_make_tts_child())
 
 
@@ -73,7 +75,7 @@ async def test_no_connection_closes_tts_child_as_neutral_skip(mock_settings, moc
     child = operation.transfer("tts")
     operation.emit_preliminary()
 
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=None):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[]):
         await service.push_audio_to_client(user_id=1, text="Hello", cost_tracking=child)
         await service._active_tasks[1]
 
@@ -99,7 +101,7 @@ async def test_stream_audio_task_success(mock_settings, mock_synthesis_client):
     mock_ws.send_json = AsyncMock()
 
     # patch connection_manager
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=mock_ws):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[mock_ws]):
         await service._stream_audio_task(user_id=1, text="Hello", cost_tracking=_make_tts_child())
 
     # Verify chunks sent
@@ -136,7 +138,7 @@ async def test_stream_audio_task_records_direct_tts_in_parent_background(
     operation.emit_preliminary()
     websocket = MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock())
 
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=websocket):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[websocket]):
         with caplog.at_level("INFO", logger="runestone.model_costs.tracking"):
             await service._stream_audio_task(1, "Hello", cost_tracking=child)
 
@@ -164,7 +166,7 @@ async def test_stream_audio_failure_closes_tts_child(mock_settings, mock_synthes
     child = operation.transfer("tts")
     websocket = MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock())
 
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=websocket):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[websocket]):
         with pytest.raises(RuntimeError, match="provider failed"):
             await service._stream_audio_task(1, "Hello", cost_tracking=child)
 
@@ -188,7 +190,7 @@ async def test_stream_audio_cancellation_closes_tts_child(mock_settings, mock_sy
     child = operation.transfer("tts")
     websocket = MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock())
 
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=websocket):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[websocket]):
         task = asyncio.create_task(service._stream_audio_task(1, "Hello", cost_tracking=child))
         await started.wait()
         task.cancel()
@@ -290,7 +292,7 @@ async def test_push_audio_replacement_records_provider_cancellation_before_child
     next_child = next_operation.transfer("tts")
     websocket = MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock())
 
-    with patch("runestone.services.tts_service.connection_manager.get_connection", return_value=websocket):
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=[websocket]):
         await service.push_audio_to_client(1, "First", cost_tracking=previous_child)
         previous_task = service._active_tasks[1]
         await first_started.wait()
@@ -427,3 +429,104 @@ async def test_cancelled_replacement_scheduling_seals_both_children_and_corrects
     assert old_child.finish("stale_replaced") is False
     release_old.set()
     await old_task
+
+
+@pytest.mark.anyio
+async def test_synthesize_speech_stream_serves_repeats_from_cache(mock_settings, mock_synthesis_client, tmp_path):
+    cache = TTSAudioCache(tmp_path, max_bytes=1024, namespace={"provider": "openai", "model": "tts", "voice": "onyx"})
+    service = TTSService(mock_settings, mock_synthesis_client, audio_cache=cache)
+
+    first = [chunk async for chunk in service.synthesize_speech_stream("Hej då!")]
+    operation = _tracking_session("chat_turn")
+    with operation.transfer("tts").activate():
+        second = [chunk async for chunk in service.synthesize_speech_stream("  Hej   då! ")]
+
+    assert first == [b"chunk1", b"chunk2"]
+    assert b"".join(second) == b"chunk1chunk2"
+    mock_synthesis_client.synthesize_speech_stream.assert_called_once()
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+    [record] = operation.interactions
+    assert record.cost_source == "cache"
+    assert record.cost_quality == "exact"
+    assert record.known_cost_usd == 0
+
+
+@pytest.mark.anyio
+async def test_synthesize_speech_stream_does_not_cache_failed_stream(mock_settings, tmp_path):
+    async def failing_stream(text: str, speed: float = 1.0):
+        yield b"partial"
+        raise RuntimeError("provider failed")
+
+    client = MagicMock()
+    client.synthesize_speech_stream = MagicMock(side_effect=failing_stream)
+    cache = TTSAudioCache(tmp_path, max_bytes=1024, namespace={"provider": "openai", "model": "tts", "voice": "onyx"})
+    service = TTSService(mock_settings, client, audio_cache=cache)
+
+    with pytest.raises(RuntimeError):
+        async for _chunk in service.synthesize_speech_stream("Hej"):
+            pass
+
+    assert cache.stats.stores == 0
+    assert await cache.get(cache.key_for("Hej", 1.0)) is None
+
+
+@pytest.mark.anyio
+async def test_synthesize_speech_stream_respects_provider_concurrency(mock_settings):
+    release = asyncio.Event()
+
+    async def blocked_stream(text: str, speed: float = 1.0):
+        await release.wait()
+        yield text.encode()
+
+    client = MagicMock()
+    client.synthesize_speech_stream = MagicMock(side_effect=blocked_stream)
+    service = TTSService(mock_settings, client, max_concurrency=1)
+
+    async def consume(text: str) -> list[bytes]:
+        return [chunk async for chunk in service.synthesize_speech_stream(text)]
+
+    first = asyncio.create_task(consume("a"))
+    second = asyncio.create_task(consume("b"))
+    await asyncio.sleep(0.01)
+
+    assert client.synthesize_speech_stream.call_count == 1
+    assert service.queue_depth == 1
+
+    release.set()
+    assert await first == [b"a"]
+    assert await second == [b"b"]
+    assert service.queue_depth == 0
+
+
+@pytest.mark.anyio
+async def test_stream_audio_task_pushes_to_every_user_socket(mock_settings, mock_synthesis_client):
+    service = TTSService(mock_settings, mock_synthesis_client)
+    sockets = [MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock()) for _ in range(2)]
+
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=sockets):
+        await service._stream_audio_task(user_id=1, text="Hello", cost_tracking=_make_tts_child())
+
+    for websocket in sockets:
+        assert websocket.send_bytes.await_count == 2
+        websocket.send_json.assert_awaited_once_with({"status": "complete"})
+
+
+@pytest.mark.anyio
+async def test_cached_clip_longer_than_socket_queue_reaches_every_socket(
+    mock_settings, mock_synthesis_client, tmp_path
+):
+    cache = TTSAudioCache(
+        tmp_path, max_bytes=1024 * 1024, namespace={"provider": "openai", "model": "tts", "voice": "onyx"}
+    )
+    service = TTSService(mock_settings, mock_synthesis_client, audio_cache=cache)
+    chunk_count = connection_manager.MAX_PENDING_CHUNKS * 2
+    await cache.put(cache.key_for("Hej", 1.0), b"x" * (TTSService.CACHE_HIT_CHUNK_BYTES * chunk_count))
+    sockets = [MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock()) for _ in range(2)]
+
+    with patch("runestone.services.tts_service.connection_manager.get_connections", return_value=sockets):
+        await service._stream_audio_task(user_id=1, text="Hej", cost_tracking=_make_tts_child())
+
+    mock_synthesis_client.synthesize_speech_stream.assert_not_called()
+    for websocket in sockets:
+        assert websocket.send_bytes.await_count == chunk_count
+        websocket.send_json.assert_awaited_once_with({"status": "complete"})
@@ -0,0 +1,116 @@
+"""
+Tests for TurnContextService.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from runestone.db.models import AgentSideEffect, ChatMessage, ChatSummary, MemoryItem
+from runestone.db.turn_context_repository import TurnContextRepository
+from runestone.services.turn_context_service import TurnContextService
+
+
+@pytest.fixture
+def turn_context_service(db_session):
+    """Create a TurnContextService backed by the test database."""
+    return TurnContextService(TurnContextRepository(db_session))
+
+
+@pytest.mark.anyio
+async def test_load_converts_rows_to_agent_schemas(turn_context_service, db_with_test_user):
+    """Test preloaded rows come back as the same schemas the per-part loaders return."""
+    db, user = db_with_test_user
+    chat_id = str(uuid4())
+    now = datetime.now(timezone.utc)
+    messages = [
+        ChatMessage(
+            user_id=user.id,
+            chat_id=chat_id,
+            role="assistant" if i else "user",
+            content=f"Message {i}",
+            sources=json.dumps([{"title": "SVT", "url": "https://svt.se", "date": "2026-10-01"}]) if i else None,
+            created_at=now - timedelta(minutes=5 - i),
+        )
+        for i in range(3)
+    ]
+    db.add_all(messages)
+    item = MemoryItem(user_id=user.id, category="area_to_improve", key="v2", content="Word order", status="struggling")
+    db.add(item)
+    await db.flush()
+    db.add(ChatSummary(user_id=user.id, chat_id=chat_id, summary_content="Earlier.", last_message_id=messages[0].id))
+    db.add(
+        AgentSideEffect(
+            user_id=user.id,
+            chat_id=chat_id,
+            specialist_name="word_keeper",
+            phase="post_response",
+            status="action_taken",
+            info_for_teacher="Saved hund",
+            artifacts_json=json.dumps({"words": ["hund"]}),
+            latency_ms=12,
+        )
+    )
+    await db.commit()
+
+    context = await turn_context_service.load(user.id, chat_id, after_summary=True)
+
+    assert context.user.id == user.id
+    assert context.chat_summary == "Earlier."
+    assert [message.content for message in context.history] == ["Message 1", "Message 2"]
+    assert context.history[0].sources[0].title == "SVT"
+    assert context.learning_focus.item_ids_json is None
+    assert context.learning_focus.items == []
+    [side_effect] = context.recent_side_effects
+    assert side_effect.name == "word_keeper"
+    assert side_effect.artifacts == {"words": ["hund"]}
+    assert side_effect.routing_reason == ""
+    assert side_effect.latency_ms == 12
+
+
+@pytest.mark.anyio
+async def test_load_ignores_summary_when_not_requested(turn_context_service, db_with_test_user):
+    """Test the summary and summarized messages are only applied with `after_summary`."""
+    db, user = db_with_test_user
+    chat_id = str(uuid4())
+    message = ChatMessage(user_id=user.id, chat_id=chat_id, role="user", content="Hej")
+    db.add(message)
+    await db.flush()
+    db.add(ChatSummary(user_id=user.id, chat_id=chat_id, summary_content="Earlier.", last_message_id=message.id))
+    await db.commit()
+
+    context = await turn_context_service.load(user.id, chat_id)
+
+    assert context.chat_summary == ""
+    assert [message.content for message in context.history] == ["Hej"]
+
+
+@pytest.mark.anyio
+async def test_load_returns_none_and_rolls_back_on_database_error():
+    """Test a failed combined query is reported as None so callers can fall back."""
+    repository = Mock()
+    repository.load = AsyncMock(side_effect=SQLAlchemyError("boom"))
+    repository.db.rollback = AsyncMock()
+
+    context = await TurnContextService(repository).load(1, "chat")
+
+    assert context is None
+    repository.db.rollback.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_load_skips_learning_focus_when_not_requested(turn_context_service, db_with_test_user):
+    """Test a cached focus lets the combined query leave the focus subqueries out."""
+    db, user = db_with_test_user
+    chat_id = str(uuid4())
+    db.add(ChatMessage(user_id=user.id, chat_id=chat_id, role="user", content="Hej"))
+    await db.commit()
+
+    context = await turn_context_service.load(user.id, chat_id, include_learning_focus=False)
+
+    assert context.learning_focus is None
+    assert [message.content for message in context.history] == ["Hej"]
@@ -4,9 +4,10 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from runestone.config import Settings
+from runestone.core.audio_normalizer import NormalizedAudio
 from runestone.core.exceptions import RunestoneError
 from runestone.model_costs.tracking import record_model_interaction
-from runestone.services.voice_service import VoiceService
+from runestone.services.voice_service import VoiceRecordingBuffer, VoiceService, transcript_looks_clean
 
 
 @pytest.fixture
@@ -14,6 +15,7 @@ def mock_settings():
     settings = MagicMock(spec=Settings)
     settings.voice_transcription_model = "whisper-1"
     settings.voice_enhancement_model = "gpt-4o-mini"
+    settings.voice_enhancement_skip_clean_transcripts = False
     return settings
 
 
@@ -242,3 +244,85 @@ async def test_concurrent_voice_operations_keep_ambient_tracking_isolated(
     summaries = [record.message for record in caplog.records if record.message.startswith("model_cost ")]
     assert len(summaries) == 2
     assert all("stage=final" in summary and "known_total_usd=0.03" in summary for summary in summaries)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Hej, hur mår du?", True),
+        ("Jag bor i Stockholm sedan 2019.", True),
+        ("hej hur mår du", False),
+        ("Jag um bor i Stockholm.", False),
+        ("Jag jag bor i Stockholm.", False),
+        ("Jag bor i Stockholm .", False),
+        ("", False),
+    ],
+)
+def test_transcript_looks_clean(text, expected):
+    assert transcript_looks_clean(text) is expected
+
+
+@pytest.mark.anyio
+async def test_process_voice_input_skips_enhancement_for_clean_transcript_when_enabled(voice_service):
+    voice_service.settings.voice_enhancement_skip_clean_transcripts = True
+    voice_service.transcribe_audio = AsyncMock(return_value="Hej, hur mår du?")
+    voice_service.enhance_text = AsyncMock()
+
+    result = await voice_service.process_voice_input(b"audio", improve=True)
+
+    assert result == "Hej, hur mår du?"
+    voice_service.enhance_text.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_process_voice_input_enhances_clean_transcript_by_default(voice_service):
+    voice_service.transcribe_audio = AsyncMock(return_value="Jag har bott i Stockholm sedan två år.")
+    voice_service.enhance_text = AsyncMock(return_value="Jag har bott i Stockholm i två år.")
+
+    result = await voice_service.process_voice_input(b"audio", improve=True)
+
+    assert result == "Jag har bott i Stockholm i två år."
+    voice_service.enhance_text.assert_awaited_once_with("Jag har bott i Stockholm sedan två år.")
+
+
+def test_voice_recording_buffer_enforces_size_limit():
+    recording = VoiceRecordingBuffer(max_bytes=4)
+    recording.append(b"ab")
+    recording.append(b"cd")
+
+    with pytest.raises(RunestoneError, match="Recording too large"):
+        recording.append(b"e")
+
+    assert len(recording) == 4
+    assert recording.getvalue() == b"abcd"
+
+
+@pytest.mark.anyio
+async def test_transcribe_audio_uploads_normalized_audio(
+    mock_settings, mock_transcription_client, mock_enhancement_client
+):
+    normalizer = MagicMock()
+    normalizer.normalize = AsyncMock(
+        return_value=NormalizedAudio(
+            content=b"small",
+            filename="recording.ogg",
+            content_type="audio/ogg",
+            input_bytes=1000,
+            output_bytes=5,
+            latency_ms=3,
+            normalized=True,
+        )
+    )
+    service = VoiceService(
+        mock_settings, mock_transcription_client, mock_enhancement_client, audio_normalizer=normalizer
+    )
+
+    await service.transcribe_audio(b"x" * 1000, language="sv")
+
+    normalizer.normalize.assert_awaited_once_with(b"x" * 1000)
+    mock_transcription_client.transcribe_audio.assert_awaited_once_with(
+        audio_content=b"small",
+        language="sv",
+        filename="recording.ogg",
+        content_type="audio/ogg",
+    )
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import httpx
 import pytest
 
+from runestone.core.metrics import RECALL_DELIVERIES
 from runestone.recall.types import RecallQueueWord, RecallState
 from runestone.telegram.delivery import TelegramRecallDelivery
 
@@ -150,6 +151,8 @@ async def test_failed_user_session_closes_and_later_user_still_runs(mock_setting
     later_service = make_service()
     provider = RecordingRecallProvider(enumeration_service, failed_service, later_service)
     delivery = TelegramRecallDelivery(provider, mock_settings)
+    failed_before = RECALL_DELIVERIES.value(outcome="failed")
+    delivered_before = RECALL_DELIVERIES.value(outcome="delivered")
 
     with (
         patch("runestone.telegram.delivery.datetime") as mock_datetime,
@@ -159,6 +162,8 @@ async def test_failed_user_session_closes_and_later_user_still_runs(mock_setting
         await delivery.send_next_recall_word()
 
     later_service.deliver_next_word.assert_awaited_once()
+    assert RECALL_DELIVERIES.value(outcome="failed") == failed_before + 1
+    assert RECALL_DELIVERIES.value(outcome="delivered") == delivered_before + 1
     assert provider.events[-4:] == [
         ("open", 1),
         ("close", 1),
@@ -6,7 +6,8 @@ import pytest
 from fastapi import HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 
-from runestone.auth.dependencies import get_current_user
+from runestone.auth.dependencies import get_current_user, get_current_user_record
+from runestone.auth.user_cache import AuthenticatedUser
 from runestone.core.exceptions import InactiveUserError, InvalidAccessTokenError
 from runestone.db.models import User
 
@@ -47,3 +48,23 @@ async def test_get_current_user_maps_inactive_user_to_forbidden():
     assert raised.value.status_code == status.HTTP_403_FORBIDDEN
     assert raised.value.detail == "User is not active"
     assert raised.value.headers is None
+
+
+async def test_get_current_user_record_loads_live_user():
+    user = User(id=1, email="user@example.com", name="User", active=True)
+    service = Mock()
+    service.get_user_by_id = AsyncMock(return_value=user)
+
+    assert await get_current_user_record(AuthenticatedUser.from_user(user), service) is user
+    service.get_user_by_id.assert_awaited_once_with(1)
+
+
+async def test_get_current_user_record_maps_missing_user_to_unauthorized():
+    service = Mock()
+    service.get_user_by_id = AsyncMock(return_value=None)
+    snapshot = AuthenticatedUser.from_user(User(id=1, email="user@example.com", name="User", active=True))
+
+    with pytest.raises(HTTPException) as raised:
+        await get_current_user_record(snapshot, service)
+
+    assert raised.value.status_code == status.HTTP_401_UNAUTHORIZED
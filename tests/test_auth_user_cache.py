@@ -0,0 +1,71 @@
+"""Tests for the authentication caches."""
+
+from runestone.auth.user_cache import AuthenticatedUser, AuthenticatedUserCache, VerifiedTokenCache
+
+
+class _Clock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _snapshot(user_id: int) -> AuthenticatedUser:
+    return AuthenticatedUser(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        name="User",
+        surname=None,
+        timezone="UTC",
+        telegram_username=None,
+        mother_tongue=None,
+        active=True,
+    )
+
+
+def test_token_cache_keeps_subject_until_token_expires():
+    clock = _Clock(1000.0)
+    cache = VerifiedTokenCache(clock=clock)
+
+    cache.put("token", {"sub": "7", "exp": 1060})
+
+    assert cache.get("token") == "7"
+    assert cache.get("other-token") is None
+    clock.now = 1060
+    assert cache.get("token") is None
+
+
+def test_token_cache_skips_tokens_without_expiry():
+    cache = VerifiedTokenCache()
+
+    cache.put("token", {"sub": "7"})
+
+    assert cache.get("token") is None
+
+
+def test_user_cache_expires_after_ttl_and_on_invalidation():
+    clock = _Clock()
+    cache = AuthenticatedUserCache(ttl_seconds=30, clock=clock)
+    cache.put(_snapshot(1))
+    cache.put(_snapshot(2))
+
+    assert cache.get(1) == _snapshot(1)
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    clock.now = 30
+    assert cache.get(2) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_user_cache_evicts_least_recently_used_snapshot():
+    cache = AuthenticatedUserCache(max_entries=2)
+    cache.put(_snapshot(1))
+    cache.put(_snapshot(2))
+    cache.get(1)
+
+    cache.put(_snapshot(3))
+
+    assert cache.get(1) is not None
+    assert cache.get(2) is None
+    assert cache.stats.evictions == 1
@@ -4,6 +4,8 @@ Tests for the CLI module.
 
 import logging
 import os
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -19,6 +21,7 @@ from runestone.cli import (
 from runestone.core.exceptions import RunestoneError
 from runestone.core.processor import RunestoneProcessor
 from runestone.model_costs.tracking import record_model_interaction
+from runestone.services.model_cost_service import CostRollupRow
 
 
 class TestCLI:
@@ -703,6 +706,75 @@ class TestCLI:
             assert user_id == 1
             assert "Added 2 new vocabulary items" in result.output
 
+    @patch("runestone.cli._prewarm_word_enrichment", new_callable=AsyncMock)
+    def test_prewarm_word_enrichment_command_prints_language_summary(self, mock_prewarm):
+        """Test prewarm-word-enrichment passes options and prints per-language counts."""
+        mock_prewarm.return_value = {"Spanish": {"phrases": 3, "cached": 1, "generated": 2, "failed": 0}}
+
+        result = self.runner.invoke(
+            cli,
+            ["prewarm-word-enrichment", "--language", "Spanish", "--limit", "50", "--dry-run"],
+        )
+
+        assert result.exit_code == 0
+        mock_prewarm.assert_awaited_once_with(["Spanish"], 50, 25, True)
+        assert "Spanish: phrases=3 cached=1 generated=2 failed=0" in result.output
+
+    @patch("runestone.cli._benchmark_turn_context", new_callable=AsyncMock)
+    def test_benchmark_turn_context_command_prints_loader_stats(self, mock_benchmark):
+        """Test benchmark-turn-context passes options and prints round-trips and latency."""
+        mock_benchmark.return_value = {
+            "sequential": {"round_trips": 6.0, "median_ms": 6.3, "p90_ms": 7.4},
+            "preloaded": {"round_trips": 1.0, "median_ms": 4.5, "p90_ms": 5.8},
+        }
+
+        result = self.runner.invoke(cli, ["benchmark-turn-context", "7", "--iterations", "10"])
+
+        assert result.exit_code == 0
+        mock_benchmark.assert_awaited_once_with(7, 10)
+        assert "sequential: round_trips=6.0 median_ms=6.30 p90_ms=7.40" in result.output
+        assert "preloaded: round_trips=1.0 median_ms=4.50 p90_ms=5.80" in result.output
+
+    @patch("runestone.cli._model_cost_rollup", new_callable=AsyncMock)
+    def test_model_cost_rollup_command_prints_daily_rows_and_total(self, mock_rollup):
+        """Test model-cost-rollup passes options and prints one line per day, user, and component."""
+        mock_rollup.return_value = [
+            CostRollupRow(date(2026, 10, 1), 7, "teacher", 3, 1, Decimal("0.0125")),
+            CostRollupRow(date(2026, 10, 1), None, "word_enrichment", 1, 0, Decimal("0.2")),
+        ]
+
+        result = self.runner.invoke(cli, ["model-cost-rollup", "--days", "3", "--user-id", "7"])
+
+        assert result.exit_code == 0
+        mock_rollup.assert_awaited_once_with(3, 7)
+        assert "2026-10-01 user=7 teacher: calls=3 unknown=1 known_usd=0.012500" in result.output
+        assert "2026-10-01 user=- word_enrichment: calls=1 unknown=0 known_usd=0.200000" in result.output
+        assert "total known_usd=0.212500" in result.output
+
+    @patch("runestone.cli._evaluate_memory_bucketing", new_callable=AsyncMock)
+    def test_evaluate_memory_bucketing_command_prints_comparison(self, mock_evaluate):
+        """Test evaluate-memory-bucketing passes options and prints both bucketings and their agreement."""
+        stats = {"bucket_count": 4, "singleton_count": 2, "max_bucket_size": 3, "oversized_bucket_count": 0}
+        mock_evaluate.return_value = {
+            "domain": "personal_info",
+            "item_count": 8,
+            "similarity_threshold": 0.65,
+            "llm": {**stats, "elapsed_ms": 4200.0, "estimated_tokens": 1800},
+            "embedding": {**stats, "cold_ms": 900.0, "warm_ms": 12.0, "estimated_tokens": 0},
+            "agreement": {"precision": 0.75, "recall": 0.6, "f1": 0.6667},
+        }
+
+        result = self.runner.invoke(
+            cli, ["evaluate-memory-bucketing", "7", "--domain", "personal_info", "--threshold", "0.65"]
+        )
+
+        assert result.exit_code == 0
+        mock_evaluate.assert_awaited_once_with(7, "personal_info", 0.65)
+        output = " ".join(result.output.split())
+        assert "llm: buckets=4 singletons=2 max_size=3 oversized=0 elapsed_ms=4200 est_tokens=1800" in output
+        assert "embedding: buckets=4 singletons=2 max_size=3 oversized=0 cold_ms=900 warm_ms=12 est_tokens=0" in output
+        assert "agreement vs llm: precision=0.75 recall=0.60 f1=0.67" in result.output
+
     @patch("runestone.cli.GrammarIndex")
     def test_rag_search_command(self, mock_index_class):
         """Test RAG search command."""
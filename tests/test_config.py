@@ -30,6 +30,7 @@ def test_paid_agent_names_are_canonical_and_include_optional_backup() -> None:
         "learning_memory_keeper",
         "personal_memory_keeper",
         "memory_maintainer",
+        "chat_summarizer",
     )
 
 
@@ -544,6 +545,15 @@ class TestSettings:
         assert test_settings.elevenlabs_tts_model == "eleven_multilingual_v2"
         assert test_settings.elevenlabs_tts_output_format == "mp3_44100_128"
 
+    def test_tts_max_concurrency_resolves_per_provider(self):
+        settings = self._base_settings(
+            tts_provider="elevenlabs", tts_openai_max_concurrency=8, tts_elevenlabs_max_concurrency=2
+        )
+        assert settings.resolve_tts_max_concurrency() == 2
+
+        settings.tts_provider = "openai"
+        assert settings.resolve_tts_max_concurrency() == 8
+
     def _base_settings(self, **kwargs):
         """Return a minimal Settings object for get_agent_llm_settings tests."""
         return Settings.model_construct(
@@ -595,6 +605,27 @@ class TestSettings:
         with pytest.raises(ValueError, match="Teacher backup model is not configured"):
             s.get_agent_llm_settings("teacher_backup")
 
+    def test_get_agent_fallback_llm_settings_swaps_model_and_keeps_agent_budget(self):
+        """The circuit-breaker fallback reuses the agent profile with the shared fallback model."""
+        s = self._base_settings(
+            coordinator_provider="openrouter",
+            coordinator_llm_timeout_seconds=3.0,
+            llm_fallback_provider="gemini",
+            llm_fallback_model="gemini-2.5-flash",
+        )
+        result = s.get_agent_fallback_llm_settings("coordinator")
+        assert result.provider == "gemini"
+        assert result.model == "gemini-2.5-flash"
+        assert result.temperature == s.coordinator_temperature
+        assert result.timeout_seconds == 10.0
+        assert s.get_agent_fallback_llm_settings("teacher_backup") is None
+
+    def test_get_agent_fallback_llm_settings_is_none_without_distinct_fallback(self):
+        """No fallback applies when none is configured or it is the agent's own model."""
+        assert self._base_settings().get_agent_fallback_llm_settings("coordinator") is None
+        s = self._base_settings(llm_fallback_provider="openrouter", llm_fallback_model="teacher-model")
+        assert s.get_agent_fallback_llm_settings("teacher") is None
+
     def test_get_agent_llm_settings_coordinator_uses_default_timeout(self):
         """coordinator uses its built-in default when no env override is given."""
         s = self._base_settings(coordinator_provider="openrouter")
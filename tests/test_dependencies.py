@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
+from runestone.auth.user_cache import authenticated_user_cache, verified_token_cache
 from runestone.config import Settings
 from runestone.core.analyzer import ContentAnalyzer
 from runestone.core.ocr import OCRProcessor
@@ -152,12 +153,29 @@ class TestDependencyProviders:
         """Auth service receives its required repository and settings."""
         user_repository = Mock()
         mock_settings = Mock(spec=Settings)
+        mock_settings.auth_user_cache_enabled = False
 
         result = get_auth_service(user_repository, mock_settings)
 
         assert result == mock_auth_service_class.return_value
         mock_auth_service_class.assert_called_once_with(user_repository, mock_settings)
 
+    @patch("runestone.dependencies.AuthService")
+    def test_get_auth_service_with_user_cache(self, mock_auth_service_class):
+        """Enabled auth caching hands the process-wide caches to the service."""
+        user_repository = Mock()
+        mock_settings = Mock(spec=Settings)
+        mock_settings.auth_user_cache_enabled = True
+
+        get_auth_service(user_repository, mock_settings)
+
+        mock_auth_service_class.assert_called_once_with(
+            user_repository,
+            mock_settings,
+            token_cache=verified_token_cache,
+            user_cache=authenticated_user_cache,
+        )
+
     @patch("runestone.dependencies.RecallService")
     def test_get_recall_service(self, mock_recall_service_class):
         """Recall provider composes required services explicitly."""
@@ -0,0 +1,79 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from memory_maintenance_worker_main import create_scheduler, main, run_sweep_job
+
+
+class TestMemoryMaintenanceWorkerMain:
+    """Test cases for memory_maintenance_worker_main functionality."""
+
+    @patch("memory_maintenance_worker_main.signal.signal")
+    @patch("memory_maintenance_worker_main.settings")
+    @patch("memory_maintenance_worker_main.setup_logging")
+    @patch("memory_maintenance_worker_main.setup_database", new_callable=AsyncMock)
+    @patch("memory_maintenance_worker_main.MemoryMaintenanceSweep")
+    @patch("memory_maintenance_worker_main.create_scheduler")
+    @pytest.mark.asyncio
+    async def test_main_schedules_sweep_until_shutdown(
+        self,
+        mock_create_scheduler,
+        mock_sweep_class,
+        mock_setup_database,
+        mock_setup_logging,
+        mock_settings,
+        mock_signal,
+    ):
+        """Test main sets up the database, builds the sweep from settings, and runs the scheduler."""
+        mock_settings.verbose = False
+        mock_settings.model_cost_persistence_enabled = False
+        mock_scheduler = Mock()
+        mock_scheduler.get_jobs.return_value = []
+        mock_create_scheduler.return_value = mock_scheduler
+
+        with patch("asyncio.Event.wait", new_callable=AsyncMock):
+            await main()
+
+        mock_setup_database.assert_awaited_once()
+        mock_sweep_class.from_settings.assert_called_once_with(mock_settings)
+        mock_create_scheduler.assert_called_once_with(mock_sweep_class.from_settings.return_value)
+        mock_scheduler.start.assert_called_once()
+        mock_scheduler.shutdown.assert_called_once_with(wait=True)
+        assert mock_signal.call_count == 2
+
+    @patch("memory_maintenance_worker_main.settings")
+    @patch("memory_maintenance_worker_main.setup_logging")
+    @patch("memory_maintenance_worker_main.setup_database", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_main_exits_when_database_setup_fails(self, mock_setup_database, mock_setup_logging, mock_settings):
+        """Test main exits with an error status when startup fails."""
+        mock_settings.verbose = False
+        mock_setup_database.side_effect = RuntimeError("db down")
+
+        with pytest.raises(SystemExit) as exc_info:
+            await main()
+
+        assert exc_info.value.code == 1
+
+    @patch("memory_maintenance_worker_main.settings")
+    def test_create_scheduler_runs_daily_at_configured_hour(self, mock_settings):
+        """Test the sweep job is a single-instance daily cron job at the configured UTC hour."""
+        mock_settings.memory_maintenance_schedule_hour_utc = 4
+        sweep = Mock()
+
+        scheduler = create_scheduler(sweep)
+
+        job = scheduler.get_job("memory_maintenance_sweep")
+        assert job.args == (sweep,)
+        assert job.max_instances == 1
+        assert str(job.trigger.fields[job.trigger.FIELD_NAMES.index("hour")]) == "4"
+
+    @pytest.mark.asyncio
+    async def test_run_sweep_job_swallows_errors(self):
+        """Test a failing sweep does not propagate out of the scheduler job."""
+        sweep = Mock()
+        sweep.run = AsyncMock(side_effect=RuntimeError("boom"))
+
+        await run_sweep_job(sweep)
+
+        sweep.run.assert_awaited_once()
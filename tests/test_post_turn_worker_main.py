@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from post_turn_worker_main import create_worker, main
+
+
+class TestPostTurnWorkerMain:
+    """Test cases for post_turn_worker_main functionality."""
+
+    @patch("post_turn_worker_main.signal.signal")
+    @patch("post_turn_worker_main.settings")
+    @patch("post_turn_worker_main.setup_logging")
+    @patch("post_turn_worker_main.setup_database", new_callable=AsyncMock)
+    @patch("post_turn_worker_main.create_worker")
+    @patch("post_turn_worker_main.stop_interaction_persistence", new_callable=AsyncMock)
+    @patch("post_turn_worker_main.start_interaction_persistence")
+    @pytest.mark.asyncio
+    async def test_main_runs_worker_until_shutdown(
+        self,
+        mock_start_persistence,
+        mock_stop_persistence,
+        mock_create_worker,
+        mock_setup_database,
+        mock_setup_logging,
+        mock_settings,
+        mock_signal,
+    ):
+        """Test main sets up the database, installs signal handlers, and runs the worker."""
+        mock_settings.verbose = False
+        mock_settings.post_turn_queue_enabled = True
+        mock_worker = Mock()
+        mock_worker.run = AsyncMock()
+        mock_create_worker.return_value = mock_worker
+
+        await main()
+
+        mock_setup_logging.assert_called_once_with(level="INFO")
+        mock_setup_database.assert_awaited_once()
+        mock_worker.run.assert_awaited_once()
+        assert mock_signal.call_count == 2
+        mock_start_persistence.assert_called_once_with(mock_settings)
+        mock_stop_persistence.assert_awaited_once()
+
+    @patch("post_turn_worker_main.settings")
+    @patch("post_turn_worker_main.setup_logging")
+    @patch("post_turn_worker_main.setup_database", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_main_exits_when_database_setup_fails(self, mock_setup_database, mock_setup_logging, mock_settings):
+        """Test main exits with an error status when startup fails."""
+        mock_settings.verbose = False
+        mock_setup_database.side_effect = RuntimeError("db down")
+
+        with pytest.raises(SystemExit) as exc_info:
+            await main()
+
+        assert exc_info.value.code == 1
+
+    @patch("post_turn_worker_main.AgentsManager")
+    @patch("post_turn_worker_main.settings")
+    def test_create_worker_uses_settings(self, mock_settings, mock_manager):
+        """Test worker tuning comes from settings."""
+        mock_settings.post_turn_worker_concurrency = 8
+        mock_settings.post_turn_worker_poll_seconds = 0.5
+        mock_settings.post_turn_job_lease_seconds = 90.0
+        mock_settings.post_turn_job_max_attempts = 3
+
+        worker = create_worker()
+
+        mock_manager.assert_called_once_with(mock_settings)
+        assert worker.concurrency == 8
+        assert worker.poll_interval_seconds == 0.5
+        assert worker.lease_seconds == 90.0
+        assert worker.max_attempts == 3